@@ -443,6 +443,7 @@ class Transpiler {
             [ /Precise\.stringGe\s/g, 'Precise.string_ge' ],
             [ /Precise\.stringLt\s/g, 'Precise.string_lt' ],
             [ /Precise\.stringLe\s/g, 'Precise.string_le' ],
+            [ /Precise\.stringSum\s/g, 'Precise.string_sum' ],
             [ /\.padEnd\s/g, '.ljust'],
             [ /\.padStart\s/g, '.rjust' ],
 
@@ -676,6 +677,7 @@ class Transpiler {
             [ /Precise\.stringGe\s/g, 'Precise::string_ge' ],
             [ /Precise\.stringLt\s/g, 'Precise::string_lt' ],
             [ /Precise\.stringLe\s/g, 'Precise::string_le' ],
+            [ /Precise\.stringSum\s/g, 'Precise::string_sum' ],
             [ /(\w+)\.padEnd\s*\(([^,]+),\s*([^)]+)\)/g, 'str_pad($1, $2, $3, STR_PAD_RIGHT)' ],
             [ /(\w+)\.padStart\s*\(([^,]+),\s*([^)]+)\)/g, 'str_pad($1, $2, $3, STR_PAD_LEFT)' ],
 
@@ -1841,11 +1843,25 @@ class Transpiler {
             const secondPart = parts[1]
             const methods = secondPart.trim ().split (/\n\s*\n/)
             const {
-                python2,
-                python3,
                 php,
                 phpAsync,
             } = this.transpileMethodsToAllLanguages (className, methods)
+            // these are implemented by hand above the delimiter in python/ccxt/base/exchange.py
+            // and orderBookChecksum in python/ccxt/async_support/base/exchange.py
+            // their transpiled versions are kept as transpiled_* for python/ccxt/test/base/test_native_methods.py
+            const pythonNativeMethods = [ 'setMarkets', 'safeMarket', 'getSymbolsForMarketType', 'fetch2', 'orderBookChecksum' ]
+            const pythonMethods = methods.map (method => {
+                const signature = method.match (/^\s*(?:async\s+)?([A-Za-z0-9_]+)\s*\(/)
+                if (signature && pythonNativeMethods.includes (signature[1])) {
+                    const name = signature[1]
+                    return method.replace (name + ' (', 'transpiled' + name[0].toUpperCase () + name.slice (1) + ' (')
+                }
+                return method
+            })
+            const {
+                python2,
+                python3,
+            } = this.transpileMethodsToAllLanguages (className, pythonMethods)
             // trim away sync methods from python async
             // since it already inherits those methods
             const python3Async = []
@@ -155,6 +155,7 @@ class Exchange {
     public $trades = array();
     public $transactions = array();
     public $positions = null;
+    public $messageHandlers = null; // the handlers of message_routes() by table, built once, see message_handler()
     public $ohlcvs = array();
     public $exceptions = array();
     public $accounts = array();
@@ -2360,6 +2361,75 @@ class Exchange {
         return -1;
     }
 
+    public function message_routes() {
+        // the handlers of the messages by $table and $key, like array( 'channel' => array( 'trades' => $this->handleTrades, 'candle*' => $this->handleOHLCV ) )
+        return array();
+    }
+
+    public function message_handler(string $table, ?string $key) {
+        /**
+         * @ignore
+         * the $handler of the messages with a $key in a $table of messageRoutes (), the tables are built once instead of once per message
+         * @param {string} $table the name of the $table, like 'event' or 'channel'
+         * @param {string} $key the $key of the message, the $routes ending with * match the keys that start with them, the longest first
+         * @return {function|null} the $handler, called with the client and the message
+         */
+        if ($key === null) {
+            return null;
+        }
+        if ($this->messageHandlers === null) {
+            $this->messageHandlers = array();
+            $tables = $this->message_routes();
+            $names = is_array($tables) ? array_keys($tables) : array();
+            for ($i = 0; $i < count($names); $i++) {
+                $routes = $tables[$names[$i]];
+                $handlers = array();
+                $prefixes = array();
+                $routeKeys = is_array($routes) ? array_keys($routes) : array();
+                for ($j = 0; $j < count($routeKeys); $j++) {
+                    $route = $routeKeys[$j];
+                    if (str_ends_with($route, '*')) {
+                        $prefixes[] = array( mb_substr($route, 0, strlen($route) - 1), $routes[$route] );
+                    } else {
+                        $handlers[$route] = $routes[$route];
+                    }
+                }
+                $this->messageHandlers[$names[$i]] = array( 'handlers' => $handlers, 'prefixes' => $prefixes, 'matches' => array(), 'size' => 0 );
+            }
+        }
+        if (!(is_array($this->messageHandlers) && array_key_exists($table, $this->messageHandlers))) {
+            return null;
+        }
+        $tableHandlers = $this->messageHandlers[$table];
+        if (is_array($tableHandlers['handlers']) && array_key_exists($key, $tableHandlers['handlers'])) {
+            return $tableHandlers['handlers'][$key];
+        }
+        $prefixes = $tableHandlers['prefixes'];
+        if (count($prefixes) === 0) {
+            return null;
+        }
+        if (is_array($tableHandlers['matches']) && array_key_exists($key, $tableHandlers['matches'])) {
+            return $tableHandlers['matches'][$key];
+        }
+        $handler = null;
+        $length = -1;
+        for ($i = 0; $i < count($prefixes); $i++) {
+            $prefix = $prefixes[$i][0];
+            if ((strlen($prefix) > $length) && str_starts_with($key, $prefix)) {
+                $handler = $prefixes[$i][1];
+                $length = strlen($prefix);
+            }
+        }
+        // the keys can hold symbols, so the matches are memoized up to a bound
+        if ($tableHandlers['size'] >= 1000) {
+            $this->messageHandlers[$table]['matches'] = array();
+            $this->messageHandlers[$table]['size'] = 0;
+        }
+        $this->messageHandlers[$table]['matches'][$key] = $handler;
+        $this->messageHandlers[$table]['size'] = $this->messageHandlers[$table]['size'] + 1;
+        return $handler;
+    }
+
     public function find_timeframe($timeframe, $timeframes = null) {
         if ($timeframes === null) {
             $timeframes = $this->timeframes;
@@ -3317,15 +3387,18 @@ class Exchange {
                 if ($parseCost) {
                     $cost = '0';
                 }
+                // added up once after the loop
+                $tradeAmounts = array( $filled );
+                $tradeCosts = array( $cost );
                 for ($i = 0; $i < count($trades); $i++) {
                     $trade = $trades[$i];
                     $tradeAmount = $this->safe_string($trade, 'amount');
                     if ($parseFilled && ($tradeAmount !== null)) {
-                        $filled = Precise::string_add($filled, $tradeAmount);
+                        $tradeAmounts[] = $tradeAmount;
                     }
                     $tradeCost = $this->safe_string($trade, 'cost');
                     if ($parseCost && ($tradeCost !== null)) {
-                        $cost = Precise::string_add($cost, $tradeCost);
+                        $tradeCosts[] = $tradeCost;
                     }
                     if ($parseSymbol) {
                         $symbol = $this->safe_string($trade, 'symbol');
@@ -3356,6 +3429,8 @@ class Exchange {
                         }
                     }
                 }
+                $filled = Precise::string_sum($tradeAmounts);
+                $cost = Precise::string_sum($tradeCosts);
             }
         }
         if ($shouldParseFees) {
@@ -3757,6 +3832,8 @@ class Exchange {
         //     )
         //
         $reduced = array();
+        // the sums are computed once at the end
+        $costs = array();
         for ($i = 0; $i < count($fees); $i++) {
             $fee = $fees[$i];
             $feeCurrencyCode = $this->safe_string($fee, 'currency');
@@ -3769,15 +3846,17 @@ class Exchange {
                 }
                 if (!(is_array($reduced) && array_key_exists($feeCurrencyCode, $reduced))) {
                     $reduced[$feeCurrencyCode] = array();
+                    $costs[$feeCurrencyCode] = array();
                 }
                 $rateKey = ($rate === null) ? '' : $rate;
                 if (is_array($reduced[$feeCurrencyCode]) && array_key_exists($rateKey, $reduced[$feeCurrencyCode])) {
-                    $reduced[$feeCurrencyCode][$rateKey]['cost'] = Precise::string_add($reduced[$feeCurrencyCode][$rateKey]['cost'], $cost);
+                    $costs[$feeCurrencyCode][$rateKey][] = $cost;
                 } else {
                     $reduced[$feeCurrencyCode][$rateKey] = array(
                         'currency' => $feeCurrencyCode,
                         'cost' => $cost,
                     );
+                    $costs[$feeCurrencyCode][$rateKey] = array( $cost );
                     if ($rate !== null) {
                         $reduced[$feeCurrencyCode][$rateKey]['rate'] = $rate;
                     }
@@ -3785,9 +3864,15 @@ class Exchange {
             }
         }
         $result = array();
-        $feeValues = is_array($reduced) ? array_values($reduced) : array();
-        for ($i = 0; $i < count($feeValues); $i++) {
-            $reducedFeeValues = is_array($feeValues[$i]) ? array_values($feeValues[$i]) : array();
+        $feeCurrencyCodes = is_array($reduced) ? array_keys($reduced) : array();
+        for ($i = 0; $i < count($feeCurrencyCodes); $i++) {
+            $feeCurrencyCode = $feeCurrencyCodes[$i];
+            $rateKeys = is_array($reduced[$feeCurrencyCode]) ? array_keys($reduced[$feeCurrencyCode]) : array();
+            for ($j = 0; $j < count($rateKeys); $j++) {
+                $rateKey = $rateKeys[$j];
+                $reduced[$feeCurrencyCode][$rateKey]['cost'] = Precise::string_sum($costs[$feeCurrencyCode][$rateKey]);
+            }
+            $reducedFeeValues = is_array($reduced[$feeCurrencyCode]) ? array_values($reduced[$feeCurrencyCode]) : array();
             $result = $this->array_concat($result, $reducedFeeValues);
         }
         return $result;
@@ -187,6 +187,15 @@ class Precise {
         return strval((new Precise($string1))->add(new Precise($string2)));
     }
 
+    public static function string_sum($strings) {
+        // the same as chaining string_add() over the strings, the null strings are skipped
+        $result = null;
+        foreach ($strings as $string) {
+            $result = static::string_add($result, $string);
+        }
+        return $result;
+    }
+
     public static function string_sub($string1, $string2) {
         if (($string1 === null) || ($string2 === null)) {
             return null;
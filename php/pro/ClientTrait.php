@@ -93,7 +93,8 @@ trait ClientTrait {
         $client->set_ws_connector($selected_proxy_address, $proxy_connector);
     }
 
-    public function watch_multiple($url, $message_hashes, $message = null, $subscribe_hashes = null, $subscription = null) {
+    public function watch_multiple($url, $message_hashes, $message = null, $subscribe_hashes = null, $subscription = null, $replay = true) {
+        // replay = false marks the one-shot requests, like the orders, that are not sent again after a reconnection
         $client = $this->client($url);
 
         // todo: calculate the backoff delay in php
@@ -152,7 +153,8 @@ trait ClientTrait {
         return $future;
     }
 
-    public function watch($url, $message_hash, $message = null, $subscribe_hash = null, $subscription = null) {
+    public function watch($url, $message_hash, $message = null, $subscribe_hash = null, $subscription = null, $replay = true) {
+        // replay = false marks the one-shot requests, like the orders, that are not sent again after a reconnection
         $client = $this->client($url);
 
         // todo: calculate the backoff delay in php
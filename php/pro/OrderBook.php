@@ -41,6 +41,7 @@ class OrderBook extends \ArrayObject implements \JsonSerializable {
     public function reset($snapshot = array()) {
         $this['asks']->index = array(PHP_FLOAT_MAX, PHP_FLOAT_MAX);
         $this['asks']->exchangeArray(array());
+        $this['asks']->strings = array();
         if (array_key_exists('asks', $snapshot) && is_array($snapshot['asks'])) {
             foreach ($snapshot['asks'] as $delta) {
                 $this['asks']->storeArray ($delta);
@@ -48,6 +49,7 @@ class OrderBook extends \ArrayObject implements \JsonSerializable {
         }
         $this['bids']->index = array(PHP_FLOAT_MAX, PHP_FLOAT_MAX);
         $this['bids']->exchangeArray(array());
+        $this['bids']->strings = array();
         if (array_key_exists('bids', $snapshot) && is_array($snapshot['bids'])) {
             foreach ($snapshot['bids'] as $delta) {
                 $this['bids']->storeArray ($delta);
@@ -19,12 +19,14 @@ class OrderBookSide extends \ArrayObject implements \JsonSerializable {
     public $index;
     public $depth;
     public $n;
+    public $strings; // the original price and size strings of the levels by price, see storeWithStrings()
 
     public function __construct($deltas = array(), $depth = null) {
         parent::__construct();
         $this->depth = $depth ? $depth : PHP_INT_MAX;
         $this->n = PHP_INT_MAX;
         $this->index = array();
+        $this->strings = array();
 
         foreach ($deltas as $delta) {
             $this->storeArray($delta);
@@ -60,12 +62,31 @@ class OrderBookSide extends \ArrayObject implements \JsonSerializable {
         $this->storeArray(array($price, $size));
     }
 
+    // keeps the strings the level was parsed from, for the checksums of the exchanges
+    public function storeWithStrings($price, $size, $price_string, $size_string) {
+        // the float keys of php arrays are truncated to integers
+        $key = strval($price);
+        if ($size) {
+            $this->strings[$key] = array($price_string, $size_string);
+        } else {
+            unset($this->strings[$key]);
+        }
+        $this->storeArray(array($price, $size));
+    }
+
+    public function levelStrings($price) {
+        $key = strval($price);
+        return array_key_exists($key, $this->strings) ? $this->strings[$key] : null;
+    }
+
     public function limit() {
         $difference = count($this) - $this->depth;
         if ($difference > 0) {
             array_splice($this->index, -$difference);
             $tmp = $this->exchangeArray(tmp);
-            array_splice($tmp, -$difference);
+            foreach (array_splice($tmp, -$difference) as $level) {
+                unset($this->strings[strval($level[0])]);
+            }
             $this->exchangeArray($tmp);
         }
     }
@@ -3434,6 +3434,35 @@ class binance extends \ccxt\async\binance {
         }
     }
 
+    public function message_routes() {
+        return array(
+            'event' => array(
+                'depthUpdate' => array($this, 'handle_order_book'),
+                'trade' => array($this, 'handle_trade'),
+                'aggTrade' => array($this, 'handle_trade'),
+                'kline' => array($this, 'handle_ohlcv'),
+                'markPrice_kline' => array($this, 'handle_ohlcv'),
+                'indexPrice_kline' => array($this, 'handle_ohlcv'),
+                '1hTicker@arr' => array($this, 'handle_tickers'),
+                '4hTicker@arr' => array($this, 'handle_tickers'),
+                '1dTicker@arr' => array($this, 'handle_tickers'),
+                '24hrTicker@arr' => array($this, 'handle_tickers'),
+                '24hrMiniTicker@arr' => array($this, 'handle_tickers'),
+                '1hTicker' => array($this, 'handle_tickers'),
+                '4hTicker' => array($this, 'handle_tickers'),
+                '1dTicker' => array($this, 'handle_tickers'),
+                '24hrTicker' => array($this, 'handle_tickers'),
+                '24hrMiniTicker' => array($this, 'handle_tickers'),
+                'bookTicker' => array($this, 'handle_bids_asks'), // there is no "bookTicker@arr" endpoint
+                'outboundAccountPosition' => array($this, 'handle_balance'),
+                'balanceUpdate' => array($this, 'handle_balance'),
+                'ACCOUNT_UPDATE' => array($this, 'handle_acount_update'),
+                'executionReport' => array($this, 'handle_order_update'),
+                'ORDER_TRADE_UPDATE' => array($this, 'handle_order_update'),
+            ),
+        );
+    }
+
     public function handle_message(Client $client, $message) {
         // handle WebSocketAPI
         $status = $this->safe_string($message, 'status');
@@ -3450,36 +3479,12 @@ class binance extends \ccxt\async\binance {
             return;
         }
         // handle other APIs
-        $methods = array(
-            'depthUpdate' => array($this, 'handle_order_book'),
-            'trade' => array($this, 'handle_trade'),
-            'aggTrade' => array($this, 'handle_trade'),
-            'kline' => array($this, 'handle_ohlcv'),
-            'markPrice_kline' => array($this, 'handle_ohlcv'),
-            'indexPrice_kline' => array($this, 'handle_ohlcv'),
-            '1hTicker@arr' => array($this, 'handle_tickers'),
-            '4hTicker@arr' => array($this, 'handle_tickers'),
-            '1dTicker@arr' => array($this, 'handle_tickers'),
-            '24hrTicker@arr' => array($this, 'handle_tickers'),
-            '24hrMiniTicker@arr' => array($this, 'handle_tickers'),
-            '1hTicker' => array($this, 'handle_tickers'),
-            '4hTicker' => array($this, 'handle_tickers'),
-            '1dTicker' => array($this, 'handle_tickers'),
-            '24hrTicker' => array($this, 'handle_tickers'),
-            '24hrMiniTicker' => array($this, 'handle_tickers'),
-            'bookTicker' => array($this, 'handle_bids_asks'), // there is no "bookTicker@arr" endpoint
-            'outboundAccountPosition' => array($this, 'handle_balance'),
-            'balanceUpdate' => array($this, 'handle_balance'),
-            'ACCOUNT_UPDATE' => array($this, 'handle_acount_update'),
-            'executionReport' => array($this, 'handle_order_update'),
-            'ORDER_TRADE_UPDATE' => array($this, 'handle_order_update'),
-        );
         $event = $this->safe_string($message, 'e');
         if (gettype($message) === 'array' && array_keys($message) === array_keys(array_keys($message))) {
             $data = $message[0];
             $event = $this->safe_string($data, 'e') . '@arr';
         }
-        $method = $this->safe_value($methods, $event);
+        $method = $this->message_handler('event', $event);
         if ($method === null) {
             $requestId = $this->safe_string($message, 'id');
             if ($requestId !== null) {
@@ -1592,6 +1592,41 @@ class okx extends \ccxt\async\okx {
         return $message;
     }
 
+    public function message_routes() {
+        return array(
+            'event' => array(
+                // 'info' => $this->handleSystemStatus,
+                // 'book' => 'handleOrderBook',
+                'login' => array($this, 'handle_authenticate'),
+                'subscribe' => array($this, 'handle_subscription_status'),
+                'order' => array($this, 'handle_place_orders'),
+                'batch-orders' => array($this, 'handle_place_orders'),
+                'amend-order' => array($this, 'handle_place_orders'),
+                'batch-amend-orders' => array($this, 'handle_place_orders'),
+                'cancel-order' => array($this, 'handle_place_orders'),
+                'mass-cancel' => array($this, 'handle_cancel_all_orders'),
+            ),
+            'channel' => array(
+                'bbo-tbt' => array($this, 'handle_order_book'), // newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
+                'books' => array($this, 'handle_order_book'), // all API users can subscribe, public depth channel, verification not required
+                'books5' => array($this, 'handle_order_book'), // all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms (vs. every 200ms now)
+                'books50-l2-tbt' => array($this, 'handle_order_book'), // only users who're VIP4 and above can subscribe, identity verification required before subscription
+                'books-l2-tbt' => array($this, 'handle_order_book'), // only users who're VIP5 and above can subscribe, identity verification required before subscription
+                'tickers' => array($this, 'handle_ticker'),
+                'positions' => array($this, 'handle_positions'),
+                'index-tickers' => array($this, 'handle_ticker'),
+                'sprd-tickers' => array($this, 'handle_ticker'),
+                'block-tickers' => array($this, 'handle_ticker'),
+                'trades' => array($this, 'handle_trades'),
+                'account' => array($this, 'handle_balance'),
+                // 'margin_account' => array($this, 'handle_balance'),
+                'orders' => array($this, 'handle_orders'),
+                'orders-algo' => array($this, 'handle_orders'),
+                'candle*' => array($this, 'handle_ohlcv'),
+            ),
+        );
+    }
+
     public function handle_message(Client $client, $message) {
         if (!$this->handle_error_message($client, $message)) {
             return;
@@ -1643,48 +1678,15 @@ class okx extends \ccxt\async\okx {
         // if ($table === null) {
         $event = $this->safe_string_2($message, 'event', 'op');
         if ($event !== null) {
-            $methods = array(
-                // 'info' => $this->handleSystemStatus,
-                // 'book' => 'handleOrderBook',
-                'login' => array($this, 'handle_authenticate'),
-                'subscribe' => array($this, 'handle_subscription_status'),
-                'order' => array($this, 'handle_place_orders'),
-                'batch-orders' => array($this, 'handle_place_orders'),
-                'amend-order' => array($this, 'handle_place_orders'),
-                'batch-amend-orders' => array($this, 'handle_place_orders'),
-                'cancel-order' => array($this, 'handle_place_orders'),
-                'mass-cancel' => array($this, 'handle_cancel_all_orders'),
-            );
-            $method = $this->safe_value($methods, $event);
+            $method = $this->message_handler('event', $event);
             if ($method !== null) {
                 $method($client, $message);
             }
         } else {
             $arg = $this->safe_value($message, 'arg', array());
             $channel = $this->safe_string($arg, 'channel');
-            $methods = array(
-                'bbo-tbt' => array($this, 'handle_order_book'), // newly added $channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth $channel, verification not required
-                'books' => array($this, 'handle_order_book'), // all API users can subscribe, public depth $channel, verification not required
-                'books5' => array($this, 'handle_order_book'), // all API users can subscribe, public depth $channel, verification not required, data feeds will be delivered every 100ms (vs. every 200ms now)
-                'books50-l2-tbt' => array($this, 'handle_order_book'), // only users who're VIP4 and above can subscribe, identity verification required before subscription
-                'books-l2-tbt' => array($this, 'handle_order_book'), // only users who're VIP5 and above can subscribe, identity verification required before subscription
-                'tickers' => array($this, 'handle_ticker'),
-                'positions' => array($this, 'handle_positions'),
-                'index-tickers' => array($this, 'handle_ticker'),
-                'sprd-tickers' => array($this, 'handle_ticker'),
-                'block-tickers' => array($this, 'handle_ticker'),
-                'trades' => array($this, 'handle_trades'),
-                'account' => array($this, 'handle_balance'),
-                // 'margin_account' => array($this, 'handle_balance'),
-                'orders' => array($this, 'handle_orders'),
-                'orders-algo' => array($this, 'handle_orders'),
-            );
-            $method = $this->safe_value($methods, $channel);
-            if ($method === null) {
-                if (mb_strpos($channel, 'candle') === 0) {
-                    $this->handle_ohlcv($client, $message);
-                }
-            } else {
+            $method = $this->message_handler('channel', $channel);
+            if ($method !== null) {
                 $method($client, $message);
             }
         }
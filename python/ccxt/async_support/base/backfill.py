@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import random
+import asyncio
+import tempfile
+
+from ccxt.base.errors import NetworkError
+
+# -----------------------------------------------------------------------------
+# a concurrent, resumable download of the history of a fetch* method, returned by
+# Exchange.backfill() as an async generator of pages in ascending time order
+#
+#     async for page in exchange.backfill('fetchOHLCV', 'BTC/USDT', since, until, '1m', config={
+#         'concurrency': 4,                # shards fetched at the same time, under the rate limiter
+#         'shards': 16,                    # the number of time ranges, default 4 per concurrent shard
+#         'limit': 1000,                   # entries per request, default the maxEntriesPerRequest option or 1000
+#         'maxRetries': 3,                 # retries of a request failing with a NetworkError before the backfill fails
+#         'retryDelay': 1000,              # ms, the backoff of the first retry, doubled on every failed one
+#         'maxRetryDelay': 30000,          # ms, the longest backoff
+#         'checkpoint': 'btc-1m.json',     # the file with the progress, a restarted backfill resumes from it
+#     }):
+#         store(page)
+#
+# the range [since, until) is split in shards, each shard is paginated forwards from its start
+# the pages are yielded in time order, the shards ahead of the consumer are buffered, at most
+# concurrency of them at a time, the entries with the same id (or the same values when there
+# is no id) are yielded once, the entries without a timestamp are skipped, so are the entries of
+# a millisecond that has more of them than fit in a page, the since argument cannot reach them
+#
+# the requests failing with a NetworkError, RateLimitExceeded included, are retried with backoff,
+# the other errors, like BadSymbol or AuthenticationError, end the backfill at once
+#
+# a page is saved in the checkpoint as done when the next page is requested or when the
+# iteration is closed, a page being processed when the process dies is yielded again
+
+
+def entry_timestamp(entry):
+    return entry[0] if isinstance(entry, list) else entry.get('timestamp')
+
+
+def entry_key(entry):
+    if isinstance(entry, list):
+        return entry[0]
+    key = entry.get('id')
+    if key is not None:
+        return key
+    # the trades without an id are told apart by their values, nan is keyed as None
+    return tuple(None if value != value else value for value in (entry.get(name) for name in ['timestamp', 'price', 'amount', 'cost', 'side']))
+
+
+class Shard(object):
+
+    def __init__(self, start, end, cursor, keys):
+        self.start = start
+        self.end = end
+        # everything before the cursor is done, the keys are the ones with the timestamp of the cursor
+        self.cursor = cursor
+        self.keys = set(keys)
+        self.pages = asyncio.Queue()
+        self.task = None
+
+    def accept(self, page):
+        """
+        :param list page: the entries of a response
+        :returns list: the entries of the shard that are not yielded yet, the cursor is advanced past them
+        """
+        result = []
+        for entry in page:
+            timestamp = entry_timestamp(entry)
+            if timestamp is None or timestamp < self.cursor or timestamp >= self.end:
+                continue
+            key = entry_key(entry)
+            if timestamp == self.cursor:
+                if key in self.keys:
+                    continue
+            else:
+                self.cursor = timestamp
+                self.keys = set()
+            self.keys.add(key)
+            result.append(entry)
+        return result
+
+
+class Backfill(object):
+
+    def __init__(self, exchange, method, symbol, since, until, timeframe, params, config):
+        self.exchange = exchange
+        self.method = method
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.params = params
+        self.concurrency = max(1, int(config.get('concurrency', 4)))
+        self.shard_count = max(1, int(config.get('shards', self.concurrency * 4)))
+        self.limit, self.params = exchange.handle_max_entries_per_request_and_params(method, config.get('limit'), params)
+        self.max_retries = config.get('maxRetries', 3)
+        self.retry_delay = config.get('retryDelay', 1000)
+        self.max_retry_delay = config.get('maxRetryDelay', 30000)
+        self.checkpoint = config.get('checkpoint')
+        self.since = since
+        self.until = exchange.milliseconds() if until is None else until
+        self.keys = []
+        self.load()
+
+    def job(self):
+        return {
+            'exchange': self.exchange.id,
+            'method': self.method,
+            'symbol': self.symbol,
+            'timeframe': self.timeframe,
+            'until': self.until,
+        }
+
+    def load(self):
+        if self.checkpoint is None:
+            return
+        try:
+            with open(self.checkpoint) as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return
+        # a checkpoint of another backfill is ignored, and overwritten by this one
+        if not isinstance(state, dict) or state.get('job') != self.job():
+            return
+        if state['cursor'] >= self.since:
+            self.since = state['cursor']
+            # the keys of the trades without an id are saved as lists
+            self.keys = [tuple(key) if isinstance(key, list) else key for key in state['keys']]
+
+    def save(self, cursor, keys):
+        if self.checkpoint is None:
+            return
+        folder = os.path.dirname(os.path.abspath(self.checkpoint))
+        state = {'job': self.job(), 'cursor': cursor, 'keys': sorted(keys, key=str)}
+        # written to a temporary file and renamed, so that a killed process leaves the previous checkpoint
+        descriptor, temporary = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w') as file:
+                json.dump(state, file)
+            os.replace(temporary, self.checkpoint)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def split(self):
+        """
+        :returns [[int, int]]: the time ranges of the shards, aligned to the timeframe if there is one
+        """
+        duration = self.until - self.since
+        step = -(-duration // self.shard_count)
+        if self.timeframe is not None:
+            candle = self.exchange.parse_timeframe(self.timeframe) * 1000
+            step = -(-step // candle) * candle
+        ranges = []
+        start = self.since
+        while start < self.until:
+            ranges.append([start, min(start + step, self.until)])
+            start += step
+        return ranges
+
+    async def request(self, since):
+        errors = 0
+        while True:
+            try:
+                if self.timeframe is not None:
+                    return await getattr(self.exchange, self.method)(self.symbol, self.timeframe, since, self.limit, self.params)
+                return await getattr(self.exchange, self.method)(self.symbol, since, self.limit, self.params)
+            except NetworkError:
+                errors += 1
+                if errors > self.max_retries:
+                    raise
+                await asyncio.sleep(self.backoff(errors))
+
+    def backoff(self, errors):
+        # seconds, exponential in the consecutive failures and jittered
+        # so that the shards limited at the same time do not come back all at once
+        delay = min(self.max_retry_delay, self.retry_delay * 2 ** (errors - 1))
+        return random.uniform(delay / 2, delay) / 1000
+
+    async def fetch(self, shard):
+        try:
+            while shard.cursor < shard.end:
+                response = await self.request(shard.cursor)
+                if not response:
+                    break
+                page = shard.accept(response)
+                last = entry_timestamp(response[-1])
+                if page:
+                    shard.pages.put_nowait(page)
+                    if last is not None and last >= shard.end:
+                        # the responses are in ascending order, the shard is complete
+                        break
+                else:
+                    if last != shard.cursor:
+                        # past the end of the shard, or the since argument is not supported
+                        break
+                    # nothing new, the entries of a single millisecond do not fit in a page
+                    shard.cursor += 1
+                    shard.keys = set()
+            shard.pages.put_nowait(None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            shard.pages.put_nowait(e)
+
+    def start(self, shard):
+        shard.task = asyncio.ensure_future(self.fetch(shard))
+
+    async def __aiter__(self):
+        shards = []
+        for start, end in self.split():
+            shards.append(Shard(start, end, start, self.keys if start == self.since else []))
+        # the progress of the consumer, saved after every page
+        progress = Shard(self.since, self.until, self.since, self.keys)
+        try:
+            for shard in shards[:self.concurrency]:
+                self.start(shard)
+            for i in range(len(shards)):
+                shard = shards[i]
+                while True:
+                    page = await shard.pages.get()
+                    if page is None:
+                        break
+                    if isinstance(page, Exception):
+                        raise page
+                    try:
+                        yield page
+                    finally:
+                        # the consumer is done with the page when it asks for the next one or stops
+                        progress.accept(page)
+                        self.save(progress.cursor, progress.keys)
+                if i + self.concurrency < len(shards):
+                    self.start(shards[i + self.concurrency])
+                progress.cursor = shard.end
+                progress.keys = set()
+                self.save(progress.cursor, progress.keys)
+        finally:
+            for shard in shards:
+                if shard.task is not None and not shard.task.done():
+                    shard.task.cancel()
@@ -21,6 +21,7 @@ from ccxt.base.types import Int, Str, Num, Strings
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.throttler import Throttler
+from ccxt.async_support.base.backfill import Backfill
 
 # -----------------------------------------------------------------------------
 
@@ -30,13 +31,18 @@ from ccxt.base.types import OrderType, OrderSide, OrderRequest, CancellationRequ
 # -----------------------------------------------------------------------------
 
 from ccxt.base.exchange import Exchange as BaseExchange, ArgumentsRequired
+from ccxt.base.json_decoder import json_decoder
 
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.ws.functions import inflate, inflate64, gunzip
 from ccxt.async_support.base.ws.fast_client import FastClient
 from ccxt.async_support.base.ws.future import Future
-from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook
+from ccxt.async_support.base.ws.stream import Stream, current_stream
+from ccxt.async_support.base.ws.cache import BaseCache, ArrayCacheByTimestamp
+from ccxt.base.ohlcv_aggregator import OHLCVAggregator
+from ccxt.async_support.base.ws.order_book_checksum import OrderBookChecksum
+from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook, SortedOrderBook, SortedIndexedOrderBook, SortedCountedOrderBook
 
 
 # -----------------------------------------------------------------------------
@@ -78,6 +84,8 @@ class Exchange(BaseExchange):
         self.init_rest_rate_limiter()
         self.markets_loading = None
         self.reloading_markets = False
+        self.ohlcv_aggregators = {}
+        self.ws_failures = {}  # url: consecutive failures of the clients deleted after an error
 
     def init_rest_rate_limiter(self):
         self.throttle = Throttler(self.tokenBucket, self.asyncio_loop)
@@ -118,6 +126,8 @@ class Exchange(BaseExchange):
             self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, trust_env=self.aiohttp_trust_env)
 
     async def close(self):
+        if self.markets_refreshing is not None and not self.markets_refreshing.done():
+            self.markets_refreshing.cancel()
         await self.ws_close()
         if self.session is not None:
             if self.own_session:
@@ -250,17 +260,96 @@ class Exchange(BaseExchange):
             return http_response
         return response.content
 
+    async def fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
+        if self.enableRateLimit:
+            cost = self.calculate_rate_limiter_cost(api, method, path, params, config)
+            await self.throttle(cost, self.rate_limiter_buckets(api, config, cost))
+        self.lastRestRequestTimestamp = self.milliseconds()
+        request = self.sign(path, api, method, params, headers, body)
+        self.last_request_headers = request['headers']
+        self.last_request_body = request['body']
+        self.last_request_url = request['url']
+        return await self.fetch(request['url'], request['method'], request['headers'], request['body'])
+
     async def load_markets_helper(self, reload=False, params={}):
         if not reload:
             if self.markets:
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            cache = self.markets_cache()
+            if cache is not None:
+                cached = cache.load()
+                if cached is not None:
+                    payload, age = cached
+                    if cache.is_fresh(age):
+                        return cache.restore(self, payload)
+                    if cache.serve_stale:
+                        markets = cache.restore(self, payload)
+                        self.refresh_markets_cache(cache, params)
+                        return markets
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = await self.fetch_currencies()
         markets = await self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        result = self.set_markets(markets, currencies)
+        self.save_markets_cache(self.markets_cache())
+        return result
+
+    def refresh_markets_cache(self, cache, params={}):
+        # the stale markets keep being served until the new ones are fetched,
+        # set_markets() does not yield to the event loop, so they are swapped at once
+        if self.markets_refreshing is not None and not self.markets_refreshing.done():
+            return self.markets_refreshing
+
+        async def refresh():
+            try:
+                currencies = None
+                if self.has['fetchCurrencies'] is True:
+                    currencies = await self.fetch_currencies()
+                markets = await self.fetch_markets(params)
+                self.set_markets(markets, currencies)
+                self.save_markets_cache(cache)
+            except Exception as e:
+                self.logger.warning('%s could not refresh the markets cache: %s', self.id, e)
+
+        self.markets_refreshing = asyncio.ensure_future(refresh())
+        return self.markets_refreshing
+
+    def use_history_store(self):
+        fetch_ohlcv = self.fetch_ohlcv
+        fetch_trades = self.fetch_trades
+
+        async def fetch_stored_ohlcv(symbol: str, timeframe='1m', since: Int = None, limit: Int = None, params={}):
+            return await self.fetch_history(fetch_ohlcv, symbol, timeframe, since, limit, params)
+
+        async def fetch_stored_trades(symbol: str, since: Int = None, limit: Int = None, params={}):
+            return await self.fetch_history(fetch_trades, symbol, None, since, limit, params)
+
+        self.fetch_ohlcv = self.fetchOHLCV = fetch_stored_ohlcv
+        self.fetch_trades = self.fetchTrades = fetch_stored_trades
+
+    async def fetch_history_page(self, fetch, symbol, timeframe, since, limit, params={}):
+        if timeframe is None:
+            return await fetch(symbol, since, limit, params)
+        return await fetch(symbol, timeframe, since, limit, params)
+
+    async def fetch_history(self, fetch, symbol, timeframe, since, limit, params):
+        bounds = self.history_range(timeframe, since, limit, params)
+        if bounds is None:
+            return await self.fetch_history_page(fetch, symbol, timeframe, since, limit, params)
+        end, stored = bounds
+        series = self.history_series(symbol, timeframe)
+        for start, stop in series.missing(since, stored):
+            cursor = start
+            while cursor < stop:
+                response = await self.fetch_history_page(fetch, symbol, timeframe, cursor, limit)
+                cursor = self.store_history_page(series, response, cursor, stop, timeframe)
+        result = self.history_rows(series, symbol, timeframe, since, stored)
+        if end > stored:
+            response = await self.fetch_history_page(fetch, symbol, timeframe, max(since, stored), limit, params)
+            result.extend(self.filter_history_page(response, max(since, stored), end))
+        return result if limit is None else result[:limit]
 
     async def load_markets(self, reload=False, params={}):
         if (reload and not self.reloading_markets) or not self.markets_loading:
@@ -341,22 +430,49 @@ class Exchange(BaseExchange):
     def gunzip(data):
         return gunzip(data)
 
+    def sorted_order_books(self):
+        # options['watchOrderBook']['orderBookEngine'] or options['orderBookEngine']
+        # 'list' (default) keeps the levels in a plain list, 'sorted' uses blocked sorted arrays for deep books
+        return self.handle_option('watchOrderBook', 'orderBookEngine', 'list') == 'sorted'
+
     def order_book(self, snapshot={}, depth=None):
+        if self.sorted_order_books():
+            return SortedOrderBook(snapshot, depth)
         return OrderBook(snapshot, depth)
 
     def indexed_order_book(self, snapshot={}, depth=None):
+        if self.sorted_order_books():
+            return SortedIndexedOrderBook(snapshot, depth)
         return IndexedOrderBook(snapshot, depth)
 
     def counted_order_book(self, snapshot={}, depth=None):
+        if self.sorted_order_books():
+            return SortedCountedOrderBook(snapshot, depth)
         return CountedOrderBook(snapshot, depth)
 
-    def client(self, url):
+    def order_book_checksum(self, orderbook, depth, piece, interleave=True, separator=':', signed=True):
+        """
+        the crc32 of the payload of the best levels of an order book, see ccxt/async_support/base/ws/order_book_checksum.py
+        :param callable piece: piece(level, strings, ask) returns the string of a level, the one of the first call is kept by the order book
+        :returns int: the checksum
+        """
+        if orderbook.checksum is None:
+            orderbook.checksum = OrderBookChecksum(depth, piece, interleave, separator)
+        return orderbook.checksum.crc32(orderbook['bids'], orderbook['asks'], signed)
+
+    def client(self, url, shard=0):
+        """
+        :param int [shard]: the index of the connection to the url, see shard()
+        :returns Client: the connection, keyed by the url in self.clients, with a #N fragment for the extra connections of a url
+        """
         self.clients = self.clients or {}
-        if url not in self.clients:
+        key = url if shard == 0 else url + '#' + str(shard)
+        if key not in self.clients:
             on_message = self.handle_message
             on_error = self.on_error
             on_close = self.on_close
             on_connected = self.on_connected
+            on_reconnect = self.on_reconnect
             # decide client type here: aiohttp ws / websockets / signalr / socketio
             ws_options = self.safe_value(self.options, 'ws', {})
             options = self.extend(self.streaming, {
@@ -365,10 +481,81 @@ class Exchange(BaseExchange):
                 'verbose': self.verbose,
                 'throttle': Throttler(self.tokenBucket, self.asyncio_loop),
                 'asyncio_loop': self.asyncio_loop,
+                'decode_json': json_decoder(self.jsonDecoder),
+                'on_reconnect_callback': on_reconnect,
+                'key': key,
             }, ws_options)
-            self.clients[url] = FastClient(url, on_message, on_error, on_close, on_connected, options)
-            self.clients[url].proxy = self.get_ws_proxy()
-        return self.clients[url]
+            self.clients[key] = FastClient(url, on_message, on_error, on_close, on_connected, options)
+            self.clients[key].proxy = self.get_ws_proxy()
+            # the backoff of the next connection grows with the failures of the previous clients
+            self.clients[key].reconnects = self.ws_failures.pop(key, 0)
+        return self.clients[key]
+
+    def shard(self, url, subscribe_hashes, place=True):
+        """
+        the client of a subscription, options['ws']['shards'] spreads the subscriptions of a url over several connections
+        :param list subscribe_hashes: the subscriptions sent together, placed on the same connection
+        :param bool [place]: False for the message hashes watched without a subscription, they stay on the first connection unless one is already waiting for them
+        :returns Client: the connection already holding one of the subscriptions, or the least loaded one with room for them
+        """
+        options = self.safe_dict(self.safe_dict(self.options, 'ws'), 'shards')
+        if options is None:
+            return self.client(url)
+        # 'urls' restricts the sharding to the public streams when the private ones share their url
+        prefixes = self.safe_list(options, 'urls')
+        if prefixes is not None and not any(url.startswith(prefix) for prefix in prefixes):
+            return self.client(url)
+        # authenticate() logs in on the first connection of a url, and the private subscriptions
+        # cannot be told apart from the public ones, so once a url has a login the subscriptions
+        # placed afterwards go to the connection holding it, 'logins' are the subscribe hashes
+        # of the logins, 'authenticated:spot' included
+        logins = self.safe_list(options, 'logins', ['authenticated', 'auth', 'login'])
+        for subscribe_hash in subscribe_hashes:
+            if isinstance(subscribe_hash, str) and subscribe_hash.split(':')[0] in logins:
+                first = self.client(url)
+                first.login = True
+                return first
+        clients = self.clients or {}
+        connections = self.safe_integer(options, 'connections', 1)
+        maxSubscriptions = self.safe_integer(options, 'maxSubscriptions')
+        best = None
+        for i in range(0, connections):
+            client = clients.get(url if i == 0 else url + '#' + str(i))
+            if client is None:
+                load = (False, 0, 0.0)
+            else:
+                for subscribe_hash in subscribe_hashes:
+                    if subscribe_hash in client.subscriptions or subscribe_hash in client.futures:
+                        return client
+                if maxSubscriptions is not None and len(client.subscriptions) + len(subscribe_hashes) > maxSubscriptions:
+                    continue
+                # the connections that are reconnecting come last
+                load = (client.gap is not None, len(client.subscriptions), client.lag)
+            if best is None or load < best[0]:
+                best = (load, i)
+        if not place:
+            return self.client(url)
+        first = clients.get(url)
+        if first is not None and (first.login or any(login in first.subscriptions or login in first.futures for login in logins)):
+            return first
+        if best is None:
+            raise BadRequest(self.id + ' reached the limit of ' + str(maxSubscriptions) + ' subscriptions by connection on ' + str(connections) + ' connections to ' + url + ', increase options["ws"]["shards"]["connections"]')
+        return self.client(url, best[1])
+
+    def ws_metrics(self):
+        """
+        the load of the websocket connections
+        :returns dict: 'connections' with the subscriptions, the handled messages, the backlog and the lag in ms of every connection, and their totals
+        """
+        connections = [client.metrics() for client in (self.clients or {}).values()]
+        return {
+            'connections': connections,
+            'subscriptions': sum(connection['subscriptions'] for connection in connections),
+            'received': sum(connection['received'] for connection in connections),
+            'backlog': sum(connection['backlog'] for connection in connections),
+            'lag': max([connection['lag'] for connection in connections] + [0.0]),
+            'maxLag': max([connection['maxLag'] for connection in connections] + [0.0]),
+        }
 
     def get_ws_proxy(self):
         httpProxy, httpsProxy, socksProxy = self.check_ws_proxy_settings()
@@ -389,11 +576,14 @@ class Exchange(BaseExchange):
             raise NotSupported(self.id + '.handle_message() not implemented yet')
         return {}
 
-    def watch_multiple(self, url, message_hashes, message=None, subscribe_hashes=None, subscription=None):
+    def watch_multiple(self, url, message_hashes, message=None, subscribe_hashes=None, subscription=None, replay=True):
         # base exchange self.open starts the aiohttp Session in an async context
         self.open()
-        backoff_delay = 0
-        client = self.client(url)
+        client = self.shard(url, message_hashes, False) if subscribe_hashes is None else self.shard(url, subscribe_hashes)
+        backoff_delay = client.backoff() if client.reconnects else 0
+        stream = current_stream.get()
+        if stream is not None:
+            stream.attach(client, message_hashes)
 
         future = Future.race([client.future(message_hash) for message_hash in message_hashes])
 
@@ -403,36 +593,34 @@ class Exchange(BaseExchange):
                 if subscribe_hash not in client.subscriptions:
                     missing_subscriptions.append(subscribe_hash)
                     client.subscriptions[subscribe_hash] = subscription or True
+        if missing_subscriptions and message:
+            if replay:
+                client.messages[tuple(subscribe_hashes)] = message
+            else:
+                for message_hash in message_hashes:
+                    client.requests[message_hash] = subscribe_hashes
 
         connected = client.connected if client.connected.done() \
             else asyncio.ensure_future(client.connect(self.session, backoff_delay))
 
         def after(fut):
             # todo: decouple signing from subscriptions
-            options = self.safe_value(self.options, 'ws')
-            cost = self.safe_value(options, 'cost', 1)
             if message:
-                async def send_message():
-                    if self.enableRateLimit:
-                        await client.throttle(cost)
-                    try:
-                        await client.send(message)
-                    except ConnectionError as e:
-                        client.on_error(e)
-                    except Exception as e:
-                        client.on_error(e)
-                asyncio.ensure_future(send_message())
+                self.send_subscribe_message(client, message)
 
         if missing_subscriptions:
             connected.add_done_callback(after)
 
         return future
 
-    def watch(self, url, message_hash, message=None, subscribe_hash=None, subscription=None):
+    def watch(self, url, message_hash, message=None, subscribe_hash=None, subscription=None, replay=True):
         # base exchange self.open starts the aiohttp Session in an async context
         self.open()
-        backoff_delay = 0
-        client = self.client(url)
+        client = self.shard(url, [message_hash], False) if subscribe_hash is None else self.shard(url, [subscribe_hash])
+        backoff_delay = client.backoff() if client.reconnects else 0
+        stream = current_stream.get()
+        if stream is not None:
+            stream.attach(client, [message_hash])
         if subscribe_hash is None and message_hash in client.futures:
             return client.futures[message_hash]
         future = client.future(message_hash)
@@ -441,39 +629,195 @@ class Exchange(BaseExchange):
 
         if not subscribed:
             client.subscriptions[subscribe_hash] = subscription or True
+            if message:
+                # the subscriptions are replayed after a reconnection, the one-shot requests like
+                # the orders are sent once, with replay=False, and rejected if the connection drops first
+                if replay:
+                    client.messages[subscribe_hash] = message
+                else:
+                    client.requests[message_hash] = [subscribe_hash]
 
         connected = client.connected if client.connected.done() \
             else asyncio.ensure_future(client.connect(self.session, backoff_delay))
 
         def after(fut):
             # todo: decouple signing from subscriptions
-            options = self.safe_value(self.options, 'ws')
-            cost = self.safe_value(options, 'cost', 1)
             if message:
-                async def send_message():
-                    if self.enableRateLimit:
-                        await client.throttle(cost)
-                    try:
-                        await client.send(message)
-                    except ConnectionError as e:
-                        client.on_error(e)
-                    except Exception as e:
-                        client.on_error(e)
-                asyncio.ensure_future(send_message())
+                self.send_subscribe_message(client, message)
 
         if not subscribed:
             connected.add_done_callback(after)
 
         return future
 
+    def send_subscribe_message(self, client, message):
+        # with options['ws']['batch'] the messages of the watch() calls made within one turn of the loop,
+        # or within 'window' ms, are merged by merge_subscribe_messages() and throttled once per merged message
+        options = self.safe_value(self.options, 'ws')
+        batch = self.safe_dict(options, 'batch')
+        if batch is None:
+            cost = self.safe_value(options, 'cost', 1)
+
+            async def send_message():
+                if self.enableRateLimit:
+                    await client.throttle(cost)
+                try:
+                    await client.send(message)
+                except ConnectionError as e:
+                    client.on_error(e)
+                except Exception as e:
+                    client.on_error(e)
+            asyncio.ensure_future(send_message())
+            return
+        client.outbox.append(message)
+        if client.outbox_handle is None:
+            window = self.safe_integer(batch, 'window', 0)
+            if window:
+                client.outbox_handle = self.asyncio_loop.call_later(window / 1000, self.flush_subscribe_messages, client)
+            else:
+                client.outbox_handle = self.asyncio_loop.call_soon(self.flush_subscribe_messages, client)
+
+    def flush_subscribe_messages(self, client):
+        messages = client.outbox
+        client.outbox = []
+        client.outbox_handle = None
+        asyncio.ensure_future(self.send_messages(client, self.merge_subscribe_messages(messages)))
+
+    async def send_messages(self, client, messages):
+        options = self.safe_value(self.options, 'ws')
+        cost = self.safe_value(options, 'cost', 1)
+        for message in messages:
+            if self.enableRateLimit:
+                await client.throttle(cost)
+            try:
+                await client.send(message)
+            except Exception as e:
+                client.on_error(e)
+                return
+
+    def merge_subscribe_messages(self, messages):
+        """
+        the messages of a burst of subscriptions in the batched subscribe format of the exchange, by default the consecutive
+        messages that differ only by the list under options['ws']['batch']['key'] are merged, like {'op': 'subscribe', 'args': [...]}
+        :param list messages: in the order of the watch() calls
+        :returns list: the messages to send, options['ws']['batch']['size'] caps the entries of a merged list, 'ignore' lists the keys like request ids that may differ
+        """
+        batch = self.safe_dict(self.safe_dict(self.options, 'ws'), 'batch', {})
+        key = self.safe_string(batch, 'key')
+        if key is None:
+            return messages
+        size = self.safe_integer(batch, 'size')
+        ignore = self.safe_list(batch, 'ignore', [])
+        result = []
+        previous = None
+        for message in messages:
+            if not isinstance(message, dict) or not isinstance(message.get(key), list):
+                result.append(message)
+                previous = None
+                continue
+            signature = [(k, v) for k, v in message.items() if k != key and k not in ignore]
+            if previous == signature and (size is None or len(result[-1][key]) + len(message[key]) <= size):
+                result[-1][key].extend(message[key])
+            else:
+                merged = dict(message)
+                merged[key] = list(message[key])
+                result.append(merged)
+                previous = signature
+        return result
+
+    def open_stream(self, method, args=[], callback=None, symbol=None):
+        """
+        runs a watch* method once to subscribe and then feeds every further update into a bounded queue
+        :param str method: the name of the watch* method, like 'watch_trades'
+        :param list args: the arguments of the watch* method
+        :param callable [callback]: called with every update (or error) instead of queueing it
+        :param str [symbol]: keeps only the cached entries of that symbol
+        :returns Stream: an async iterator over the updates, options['stream'] sets 'maxSize' and 'overflow'('dropOldest', 'conflate' or 'block')
+        """
+        max_size = self.handle_option('stream', 'maxSize', 1000)
+        overflow = self.handle_option('stream', 'overflow', 'dropOldest')
+        stream = Stream(max_size, overflow, callback, symbol)
+        # the entries cached before the stream is opened are not emitted by its first push
+        for cache in self.stream_caches():
+            stream.seen[id(cache)] = cache._appended
+
+        async def subscribe():
+            current_stream.set(stream)
+            try:
+                await getattr(self, method)(*args)
+            except Exception as e:
+                stream.reject(e)
+                stream.close()
+
+        stream.task = asyncio.ensure_future(subscribe())
+        return stream
+
+    def stream_caches(self):
+        # the caches of the instance, like self.trades[symbol] or self.ohlcvs[symbol][timeframe]
+        values = [getattr(self, name, None) for name in ['trades', 'ohlcvs', 'orders', 'myTrades', 'positions']]
+        for depth in range(3):
+            nested = []
+            for value in values:
+                if isinstance(value, BaseCache):
+                    yield value
+                elif isinstance(value, dict) and depth < 2:
+                    nested.extend(value.values())
+            values = nested
+
+    def stream_trades(self, symbol: str, callback=None, params={}):
+        return self.open_stream('watch_trades', [symbol, None, None, params], callback, symbol)
+
+    def stream_ticker(self, symbol: str, callback=None, params={}):
+        return self.open_stream('watch_ticker', [symbol, params], callback, symbol)
+
+    def stream_order_book(self, symbol: str, limit: Int = None, callback=None, params={}):
+        return self.open_stream('watch_order_book', [symbol, limit, params], callback, symbol)
+
+    def stream_ohlcv(self, symbol: str, timeframe='1m', callback=None, params={}):
+        return self.open_stream('watch_ohlcv', [symbol, timeframe, None, None, params], callback, symbol)
+
+    def stream_orders(self, symbol: Str = None, callback=None, params={}):
+        return self.open_stream('watch_orders', [symbol, None, None, params], callback, symbol)
+
+    def stream_my_trades(self, symbol: Str = None, callback=None, params={}):
+        return self.open_stream('watch_my_trades', [symbol, None, None, params], callback, symbol)
+
+    async def watch_ohlcv_from_trades(self, symbol: str, timeframes=['1m'], since: Int = None, limit: Int = None, params={}):
+        """
+        the candles of every timeframe built from the trades of watch_trades(), for the exchanges without a candles channel
+        :returns dict: the candles by timeframe, [timestamp, open, high, low, close, volume, count]
+        """
+        aggregator = self.ohlcv_aggregators.get(symbol)
+        if aggregator is None:
+            size = self.safe_integer(self.options, 'OHLCVLimit', 1000)
+            aggregator = OHLCVAggregator({}, lambda: ArrayCacheByTimestamp(size), size)
+            self.ohlcv_aggregators[symbol] = aggregator
+        for timeframe in timeframes:
+            aggregator.add(timeframe, self.parse_timeframe(timeframe) * 1000)
+        trades = await self.watch_trades(symbol, None, None, params)
+        cache = self.safe_value(self.trades, symbol)
+        if isinstance(cache, BaseCache):
+            # the trades appended since the previous call, whatever the limit of watch_trades()
+            count = min(cache._appended - aggregator.appended, len(cache))
+            aggregator.appended = cache._appended
+            trades = cache[-count:] if count else []
+        aggregator.update(trades)
+        result = {}
+        for timeframe in timeframes:
+            candles = aggregator.candles[timeframe]
+            timeframeLimit = candles.getLimit(symbol, limit) if self.newUpdates else limit
+            result[timeframe] = self.filter_by_since_limit(candles, since, timeframeLimit, 0, True)
+        return result
+
     def on_connected(self, client, message=None):
         # for user hooks
         # print('Connected to', client.url)
         pass
 
     def on_error(self, client, error):
-        if client.url in self.clients and self.clients[client.url].error:
-            del self.clients[client.url]
+        if client.key in self.clients and self.clients[client.key].error:
+            self.ws_failures[client.key] = client.reconnects + 1
+            del self.clients[client.key]
 
     def on_close(self, client, error):
         if client.error:
@@ -481,8 +825,42 @@ class Exchange(BaseExchange):
             pass
         else:
             # server disconnected a working connection
-            if client.url in self.clients:
-                del self.clients[client.url]
+            if client.key in self.clients:
+                self.ws_failures[client.key] = client.reconnects + 1
+                del self.clients[client.key]
+
+    def on_reconnect(self, client, messages):
+        """
+        called once a client with options['ws']['reconnect'] is connected again, replays its subscriptions
+        and lets the order books synchronized with a rest snapshot be loaded again by load_order_book()
+        :param list messages: the (subscribe_hash, message) sent before the disconnection, like the authentication
+        """
+        for symbol in list(client.snapshots.keys()):
+            orderbook = self.safe_value(self.orderbooks, symbol)
+            if orderbook is not None:
+                # without a nonce the handlers cache the deltas and call load_order_book() again
+                orderbook.reset({'symbol': symbol})
+                orderbook.cache.clear()
+        client.snapshots = {}
+        replayed = []
+        for subscribe_hash, message in messages:
+            subscribe_hashes = subscribe_hash if isinstance(subscribe_hash, tuple) else [subscribe_hash]
+            # the subscriptions removed in the meantime are not replayed
+            if any(key in client.subscriptions for key in subscribe_hashes):
+                replayed.append(message)
+        if self.safe_dict(self.safe_dict(self.options, 'ws'), 'batch') is not None:
+            replayed = self.merge_subscribe_messages(replayed)
+        asyncio.ensure_future(self.send_messages(client, replayed))
+
+    def ws_gaps(self):
+        """
+        the last disconnections of the websocket clients with options['ws']['reconnect'], a gap without an end is still going on and the data of its client is stale
+        :returns list: [{'url', 'start', 'end', 'error', 'attempts'}] sorted by start
+        """
+        gaps = []
+        for client in (self.clients or {}).values():
+            gaps.extend(client.gaps)
+        return sorted(gaps, key=lambda gap: gap['start'])
 
     async def ws_close(self):
         if self.clients:
@@ -494,6 +872,7 @@ class Exchange(BaseExchange):
         if symbol not in self.orderbooks:
             client.reject(ExchangeError(self.id + ' loadOrderBook() orderbook is not initiated'), messageHash)
             return
+        client.snapshots[symbol] = messageHash
         try:
             maxRetries = self.handle_option('watchOrderBook', 'maxRetries', 3)
             tries = 0
@@ -510,7 +889,7 @@ class Exchange(BaseExchange):
                     return
                 tries += 1
             client.reject(ExchangeError(self.id + ' nonce is behind cache after ' + str(maxRetries) + ' tries.'), messageHash)
-            del self.clients[client.url]
+            del self.clients[client.key]
         except BaseError as e:
             client.reject(e, messageHash)
             await self.load_order_book(client, messageHash, symbol, limit, params)
@@ -520,6 +899,38 @@ class Exchange(BaseExchange):
             return '0e-00'
         return format(n, 'g')
 
+    def backfill(self, method: str, symbol: Str = None, since: Int = None, until: Int = None, timeframe: Str = None, params={}, config={}):
+        """
+        the history of a paginated fetch* method from since to until, see ccxt/async_support/base/backfill.py
+        :param str method: like 'fetchOHLCV', 'fetchTrades' or 'fetchFundingRateHistory'
+        :param str [timeframe]: required by fetchOHLCV, the shards are aligned to it
+        :param dict [config]: concurrency, shards, limit, maxRetries, retryDelay, maxRetryDelay and checkpoint, extends options['backfill']
+        :returns AsyncIterator[list]: the pages of unique entries in ascending time order
+        """
+        if since is None:
+            raise ArgumentsRequired(self.id + ' backfill() requires a since argument')
+        config = self.extend(self.safe_dict(self.options, 'backfill', {}), config)
+        return Backfill(self, method, symbol, since, until, timeframe, params, config)
+
+    async def fetch_many(self, calls, params={}):
+        """
+        runs public unified calls concurrently, their requests still go through the rate limiter of the instance
+        the private calls are not safe to run this way, their nonces can reach the exchange out of order,
+        and last_http_response, last_json_response and last_response_headers are those of any of the calls
+        :param list calls: the calls, like ['fetch_ticker', 'BTC/USDT'], a method name followed by its arguments
+        :param dict [params]: 'workers' the number of calls running at once, default 10, 'returnExceptions' to return the exceptions in place of the results instead of raising the first one, 'loadMarkets' False to skip loading the markets once before the calls
+        :returns list: the results in the order of the calls
+        """
+        semaphore = asyncio.Semaphore(self.safe_integer(params, 'workers', 10))
+        if self.safe_bool(params, 'loadMarkets', True):
+            await self.load_markets()
+
+        async def run(call):
+            async with semaphore:
+                return await getattr(self, call[0])(*call[1:])
+
+        return await asyncio.gather(*[run(call) for call in calls], return_exceptions=self.safe_bool(params, 'returnExceptions', False))
+
     # ########################################################################
     # ########################################################################
     # ########################################################################
@@ -801,7 +1212,7 @@ class Exchange(BaseExchange):
                 self.options['limitsLoaded'] = self.milliseconds()
         return self.markets
 
-    async def fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
+    async def transpiled_fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
         if self.enableRateLimit:
             cost = self.calculate_rate_limiter_cost(api, method, path, params, config)
             await self.throttle(cost)
@@ -12,6 +12,7 @@ from ccxt import NetworkError, RequestTimeout, ExchangeClosedByUser
 class AiohttpClient(Client):
 
     proxy = None
+    decode_json = staticmethod(json.loads)  # takes str or bytes
 
     def closed(self):
         return (self.connection is None) or self.connection.closed
@@ -24,8 +25,13 @@ class AiohttpClient(Client):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'message', data)
         if isinstance(data, bytes):
-            data = data.decode()
-        decoded = json.loads(data) if is_json_encoded_object(data) else data
+            # json is decoded straight from the bytes, anything else is passed on as text
+            if len(data) >= 2 and data[0] in b'{[':
+                decoded = self.decode_json(data)
+            else:
+                decoded = data.decode()
+        else:
+            decoded = self.decode_json(data) if is_json_encoded_object(data) else data
         self.on_message_callback(self, decoded)
 
     def handle_message(self, message):
@@ -85,6 +91,15 @@ class AiohttpClient(Client):
     async def close(self, code=1000):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'closing', code)
+        # closed by the user or after an error, not reconnected
+        self.reconnect = False
+        self.isConnected = False
+        if self.reconnecting is not None:
+            self.reconnecting.cancel()
+            self.reconnecting = None
+        if self.outbox_handle is not None:
+            self.outbox_handle.cancel()
+            self.outbox_handle = None
         if not self.closed():
             await self.connection.close()
         # these will end automatically once self.closed() = True
@@ -101,6 +116,19 @@ class AiohttpClient(Client):
                 else:
                     future.reject(ExchangeClosedByUser('Connection closed by the user'))
 
+    async def disconnect(self):
+        # closes the connection before a reconnection, the futures are kept
+        if self.ping_looper:
+            self.ping_looper.cancel()
+        if self.receive_looper:
+            self.receive_looper.cancel()
+        self.lastPong = None
+        if not self.closed():
+            try:
+                await self.connection.close()
+            except Exception:
+                pass
+
     async def ping_loop(self):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'ping loop')
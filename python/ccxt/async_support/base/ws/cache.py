@@ -28,6 +28,7 @@ class BaseCache(list):
         super(BaseCache, self).__init__()
         self.max_size = max_size
         self._deque = collections.deque([], max_size)
+        self._appended = 0  # total number of appends, used by streams
 
     def __eq__(self, other):
         return list(self) == other
@@ -83,6 +84,7 @@ class ArrayCache(BaseCache):
             return new_updates_value
 
     def append(self, item):
+        self._appended += 1
         self._deque.append(item)
         if self._clear_all_updates:
             self._clear_all_updates = False
@@ -111,6 +113,7 @@ class ArrayCacheByTimestamp(BaseCache):
         return min(self._new_updates, limit)
 
     def append(self, item):
+        self._appended += 1
         if item[0] in self.hashmap:
             reference = self.hashmap[item[0]]
             if reference != item:
@@ -128,85 +131,109 @@ class ArrayCacheByTimestamp(BaseCache):
         self._new_updates = len(self._size_tracker)
 
 
-class ArrayCacheBySymbolById(ArrayCache):
-    def __init__(self, max_size=None):
-        super(ArrayCacheBySymbolById, self).__init__(max_size)
-        self._nested_new_updates_by_symbol = True
-        self.hashmap = {}
-        self._index = collections.deque([], max_size)
+class IndexedDeque:
+    # the items of a cache in the order of their last update, indexed by key, so that updating an
+    # item, moving it to the end and evicting the oldest one are O(1), the list of the items is
+    # built again on the first access by position after a change
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self._items = collections.OrderedDict()
+        self._list = None
 
-    def append(self, item):
-        by_id = self.hashmap.setdefault(item['symbol'], {})
-        if item['id'] in by_id:
-            reference = by_id[item['id']]
-            if reference != item:
-                reference.update(item)
-            item = reference
-            index = self._index.index(item['id'])
-            del self._deque[index]
-            del self._index[index]
-        else:
-            by_id[item['id']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
-            del self.hashmap[delete_item['symbol']][delete_item['id']]
-        self._deque.append(item)
-        self._index.append(item['id'])
-        if self._clear_all_updates:
-            self._clear_all_updates = False
-            self._clear_updates_by_symbol.clear()
-            self._all_new_updates = 0
-            self._new_updates_by_symbol.clear()
-        if item['symbol'] not in self._new_updates_by_symbol:
-            self._new_updates_by_symbol[item['symbol']] = set()
-        if self._clear_updates_by_symbol.get(item['symbol']):
-            self._clear_updates_by_symbol[item['symbol']] = False
-            self._new_updates_by_symbol[item['symbol']].clear()
-        id_set = self._new_updates_by_symbol[item['symbol']]
-        before_length = len(id_set)
-        id_set.add(item['id'])
-        after_length = len(id_set)
-        self._all_new_updates = (self._all_new_updates or 0) + (after_length - before_length)
+    def __len__(self):
+        return len(self._items)
 
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __reversed__(self):
+        return reversed(self._items.values())
+
+    def __contains__(self, item):
+        return any(value is item or value == item for value in self._items.values())
+
+    def __getitem__(self, index):
+        if self._list is None:
+            self._list = list(self._items.values())
+        return self._list[index]
+
+    def __setitem__(self, index, item):
+        self._items[list(self._items)[index]] = item
+        self._list = None
+
+    def __delitem__(self, index):
+        del self._items[list(self._items)[index]]
+        self._list = None
+
+    def clear(self):
+        self._items.clear()
+        self._list = None
+
+    def put(self, key, item):
+        # returns the key and the item that were evicted to make room, if any
+        items = self._items
+        self._list = None
+        if key in items:
+            items[key] = item
+            items.move_to_end(key)
+            return None
+        evicted = None
+        if self.maxlen is not None and len(items) == self.maxlen:
+            evicted = items.popitem(last=False)
+        items[key] = item
+        return evicted
+
+    def popleft(self):
+        self._list = None
+        return self._items.popitem(last=False)[1]
+
+
+class ArrayCacheBySymbolByKey(ArrayCache):
+    # the last update of every item by symbol and key, in the order of the updates
+    key = None
 
-class ArrayCacheBySymbolBySide(ArrayCache):
     def __init__(self, max_size=None):
-        super(ArrayCacheBySymbolBySide, self).__init__(max_size)
+        super(ArrayCacheBySymbolByKey, self).__init__(max_size)
         self._nested_new_updates_by_symbol = True
         self.hashmap = {}
-        self._index = collections.deque([], max_size)
+        self._deque = IndexedDeque(max_size)
 
     def append(self, item):
-        by_side = self.hashmap.setdefault(item['symbol'], {})
-        if item['side'] in by_side:
-            reference = by_side[item['side']]
+        self._appended += 1
+        symbol = item['symbol']
+        key = item[self.key]
+        by_key = self.hashmap.setdefault(symbol, {})
+        if key in by_key:
+            reference = by_key[key]
             if reference != item:
                 reference.update(item)
             item = reference
-            index = self._index.index(item['side'])
-            del self._deque[index]
-            del self._index[index]
         else:
-            by_side[item['side']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
-            del self.hashmap[delete_item['symbol']][delete_item['side']]
-        self._deque.append(item)
-        self._index.append(item['side'])
+            by_key[key] = item
+        evicted = self._deque.put((symbol, key), item)
+        if evicted is not None:
+            evicted_symbol, evicted_key = evicted[0]
+            del self.hashmap[evicted_symbol][evicted_key]
         if self._clear_all_updates:
             self._clear_all_updates = False
             self._clear_updates_by_symbol.clear()
             self._all_new_updates = 0
             self._new_updates_by_symbol.clear()
-        if item['symbol'] not in self._new_updates_by_symbol:
-            self._new_updates_by_symbol[item['symbol']] = set()
-        if self._clear_updates_by_symbol.get(item['symbol']):
-            self._clear_updates_by_symbol[item['symbol']] = False
-            self._new_updates_by_symbol[item['symbol']].clear()
-        side_set = self._new_updates_by_symbol[item['symbol']]
-        before_length = len(side_set)
-        side_set.add(item['side'])
-        after_length = len(side_set)
+        if symbol not in self._new_updates_by_symbol:
+            self._new_updates_by_symbol[symbol] = set()
+        if self._clear_updates_by_symbol.get(symbol):
+            self._clear_updates_by_symbol[symbol] = False
+            self._new_updates_by_symbol[symbol].clear()
+        key_set = self._new_updates_by_symbol[symbol]
+        before_length = len(key_set)
+        key_set.add(key)
+        after_length = len(key_set)
         self._all_new_updates = (self._all_new_updates or 0) + (after_length - before_length)
+
+
+class ArrayCacheBySymbolById(ArrayCacheBySymbolByKey):
+    key = 'id'
+
+
+class ArrayCacheBySymbolBySide(ArrayCacheBySymbolByKey):
+    key = 'side'
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from asyncio import sleep, ensure_future, wait_for, TimeoutError
+import random
+from time import monotonic
+from asyncio import sleep, ensure_future, wait_for, TimeoutError, get_event_loop
 from .functions import milliseconds, iso8601, deep_extend
 from ccxt import NetworkError, RequestTimeout, NotSupported
 from ccxt.async_support.base.ws.future import Future
@@ -9,6 +11,8 @@ from ccxt.async_support.base.ws.future import Future
 class Client(object):
 
     url = None
+    key = None  # the key of the client in Exchange.clients, the url with a #N fragment for the extra connections of a url
+    login = False  # a login went through this connection, the next subscriptions of its url are not sharded, see Exchange.shard()
     ws = None
     futures = {}
     options = {}  # ws-specific options
@@ -38,13 +42,46 @@ class Client(object):
     asyncio_loop = None
     ping_looper = None
     receive_looper = None
+    conflate = None  # 'latest' or milliseconds, wakes up waiters once per loop turn or interval
+    conflated = {}  # message_hash: number of updates merged into the last resolution
+    pending = {}  # message_hash: [result, updates] awaiting the conflated resolution
+    streams = {}  # message_hash: [Stream] fed directly on every resolution
+    flush_handle = None
+    last_flush = 0
+    reconnect = False  # reconnect with backoff and replay the subscriptions instead of rejecting the waiters
+    reconnectDelay = 1000  # ms, the backoff of the first attempt, doubled on every failed one
+    maxReconnectDelay = 30000  # ms
+    maxReconnects = 10  # consecutive failed attempts before the waiters are rejected, None to retry forever
+    reconnects = 0  # consecutive failed connection attempts
+    reconnecting = None  # the reconnection task
+    on_reconnect_callback = None
+    session = None
+    messages = {}  # subscribe_hash: the message sent for the subscription, replayed after a reconnection
+    requests = {}  # message_hash: the subscribe hashes of the one-shot requests waiting for their response, see Exchange.watch()
+    snapshots = {}  # symbol: message_hash of the order books synchronized with a rest snapshot
+    gaps = []  # the last disconnections, {'url', 'start', 'end', 'error', 'attempts'}
+    gap = None  # the disconnection going on, the data of the client is stale until it ends
+    received = 0  # messages handled
+    lag = 0.0  # ms between the arrival of a message and its handling, moving average
+    maxLag = 0.0  # ms
+    outbox = []  # the subscribe messages waiting to be merged and sent, see Exchange.send_subscribe_message()
+    outbox_handle = None
 
     def __init__(self, url, on_message_callback, on_error_callback, on_close_callback, on_connected_callback, config={}):
         defaults = {
             'url': url,
+            'key': url,
             'futures': {},
             'subscriptions': {},
             'rejections': {},
+            'conflated': {},
+            'pending': {},
+            'streams': {},
+            'messages': {},
+            'requests': {},
+            'snapshots': {},
+            'gaps': [],
+            'outbox': [],
             'on_message_callback': on_message_callback,
             'on_error_callback': on_error_callback,
             'on_close_callback': on_close_callback,
@@ -73,14 +110,85 @@ class Client(object):
     def resolve(self, result, message_hash):
         if self.verbose and message_hash is None:
             self.log(iso8601(milliseconds()), 'resolve received None messageHash')
+        if message_hash in self.streams:
+            for stream in self.streams[message_hash]:
+                stream.push(result)
+        self.requests.pop(message_hash, None)
+        if self.conflate:
+            return self.conflate_result(result, message_hash)
         if message_hash in self.futures:
             future = self.futures[message_hash]
             future.resolve(result)
             del self.futures[message_hash]
         return result
 
+    def conflate_result(self, result, message_hash):
+        # the handlers have already applied the update to result,
+        # only the wakeup of the waiters is postponed and merged
+        if message_hash in self.pending:
+            pending = self.pending[message_hash]
+            pending[0] = result
+            pending[1] += 1
+        else:
+            self.pending[message_hash] = [result, 1]
+        if self.flush_handle is None:
+            loop = self.asyncio_loop or get_event_loop()
+            if self.conflate == 'latest':
+                self.flush_handle = loop.call_soon(self.flush)
+            else:
+                delay = max(0, self.last_flush + self.conflate - milliseconds())
+                self.flush_handle = loop.call_later(delay / 1000, self.flush)
+        return result
+
+    def flush(self):
+        if self.conflate == 'latest' and self.backlog():
+            # wait for the buffered messages to be handled first
+            self.flush_handle = (self.asyncio_loop or get_event_loop()).call_soon(self.flush)
+            return
+        self.flush_handle = None
+        self.last_flush = milliseconds()
+        pending = self.pending
+        self.pending = {}
+        for message_hash in pending:
+            result, updates = pending[message_hash]
+            self.conflated[message_hash] = updates
+            if message_hash in self.futures:
+                future = self.futures[message_hash]
+                future.resolve(result)
+                del self.futures[message_hash]
+
+    def backlog(self):
+        # number of received messages that are not handled yet
+        return 0
+
+    def measure(self, received):
+        # received is the monotonic() time of the arrival of the message about to be handled
+        lag = (monotonic() - received) * 1000
+        self.received += 1
+        self.lag += (lag - self.lag) * 0.05
+        if lag > self.maxLag:
+            self.maxLag = lag
+
+    def metrics(self):
+        return {
+            'url': self.url,
+            'connected': self.isConnected,
+            'stale': self.gap is not None,
+            'subscriptions': len(self.subscriptions),
+            'received': self.received,
+            'backlog': self.backlog(),
+            'lag': self.lag,
+            'maxLag': self.maxLag,
+        }
+
     def reject(self, result, message_hash=None):
+        if message_hash in self.pending:
+            del self.pending[message_hash]
+        if message_hash in self.streams:
+            for stream in self.streams[message_hash]:
+                stream.reject(result)
         if message_hash:
+            self.requests.pop(message_hash, None)
             if message_hash in self.futures:
                 future = self.futures[message_hash]
                 future.reject(result)
@@ -91,6 +199,10 @@ class Client(object):
             message_hashes = list(self.futures.keys())
             for message_hash in message_hashes:
                 self.reject(result, message_hash)
+            for message_hash in list(self.streams.keys()):
+                if message_hash not in message_hashes:
+                    for stream in self.streams[message_hash]:
+                        stream.reject(result)
         return result
 
     async def receive_loop(self):
@@ -100,12 +212,16 @@ class Client(object):
             try:
                 message = await self.receive()
                 # self.log(iso8601(milliseconds()), 'received', message)
+                self.measure(monotonic())
                 self.handle_message(message)
             except Exception as e:
                 error = NetworkError(str(e))
                 if self.verbose:
                     self.log(iso8601(milliseconds()), 'receive_loop', 'Exception', error)
-                self.reset(error)
+                if self.reconnect:
+                    self.on_disconnect(error)
+                else:
+                    self.reset(error)
 
     async def open(self, session, backoff_delay=0):
         # exponential backoff for consequent connections if necessary
@@ -120,6 +236,7 @@ class Client(object):
             self.connecting = False
             self.connectionEstablished = milliseconds()
             self.isConnected = True
+            self.reconnects = 0
             if self.verbose:
                 self.log(iso8601(milliseconds()), 'connected')
             self.connected.resolve(self.url)
@@ -143,6 +260,7 @@ class Client(object):
     def connect(self, session, backoff_delay=0):
         if not self.connection and not self.connecting:
             self.connecting = True
+            self.session = session
             ensure_future(self.open(session, backoff_delay), loop=self.asyncio_loop)
         return self.connected
 
@@ -150,6 +268,9 @@ class Client(object):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'on_error', error)
         self.error = error
+        if self.reconnect:
+            self.on_disconnect(error)
+            return
         self.reset(error)
         self.on_error_callback(self, error)
         if not self.closed():
@@ -158,14 +279,82 @@ class Client(object):
     def on_close(self, code):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'on_close', code)
+        if self.reconnect:
+            self.on_disconnect(self.error or NetworkError('Connection closed by remote server, closing code ' + str(code)))
+            return
         if not self.error:
             self.reset(NetworkError('Connection closed by remote server, closing code ' + str(code)))
         self.on_close_callback(self, code)
         if not self.closed():
             ensure_future(self.close(code), loop=self.asyncio_loop)
 
+    def backoff(self):
+        # seconds, exponential in the consecutive failures and jittered
+        # so that the clients dropped by an outage do not come back all at once
+        delay = min(self.maxReconnectDelay, self.reconnectDelay * 2 ** max(self.reconnects - 1, 0))
+        return random.uniform(delay / 2, delay) / 1000
+
+    def on_disconnect(self, error):
+        # the waiters and the streams are kept while the connection is restored
+        if self.reconnecting is not None:
+            return
+        if self.verbose:
+            self.log(iso8601(milliseconds()), 'reconnecting', error)
+        self.isConnected = False
+        self.gap = {'url': self.url, 'start': milliseconds(), 'end': None, 'error': error, 'attempts': 0}
+        self.gaps.append(self.gap)
+        del self.gaps[:-100]
+        # the one-shot requests cannot be answered anymore, they may or may not have been executed
+        for message_hash, subscribe_hashes in list(self.requests.items()):
+            for subscribe_hash in subscribe_hashes:
+                self.subscriptions.pop(subscribe_hash, None)
+            self.reject(NetworkError('Connection lost before the response to ' + message_hash), message_hash)
+        # the messages sent until now are replayed, the watch() calls made
+        # during the reconnection send their own once connected
+        messages = list(self.messages.items())
+        self.connected = Future()
+        self.connecting = True
+        self.reconnecting = ensure_future(self.reconnect_loop(messages), loop=self.asyncio_loop)
+
+    async def reconnect_loop(self, messages):
+        await self.disconnect()
+        while self.maxReconnects is None or self.reconnects < self.maxReconnects:
+            self.reconnects += 1
+            self.gap['attempts'] = self.reconnects
+            await sleep(self.backoff())
+            self.connection = None
+            await self.open(self.session)
+            if self.isConnected:
+                self.gap['end'] = milliseconds()
+                self.gap = None
+                self.error = None
+                self.reconnecting = None
+                if self.on_reconnect_callback:
+                    self.on_reconnect_callback(self, messages)
+                return
+        # given up, the waiters are rejected with the last error
+        error = self.error or self.gap['error']
+        self.error = error
+        self.gap = None
+        self.reconnecting = None
+        self.connecting = False
+        self.reset(error)
+        self.on_error_callback(self, error)
+
     def reset(self, error):
+        self.pending.clear()
         self.reject(error)
+        # the streams end after the error, the connection is gone
+        for streams in list(self.streams.values()):
+            for stream in list(streams):
+                stream.close()
+
+    def pause_reading(self):
+        # backpressure from streams with the 'block' overflow policy
+        pass
+
+    def resume_reading(self):
+        pass
 
     async def ping_loop(self):
         if self.verbose:
@@ -186,6 +375,9 @@ class Client(object):
     async def close(self, code=1000):
         raise NotSupported('close() not implemented')
 
+    async def disconnect(self):
+        raise NotSupported('disconnect() not implemented')
+
     def create_connection(self, session):
         raise NotSupported('create_connection() not implemented')
 
@@ -3,6 +3,7 @@
 import asyncio
 import socket
 import collections
+from time import monotonic
 from ccxt.async_support.base.ws.aiohttp_client import AiohttpClient
 
 
@@ -21,7 +22,8 @@ class FastClient(AiohttpClient):
             if not self.stack:
                 self.callback_scheduled = False
                 return
-            message = self.stack.popleft()
+            message, received = self.stack.popleft()
+            self.measure(received)
             try:
                 self.handle_message(message)
             except Exception as error:
@@ -32,7 +34,7 @@ class FastClient(AiohttpClient):
             if not self.callback_scheduled:
                 self.callback_scheduled = True
                 self.asyncio_loop.call_soon(handler)
-            self.stack.append(message)
+            self.stack.append((message, monotonic()))
 
         def feed_eof():
             if self._close_code == 1000:  # OK close
@@ -43,7 +45,9 @@ class FastClient(AiohttpClient):
         def wrapper(func):
             def parse_frame(buf):
                 while self.stack:
-                    self.handle_message(self.stack.popleft())
+                    message, received = self.stack.popleft()
+                    self.measure(received)
+                    self.handle_message(message)
                 return func(buf)
             return parse_frame
 
@@ -89,6 +93,25 @@ class FastClient(AiohttpClient):
         # return a future so super class won't complain
         return asyncio.sleep(0)
 
+    def backlog(self):
+        return len(self.stack)
+
+    def pause_reading(self):
+        if self.transport:
+            self.transport.pause_reading()
+
+    def resume_reading(self):
+        if self.transport and not self.transport.is_closing():
+            self.transport.resume_reading()
+
+    async def disconnect(self):
+        if self.transport:
+            self.transport.abort()
+        await super(FastClient, self).disconnect()
+        if self.connection is not None:
+            # the close above does not release the response after a failed close handshake
+            self.connection._response.close()
+
     def reset(self, error):
         super(FastClient, self).reset(error)
         self.stack.clear()
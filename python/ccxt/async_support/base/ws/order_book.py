@@ -6,6 +6,8 @@ import sys
 
 
 class OrderBook(dict):
+    checksum = None  # the OrderBookChecksum of Exchange.order_book_checksum()
+
     def __init__(self, snapshot={}, depth=None):
         self.cache = []
         depth = depth or sys.maxsize
@@ -32,12 +34,16 @@ class OrderBook(dict):
         self['bids'].limit()
         return self
 
+    def as_arrays(self, limit=None):
+        # float64 price/size columns with vectorized depth helpers, requires numpy
+        # imported here to keep numpy out of the import time of ccxt.pro
+        from ccxt.async_support.base.ws.order_book_arrays import OrderBookArrays
+        return OrderBookArrays(self, limit)
+
     def reset(self, snapshot={}):
-        self['asks']._index.clear()
         self['asks'].clear()
         for ask in snapshot.get('asks', []):
             self['asks'].storeArray(ask)
-        self['bids']._index.clear()
         self['bids'].clear()
         for bid in snapshot.get('bids', []):
             self['bids'].storeArray(bid)
@@ -76,3 +82,33 @@ class IndexedOrderBook(OrderBook):
             'bids': order_book_side.IndexedBids(snapshot.get('bids', []), depth),
         })
         super(IndexedOrderBook, self).__init__(copy, depth)
+
+# -----------------------------------------------------------------------------
+# same books backed by blocked sorted arrays, see SortedOrderBookSide
+
+
+class SortedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.SortedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.SortedBids(snapshot.get('bids', []), depth),
+        })
+        super(SortedOrderBook, self).__init__(copy, depth)
+
+
+class SortedCountedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.SortedCountedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.SortedCountedBids(snapshot.get('bids', []), depth),
+        })
+        super(SortedCountedOrderBook, self).__init__(copy, depth)
+
+
+class SortedIndexedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.SortedIndexedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.SortedIndexedBids(snapshot.get('bids', []), depth),
+        })
+        super(SortedIndexedOrderBook, self).__init__(copy, depth)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+from operator import itemgetter
+from ccxt.base.errors import BadRequest, NotSupported
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# -----------------------------------------------------------------------------
+# contiguous float64 price and size columns of an order book
+# best levels first: bids descending, asks ascending
+# works for any unified order book, streamed or fetched over REST
+
+price_of = itemgetter(0)
+size_of = itemgetter(1)
+
+
+def columns(levels, limit=None):
+    if limit is not None:
+        levels = levels[:limit]
+    count = len(levels)
+    # itemgetter keeps the loop in C and reuses the existing float objects
+    prices = np.fromiter(map(price_of, levels), np.float64, count)
+    sizes = np.fromiter(map(size_of, levels), np.float64, count)
+    return prices, sizes
+
+
+class OrderBookArrays(object):
+    def __init__(self, orderbook, limit=None):
+        if np is None:
+            raise NotSupported('OrderBookArrays requires the "numpy" module that can be installed by "pip install ccxt[numpy]"')
+        self.bid_prices, self.bid_sizes = columns(orderbook['bids'], limit)
+        self.ask_prices, self.ask_sizes = columns(orderbook['asks'], limit)
+        self.symbol = orderbook.get('symbol')
+        self.timestamp = orderbook.get('timestamp')
+        self.nonce = orderbook.get('nonce')
+
+    def levels(self, side):
+        # the levels consumed by a market order of that side
+        if side == 'buy':
+            return self.ask_prices, self.ask_sizes
+        elif side == 'sell':
+            return self.bid_prices, self.bid_sizes
+        raise BadRequest('OrderBookArrays side must be "buy" or "sell"')
+
+    def mid(self):
+        if not len(self.bid_prices) or not len(self.ask_prices):
+            return None
+        return float((self.bid_prices[0] + self.ask_prices[0]) / 2)
+
+    def microprice(self):
+        # mid price weighted by the size imbalance at the top of the book
+        if not len(self.bid_prices) or not len(self.ask_prices):
+            return None
+        bid_size = self.bid_sizes[0]
+        ask_size = self.ask_sizes[0]
+        total = bid_size + ask_size
+        if not total:
+            return self.mid()
+        return float((self.bid_prices[0] * ask_size + self.ask_prices[0] * bid_size) / total)
+
+    def cumulative_depth(self, side, quote=False):
+        # running base amount (or quote cost) available up to every level
+        prices, sizes = self.levels(side)
+        return np.cumsum(prices * sizes if quote else sizes)
+
+    def vwap(self, side, amount):
+        # average fill price of a market order for a base amount
+        # returns None if the book is too thin to fill it
+        prices, sizes = self.levels(side)
+        depth = np.cumsum(sizes)
+        if not len(depth) or depth[-1] < amount:
+            return None
+        if amount <= 0:
+            return float(prices[0])
+        index = int(np.searchsorted(depth, amount))
+        before = depth[index - 1] if index else 0.0
+        cost = np.dot(prices[:index], sizes[:index]) + prices[index] * (amount - before)
+        return float(cost / amount)
+
+    def price_impact(self, side, notional):
+        # relative distance of the average fill price of a market order
+        # worth notional (in quote currency) from the mid price
+        # returns None if the book is too thin to fill it
+        prices, sizes = self.levels(side)
+        costs = np.cumsum(prices * sizes)
+        mid = self.mid()
+        if mid is None or not len(costs) or costs[-1] < notional:
+            return None
+        if notional <= 0:
+            return abs(float(prices[0]) - mid) / mid
+        index = int(np.searchsorted(costs, notional))
+        before = costs[index - 1] if index else 0.0
+        filled = sizes[:index].sum() + (notional - before) / prices[index]
+        average = notional / filled
+        return abs(float(average) - mid) / mid
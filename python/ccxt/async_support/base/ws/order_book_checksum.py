@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+import zlib
+
+# -----------------------------------------------------------------------------
+# the crc32 of the payload built from the best levels of an order book, like the checksums of
+# kraken, okx, bitget and bitfinex, computed again for the changed part of the payload only
+#
+# the payload is made of one piece per level, the piece of a level is formatted once and
+# cached while the level does not change, and the crc32 of every prefix of the payload is
+# kept, so that an update starts from the crc32 of the pieces in front of the first change
+#
+#     checksum = OrderBookChecksum(25, lambda level, strings, ask: strings[0] + ':' + strings[1])
+#     checksum.crc32(orderbook['bids'], orderbook['asks'], True)
+#
+# the strings of a level are the original strings of its price and size, kept by
+# OrderBookSide.storeWithStrings(), or None for the levels stored without them
+
+
+class OrderBookChecksum(object):
+
+    def __init__(self, depth, piece, interleave=True, separator=':'):
+        """
+        :param int depth: the number of levels of every side in the payload
+        :param callable piece: piece(level, strings, ask) returns the string of a level
+        :param bool [interleave]: True for the bids and asks one level after the other, False for the asks then the bids
+        :param str [separator]: between the pieces
+        """
+        self.depth = depth
+        self.piece = piece
+        self.interleave = interleave
+        self.separator = separator.encode()
+        self.cache = ({}, {})  # the encoded pieces of the bids and the asks by level
+        self.pieces = []
+        self.crcs = []  # the crc32 of the payload up to every piece
+
+    def encoded(self, side, ask):
+        cache = self.cache[ask]
+        if len(cache) > 4 * self.depth:
+            cache.clear()
+        strings = side.strings if hasattr(side, 'strings') else None
+        result = []
+        for level in side[:self.depth]:
+            level_strings = strings.get(level[0]) if strings else None
+            key = level_strings or tuple(level)
+            piece = cache.get(key)
+            if piece is None:
+                piece = cache[key] = self.piece(level, level_strings, ask).encode()
+            result.append(piece)
+        return result
+
+    def crc32(self, bids, asks, signed=False):
+        bid_pieces = self.encoded(bids, False)
+        ask_pieces = self.encoded(asks, True)
+        if self.interleave:
+            pieces = []
+            for i in range(max(len(bid_pieces), len(ask_pieces))):
+                if i < len(bid_pieces):
+                    pieces.append(bid_pieces[i])
+                if i < len(ask_pieces):
+                    pieces.append(ask_pieces[i])
+        else:
+            pieces = ask_pieces + bid_pieces
+        previous = self.pieces
+        crcs = self.crcs
+        start = 0
+        length = min(len(pieces), len(previous))
+        while start < length and pieces[start] is previous[start]:
+            start += 1
+        del crcs[start:]
+        crc = crcs[-1] if crcs else 0
+        separator = self.separator
+        for i in range(start, len(pieces)):
+            if i and separator:
+                crc = zlib.crc32(separator, crc)
+            crc = zlib.crc32(pieces[i], crc)
+            crcs.append(crc)
+        self.pieces = pieces
+        if signed and crc >= 0x80000000:
+            return crc - 0x100000000
+        return crc
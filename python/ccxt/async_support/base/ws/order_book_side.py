@@ -2,6 +2,7 @@
 
 import sys
 import bisect
+import itertools
 
 """Author: Carlo Revelli"""
 """Fast bisect bindings"""
@@ -11,6 +12,7 @@ import bisect
 
 class OrderBookSide(list):
     side = None  # set to True for bids and False for asks
+    strings = None  # the original price and size strings of the levels by price, see storeWithStrings()
 
     def __init__(self, deltas=[], depth=None):
         super(OrderBookSide, self).__init__()
@@ -39,6 +41,19 @@ class OrderBookSide(list):
     def store(self, price, size):
         self.storeArray([price, size])
 
+    def storeWithStrings(self, price, size, price_string, size_string):
+        # keeps the strings the level was parsed from, for the checksums of the exchanges
+        if self.strings is None:
+            self.strings = {}
+        if size:
+            self.strings[price] = (price_string, size_string)
+        else:
+            self.strings.pop(price, None)
+        self.storeArray([price, size])
+
+    def levelStrings(self, price):
+        return self.strings.get(price) if self.strings else None
+
     def limit(self):
         difference = len(self) - self._depth
         for _ in range(difference):
@@ -46,7 +61,14 @@ class OrderBookSide(list):
             self._index.pop()
 
     def remove_index(self, order):
-        pass
+        if self.strings:
+            self.strings.pop(order[0], None)
+
+    def clear(self):
+        self._index.clear()
+        if self.strings:
+            self.strings.clear()
+        super(OrderBookSide, self).clear()
 
     def __len__(self):
         length = super(OrderBookSide, self).__len__()
@@ -160,6 +182,239 @@ class IndexedOrderBookSide(OrderBookSide):
     def store(self, price, size, order_id):
         self.storeArray([price, size, order_id])
 
+# -----------------------------------------------------------------------------
+# blocked sorted arrays, O(log n) search and O(sqrt n) memmove per insert/delete
+# the levels live in self._blocks, limit() splices the changed blocks into the list storage
+
+
+class SortedOrderBookSide(OrderBookSide):
+    load = 256  # a block is split in two halves when it grows over 2 * load
+
+    def __init__(self, deltas=[], depth=None):
+        self._keys = []  # blocks of sort keys
+        self._blocks = []  # blocks of deltas, parallel to self._keys
+        self._maxes = []  # the last key of every block
+        self._offsets = None  # cumulative block lengths, built on demand
+        self._size = 0
+        self._dirty = set()  # positions of the blocks changed since the last limit()
+        self._lengths = []  # block lengths as of the last limit()
+        self._rebuild = False  # blocks were split or dropped since the last limit()
+        super(SortedOrderBookSide, self).__init__(deltas, depth)
+
+    def key(self, delta):
+        price = delta[0]
+        return -price if self.side else price
+
+    def search(self, key):
+        # returns the position of the leftmost key >= key as (block, index)
+        position = bisect.bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            return position, 0
+        return position, bisect.bisect_left(self._keys[position], key)
+
+    def found(self, position, index, key):
+        return position < len(self._maxes) and self._keys[position][index] == key
+
+    def insert_at(self, position, index, key, delta):
+        if not self._maxes:
+            self._keys.append([key])
+            self._blocks.append([delta])
+            self._maxes.append(key)
+            self._rebuild = True
+        else:
+            if position == len(self._maxes):
+                position -= 1
+                index = len(self._keys[position])
+            keys = self._keys[position]
+            block = self._blocks[position]
+            keys.insert(index, key)
+            block.insert(index, delta)
+            self._maxes[position] = keys[-1]
+            self._dirty.add(position)
+            if len(keys) > 2 * self.load:
+                half = len(keys) >> 1
+                self._keys.insert(position + 1, keys[half:])
+                self._blocks.insert(position + 1, block[half:])
+                self._maxes.insert(position, keys[half - 1])
+                del keys[half:]
+                del block[half:]
+                self._rebuild = True
+        self._size += 1
+        self._offsets = None
+
+    def delete_at(self, position, index):
+        keys = self._keys[position]
+        delta = self._blocks[position].pop(index)
+        del keys[index]
+        if keys:
+            self._maxes[position] = keys[-1]
+            self._dirty.add(position)
+        else:
+            del self._keys[position]
+            del self._blocks[position]
+            del self._maxes[position]
+            self._rebuild = True
+        self._size -= 1
+        self._offsets = None
+        return delta
+
+    def storeArray(self, delta):
+        size = delta[1]
+        key = self.key(delta)
+        position, index = self.search(key)
+        if size:
+            if self.found(position, index, key):
+                self._blocks[position][index][1] = size
+            else:
+                self.insert_at(position, index, key, delta)
+        elif self.found(position, index, key):
+            self.delete_at(position, index)
+
+    def limit(self):
+        difference = self._size - self._depth
+        for _ in range(difference):
+            self.remove_index(self.delete_at(len(self._maxes) - 1, -1))
+        if self._rebuild:
+            list.__delitem__(self, slice(None))
+            for block in self._blocks:
+                list.extend(self, block)
+            self._lengths = [len(block) for block in self._blocks]
+            self._rebuild = False
+        elif self._dirty:
+            lengths = self._lengths
+            # back to front, so that the offsets of the blocks in front stay valid
+            for position in sorted(self._dirty, reverse=True):
+                offset = sum(lengths[:position])
+                block = self._blocks[position]
+                list.__setitem__(self, slice(offset, offset + lengths[position]), block)
+                lengths[position] = len(block)
+        self._dirty.clear()
+
+    def clear(self):
+        self._keys.clear()
+        self._blocks.clear()
+        self._maxes.clear()
+        self._offsets = None
+        self._size = 0
+        self._dirty.clear()
+        self._lengths = []
+        self._rebuild = False
+        super(SortedOrderBookSide, self).clear()
+
+    def locate(self, index):
+        first = len(self._blocks[0])
+        if index < first:
+            return 0, index
+        if self._offsets is None:
+            self._offsets = list(itertools.accumulate(len(block) for block in self._blocks))
+        position = bisect.bisect_right(self._offsets, index)
+        return position, index - self._offsets[position - 1]
+
+    def __len__(self):
+        return min(self._size, self._n)
+
+    def __iter__(self):
+        return itertools.islice(itertools.chain.from_iterable(self._blocks), len(self))
+
+    def __getitem__(self, item):
+        length = len(self)
+        if isinstance(item, slice):
+            start, stop, step = item.indices(length)
+            if step > 0:
+                return list(itertools.islice(itertools.chain.from_iterable(self._blocks), start, stop, step))
+            return [self[i] for i in range(start, stop, step)]
+        if item < 0:
+            item += length
+        if item < 0 or item >= length:
+            raise IndexError('list index out of range')
+        position, index = self.locate(item)
+        return self._blocks[position][index]
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return str(list(self))
+
+# -----------------------------------------------------------------------------
+# sorted counterpart of CountedOrderBookSide
+
+
+class SortedCountedOrderBookSide(SortedOrderBookSide):
+    def storeArray(self, delta):
+        size = delta[1]
+        count = delta[2]
+        key = self.key(delta)
+        position, index = self.search(key)
+        if size and count:
+            if self.found(position, index, key):
+                level = self._blocks[position][index]
+                level[1] = size
+                level[2] = count
+            else:
+                self.insert_at(position, index, key, delta)
+        elif self.found(position, index, key):
+            self.delete_at(position, index)
+
+    def store(self, price, size, count):
+        self.storeArray([price, size, count])
+
+# -----------------------------------------------------------------------------
+# sorted counterpart of IndexedOrderBookSide
+# levels are keyed by (price, order id), so an order is found without a scan
+
+
+class SortedIndexedOrderBookSide(SortedOrderBookSide):
+    def __init__(self, deltas=[], depth=None):
+        self._hashmap = {}
+        super(SortedIndexedOrderBookSide, self).__init__(deltas, depth)
+
+    def storeArray(self, delta):
+        price = delta[0]
+        if price is not None:
+            index_price = -price if self.side else price
+        else:
+            index_price = None
+        size = delta[1]
+        order_id = delta[2]
+        if size:
+            if order_id in self._hashmap:
+                old_key = self._hashmap[order_id]
+                index_price = index_price or old_key[0]
+                # in case the price is not defined
+                delta[0] = abs(index_price)
+                position, index = self.search(old_key)
+                # matches if price is not defined or if price matches
+                if index_price == old_key[0]:
+                    # just overwrite the old level
+                    self._blocks[position][index] = delta
+                    self._dirty.add(position)
+                    return
+                # remove old price level
+                self.delete_at(position, index)
+            # insert new price level
+            key = (index_price, order_id)
+            self._hashmap[order_id] = key
+            position, index = self.search(key)
+            self.insert_at(position, index, key, delta)
+        elif order_id in self._hashmap:
+            position, index = self.search(self._hashmap.pop(order_id))
+            self.delete_at(position, index)
+
+    def remove_index(self, order):
+        order_id = order[2]
+        if order_id in self._hashmap:
+            del self._hashmap[order_id]
+
+    def clear(self):
+        self._hashmap.clear()
+        super(SortedIndexedOrderBookSide, self).clear()
+
+    def store(self, price, size, order_id):
+        self.storeArray([price, size, order_id])
+
 # -----------------------------------------------------------------------------
 # a more elegant syntax is possible here, but native inheritance is portable
 
@@ -169,3 +424,9 @@ class CountedAsks(CountedOrderBookSide): side = False                       # no
 class CountedBids(CountedOrderBookSide): side = True                        # noqa
 class IndexedAsks(IndexedOrderBookSide): side = False                       # noqa
 class IndexedBids(IndexedOrderBookSide): side = True                        # noqa
+class SortedAsks(SortedOrderBookSide): side = False                         # noqa
+class SortedBids(SortedOrderBookSide): side = True                          # noqa
+class SortedCountedAsks(SortedCountedOrderBookSide): side = False           # noqa
+class SortedCountedBids(SortedCountedOrderBookSide): side = True            # noqa
+class SortedIndexedAsks(SortedIndexedOrderBookSide): side = False           # noqa
+class SortedIndexedBids(SortedIndexedOrderBookSide): side = True            # noqa
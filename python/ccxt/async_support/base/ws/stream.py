@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+import collections
+from asyncio import get_event_loop
+from contextvars import ContextVar
+from ccxt.base.errors import BadRequest
+from ccxt.async_support.base.ws.cache import BaseCache
+from ccxt.async_support.base.ws.order_book import OrderBook
+
+# the stream that the watch() calls of the running subscription task attach to
+current_stream = ContextVar('current_stream', default=None)
+
+# -----------------------------------------------------------------------------
+# a bounded queue fed directly by Client.resolve() for the message hashes of one watch_* call
+# results are delivered in order without a Future per message
+#
+# overflow policies once max_size items are queued:
+#   'dropOldest' - discard the oldest item (counted in self.dropped)
+#   'conflate'   - keep only the latest item
+#   'block'      - stop reading from the socket until the consumer catches up
+
+
+class Stream(object):
+    overflows = ['dropOldest', 'conflate', 'block']
+
+    def __init__(self, max_size=1000, overflow='dropOldest', callback=None, symbol=None):
+        if overflow not in self.overflows:
+            raise BadRequest('Stream overflow must be one of ' + ', '.join(self.overflows))
+        self.max_size = max_size
+        self.overflow = overflow
+        self.callback = callback
+        self.symbol = symbol
+        self.queue = collections.deque()
+        self.waiter = None
+        self.dropped = 0
+        self.closed = False
+        self.paused = False
+        self.client = None
+        self.message_hashes = []
+        self.seen = {}  # id(cache): cache._appended as of the last push
+        self.task = None
+
+    def attach(self, client, message_hashes):
+        # the last watch() call of a subscription wins, earlier ones
+        # are auxiliary subscriptions like authentication
+        self.detach()
+        self.queue.clear()
+        self.client = client
+        self.message_hashes = message_hashes
+        for message_hash in message_hashes:
+            client.streams.setdefault(message_hash, []).append(self)
+
+    def detach(self):
+        if self.client is None:
+            return
+        for message_hash in self.message_hashes:
+            streams = self.client.streams.get(message_hash)
+            if streams and self in streams:
+                streams.remove(self)
+                if not streams:
+                    del self.client.streams[message_hash]
+        if self.paused:
+            self.paused = False
+            self.client.resume_reading()
+        self.client = None
+        self.message_hashes = []
+
+    def push(self, result):
+        if isinstance(result, BaseCache):
+            # only the entries appended since the previous push
+            key = id(result)
+            count = min(result._appended - self.seen.get(key, 0), len(result))
+            self.seen[key] = result._appended
+            for item in (result[-count:] if count else []):
+                if self.symbol is None or not isinstance(item, dict) or item.get('symbol') == self.symbol:
+                    self.put(item)
+        else:
+            if isinstance(result, OrderBook):
+                result.limit()
+            self.put(result)
+
+    def put(self, item):
+        if self.closed:
+            return
+        if self.callback is not None:
+            self.callback(item)
+            return
+        if self.overflow == 'conflate':
+            self.queue.clear()
+        elif len(self.queue) >= self.max_size:
+            if self.overflow == 'dropOldest':
+                self.queue.popleft()
+                self.dropped += 1
+            elif not self.paused and self.client is not None:
+                self.paused = True
+                self.client.pause_reading()
+        self.queue.append(item)
+        self.wakeup()
+
+    def reject(self, error):
+        # errors are raised by the iteration or passed to the callback
+        if self.callback is not None:
+            self.callback(error)
+            return
+        self.queue.append(error)
+        self.wakeup()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.detach()
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+        self.wakeup()
+
+    def wakeup(self):
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.queue:
+            if self.closed:
+                raise StopAsyncIteration
+            self.waiter = get_event_loop().create_future()
+            try:
+                await self.waiter
+            finally:
+                self.waiter = None
+        item = self.queue.popleft()
+        if self.paused and len(self.queue) < self.max_size:
+            self.paused = False
+            self.client.resume_reading()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def get(self):
+        return await self.__anext__()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import http.cookiejar
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# -----------------------------------------------------------------------------
+# the connection pools of the requests sessions of the sync exchanges
+#
+#     exchange = ccxt.binance({
+#         'options': {
+#             'connectionPool': {
+#                 'connections': 10,   # the number of hosts that keep a pool of connections
+#                 'maxPerHost': 10,    # the connections kept open to every host
+#                 'block': False,      # wait for a free connection instead of opening one more
+#                 'retries': 0,        # the retries of the requests that could not connect
+#                 'keepAlive': True,   # False closes the connection after every request
+#                 'shared': False,     # True shares the session with the instances of the same exchange,
+#                                      # a string with the instances that use the same string
+#             },
+#         },
+#     })
+#
+# the shared sessions are never closed, and they do not store the cookies of the responses,
+# since the instances sharing them would send them to each other
+
+sessions = {}  # the shared sessions by key
+lock = threading.Lock()
+
+
+class PoolAdapter(HTTPAdapter):
+    # an HTTPAdapter that counts the requests it sends and the connections it opens
+
+    def __init__(self, *args, **kwargs):
+        self.requests = 0
+        self.connections = 0
+        self.counter_lock = threading.Lock()
+        self.pool_classes = {}
+        super(PoolAdapter, self).__init__(*args, **kwargs)
+
+    def count(self, requests, connections):
+        with self.counter_lock:
+            self.requests += requests
+            self.connections += connections
+
+    def counted(self, pool_class):
+        # a subclass of the pool class whose connections count the sockets they open
+        if pool_class not in self.pool_classes:
+            adapter = self
+
+            class Connection(pool_class.ConnectionCls):
+                def _new_conn(self):
+                    result = super(Connection, self)._new_conn()
+                    adapter.count(0, 1)
+                    return result
+
+            self.pool_classes[pool_class] = type(pool_class.__name__, (pool_class,), {'ConnectionCls': Connection})
+        return self.pool_classes[pool_class]
+
+    def count_connections(self, manager):
+        classes = manager.pool_classes_by_scheme
+        manager.pool_classes_by_scheme = dict((scheme, self.counted(cls)) for scheme, cls in classes.items())
+        manager.counted = True
+        return manager
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(PoolAdapter, self).init_poolmanager(*args, **kwargs)
+        self.count_connections(self.poolmanager)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        manager = super(PoolAdapter, self).proxy_manager_for(proxy, **proxy_kwargs)
+        return manager if getattr(manager, 'counted', False) else self.count_connections(manager)
+
+    def send(self, *args, **kwargs):
+        self.count(1, 0)
+        return super(PoolAdapter, self).send(*args, **kwargs)
+
+
+def create(config, trust_env=True):
+    session = Session()
+    session.trust_env = trust_env
+    retries = config.get('retries', 0)
+    adapter = PoolAdapter(
+        pool_connections=config.get('connections', 10),
+        pool_maxsize=config.get('maxPerHost', 10),
+        pool_block=config.get('block', False),
+        max_retries=Retry(total=None, connect=retries, read=False, status=0, redirect=None) if retries else 0,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if not config.get('keepAlive', True):
+        session.headers['Connection'] = 'close'
+    return session
+
+
+def session(config, trust_env, exchange_id):
+    """
+    :param dict config: options['connectionPool'], the defaults are the ones of requests
+    :param bool trust_env: requests_trust_env of the exchange
+    :param str exchange_id: the key of the session shared by the instances of the exchange
+    :returns Session: a new session, or the shared one
+    """
+    shared = config.get('shared', False)
+    if not shared:
+        return create(config, trust_env)
+    key = (exchange_id if shared is True else shared, trust_env)
+    with lock:
+        result = sessions.get(key)
+        if result is None:
+            result = create(config, trust_env)
+            result.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            sessions[key] = result
+    return result
+
+
+def is_shared(session):
+    return any(shared is session for shared in list(sessions.values()))
+
+
+def metrics(session):
+    """
+    :returns dict: the requests sent by the session, the connections it opened and the requests that reused one
+    """
+    requests = 0
+    connections = 0
+    for adapter in set(session.adapters.values()):
+        if isinstance(adapter, PoolAdapter):
+            requests += adapter.requests
+            connections += adapter.connections
+    return {
+        'requests': requests,
+        'connections': connections,
+        'reused': max(requests - connections, 0),
+    }
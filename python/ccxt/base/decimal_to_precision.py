@@ -32,8 +32,89 @@ TICK_SIZE = 4
 NO_PADDING = 5
 PAD_WITH_ZERO = 6
 
+# the context of the conversions, the decimal context of the thread is left as it is
+# all default except decimal.Underflow (raised when a number is rounded to zero)
+# and the rounding, 0.5 is rounded away from zero
+context = decimal.Context(
+    rounding=decimal.ROUND_HALF_UP,
+    traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow, decimal.Underflow],
+)
+
+# the decimal strings that are the same after '{:f}'.format(decimal.Decimal(string))
+plain = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?').fullmatch
+
+cache_size = 1024
+
+# (rounding mode, precision, type of the precision, counting mode, padding mode) -> formatter
+formatters = {}
+
+# the plain strings that fit in the 28 digits of the context with the decimals of the precision
+# are rounded as integers, the decimal arithmetic is exact for them
+plain_size = 24
+
+
+def split_plain(string):
+    """
+    :param str string: an unsigned plain decimal string
+    :returns [int, int]: the integer and the decimals of the string
+    """
+    index = string.find('.')
+    if index < 0:
+        return int(string), 0
+    return int(string[:index] + string[index + 1:]), len(string) - index - 1
+
+
+def fixed(negative, integer, decimals):
+    """
+    :returns str: '{:f}' of the decimal with the sign, the digits of the integer and the exponent -decimals
+    """
+    string = str(integer)
+    if decimals > 0:
+        if len(string) <= decimals:
+            string = '0' * (decimals - len(string) + 1) + string
+        string = string[:-decimals] + '.' + string[-decimals:]
+    return '-' + string if negative else string
+
+
+def pad_decimal_places(precise, precision, pad):
+    """
+    :returns str: the string with the decimals rounded or truncated to the precision, with or without the padding zeros
+    """
+    if precise == '-0':
+        precise = '0'
+    if '.' in precise:
+        if pad:
+            before, after = precise.split('.')
+            return before + '.' + after.ljust(precision, '0')
+        return precise.rstrip('0').rstrip('.')
+    return precise + '.' + precision * '0' if pad and precision > 0 else precise
+
 
 def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    return precision_formatter(rounding_mode, precision, counting_mode, padding_mode)(n)
+
+
+def precision_formatter(rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    """
+    :returns callable: decimal_to_precision() with these arguments, the same precisions of the
+    markets come again and again, so the work that depends on the precision only is done once
+    """
+    # 10 and 10.0 are equal keys, but not the same tick size
+    key = (rounding_mode, precision, type(precision), counting_mode, padding_mode)
+    try:
+        result = formatters.get(key)
+    except TypeError:
+        # an unhashable precision is rejected by the assertions
+        return compile_formatter(rounding_mode, precision, counting_mode, padding_mode)
+    if result is None:
+        result = compile_formatter(rounding_mode, precision, counting_mode, padding_mode)
+        if len(formatters) >= cache_size:
+            formatters.clear()
+        formatters[key] = result
+    return result
+
+
+def compile_formatter(rounding_mode, precision, counting_mode, padding_mode):
     assert precision is not None
     if counting_mode == TICK_SIZE:
         assert(isinstance(precision, float) or isinstance(precision, decimal.Decimal) or isinstance(precision, numbers.Integral) or isinstance(precision, str))
@@ -46,52 +127,21 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
     if isinstance(precision, str):
         precision = float(precision)
 
-    context = decimal.getcontext()
-
     if counting_mode != TICK_SIZE:
         precision = min(context.prec - 2, precision)
 
-    # all default except decimal.Underflow (raised when a number is rounded to zero)
-    context.traps[decimal.Underflow] = True
-    context.rounding = decimal.ROUND_HALF_UP  # rounds 0.5 away from zero
-
-    dec = decimal.Decimal(str(n))
-    precision_dec = decimal.Decimal(str(precision))
-    string = '{:f}'.format(dec)  # convert to string using .format to avoid engineering notation
-    precise = None
+    if precision < 0 or (counting_mode == TICK_SIZE and precision == 0):
+        # the original implementation
+        def format(n):
+            return decimal_to_precision_slowly(n, rounding_mode, precision, counting_mode, padding_mode)
+        return format
 
-    def power_of_10(x):
-        return decimal.Decimal('10') ** (-x)
-
-    if precision < 0:
-        if counting_mode == TICK_SIZE:
-            raise ValueError('TICK_SIZE cant be used with negative numPrecisionDigits')
-        to_nearest = power_of_10(precision)
-        if rounding_mode == ROUND:
-            return "{:f}".format(to_nearest * decimal.Decimal(decimal_to_precision(dec / to_nearest, rounding_mode, 0, DECIMAL_PLACES, padding_mode)))
-        elif rounding_mode == TRUNCATE:
-            return decimal_to_precision(dec - dec % to_nearest, rounding_mode, 0, DECIMAL_PLACES, padding_mode)
+    pad = padding_mode == PAD_WITH_ZERO
 
     if counting_mode == TICK_SIZE:
-        # python modulo with negative numbers behaves different than js/php, so use abs first
-        missing = abs(dec) % precision_dec
-        if missing != 0:
-            if rounding_mode == ROUND:
-                if dec > 0:
-                    if missing >= precision / 2:
-                        dec = dec - missing + precision_dec
-                    else:
-                        dec = dec - missing
-                else:
-                    if missing >= precision / 2:
-                        dec = dec + missing - precision_dec
-                    else:
-                        dec = dec + missing
-            elif rounding_mode == TRUNCATE:
-                if dec < 0:
-                    dec = dec + missing
-                else:
-                    dec = dec - missing
+        precision_dec = decimal.Decimal(str(precision))
+        with decimal.localcontext(context):
+            half = precision / 2
         parts = re.sub(r'0+$', '', '{:f}'.format(precision_dec)).split('.')
         if len(parts) > 1:
             new_precision = len(parts[1])
@@ -101,68 +151,274 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
                 new_precision = 0
             else:
                 new_precision = - len(match.group(0))
-        return decimal_to_precision('{:f}'.format(dec), ROUND, new_precision, DECIMAL_PLACES, padding_mode)
+        to_precision = precision_formatter(ROUND, new_precision, DECIMAL_PLACES, padding_mode)
+        # the tick and the half tick as integers, half_integer * 10 ** -half_decimals is exactly half
+        tick_sign, tick_digits, tick_exponent = precision_dec.as_tuple()
+        tick_integer = int(''.join(map(str, tick_digits)))
+        tick_decimals = max(-tick_exponent, 0)
+        tick_integer *= 10 ** max(tick_exponent, 0)
+        half_sign, half_digits, half_exponent = decimal.Decimal(half).as_tuple()
+        half_integer = int(''.join(map(str, half_digits))) * 10 ** max(half_exponent, 0)
+        half_decimals = max(-half_exponent, 0)
+        integers = not tick_sign and precision_dec.is_finite() and new_precision >= 0
 
-    if rounding_mode == ROUND:
-        if counting_mode == DECIMAL_PLACES:
-            precise = '{:f}'.format(dec.quantize(power_of_10(precision)))  # ROUND_HALF_EVEN is default context
-        elif counting_mode == SIGNIFICANT_DIGITS:
-            q = precision - dec.adjusted() - 1
-            sigfig = power_of_10(q)
-            if q < 0:
-                string_to_precision = string[:precision]
-                # string_to_precision is '' when we have zero precision
-                below = sigfig * decimal.Decimal(string_to_precision if string_to_precision else '0')
-                above = below + sigfig
-                precise = '{:f}'.format(min((below, above), key=lambda x: abs(x - dec)))
+        def format(n):
+            string = str(n)
+            if integers and len(string) + tick_decimals <= plain_size and plain(string):
+                negative = string[0] == '-'
+                integer, decimals = split_plain(string[1:] if negative else string)
+                if integer:
+                    scale = max(decimals, tick_decimals)
+                    value = integer * 10 ** (scale - decimals)
+                    tick = tick_integer * 10 ** (scale - tick_decimals)
+                    missing = value % tick
+                    if missing:
+                        if rounding_mode == ROUND and missing * 10 ** half_decimals >= half_integer * 10 ** scale:
+                            value = value - missing + tick
+                        else:
+                            value = value - missing
+                    # a multiple of the tick has new_precision decimals at most
+                    if scale >= new_precision:
+                        value, remainder = divmod(value, 10 ** (scale - new_precision))
+                    else:
+                        value, remainder = value * 10 ** (new_precision - scale), 0
+                    if not remainder:
+                        return pad_decimal_places(fixed(negative and value > 0, value, new_precision), new_precision, pad)
+            dec = decimal.Decimal(string)
+            # python modulo with negative numbers behaves different than js/php, so use abs first
+            missing = context.remainder(context.abs(dec), precision_dec)
+            if missing != 0:
+                if rounding_mode == ROUND:
+                    if dec > 0:
+                        if missing >= half:
+                            dec = context.add(context.subtract(dec, missing), precision_dec)
+                        else:
+                            dec = context.subtract(dec, missing)
+                    else:
+                        if missing >= half:
+                            dec = context.subtract(context.add(dec, missing), precision_dec)
+                        else:
+                            dec = context.add(dec, missing)
+                elif dec < 0:
+                    dec = context.add(dec, missing)
+                else:
+                    dec = context.subtract(dec, missing)
+            return to_precision(dec)
+        return format
+
+    if counting_mode == SIGNIFICANT_DIGITS:
+        ten = decimal.Decimal('10')
+        zero = decimal.Decimal('0')
+
+        def format(n):
+            dec = decimal.Decimal(str(n))
+            string = '{:f}'.format(dec)
+            if rounding_mode == ROUND:
+                q = precision - dec.adjusted() - 1
+                sigfig = context.power(ten, -q)
+                if q < 0:
+                    string_to_precision = string[:precision]
+                    # string_to_precision is '' when we have zero precision
+                    below = context.multiply(sigfig, decimal.Decimal(string_to_precision) if string_to_precision else zero)
+                    above = context.add(below, sigfig)
+                    precise = '{:f}'.format(min((below, above), key=lambda x: context.abs(context.subtract(x, dec))))
+                else:
+                    precise = '{:f}'.format(dec.quantize(sigfig, context=context))
+                if precise == '-0':
+                    precise = '0'
             else:
-                precise = '{:f}'.format(dec.quantize(sigfig))
-        if precise == ('-0.' + len(precise) * '0')[:2] or precise == '-0':
-            precise = precise[1:]
-
-    elif rounding_mode == TRUNCATE:
-        # Slice a string
-        if counting_mode == DECIMAL_PLACES:
-            before, after = string.split('.') if '.' in string else (string, '')
-            precise = before + '.' + after[:precision]
-        elif counting_mode == SIGNIFICANT_DIGITS:
-            if precision == 0:
-                return '0'
-            dot = string.index('.') if '.' in string else len(string)
-            start = dot - dec.adjusted()
-            end = start + precision
-            # need to clarify these conditionals
-            if dot >= end:
-                end -= 1
-            if precision >= len(string.replace('.', '')):
-                precise = string
+                if precision == 0:
+                    return '0'
+                dot = string.index('.') if '.' in string else len(string)
+                start = dot - dec.adjusted()
+                end = start + precision
+                # need to clarify these conditionals
+                if dot >= end:
+                    end -= 1
+                if precision >= len(string.replace('.', '')):
+                    precise = string
+                else:
+                    precise = string[:end].ljust(dot, '0')
+                if precise == '-0.' or precise == '-0':
+                    precise = precise[1:]
+                precise = precise.rstrip('.')
+            if not pad:
+                return precise.rstrip('0').rstrip('.') if '.' in precise else precise
+            if '.' in precise:
+                fsfg = len(list(itertools.takewhile(lambda x: x == '.' or x == '0', precise)))
+                digits = precision + 1 if '.' in precise[fsfg:] else precision
+                return precise[:fsfg] + precise[fsfg:].rstrip('0').ljust(digits, '0')
+            if precision > len(precise):
+                return precise + '.' + (precision - len(precise)) * '0'
+            return precise
+        return format
+
+    if rounding_mode == ROUND:
+        with decimal.localcontext(context):
+            exponent = decimal.Decimal('10') ** (-precision)
+
+        def format(n):
+            # a decimal is the same after decimal.Decimal(str(n))
+            if type(n) is decimal.Decimal:
+                return pad_decimal_places('{:f}'.format(n.quantize(exponent, context=context)), precision, pad)
+            string = str(n)
+            if len(string) + precision <= plain_size and plain(string):
+                # rounded half up as an integer, the sign of a negative zero is kept like quantize() does
+                negative = string[0] == '-'
+                integer, decimals = split_plain(string[1:] if negative else string)
+                if decimals > precision:
+                    divisor = 10 ** (decimals - precision)
+                    integer, remainder = divmod(integer, divisor)
+                    if remainder * 2 >= divisor:
+                        integer += 1
+                else:
+                    integer *= 10 ** (precision - decimals)
+                return pad_decimal_places(fixed(negative, integer, precision), precision, pad)
+            return pad_decimal_places('{:f}'.format(decimal.Decimal(string).quantize(exponent, context=context)), precision, pad)
+        return format
+
+    def format(n):
+        string = str(n)
+        if not plain(string):
+            string = '{:f}'.format(decimal.Decimal(string))
+        before, after = string.split('.') if '.' in string else (string, '')
+        precise = before + '.' + after[:precision]
+        if precise == '-0.':
+            precise = '0.'
+        return pad_decimal_places(precise.rstrip('.'), precision, pad)
+    return format
+
+
+def decimal_to_precision_slowly(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    # decimal.localcontext() copies the context, the context is never changed, so it is shared
+    saved = decimal.getcontext()
+    decimal.setcontext(context)
+    try:
+        assert precision is not None
+        if counting_mode == TICK_SIZE:
+            assert(isinstance(precision, float) or isinstance(precision, decimal.Decimal) or isinstance(precision, numbers.Integral) or isinstance(precision, str))
+        else:
+            assert(isinstance(precision, numbers.Integral))
+        assert rounding_mode in [TRUNCATE, ROUND]
+        assert counting_mode in [DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE]
+        assert padding_mode in [NO_PADDING, PAD_WITH_ZERO]
+
+        if isinstance(precision, str):
+            precision = float(precision)
+
+        if counting_mode != TICK_SIZE:
+            precision = min(context.prec - 2, precision)
+
+        dec = decimal.Decimal(str(n))
+        precision_dec = decimal.Decimal(str(precision))
+        string = '{:f}'.format(dec)  # convert to string using .format to avoid engineering notation
+        precise = None
+
+        def power_of_10(x):
+            return decimal.Decimal('10') ** (-x)
+
+        if precision < 0:
+            if counting_mode == TICK_SIZE:
+                raise ValueError('TICK_SIZE cant be used with negative numPrecisionDigits')
+            to_nearest = power_of_10(precision)
+            if rounding_mode == ROUND:
+                return "{:f}".format(to_nearest * decimal.Decimal(decimal_to_precision(dec / to_nearest, rounding_mode, 0, DECIMAL_PLACES, padding_mode)))
+            elif rounding_mode == TRUNCATE:
+                return decimal_to_precision(dec - dec % to_nearest, rounding_mode, 0, DECIMAL_PLACES, padding_mode)
+
+        if counting_mode == TICK_SIZE:
+            # python modulo with negative numbers behaves different than js/php, so use abs first
+            missing = abs(dec) % precision_dec
+            if missing != 0:
+                if rounding_mode == ROUND:
+                    if dec > 0:
+                        if missing >= precision / 2:
+                            dec = dec - missing + precision_dec
+                        else:
+                            dec = dec - missing
+                    else:
+                        if missing >= precision / 2:
+                            dec = dec + missing - precision_dec
+                        else:
+                            dec = dec + missing
+                elif rounding_mode == TRUNCATE:
+                    if dec < 0:
+                        dec = dec + missing
+                    else:
+                        dec = dec - missing
+            parts = re.sub(r'0+$', '', '{:f}'.format(precision_dec)).split('.')
+            if len(parts) > 1:
+                new_precision = len(parts[1])
             else:
-                precise = string[:end].ljust(dot, '0')
-        if precise == ('-0.' + len(precise) * '0')[:3] or precise == '-0':
-            precise = precise[1:]
-        precise = precise.rstrip('.')
-
-    if padding_mode == NO_PADDING:
-        return precise.rstrip('0').rstrip('.') if '.' in precise else precise
-    elif padding_mode == PAD_WITH_ZERO:
-        if '.' in precise:
+                match = re.search(r'0+$', parts[0])
+                if match is None:
+                    new_precision = 0
+                else:
+                    new_precision = - len(match.group(0))
+            return decimal_to_precision('{:f}'.format(dec), ROUND, new_precision, DECIMAL_PLACES, padding_mode)
+
+        if rounding_mode == ROUND:
             if counting_mode == DECIMAL_PLACES:
-                before, after = precise.split('.')
-                return before + '.' + after.ljust(precision, '0')
+                precise = '{:f}'.format(dec.quantize(power_of_10(precision)))  # ROUND_HALF_EVEN is default context
+            elif counting_mode == SIGNIFICANT_DIGITS:
+                q = precision - dec.adjusted() - 1
+                sigfig = power_of_10(q)
+                if q < 0:
+                    string_to_precision = string[:precision]
+                    # string_to_precision is '' when we have zero precision
+                    below = sigfig * decimal.Decimal(string_to_precision if string_to_precision else '0')
+                    above = below + sigfig
+                    precise = '{:f}'.format(min((below, above), key=lambda x: abs(x - dec)))
+                else:
+                    precise = '{:f}'.format(dec.quantize(sigfig))
+            if precise == ('-0.' + len(precise) * '0')[:2] or precise == '-0':
+                precise = precise[1:]
 
+        elif rounding_mode == TRUNCATE:
+            # Slice a string
+            if counting_mode == DECIMAL_PLACES:
+                before, after = string.split('.') if '.' in string else (string, '')
+                precise = before + '.' + after[:precision]
             elif counting_mode == SIGNIFICANT_DIGITS:
-                fsfg = len(list(itertools.takewhile(lambda x: x == '.' or x == '0', precise)))
-                if '.' in precise[fsfg:]:
-                    precision += 1
-                return precise[:fsfg] + precise[fsfg:].rstrip('0').ljust(precision, '0')
-        else:
-            if counting_mode == SIGNIFICANT_DIGITS:
-                if precision > len(precise):
-                    return precise + '.' + (precision - len(precise)) * '0'
-            elif counting_mode == DECIMAL_PLACES:
-                if precision > 0:
-                    return precise + '.' + precision * '0'
-            return precise
+                if precision == 0:
+                    return '0'
+                dot = string.index('.') if '.' in string else len(string)
+                start = dot - dec.adjusted()
+                end = start + precision
+                # need to clarify these conditionals
+                if dot >= end:
+                    end -= 1
+                if precision >= len(string.replace('.', '')):
+                    precise = string
+                else:
+                    precise = string[:end].ljust(dot, '0')
+            if precise == ('-0.' + len(precise) * '0')[:3] or precise == '-0':
+                precise = precise[1:]
+            precise = precise.rstrip('.')
+
+        if padding_mode == NO_PADDING:
+            return precise.rstrip('0').rstrip('.') if '.' in precise else precise
+        elif padding_mode == PAD_WITH_ZERO:
+            if '.' in precise:
+                if counting_mode == DECIMAL_PLACES:
+                    before, after = precise.split('.')
+                    return before + '.' + after.ljust(precision, '0')
+
+                elif counting_mode == SIGNIFICANT_DIGITS:
+                    fsfg = len(list(itertools.takewhile(lambda x: x == '.' or x == '0', precise)))
+                    if '.' in precise[fsfg:]:
+                        precision += 1
+                    return precise[:fsfg] + precise[fsfg:].rstrip('0').ljust(precision, '0')
+            else:
+                if counting_mode == SIGNIFICANT_DIGITS:
+                    if precision > len(precise):
+                        return precise + '.' + (precision - len(precise)) * '0'
+                elif counting_mode == DECIMAL_PLACES:
+                    if precision > 0:
+                        return precise + '.' + precision * '0'
+                return precise
+    finally:
+        decimal.setcontext(saved)
 
 
 def number_to_string(x):
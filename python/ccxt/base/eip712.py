@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+import functools
+
+from ccxt.static_dependencies.keccak import SHA3
+
+# -----------------------------------------------------------------------------
+# EIP-712 encoding of Exchange.eth_encode_structured_data() for the flat messages the
+# exchanges sign, like the hyperliquid Agent
+#
+# the hashes of the domain and of the types are memoized, they are the same for every
+# message an exchange signs, and the fields of the message are abi encoded directly
+# anything else (nested or array types, values that need coercion or validation) is
+# encoded by the vendored ethereum.account pipeline, with the same result
+
+cache_size = 256
+
+# the fields of the EIP712Domain type, in the order of ethereum.account hash_domain()
+domain_fields = [
+    ['name', 'string'],
+    ['version', 'string'],
+    ['chainId', 'uint256'],
+    ['verifyingContract', 'address'],
+    ['salt', 'bytes32'],
+]
+
+
+class Unsupported(Exception):
+    pass
+
+
+def keccak(data):
+    return bytes(SHA3(data))
+
+
+# the types encoded in place, not the dynamic bytes, arrays or structs
+core_types = set(['string', 'address', 'bool', 'uint', 'int'])
+core_types.update('bytes' + str(size) for size in range(1, 33))
+core_types.update(prefix + str(bits) for prefix in ('uint', 'int') for bits in range(8, 257, 8))
+
+
+def encode_value(field_type, value):
+    """
+    :returns bytes: the 32 bytes abi encoding of a field of the message
+    """
+    value_type = type(value)
+    if field_type == 'string':
+        if value_type is str:
+            return keccak(value.encode('utf-8'))
+    elif field_type == 'address':
+        if value_type is str and len(value) == 42 and value[0:2] == '0x':
+            digits = value[2:]
+            # mixed case addresses are checksummed and validated by the vendored encoder
+            if digits == digits.lower() or digits == digits.upper():
+                return bytes(12) + bytes.fromhex(digits)
+    elif field_type == 'bool':
+        if value_type is bool:
+            return value.to_bytes(32, 'big')
+    elif field_type.startswith('bytes'):
+        if (value_type is bytes or value_type is bytearray) and len(value) <= int(field_type[5:]):
+            return bytes(value).ljust(32, b'\x00')
+    elif field_type.startswith('uint'):
+        if value_type is int and 0 <= value < (1 << int(field_type[4:] or 256)):
+            return value.to_bytes(32, 'big')
+    elif field_type.startswith('int'):
+        bits = int(field_type[3:] or 256)
+        if value_type is int and -(1 << (bits - 1)) <= value < (1 << (bits - 1)):
+            return value.to_bytes(32, 'big', signed=True)
+    raise Unsupported(field_type)
+
+
+@functools.lru_cache(maxsize=cache_size)
+def hash_domain(domain):
+    """
+    :param tuple domain: the items of the domain
+    :returns bytes: the EIP712Domain separator
+    """
+    values = dict(domain)
+    fields = [field for field in domain_fields if field[0] in values]
+    if len(fields) != len(values):
+        raise Unsupported('EIP712Domain')
+    encoded_type = 'EIP712Domain(' + ','.join(field_type + ' ' + name for name, field_type in fields) + ')'
+    encoded = [keccak(encoded_type.encode())]
+    for name, field_type in fields:
+        encoded.append(encode_value(field_type, values[name]))
+    return keccak(b''.join(encoded))
+
+
+@functools.lru_cache(maxsize=cache_size)
+def hash_type(types):
+    """
+    :param tuple types: a single flat struct type, (name, ((field name, field type), ...))
+    :returns [bytes, tuple]: the type hash and the fields of the struct
+    """
+    name, fields = types
+    for field_name, field_type in fields:
+        if field_type not in core_types:
+            raise Unsupported(field_type)
+    encoded_type = name + '(' + ','.join(field_type + ' ' + field_name for field_name, field_type in fields) + ')'
+    return [keccak(encoded_type.encode()), fields]
+
+
+def encode_structured_data(domain, message_types, message):
+    """
+    :returns bytes|None: the EIP-712 encoded message, None if it is not a flat message of core types
+    """
+    if len(message_types) != 1:
+        return None
+    try:
+        for name, fields in message_types.items():
+            type_hash, fields = hash_type((name, tuple((field['name'], field['type']) for field in fields)))
+        domain_separator = hash_domain(tuple(domain.items()))
+        encoded = [type_hash]
+        for field_name, field_type in fields:
+            encoded.append(encode_value(field_type, message.get(field_name)))
+    except (Unsupported, TypeError, ValueError):
+        return None
+    return b'\x19\x01' + domain_separator + keccak(b''.join(encoded))
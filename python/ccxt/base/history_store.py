@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import json
+import mmap
+import array
+import bisect
+import tempfile
+from abc import ABC, abstractmethod
+
+from ccxt.base.markets_cache import user_cache_folder, private_folder
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# -----------------------------------------------------------------------------
+# an opt-in local store of the candles and the trades fetched with fetch_ohlcv() and
+# fetch_trades(), so that the ranges fetched once are read from disk afterwards
+#
+#     exchange = ccxt.binance({
+#         'options': {
+#             'historyStore': {
+#                 'path': '~/.cache/ccxt-history',  # the directory of the store, default ~/.cache/ccxt/history
+#             },
+#         },
+#     })
+#     exchange.fetch_ohlcv('BTC/USDT', '1m', since, 1000)  # fetches the missing candles only
+#
+#     series = exchange.history_store().ohlcv(exchange.id, 'BTC/USDT', '1m')
+#     columns = series.columns(since, until)  # numpy arrays or memoryviews of the mapped files
+#
+# every series is a directory with one file per column, the values are sorted by timestamp and
+# in the native byte order, new rows are appended to the end of the files, a meta.json file has
+# the number of rows and the time ranges that are fetched already, it is written last, so the
+# rows after its count are ignored and overwritten after an interrupted write
+#
+# older rows are merged into new files, of the next generation, the files of the previous one are
+# removed after meta.json is switched to the new one, so the arrays returned before stay valid
+#
+# only the closed candles and the trades older than a minute are stored, and only the fetches
+# with a since and a limit or an until argument and no other params use the store, a range is
+# marked as fetched up to the last row received, the end of a range without rows is fetched again
+#
+# the default directory is created with the mode 0o700 and must not be writable by the others
+
+
+# the trades are final after a minute
+settled = 60000
+
+
+def encode(part):
+    return re.sub(r'[^0-9A-Za-z._-]', '_', str(part))
+
+
+def sort_columns(columns):
+    order = sorted(range(len(columns['timestamp'])), key=columns['timestamp'].__getitem__)
+    return dict((name, [values[i] for i in order]) for name, values in columns.items())
+
+
+class Series(ABC):
+
+    # [name, array typecode] of the numeric columns, the first one is the timestamp
+    types = []
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.meta = {'count': 0, 'generation': 0, 'covered': []}
+        self.maps = {}
+        try:
+            with open(os.path.join(folder, 'meta.json')) as file:
+                self.meta = json.load(file)
+        except (OSError, ValueError):
+            pass
+
+    def __len__(self):
+        return self.meta['count']
+
+    def filename(self, name, generation=None):
+        return os.path.join(self.folder, name + '.' + str(self.meta['generation'] if generation is None else generation) + '.bin')
+
+    @abstractmethod
+    def to_columns(self, rows):
+        """
+        :returns dict: the values of every column of the rows, like the ones of the fetch method
+        """
+
+    @abstractmethod
+    def to_rows(self, columns, start, end):
+        """
+        :returns list: the rows from start to end of the columns
+        """
+
+    def key(self, columns, index):
+        return columns['timestamp'][index]
+
+    def save_meta(self):
+        os.makedirs(self.folder, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=self.folder, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w') as file:
+                json.dump(self.meta, file)
+            os.replace(temporary, os.path.join(self.folder, 'meta.json'))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def column(self, name, typecode):
+        """
+        :returns memoryview: the stored values of the column, mapped from its file without copying
+        """
+        count = self.meta['count']
+        if count == 0:
+            return memoryview(array.array(typecode))
+        size = count * array.array(typecode).itemsize
+        mapped = self.maps.get(name)
+        if mapped is None or len(mapped) < size:
+            with open(self.filename(name), 'rb') as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.maps[name] = mapped
+        return memoryview(mapped)[:size].cast(typecode)
+
+    def views(self):
+        return dict((name, self.column(name, typecode)) for name, typecode in self.types)
+
+    def bounds(self, views, since, until):
+        timestamps = views['timestamp']
+        start = 0 if since is None else bisect.bisect_left(timestamps, since)
+        end = len(timestamps) if until is None else bisect.bisect_left(timestamps, until)
+        return start, end
+
+    def columns(self, since=None, until=None):
+        """
+        :param int [since]: the first timestamp, inclusive
+        :param int [until]: the last timestamp, exclusive
+        :returns dict: the values of every column, numpy arrays if numpy is installed, memoryviews otherwise
+        """
+        views = self.views()
+        start, end = self.bounds(views, since, until)
+        result = {}
+        for name, typecode in self.types:
+            view = views[name][start:end]
+            result[name] = view if numpy is None else numpy.frombuffer(view, dtype=typecode)
+        return result
+
+    def rows(self, since=None, until=None):
+        """
+        :returns list: the stored rows from since to until, like the ones of the fetch method
+        """
+        views = self.views()
+        start, end = self.bounds(views, since, until)
+        return self.to_rows(views, start, end)
+
+    def missing(self, since, until):
+        """
+        :returns [[int, int]]: the ranges of [since, until) that are not fetched yet
+        """
+        result = []
+        cursor = since
+        for start, end in self.meta['covered']:
+            if end <= cursor:
+                continue
+            if start >= until:
+                break
+            if start > cursor:
+                result.append([cursor, start])
+            cursor = max(cursor, end)
+        if cursor < until:
+            result.append([cursor, until])
+        return result
+
+    def cover(self, since, until, save=True):
+        """
+        marks [since, until) as fetched, the rows of the range are appended before
+        """
+        if since >= until:
+            return
+        ranges = []
+        for start, end in sorted(self.meta['covered'] + [[since, until]]):
+            if ranges and start <= ranges[-1][1]:
+                ranges[-1][1] = max(ranges[-1][1], end)
+            else:
+                ranges.append([start, end])
+        self.meta['covered'] = ranges
+        if save:
+            self.save_meta()
+
+    def append(self, rows, covered=None):
+        """
+        :param list rows: the rows to store, in any order, the ones stored already are skipped
+        :param [int, int] [covered]: the range of the rows, marked as fetched with them
+        """
+        if covered is not None:
+            self.cover(covered[0], covered[1], False)
+        if not rows:
+            if covered is not None:
+                self.save_meta()
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        new = sort_columns(self.to_columns(rows))
+        count = self.meta['count']
+        if count and new['timestamp'][0] <= self.column('timestamp', 'q')[count - 1]:
+            # the rows that overlap the end of the stored ones are skipped if they are stored already
+            last = self.column('timestamp', 'q')[count - 1]
+            overlap = bisect.bisect_right(new['timestamp'], last)
+            views = self.views()
+            first, end = self.bounds(views, new['timestamp'][0], None)
+            stored = set(self.key(views, i) for i in range(first, end))
+            if all(self.key(new, i) in stored for i in range(overlap)):
+                new = dict((name, values[overlap:]) for name, values in new.items())
+                if not new['timestamp']:
+                    self.save_meta()
+                    return
+        if count and new['timestamp'][0] <= self.column('timestamp', 'q')[count - 1]:
+            # an older range, the rows are merged into the files of the next generation
+            merged = self.to_columns(self.rows())
+            for name in merged:
+                merged[name].extend(new[name])
+            merged = sort_columns(merged)
+            unique = self.unique(merged)
+            self.write(dict((name, [values[i] for i in unique]) for name, values in merged.items()), 0, self.meta['generation'] + 1)
+        else:
+            unique = self.unique(new)
+            self.write(dict((name, [values[i] for i in unique]) for name, values in new.items()), count, self.meta['generation'])
+
+    def unique(self, columns):
+        """
+        :returns [int]: the index of the first row of every key of the sorted columns
+        """
+        result = []
+        seen = set()
+        timestamp = None
+        timestamps = columns['timestamp']
+        for i in range(len(timestamps)):
+            if timestamps[i] != timestamp:
+                timestamp = timestamps[i]
+                seen = set()
+            key = self.key(columns, i)
+            if key not in seen:
+                seen.add(key)
+                result.append(i)
+        return result
+
+    def write(self, columns, offset, generation):
+        previous = self.meta['generation']
+        for name, typecode in self.types:
+            with open(self.filename(name, generation), 'r+b' if offset else 'wb') as file:
+                file.seek(offset * array.array(typecode).itemsize)
+                file.truncate()
+                array.array(typecode, columns[name]).tofile(file)
+        self.write_extra(columns, offset, generation)
+        self.meta['count'] = offset + len(columns['timestamp'])
+        self.meta['generation'] = generation
+        self.save_meta()
+        if generation != previous:
+            self.maps = {}
+            for name in os.listdir(self.folder):
+                if name.endswith('.' + str(previous) + '.bin'):
+                    os.unlink(os.path.join(self.folder, name))
+
+    def write_extra(self, columns, offset, generation):
+        pass
+
+
+class OHLCVSeries(Series):
+
+    types = [['timestamp', 'q'], ['open', 'd'], ['high', 'd'], ['low', 'd'], ['close', 'd'], ['volume', 'd']]
+
+    def to_columns(self, rows):
+        # the missing values are stored as nan
+        result = {'timestamp': [row[0] for row in rows]}
+        for i in range(1, 6):
+            result[self.types[i][0]] = [float('nan') if row[i] is None else row[i] for row in rows]
+        return result
+
+    def to_rows(self, columns, start, end):
+        values = []
+        for name, typecode in self.types:
+            column = columns[name][start:end]
+            column = column.tolist() if isinstance(column, memoryview) else column
+            if typecode == 'd' and any(value != value for value in column):
+                column = [None if value != value else value for value in column]
+            values.append(column)
+        return list(map(list, zip(*values)))
+
+    def unique(self, columns):
+        timestamps = columns['timestamp']
+        return [i for i in range(len(timestamps)) if i == 0 or timestamps[i] != timestamps[i - 1]]
+
+
+class TradesSeries(Series):
+
+    types = [['timestamp', 'q'], ['price', 'd'], ['amount', 'd'], ['cost', 'd'], ['side', 'b']]
+    sides = {'buy': 1, 'sell': -1}
+    names = {1: 'buy', -1: 'sell', 0: None}
+
+    def __init__(self, folder):
+        super(TradesSeries, self).__init__(folder)
+        self.ids = None
+
+    def key(self, columns, index):
+        # the trades without an id are told apart by their values, nan is keyed as None
+        id = columns['id'][index]
+        if id:
+            return id
+        return tuple(None if value != value else value for value in (columns[name][index] for name in ['timestamp', 'price', 'amount', 'cost', 'side']))
+
+    def views(self):
+        result = super(TradesSeries, self).views()
+        result['id'] = self.read_ids()
+        return result
+
+    def read_ids(self):
+        """
+        :returns [str]: the ids of the stored trades, the lines of a text file, kept in memory once read
+        """
+        count = self.meta['count']
+        if self.ids is None or len(self.ids) < count:
+            try:
+                with open(self.filename('id'), 'rb') as file:
+                    self.ids = file.read().decode('utf-8').split('\n')
+            except OSError:
+                self.ids = []
+        return self.ids[:count]
+
+    def columns(self, since=None, until=None):
+        result = super(TradesSeries, self).columns(since, until)
+        views = self.views()
+        start, end = self.bounds(views, since, until)
+        result['id'] = views['id'][start:end]
+        return result
+
+    def to_columns(self, trades):
+        nan = float('nan')
+        result = {
+            'id': ['' if trade.get('id') is None else str(trade['id']) for trade in trades],
+            'timestamp': [trade['timestamp'] for trade in trades],
+            'side': [self.sides.get(trade.get('side'), 0) for trade in trades],
+        }
+        for name in ['price', 'amount', 'cost']:
+            result[name] = [nan if trade.get(name) is None else trade[name] for trade in trades]
+        return result
+
+    def to_rows(self, columns, start, end):
+        result = []
+        for i in range(start, end):
+            trade = {
+                'id': columns['id'][i] or None,
+                'timestamp': columns['timestamp'][i],
+                'side': self.names[columns['side'][i]],
+            }
+            for name in ['price', 'amount', 'cost']:
+                value = columns[name][i]
+                trade[name] = None if value != value else value
+            result.append(trade)
+        return result
+
+    def write_extra(self, columns, offset, generation):
+        if any('\n' in id for id in columns['id']):
+            raise ValueError('trade ids with line breaks cannot be stored')
+        ids = self.read_ids()[:offset] if offset else []
+        # every id is followed by a line break, the file is cut after the ids of the first offset rows
+        with open(self.filename('id', generation), 'r+b' if offset else 'wb') as file:
+            file.seek(sum(len(id.encode('utf-8')) + 1 for id in ids))
+            file.truncate()
+            file.write(''.join(id + '\n' for id in columns['id']).encode('utf-8'))
+        self.ids = ids + columns['id']
+
+
+class HistoryStore(object):
+
+    def __init__(self, config):
+        path = config.get('path')
+        self.folder = os.path.expanduser(path) if path else user_cache_folder('history')
+        self.series = {}
+
+    def get(self, cls, parts):
+        folder = os.path.join(self.folder, *[encode(part) for part in parts])
+        series = self.series.get(folder)
+        if series is None:
+            private_folder(self.folder)
+            series = cls(folder)
+            self.series[folder] = series
+        return series
+
+    def ohlcv(self, exchange_id, symbol, timeframe):
+        return self.get(OHLCVSeries, [exchange_id, symbol, timeframe])
+
+    def trades(self, exchange_id, symbol):
+        return self.get(TradesSeries, [exchange_id, symbol, 'trades'])
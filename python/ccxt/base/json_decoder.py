@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from ccxt.base.errors import NotSupported
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# -----------------------------------------------------------------------------
+# pluggable json decoders, all of them accept both str and bytes
+# the accelerated decoders fall back to the standard library on the inputs
+# they reject (NaN, Infinity, integers over 64 bits for ujson), except that
+# orjson silently decodes integers over 64 bits as floats
+# none of them can return integers as strings, therefore the quoteJsonNumbers
+# mode always uses the standard library
+# the standard library stays the default, the others are opt-in through jsonDecoder
+
+
+def quoted_loads(data):
+    return json.loads(data, parse_float=str, parse_int=str)
+
+
+def with_fallback(loads):
+    def decode(data):
+        try:
+            return loads(data)
+        except Exception:
+            return json.loads(data)
+    return decode
+
+
+decoders = {
+    'json': json.loads,
+}
+
+if orjson is not None:
+    decoders['orjson'] = with_fallback(orjson.loads)
+if msgspec is not None:
+    decoders['msgspec'] = with_fallback(msgspec.json.Decoder().decode)
+if ujson is not None:
+    decoders['ujson'] = with_fallback(ujson.loads)
+
+# fastest first
+preference = ['orjson', 'msgspec', 'ujson', 'json']
+
+
+def json_decoder(name=None, quote_numbers=False):
+    """
+    :param str|callable [name]: 'orjson', 'msgspec', 'ujson', 'json' (the default for None), a custom loads function, or 'auto' to pick the fastest one installed
+    :param bool [quote_numbers]: return numbers as strings
+    :returns callable: a loads function taking str or bytes
+    """
+    if callable(name):
+        return name
+    if quote_numbers:
+        return quoted_loads
+    if name is None:
+        return decoders['json']
+    if name == 'auto':
+        for candidate in preference:
+            if candidate in decoders:
+                return decoders[candidate]
+    if name not in decoders:
+        raise NotSupported('jsonDecoder ' + str(name) + ' is not available, install it with "pip install ' + str(name) + '"')
+    return decoders[name]
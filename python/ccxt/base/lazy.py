@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from importlib import import_module
+from types import ModuleType
+
+# -----------------------------------------------------------------------------
+# exchange classes of ccxt, ccxt.async_support and ccxt.pro are imported on first
+# access through the module level __getattr__ of PEP 562, so that importing the
+# package does not load every exchange module and its implicit api
+
+
+class ExchangePackage(ModuleType):
+
+    def __setattr__(self, name, value):
+        # the import system binds every submodule on its parent package once loaded,
+        # ccxt.binanceusdm imports ccxt.binance, which must still resolve to the class
+        if isinstance(value, ModuleType) and name in self.__dict__.get('__lazy__', ()):
+            value = getattr(value, name)
+        super(ExchangePackage, self).__setattr__(name, value)
+
+
+def lazy_exchanges(package, exchanges):
+    """
+    :param str package: the name of the package the exchange modules belong to
+    :param [str] exchanges: the exchange ids
+    :returns (callable, callable): the __getattr__ and __dir__ functions of the package
+    """
+    module = sys.modules[package]
+    module.__lazy__ = frozenset(exchanges)
+    module.__class__ = ExchangePackage
+
+    def __getattr__(name):
+        if name in module.__lazy__:
+            exchange = getattr(import_module(package + '.' + name), name)
+            setattr(module, name, exchange)
+            return exchange
+        raise AttributeError('module ' + repr(package) + ' has no attribute ' + repr(name))
+
+    def __dir__():
+        return sorted(set(module.__dict__) | module.__lazy__)
+
+    return __getattr__, __dir__
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+# -----------------------------------------------------------------------------
+# the answers of Exchange.get_symbols_for_market_type() over the loaded markets
+# built by Exchange.set_markets(), and again by Exchange.get_market_index() once
+# the markets were replaced or changed in place
+
+from operator import is_
+
+
+class MarketIndex(object):
+
+    def __init__(self, markets):
+        self.by_symbol = markets  # symbol: market, the same dict as exchange.markets
+        self.values = list(markets.values())  # the markets the answers were computed from
+        self.symbols_by_type = {}  # (type, subtype, active, unknown status): [symbol, ...]
+
+    def current(self, markets):
+        """
+        :param dict markets: exchange.markets
+        :returns bool: False if markets is another dict or if its markets were added, removed or replaced since the index was built
+        """
+        if markets is not self.by_symbol or len(markets) != len(self.values):
+            return False
+        return all(map(is_, markets.values(), self.values))
+
+    def symbols_for_market_type(self, market_type=None, sub_type=None, with_active_status=True, with_unknown_status=True):
+        key = (market_type, sub_type, with_active_status, with_unknown_status)
+        symbols = self.symbols_by_type.get(key)
+        if symbols is None:
+            statuses = []
+            if with_active_status:
+                statuses.append(True)
+            if with_unknown_status:
+                statuses.append(None)
+            symbols = []
+            for market in self.values:
+                if market_type is not None and market.get('type') != market_type:
+                    continue
+                if sub_type is not None and market.get('subType') != sub_type:
+                    continue
+                if statuses and market.get('active') not in statuses:
+                    continue
+                symbols.append(market['symbol'])
+            self.symbols_by_type[key] = symbols
+        return list(symbols)
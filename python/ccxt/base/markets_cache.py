@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import pickle
+import tempfile
+
+from ccxt.base.market_index import MarketIndex
+
+# -----------------------------------------------------------------------------
+# an opt-in on-disk cache of the structures built by Exchange.set_markets(), so that
+# a process start can skip both fetch_markets/fetch_currencies and the parsing
+#
+#     exchange = ccxt.binance({
+#         'options': {
+#             'marketsCache': {
+#                 'path': '~/.cache/ccxt',  # the directory of the cache files, default ~/.cache/ccxt/markets
+#                 'ttl': 3600000,           # milliseconds after which the cached markets are stale
+#                 'serveStale': True,       # load stale markets and refresh them in the background
+#                 'key': '',                # anything else the markets depend on, like options['fetchMarkets']
+#             },
+#         },
+#     })
+#
+# the entries are keyed by exchange id, sandbox mode, api version and the ccxt version
+# the files are pickled, so they are only read from a directory owned by the user running ccxt
+# and not writable by the others, the directory is created with the mode 0o700
+
+# the attributes set by Exchange.set_markets()
+attributes = ['markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'baseCurrencies', 'quoteCurrencies', 'codes']
+
+
+def user_cache_folder(name):
+    # the system temp directory is shared by all the users, the cache of the user is not
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(root, 'ccxt', name)
+
+
+def is_private(stat):
+    # owned by the user and not writable by the group or the others, always True without owners (windows)
+    if not hasattr(os, 'getuid'):
+        return True
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def private_folder(folder):
+    """
+    creates the folder with the mode 0o700 if it does not exist
+    :raises PermissionError: if the folder is owned by another user or writable by the others
+    """
+    os.makedirs(folder, 0o700, exist_ok=True)
+    if not is_private(os.stat(folder)):
+        raise PermissionError('the folder ' + folder + ' must be owned by the user and not writable by the others')
+    return folder
+
+
+class MarketsCache(object):
+
+    def __init__(self, exchange, config):
+        from ccxt import __version__
+        path = config.get('path')
+        self.folder = os.path.expanduser(path) if path else user_cache_folder('markets')
+        self.ttl = config.get('ttl', 3600000)
+        self.serve_stale = config.get('serveStale', True)
+        parts = [
+            exchange.id,
+            'sandbox' if exchange.safe_bool(exchange.options, 'sandboxMode', 'apiBackup' in exchange.urls) else 'live',
+            str(exchange.version),
+            str(config.get('key', '')),
+            __version__,
+        ]
+        self.filename = os.path.join(self.folder, '-'.join(part.replace(os.sep, '_') for part in parts if part) + '.pickle')
+
+    def load(self):
+        """
+        :returns [dict, float]|None: the cached structures and their age in milliseconds, None if there are none
+        """
+        try:
+            if not is_private(os.stat(self.folder)):
+                return None
+            with open(self.filename, 'rb') as file:
+                if not is_private(os.fstat(file.fileno())):
+                    return None
+                payload = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+        if not isinstance(payload, dict) or any(name not in payload for name in attributes + ['timestamp']):
+            return None
+        return [payload, time.time() * 1000 - payload['timestamp']]
+
+    def is_fresh(self, age):
+        return age < self.ttl
+
+    def save(self, exchange):
+        payload = {name: getattr(exchange, name) for name in attributes}
+        payload['timestamp'] = time.time() * 1000
+        private_folder(self.folder)
+        # written to a temporary file and renamed, so that readers never see a partial file
+        descriptor, temporary = tempfile.mkstemp(dir=self.folder, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                pickle.dump(payload, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self.filename)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def clear(self):
+        if os.path.exists(self.filename):
+            os.unlink(self.filename)
+
+    @staticmethod
+    def restore(exchange, payload):
+        for name in attributes:
+            setattr(exchange, name, payload[name])
+        exchange.market_index = MarketIndex(exchange.markets)
+        return exchange.markets
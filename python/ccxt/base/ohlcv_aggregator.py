@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# -----------------------------------------------------------------------------
+# candles built from trades, like Exchange.build_ohlcvc(), without building them again
+# from all the trades every time
+#
+#     aggregator = OHLCVAggregator({'1m': 60000, '1h': 3600000}, lambda: ArrayCacheByTimestamp(1000))
+#     aggregator.update(trades)  # the new trades, in the order of their timestamps
+#     aggregator.candles['1m']   # [timestamp, open, high, low, close, volume, count]
+#
+# aggregate_ohlcvc() builds the candles of the columns of many trades at once, with numpy if it
+# is installed, like the numpy arrays of HistoryStore.trades(...).columns()
+
+
+class OHLCVAggregator(object):
+
+    def __init__(self, durations, create_cache=list, max_size=1000):
+        """
+        :param dict durations: the milliseconds of every timeframe
+        :param callable [create_cache]: returns the list of the candles of a timeframe, like an ArrayCacheByTimestamp
+        :param int [max_size]: the number of the last candles of every timeframe that the late trades can update or create
+        """
+        self.durations = durations
+        self.create_cache = create_cache
+        self.max_size = max_size
+        self.candles = {}
+        self.recent = {}  # timeframe: {timestamp: candle}, the last candles in the order of their timestamps
+        self.appended = 0  # the number of trades the caller has aggregated, like the _appended of a trades cache
+        for timeframe in durations:
+            self.add(timeframe, durations[timeframe])
+
+    def add(self, timeframe, duration):
+        if timeframe not in self.candles:
+            self.durations[timeframe] = duration
+            self.candles[timeframe] = self.create_cache()
+            self.recent[timeframe] = {}
+
+    def update(self, trades):
+        """
+        :param list trades: the trade structures, the ones without a timestamp, a price or an amount are skipped
+        :returns dict: the candles that changed, by timeframe
+        """
+        result = {}
+        for timeframe in self.candles:
+            duration = self.durations[timeframe]
+            cache = self.candles[timeframe]
+            recent = self.recent[timeframe]
+            # the candles of a cache by timestamp are appended again to count the updates
+            hashmap = getattr(cache, 'hashmap', None)
+            last = cache[-1] if len(cache) else None
+            changed = {}
+            created = set()
+            inserted = set()
+            for trade in trades:
+                timestamp = trade['timestamp']
+                price = trade['price']
+                amount = trade['amount']
+                if timestamp is None or price is None or amount is None:
+                    continue
+                opening = timestamp - timestamp % duration
+                if last is not None and opening == last[0]:
+                    candle = last
+                    candle[4] = price
+                elif last is None or opening > last[0]:
+                    candle = [opening, price, price, price, price, 0, 0]
+                    last = candle
+                    created.add(opening)
+                    recent[opening] = candle
+                    if len(recent) > self.max_size:
+                        del recent[next(iter(recent))]
+                else:
+                    # a late trade, the close of its candle is the one of the later trades
+                    candle = recent.get(opening)
+                    if candle is None:
+                        if len(recent) >= self.max_size and opening < next(iter(recent)):
+                            continue  # older than the candles that are kept
+                        candle = [opening, price, price, price, price, 0, 0]
+                        inserted.add(opening)
+                        recent[opening] = candle
+                        recent = self.recent[timeframe] = dict(sorted(recent.items()))
+                        if len(recent) > self.max_size:
+                            del recent[next(iter(recent))]
+                if price > candle[2]:
+                    candle[2] = price
+                if price < candle[3]:
+                    candle[3] = price
+                candle[5] += amount
+                candle[6] += 1
+                changed[opening] = candle
+            result[timeframe] = [changed[opening] for opening in sorted(changed)]
+            for candle in result[timeframe]:
+                if candle[0] in inserted:
+                    insert(cache, candle)
+                if candle[0] in created or (hashmap is not None and candle[0] in hashmap):
+                    cache.append(candle)
+        return result
+
+
+def insert(cache, candle):
+    """
+    inserts a candle before the later candles of a cache, the oldest one is evicted if the cache is full
+    :param list cache: the candles of a timeframe, a list or a cache with a deque of the candles
+    :param list candle: a candle older than the last one of the cache
+    """
+    candles = getattr(cache, '_deque', cache)
+    index = len(candles)
+    while index > 0 and candles[index - 1][0] > candle[0]:
+        index -= 1
+    hashmap = getattr(cache, 'hashmap', None)
+    if len(candles) == getattr(candles, 'maxlen', None):
+        if index == 0:
+            return
+        evicted = candles.popleft()
+        index -= 1
+        if hashmap is not None:
+            del hashmap[evicted[0]]
+    candles.insert(index, candle)
+    if hashmap is not None:
+        # update() appends it again to count the update
+        hashmap[candle[0]] = candle
+
+
+def aggregate_ohlcvc(timestamps, prices, amounts, duration):
+    """
+    :param list timestamps: the timestamps of the trades, in ascending order, a list or a numpy array
+    :param list prices: the prices of the trades
+    :param list amounts: the amounts of the trades
+    :param int duration: the milliseconds of the timeframe
+    :returns list: the candles, like the ones of Exchange.build_ohlcvc()
+    """
+    if numpy is not None and len(timestamps):
+        timestamps = numpy.asarray(timestamps, dtype=numpy.int64)
+        prices = numpy.asarray(prices, dtype=numpy.float64)
+        amounts = numpy.asarray(amounts, dtype=numpy.float64)
+        openings = timestamps - timestamps % duration
+        starts = numpy.concatenate(([0], numpy.flatnonzero(openings[1:] != openings[:-1]) + 1))
+        ends = numpy.append(starts[1:], len(openings))
+        return [list(candle) for candle in zip(
+            openings[starts].tolist(),
+            prices[starts].tolist(),
+            numpy.maximum.reduceat(prices, starts).tolist(),
+            numpy.minimum.reduceat(prices, starts).tolist(),
+            prices[ends - 1].tolist(),
+            numpy.add.reduceat(amounts, starts).tolist(),
+            (ends - starts).tolist(),
+        )]
+    result = []
+    candle = None
+    for i in range(len(timestamps)):
+        timestamp = timestamps[i]
+        price = prices[i]
+        opening = timestamp - timestamp % duration
+        if candle is None or opening != candle[0]:
+            candle = [opening, price, price, price, price, amounts[i], 1]
+            result.append(candle)
+        else:
+            if price > candle[2]:
+                candle[2] = price
+            if price < candle[3]:
+                candle[3] = price
+            candle[4] = price
+            candle[5] += amounts[i]
+            candle[6] += 1
+    return result
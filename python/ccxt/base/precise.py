@@ -10,23 +10,119 @@
 #
 # (╯°□°）╯︵ ┻━┻
 
+# the string_* methods work on (integer, decimals) pairs, the value is integer * 10 ** -decimals
+# the strings are parsed once, the same amounts, prices and '0' come again and again
+# in the responses, and a pair is formatted once at the end of the operation
+
+cache_size = 4096
+
+
+# number -> (integer, decimals)
+parsed = {}
+
+
+def parse_number(number):
+    modifier = 0
+    number = number.lower()
+    if 'e' in number:
+        number, modifier = number.split('e')
+        modifier = int(modifier)
+    decimal_index = number.find('.')
+    if decimal_index > -1:
+        return int(number.replace('.', '')), len(number) - decimal_index - 1 - modifier
+    return int(number), -modifier
+
+
+def parse(number):
+    """
+    :param str number: a decimal number, in scientific notation or not
+    :returns [int, int]: the integer and the decimals
+    """
+    result = parsed.get(number)
+    if result is None:
+        result = parse_number(number)
+        if len(parsed) >= cache_size:
+            parsed.clear()
+        parsed[number] = result
+    return result
+
+
+def reduce(integer, decimals):
+    """
+    :returns [int, int]: the same number without the trailing zeros of the integer
+    """
+    if integer == 0:
+        return 0, 0
+    if integer % 10:
+        return integer, decimals
+    string = str(integer)
+    stripped = string.rstrip('0')
+    return int(stripped), decimals - len(string) + len(stripped)
+
+
+def to_string(integer, decimals):
+    """
+    :returns str: the same string as str(Precise(integer, decimals))
+    """
+    if integer == 0:
+        return '0'
+    if decimals <= 0:
+        return str(integer) + '0' * -decimals if decimals else str(integer)
+    if integer < 0:
+        return '-' + to_string(-integer, decimals)
+    string = str(integer)
+    length = len(string)
+    if length > decimals:
+        fraction = string[-decimals:].rstrip('0')
+        return string[:-decimals] + '.' + fraction if fraction else string[:-decimals]
+    return '0.' + '0' * (decimals - length) + string.rstrip('0')
+
+
+def add(integer1, decimals1, integer2, decimals2):
+    if decimals1 == decimals2:
+        return integer1 + integer2, decimals1
+    elif decimals1 > decimals2:
+        return integer1 + integer2 * 10 ** (decimals1 - decimals2), decimals1
+    return integer1 * 10 ** (decimals2 - decimals1) + integer2, decimals2
+
+
+def compare(integer1, decimals1, integer2, decimals2):
+    """
+    :returns int: the sign of the difference of the numbers, -1, 0 or 1
+    """
+    if decimals1 > decimals2:
+        integer2 *= 10 ** (decimals1 - decimals2)
+    elif decimals2 > decimals1:
+        integer1 *= 10 ** (decimals2 - decimals1)
+    return (integer1 > integer2) - (integer1 < integer2)
+
+
+def div(integer1, decimals1, integer2, decimals2, precision=18):
+    distance = precision - decimals1 + decimals2
+    if distance == 0:
+        numerator = integer1
+    elif distance < 0:
+        numerator = integer1 // 10 ** -distance
+    else:
+        numerator = integer1 * 10 ** distance
+    result, mod = divmod(numerator, integer2)
+    # python floors negative numbers down instead of truncating
+    # if mod is zero it will be floored to itself so we do not add one
+    return result + 1 if result < 0 and mod else result, precision
+
+
+def mod(integer1, decimals1, integer2, decimals2):
+    rationizerNumberator = max(-decimals1 + decimals2, 0)
+    numerator = integer1 * (10 ** rationizerNumberator)
+    rationizerDenominator = max(-decimals2 + decimals1, 0)
+    denominator = integer2 * (10 ** rationizerDenominator)
+    return numerator % denominator, rationizerDenominator + decimals2
+
 
 class Precise:
     def __init__(self, number, decimals=None):
         if decimals is None:
-            modifier = 0
-            number = number.lower()
-            if 'e' in number:
-                number, modifier = number.split('e')
-                modifier = int(modifier)
-            decimal_index = number.find('.')
-            if decimal_index > -1:
-                self.decimals = len(number) - decimal_index - 1
-                self.integer = int(number.replace('.', ''))
-            else:
-                self.decimals = 0
-                self.integer = int(number)
-            self.decimals = self.decimals - modifier
+            self.integer, self.decimals = parse(number)
         else:
             self.integer = number
             self.decimals = decimals
@@ -82,35 +178,16 @@ class Precise:
         return Precise(integer_result, self.decimals + other.decimals)
 
     def div(self, other, precision=18):
-        distance = precision - self.decimals + other.decimals
-        if distance == 0:
-            numerator = self.integer
-        elif distance < 0:
-            exponent = self.base ** -distance
-            numerator = self.integer // exponent
-        else:
-            exponent = self.base ** distance
-            numerator = self.integer * exponent
-        result, mod = divmod(numerator, other.integer)
-        # python floors negative numbers down instead of truncating
-        # if mod is zero it will be floored to itself so we do not add one
-        result = result + 1 if result < 0 and mod else result
-        return Precise(result, precision)
+        integer, decimals = div(self.integer, self.decimals, other.integer, other.decimals, precision)
+        return Precise(integer, decimals)
 
     def add(self, other):
-        if self.decimals == other.decimals:
-            integer_result = self.integer + other.integer
-            return Precise(integer_result, self.decimals)
-        else:
-            smaller, bigger = [other, self] if self.decimals > other.decimals else [self, other]
-            exponent = bigger.decimals - smaller.decimals
-            normalised = smaller.integer * (self.base ** exponent)
-            result = normalised + bigger.integer
-            return Precise(result, bigger.decimals)
+        integer, decimals = add(self.integer, self.decimals, other.integer, other.decimals)
+        return Precise(integer, decimals)
 
     def sub(self, other):
-        negative = Precise(-other.integer, other.decimals)
-        return self.add(negative)
+        integer, decimals = add(self.integer, self.decimals, -other.integer, other.decimals)
+        return Precise(integer, decimals)
 
     def abs(self):
         return Precise(abs(self.integer), self.decimals)
@@ -119,12 +196,8 @@ class Precise:
         return Precise(-self.integer, self.decimals)
 
     def mod(self, other):
-        rationizerNumberator = max(-self.decimals + other.decimals, 0)
-        numerator = self.integer * (self.base ** rationizerNumberator)
-        rationizerDenominator = max(-other.decimals + self.decimals, 0)
-        denominator = other.integer * (self.base ** rationizerDenominator)
-        result = numerator % denominator
-        return Precise(result, rationizerDenominator + other.decimals)
+        integer, decimals = mod(self.integer, self.decimals, other.integer, other.decimals)
+        return Precise(integer, decimals)
 
     def min(self, other):
         return self if self.lt(other) else other
@@ -147,20 +220,8 @@ class Precise:
         return other.ge(self)
 
     def reduce(self):
-        string = str(self.integer)
-        start = len(string) - 1
-        if start == 0:
-            if string == "0":
-                self.decimals = 0
-            return self
-        for i in range(start, -1, -1):
-            if string[i] != '0':
-                break
-        difference = start - i
-        if difference == 0:
-            return self
-        self.decimals -= difference
-        self.integer = int(string[:i + 1])
+        self.integer, self.decimals = reduce(self.integer, self.decimals)
+        return self
 
     def equals(self, other):
         self.reduce()
@@ -169,19 +230,7 @@ class Precise:
 
     def __str__(self):
         self.reduce()
-        sign = '-' if self.integer < 0 else ''
-        integer_array = list(str(abs(self.integer)).rjust(self.decimals, '0'))
-        index = len(integer_array) - self.decimals
-        if index == 0:
-            item = '0.'
-        elif self.decimals < 0:
-            item = '0' * (-self.decimals)
-        elif self.decimals == 0:
-            item = ''
-        else:
-            item = '.'
-        integer_array.insert(index, item)
-        return sign + ''.join(integer_array)
+        return to_string(self.integer, self.decimals)
 
     def __repr__(self):
         return "Precise(" + str(self) + ")"
@@ -193,16 +242,20 @@ class Precise:
     def string_mul(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).mul(Precise(string2)))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        return to_string(integer1 * integer2, decimals1 + decimals2)
 
     @staticmethod
     def string_div(string1, string2, precision=18):
         if string1 is None or string2 is None:
             return None
-        string2_precise = Precise(string2)
-        if string2_precise.integer == 0:
+        integer2, decimals2 = parse(string2)
+        if integer2 == 0:
             return None
-        return str(Precise(string1).div(string2_precise, precision))
+        integer1, decimals1 = parse(string1)
+        integer, decimals = div(integer1, decimals1, integer2, decimals2, precision)
+        return to_string(integer, decimals)
 
     @staticmethod
     def string_add(string1, string2):
@@ -212,76 +265,124 @@ class Precise:
             return string2
         elif string2 is None:
             return string1
-        return str(Precise(string1).add(Precise(string2)))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        integer, decimals = add(integer1, decimals1, integer2, decimals2)
+        return to_string(integer, decimals)
 
     @staticmethod
     def string_sub(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).sub(Precise(string2)))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        integer, decimals = add(integer1, decimals1, -integer2, decimals2)
+        return to_string(integer, decimals)
 
     @staticmethod
     def string_abs(string):
         if string is None:
             return None
-        return str(Precise(string).abs())
+        integer, decimals = parse(string)
+        return to_string(abs(integer), decimals)
 
     @staticmethod
     def string_neg(string):
         if string is None:
             return None
-        return str(Precise(string).neg())
+        integer, decimals = parse(string)
+        return to_string(-integer, decimals)
 
     @staticmethod
     def string_mod(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).mod(Precise(string2)))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        integer, decimals = mod(integer1, decimals1, integer2, decimals2)
+        return to_string(integer, decimals)
 
     @staticmethod
     def string_equals(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        return compare(integer1, decimals1, integer2, decimals2) == 0
 
     @staticmethod
     def string_eq(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        return compare(integer1, decimals1, integer2, decimals2) == 0
 
     @staticmethod
     def string_min(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).min(Precise(string2)))
+        number1 = parse(string1)
+        number2 = parse(string2)
+        return to_string(*(number1 if compare(*number1, *number2) < 0 else number2))
 
     @staticmethod
     def string_max(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).max(Precise(string2)))
+        number1 = parse(string1)
+        number2 = parse(string2)
+        return to_string(*(number1 if compare(*number1, *number2) > 0 else number2))
 
     @staticmethod
     def string_gt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).gt(Precise(string2))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        return compare(integer1, decimals1, integer2, decimals2) > 0
 
     @staticmethod
     def string_ge(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).ge(Precise(string2))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        return compare(integer1, decimals1, integer2, decimals2) >= 0
 
     @staticmethod
     def string_lt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).lt(Precise(string2))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        return compare(integer1, decimals1, integer2, decimals2) < 0
 
     @staticmethod
     def string_le(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).le(Precise(string2))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        return compare(integer1, decimals1, integer2, decimals2) <= 0
+
+    @staticmethod
+    def string_sum(strings):
+        """
+        the same as chaining string_add() over the strings, the None strings are skipped
+        :param str[] strings: the amounts to sum
+        :returns str|None: the sum, None if all the strings are None
+        """
+        result = None
+        integer = 0
+        decimals = 0
+        count = 0
+        for string in strings:
+            if string is None:
+                continue
+            if count == 0:
+                result = string
+            integer2, decimals2 = parse(string)
+            integer, decimals = add(integer, decimals, integer2, decimals2)
+            count += 1
+        return to_string(integer, decimals) if count > 1 else result
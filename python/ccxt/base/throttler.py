@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+
+# -----------------------------------------------------------------------------
+# token buckets of the rest rate limiter, shared by the sync and the async Throttler
+#
+# every request draws from the default bucket (exchange.tokenBucket) and from the named
+# buckets it is routed to, a request may leave once all of them have tokens >= 0, after
+# which its cost is subtracted, so the tokens go negative by the cost of the last request
+# and the wait until the next one is computed from the refill rates instead of polling
+#
+#     exchange = ccxt.binance({
+#         'tokenBucket': {
+#             'buckets': {
+#                 'sapi': {'refillRate': 1 / 50, 'capacity': 1, 'apis': ['sapi', 'sapiV2']},
+#                 'uid': {'refillRate': 1 / 100, 'capacity': 10},
+#             },
+#         },
+#     })
+#
+# a request is charged in a named bucket either by the weight its Entry config declares
+# under the name of that bucket, like {'cost': 1, 'uid': 6}, or by its regular cost if its
+# api is listed in the 'apis' of that bucket
+
+
+class TokenBucket(object):
+
+    def __init__(self, config, timestamp):
+        self.config = config  # refillRate in tokens per millisecond, capacity, tokens
+        self.timestamp = timestamp
+
+    def refill(self, now):
+        tokens = self.config['tokens']
+        capacity = self.config['capacity']
+        # the initial tokens may exceed the capacity, they are spent before the bucket refills
+        if tokens < capacity and now > self.timestamp:
+            self.config['tokens'] = min(tokens + (now - self.timestamp) * self.config['refillRate'], capacity)
+        self.timestamp = now
+
+    def wait(self):
+        """
+        :returns float: milliseconds until the bucket has tokens >= 0 again
+        """
+        tokens = self.config['tokens']
+        if tokens >= 0:
+            return 0
+        return -tokens / self.config['refillRate']
+
+
+class Throttler(object):
+
+    def __init__(self, config):
+        self.config = {
+            'refillRate': 1.0,
+            'delay': 0.001,
+            'cost': 1.0,
+            'tokens': 0,
+            'maxCapacity': 2000,
+            'capacity': 1.0,
+        }
+        self.config.update(config)
+        now = self.now()
+        self.bucket = TokenBucket(self.config, now)
+        self.buckets = {}
+        for name, bucket in (self.config.get('buckets') or {}).items():
+            self.buckets[name] = TokenBucket(dict({'refillRate': 1.0, 'capacity': 1.0, 'tokens': 0}, **bucket), now)
+        self.requests = 0
+        self.delayed = 0
+        self.total_wait = 0
+        self.max_wait = 0
+        self.lock = threading.Lock()  # held by the request that is next to leave
+        self.queue_lock = threading.Lock()
+        self.queued = 0
+
+    @staticmethod
+    def now():
+        return time.monotonic() * 1000
+
+    def wait(self, buckets):
+        """
+        :param dict|None buckets: the cost of the request in the named buckets
+        :returns float: milliseconds until the request can leave
+        """
+        now = self.now()
+        self.bucket.refill(now)
+        wait = self.bucket.wait()
+        if buckets:
+            for name in buckets:
+                bucket = self.buckets[name]
+                bucket.refill(now)
+                wait = max(wait, bucket.wait())
+        return wait
+
+    def take(self, cost, buckets, queued_at):
+        self.config['tokens'] -= self.config['cost'] if cost is None else cost
+        if buckets:
+            for name, bucket_cost in buckets.items():
+                self.buckets[name].config['tokens'] -= bucket_cost
+        waited = self.now() - queued_at
+        self.requests += 1
+        if waited >= 1:
+            self.delayed += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def queue_depth(self):
+        return self.queued
+
+    def metrics(self):
+        """
+        :returns dict: the current queue depth, the requests let through so far and how long they have waited in milliseconds
+        """
+        return {
+            'queue': self.queue_depth(),
+            'requests': self.requests,
+            'delayed': self.delayed,
+            'totalWait': self.total_wait,
+            'averageWait': self.total_wait / self.requests if self.requests else 0,
+            'maxWait': self.max_wait,
+            'tokens': dict({name: bucket.config['tokens'] for name, bucket in self.buckets.items()}, default=self.config['tokens']),
+        }
+
+    def __call__(self, cost=None, buckets=None):
+        queued_at = self.now()
+        with self.queue_lock:
+            if self.queued > self.config['maxCapacity']:
+                raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
+            self.queued += 1
+        try:
+            # the threads holding the lock leave one by one, the others queue on it
+            with self.lock:
+                wait = self.wait(buckets)
+                while wait > 0:
+                    time.sleep(wait / 1000)
+                    wait = self.wait(buckets)
+                self.take(cost, buckets, queued_at)
+        finally:
+            with self.queue_lock:
+                self.queued -= 1
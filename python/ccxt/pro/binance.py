@@ -315,7 +315,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_fetch_order_book,
         }
-        orderbook = await self.watch(url, messageHash, message, messageHash, subscription)
+        orderbook = await self.watch(url, messageHash, message, messageHash, subscription, False)
         orderbook['symbol'] = market['symbol']
         return orderbook
 
@@ -909,7 +909,7 @@ class binance(ccxt.async_support.binance):
             'method': method,
             'params': self.sign_params(self.extend(payload, params)),
         }
-        ticker = await self.watch(url, messageHash, message, messageHash, subscription)
+        ticker = await self.watch(url, messageHash, message, messageHash, subscription, False)
         return ticker
 
     async def fetch_ohlcv_ws(self, symbol: str, timeframe='1m', since: Int = None, limit: Int = None, params={}) -> List[list]:
@@ -958,7 +958,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_fetch_ohlcv,
         }
-        return await self.watch(url, messageHash, message, messageHash, subscription)
+        return await self.watch(url, messageHash, message, messageHash, subscription, False)
 
     def handle_fetch_ohlcv(self, client: Client, message):
         #
@@ -1517,7 +1517,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_account_status_ws if (method == 'account.status') else self.handle_balance_ws,
         }
-        return await self.watch(url, messageHash, message, messageHash, subscription)
+        return await self.watch(url, messageHash, message, messageHash, subscription, False)
 
     def handle_balance_ws(self, client: Client, message):
         #
@@ -1620,7 +1620,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_positions_ws,
         }
-        result = await self.watch(url, messageHash, message, messageHash, subscription)
+        result = await self.watch(url, messageHash, message, messageHash, subscription, False)
         return self.filter_by_array_positions(result, 'symbol', symbols, False)
 
     def handle_positions_ws(self, client: Client, message):
@@ -1853,7 +1853,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_order_ws,
         }
-        return await self.watch(url, messageHash, message, messageHash, subscription)
+        return await self.watch(url, messageHash, message, messageHash, subscription, False)
 
     def handle_order_ws(self, client: Client, message):
         #
@@ -1989,7 +1989,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_edit_order_ws,
         }
-        return await self.watch(url, messageHash, message, messageHash, subscription)
+        return await self.watch(url, messageHash, message, messageHash, subscription, False)
 
     def handle_edit_order_ws(self, client: Client, message):
         #
@@ -2139,7 +2139,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_order_ws,
         }
-        return await self.watch(url, messageHash, message, messageHash, subscription)
+        return await self.watch(url, messageHash, message, messageHash, subscription, False)
 
     async def cancel_all_orders_ws(self, symbol: Str = None, params={}):
         """
@@ -2171,7 +2171,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_orders_ws,
         }
-        return await self.watch(url, messageHash, message, messageHash, subscription)
+        return await self.watch(url, messageHash, message, messageHash, subscription, False)
 
     async def fetch_order_ws(self, id: str, symbol: Str = None, params={}) -> Order:
         """
@@ -2211,7 +2211,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_order_ws,
         }
-        return await self.watch(url, messageHash, message, messageHash, subscription)
+        return await self.watch(url, messageHash, message, messageHash, subscription, False)
 
     async def fetch_orders_ws(self, symbol: Str = None, since: Int = None, limit: Int = None, params={}) -> List[Order]:
         """
@@ -2251,7 +2251,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_orders_ws,
         }
-        orders = await self.watch(url, messageHash, message, messageHash, subscription)
+        orders = await self.watch(url, messageHash, message, messageHash, subscription, False)
         return self.filter_by_symbol_since_limit(orders, symbol, since, limit)
 
     async def fetch_closed_orders_ws(self, symbol: Str = None, since: Int = None, limit: Int = None, params={}) -> List[Order]:
@@ -2305,7 +2305,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_orders_ws,
         }
-        orders = await self.watch(url, messageHash, message, messageHash, subscription)
+        orders = await self.watch(url, messageHash, message, messageHash, subscription, False)
         return self.filter_by_symbol_since_limit(orders, symbol, since, limit)
 
     async def watch_orders(self, symbol: Str = None, since: Int = None, limit: Int = None, params={}) -> List[Order]:
@@ -2830,7 +2830,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_trades_ws,
         }
-        trades = await self.watch(url, messageHash, message, messageHash, subscription)
+        trades = await self.watch(url, messageHash, message, messageHash, subscription, False)
         return self.filter_by_symbol_since_limit(trades, symbol, since, limit)
 
     async def fetch_trades_ws(self, symbol: Str = None, since: Int = None, limit: Int = None, params={}) -> List[Trade]:
@@ -2872,7 +2872,7 @@ class binance(ccxt.async_support.binance):
         subscription = {
             'method': self.handle_trades_ws,
         }
-        trades = await self.watch(url, messageHash, message, messageHash, subscription)
+        trades = await self.watch(url, messageHash, message, messageHash, subscription, False)
         return self.filter_by_since_limit(trades, since, limit)
 
     def handle_trades_ws(self, client: Client, message):
@@ -3094,6 +3094,34 @@ class binance(ccxt.async_support.binance):
         if self.safe_string(code, 0) == '5':
             client.reset(message)
 
+    def message_routes(self):
+        return {
+            'event': {
+                'depthUpdate': self.handle_order_book,
+                'trade': self.handle_trade,
+                'aggTrade': self.handle_trade,
+                'kline': self.handle_ohlcv,
+                'markPrice_kline': self.handle_ohlcv,
+                'indexPrice_kline': self.handle_ohlcv,
+                '1hTicker@arr': self.handle_tickers,
+                '4hTicker@arr': self.handle_tickers,
+                '1dTicker@arr': self.handle_tickers,
+                '24hrTicker@arr': self.handle_tickers,
+                '24hrMiniTicker@arr': self.handle_tickers,
+                '1hTicker': self.handle_tickers,
+                '4hTicker': self.handle_tickers,
+                '1dTicker': self.handle_tickers,
+                '24hrTicker': self.handle_tickers,
+                '24hrMiniTicker': self.handle_tickers,
+                'bookTicker': self.handle_bids_asks,  # there is no "bookTicker@arr" endpoint
+                'outboundAccountPosition': self.handle_balance,
+                'balanceUpdate': self.handle_balance,
+                'ACCOUNT_UPDATE': self.handle_acount_update,
+                'executionReport': self.handle_order_update,
+                'ORDER_TRADE_UPDATE': self.handle_order_update,
+            },
+        }
+
     def handle_message(self, client: Client, message):
         # handle WebSocketAPI
         status = self.safe_string(message, 'status')
@@ -3108,35 +3136,11 @@ class binance(ccxt.async_support.binance):
             method(client, message)
             return
         # handle other APIs
-        methods = {
-            'depthUpdate': self.handle_order_book,
-            'trade': self.handle_trade,
-            'aggTrade': self.handle_trade,
-            'kline': self.handle_ohlcv,
-            'markPrice_kline': self.handle_ohlcv,
-            'indexPrice_kline': self.handle_ohlcv,
-            '1hTicker@arr': self.handle_tickers,
-            '4hTicker@arr': self.handle_tickers,
-            '1dTicker@arr': self.handle_tickers,
-            '24hrTicker@arr': self.handle_tickers,
-            '24hrMiniTicker@arr': self.handle_tickers,
-            '1hTicker': self.handle_tickers,
-            '4hTicker': self.handle_tickers,
-            '1dTicker': self.handle_tickers,
-            '24hrTicker': self.handle_tickers,
-            '24hrMiniTicker': self.handle_tickers,
-            'bookTicker': self.handle_bids_asks,  # there is no "bookTicker@arr" endpoint
-            'outboundAccountPosition': self.handle_balance,
-            'balanceUpdate': self.handle_balance,
-            'ACCOUNT_UPDATE': self.handle_acount_update,
-            'executionReport': self.handle_order_update,
-            'ORDER_TRADE_UPDATE': self.handle_order_update,
-        }
         event = self.safe_string(message, 'e')
         if isinstance(message, list):
             data = message[0]
             event = self.safe_string(data, 'e') + '@arr'
-        method = self.safe_value(methods, event)
+        method = self.message_handler('event', event)
         if method is None:
             requestId = self.safe_string(message, 'id')
             if requestId is not None:
@@ -620,30 +620,26 @@ class bitfinex2(ccxt.async_support.bitfinex2):
         if book is None:
             return
         depth = 25  # covers the first 25 bids and asks
-        stringArray = []
-        bids = book['bids']
-        asks = book['asks']
         prec = self.safe_string(subscription, 'prec', 'P0')
         isRaw = (prec == 'R0')
-        idToCheck = 2 if isRaw else 0
         # pepperoni pizza from bitfinex
-        for i in range(0, depth):
-            bid = self.safe_value(bids, i)
-            ask = self.safe_value(asks, i)
-            if bid is not None:
-                stringArray.append(self.number_to_string(bids[i][idToCheck]))
-                stringArray.append(self.number_to_string(bids[i][1]))
-            if ask is not None:
-                stringArray.append(self.number_to_string(asks[i][idToCheck]))
-                aski1 = asks[i][1]
-                stringArray.append(self.number_to_string(-aski1))
-        payload = ':'.join(stringArray)
-        localChecksum = self.crc32(payload, True)
+        piece = self.raw_checksum_piece if isRaw else self.checksum_piece
+        localChecksum = self.order_book_checksum(book, depth, piece)
         responseChecksum = self.safe_integer(message, 2)
         if responseChecksum != localChecksum:
             error = InvalidNonce(self.id + ' invalid checksum')
             client.reject(error, messageHash)
 
+    def checksum_piece(self, level, strings, ask):
+        # the amounts of the asks are negative
+        amount = -level[1] if ask else level[1]
+        return self.number_to_string(level[0]) + ':' + self.number_to_string(amount)
+
+    def raw_checksum_piece(self, level, strings, ask):
+        # the order id in place of the price
+        amount = -level[1] if ask else level[1]
+        return self.number_to_string(level[2]) + ':' + self.number_to_string(amount)
+
     async def watch_balance(self, params={}) -> Balances:
         """
         watch balance and get the amount of funds available for trading or funds locked in orders
@@ -56,6 +56,13 @@ class bitget(ccxt.async_support.bitget):
             'options': {
                 'tradesLimit': 1000,
                 'OHLCVLimit': 1000,
+                'ws': {
+                    # the subscriptions of one turn of the event loop are sent together, up to 20 channels per request
+                    'batch': {
+                        'key': 'args',
+                        'size': 20,
+                    },
+                },
                 # WS timeframes differ from REST timeframes
                 'timeframes': {
                     '1m': '1m',
@@ -510,8 +517,7 @@ class bitget(ccxt.async_support.bitget):
         if incrementalBook:
             # storedOrderBook = self.safe_value(self.orderbooks, symbol)
             if not (symbol in self.orderbooks):
-                # ob = self.order_book({})
-                ob = self.counted_order_book({})
+                ob = self.order_book({})
                 ob['symbol'] = symbol
                 self.orderbooks[symbol] = ob
             storedOrderBook = self.orderbooks[symbol]
@@ -524,20 +530,8 @@ class bitget(ccxt.async_support.bitget):
             checksum = self.safe_bool(self.options, 'checksum', True)
             isSnapshot = self.safe_string(message, 'action') == 'snapshot'  # snapshot does not have a checksum
             if not isSnapshot and checksum:
-                storedAsks = storedOrderBook['asks']
-                storedBids = storedOrderBook['bids']
-                asksLength = len(storedAsks)
-                bidsLength = len(storedBids)
-                payloadArray = []
-                for i in range(0, 25):
-                    if i < bidsLength:
-                        payloadArray.append(storedBids[i][2][0])
-                        payloadArray.append(storedBids[i][2][1])
-                    if i < asksLength:
-                        payloadArray.append(storedAsks[i][2][0])
-                        payloadArray.append(storedAsks[i][2][1])
-                payload = ':'.join(payloadArray)
-                calculatedChecksum = self.crc32(payload, True)
+                # the first 25 bids and asks, one level after the other, from the strings of the levels
+                calculatedChecksum = self.order_book_checksum(storedOrderBook, 25, self.checksum_piece)
                 responseChecksum = self.safe_integer(rawOrderBook, 'checksum')
                 if calculatedChecksum != responseChecksum:
                     error = InvalidNonce(self.id + ' invalid checksum')
@@ -553,8 +547,12 @@ class bitget(ccxt.async_support.bitget):
         bidAsk = self.parse_bid_ask(delta, 0, 1)
         # we store the string representations in the orderbook for checksum calculation
         # self simplifies the code for generating checksums do not need to do any complex number transformations
-        bidAsk.append(delta)
-        bookside.storeArray(bidAsk)
+        bookside.storeWithStrings(bidAsk[0], bidAsk[1], self.safe_string(delta, 0), self.safe_string(delta, 1))
+
+    def checksum_piece(self, level, strings, ask):
+        if strings is None:
+            return self.number_to_string(level[0]) + ':' + self.number_to_string(level[1])
+        return strings[0] + ':' + strings[1]
 
     def handle_deltas(self, bookside, deltas):
         for i in range(0, len(deltas)):
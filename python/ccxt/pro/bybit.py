@@ -85,6 +85,14 @@ class bybit(ccxt.async_support.bybit):
                 },
             },
             'options': {
+                'ws': {
+                    # the subscriptions of one turn of the event loop are sent together, up to 10 topics per request on spot
+                    'batch': {
+                        'key': 'args',
+                        'size': 10,
+                        'ignore': ['req_id'],
+                    },
+                },
                 'watchTicker': {
                     'name': 'tickers',  # 'tickers' for 24hr statistical ticker or 'tickers_lt' for leverage token ticker
                 },
@@ -220,7 +228,7 @@ class bybit(ccxt.async_support.bybit):
                 'X-BAPI-RECV-WINDOW': str(self.options['recvWindow']),
             },
         }
-        return await self.watch(url, requestId, request, requestId, True)
+        return await self.watch(url, requestId, request, requestId, True, False)
 
     async def edit_order_ws(self, id: str, symbol: str, type: OrderType, side: OrderSide, amount: Num = None, price: Num = None, params={}):
         """
@@ -262,7 +270,7 @@ class bybit(ccxt.async_support.bybit):
                 'X-BAPI-RECV-WINDOW': str(self.options['recvWindow']),
             },
         }
-        return await self.watch(url, requestId, request, requestId, True)
+        return await self.watch(url, requestId, request, requestId, True, False)
 
     async def cancel_order_ws(self, id: str, symbol: Str = None, params={}):
         """
@@ -293,7 +301,7 @@ class bybit(ccxt.async_support.bybit):
                 'X-BAPI-RECV-WINDOW': str(self.options['recvWindow']),
             },
         }
-        return await self.watch(url, requestId, request, requestId, True)
+        return await self.watch(url, requestId, request, requestId, True, False)
 
     async def watch_ticker(self, symbol: str, params={}) -> Ticker:
         """
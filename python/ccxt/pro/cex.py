@@ -314,7 +314,7 @@ class cex(ccxt.async_support.cex):
             'oid': messageHash,
             'data': [market['base'], market['quote']],
         }, params)
-        return await self.watch(url, messageHash, request, messageHash)
+        return await self.watch(url, messageHash, request, messageHash, None, False)
 
     def handle_ticker(self, client: Client, message):
         #
@@ -417,7 +417,7 @@ class cex(ccxt.async_support.cex):
             'e': 'get-balance',
             'oid': messageHash,
         }, params)
-        return await self.watch(url, messageHash, request, messageHash)
+        return await self.watch(url, messageHash, request, messageHash, None, False)
 
     async def watch_orders(self, symbol: Str = None, since: Int = None, limit: Int = None, params={}) -> List[Order]:
         """
@@ -1148,7 +1148,7 @@ class cex(ccxt.async_support.cex):
             'oid': messageHash,
             'data': data,
         }
-        response = await self.watch(url, messageHash, request, messageHash)
+        response = await self.watch(url, messageHash, request, messageHash, None, False)
         return self.parse_order(response, market)
 
     async def fetch_open_orders_ws(self, symbol: Str = None, since: Int = None, limit: Int = None, params={}):
@@ -1176,7 +1176,7 @@ class cex(ccxt.async_support.cex):
             'oid': messageHash,
             'data': data,
         }
-        response = await self.watch(url, messageHash, request, messageHash)
+        response = await self.watch(url, messageHash, request, messageHash, None, False)
         return self.parse_orders(response, market, since, limit, params)
 
     async def create_order_ws(self, symbol: str, type: OrderType, side: OrderSide, amount: float, price: Num = None, params={}) -> Order:
@@ -1210,7 +1210,7 @@ class cex(ccxt.async_support.cex):
             'oid': messageHash,
             'data': data,
         }
-        rawOrder = await self.watch(url, messageHash, request, messageHash)
+        rawOrder = await self.watch(url, messageHash, request, messageHash, None, False)
         return self.parse_order(rawOrder, market)
 
     async def edit_order_ws(self, id: str, symbol: str, type: OrderType, side: OrderSide, amount: Num = None, price: Num = None, params={}) -> Order:
@@ -1247,7 +1247,7 @@ class cex(ccxt.async_support.cex):
             'oid': messageHash,
             'data': data,
         }
-        response = await self.watch(url, messageHash, request, messageHash, messageHash)
+        response = await self.watch(url, messageHash, request, messageHash, messageHash, False)
         return self.parse_order(response, market)
 
     async def cancel_order_ws(self, id: str, symbol: Str = None, params={}):
@@ -1274,7 +1274,7 @@ class cex(ccxt.async_support.cex):
             'oid': messageHash,
             'data': data,
         }
-        response = await self.watch(url, messageHash, request, messageHash, messageHash)
+        response = await self.watch(url, messageHash, request, messageHash, messageHash, False)
         return self.parse_order(response, market)
 
     async def cancel_orders_ws(self, ids: List[str], symbol: Str = None, params={}):
@@ -1300,7 +1300,7 @@ class cex(ccxt.async_support.cex):
             'oid': messageHash,
             'data': data,
         }
-        response = await self.watch(url, messageHash, request, messageHash, messageHash)
+        response = await self.watch(url, messageHash, request, messageHash, messageHash, False)
         #
         #    {
         #        "cancel-orders": [{
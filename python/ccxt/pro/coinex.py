@@ -596,7 +596,7 @@ class coinex(ccxt.async_support.coinex):
         }
         subscriptionHash = id
         request = self.deep_extend(subscribe, query)
-        ohlcvs = await self.watch(url, messageHash, request, subscriptionHash, subscription)
+        ohlcvs = await self.watch(url, messageHash, request, subscriptionHash, subscription, False)
         return self.filter_by_since_limit(ohlcvs, since, limit, 0)
 
     def handle_delta(self, bookside, delta):
@@ -151,7 +151,7 @@ class kraken(ccxt.async_support.kraken):
             'volume': self.amount_to_precision(symbol, amount),
         }
         request, params = self.orderRequest('createOrderWs', symbol, type, request, price, params)
-        return await self.watch(url, messageHash, self.extend(request, params), messageHash)
+        return await self.watch(url, messageHash, self.extend(request, params), messageHash, None, False)
 
     def handle_create_edit_order(self, client, message):
         #
@@ -205,7 +205,7 @@ class kraken(ccxt.async_support.kraken):
             'volume': self.amount_to_precision(symbol, amount),
         }
         request, params = self.orderRequest('editOrderWs', symbol, type, request, price, params)
-        return await self.watch(url, messageHash, self.extend(request, params), messageHash)
+        return await self.watch(url, messageHash, self.extend(request, params), messageHash, None, False)
 
     async def cancel_orders_ws(self, ids: List[str], symbol: Str = None, params={}):
         """
@@ -227,7 +227,7 @@ class kraken(ccxt.async_support.kraken):
             'reqid': requestId,
             'txid': ids,
         }
-        return await self.watch(url, messageHash, self.extend(request, params), messageHash)
+        return await self.watch(url, messageHash, self.extend(request, params), messageHash, None, False)
 
     async def cancel_order_ws(self, id: str, symbol: Str = None, params={}) -> Order:
         """
@@ -251,7 +251,7 @@ class kraken(ccxt.async_support.kraken):
             'reqid': requestId,
             'txid': [clientOrderId],
         }
-        return await self.watch(url, messageHash, self.extend(request, params), messageHash)
+        return await self.watch(url, messageHash, self.extend(request, params), messageHash, None, False)
 
     def handle_cancel_order(self, client, message):
         #
@@ -285,7 +285,7 @@ class kraken(ccxt.async_support.kraken):
             'token': token,
             'reqid': requestId,
         }
-        return await self.watch(url, messageHash, self.extend(request, params), messageHash)
+        return await self.watch(url, messageHash, self.extend(request, params), messageHash, None, False)
 
     def handle_cancel_all_orders(self, client, message):
         #
@@ -705,33 +705,18 @@ class kraken(ccxt.async_support.kraken):
                     b = self.safe_value(message[1], 'b', [])
             storedAsks = orderbook['asks']
             storedBids = orderbook['bids']
-            example = None
             if a is not None:
                 timestamp = self.custom_handle_deltas(storedAsks, a, timestamp)
-                example = self.safe_value(a, 0)
             if b is not None:
                 timestamp = self.custom_handle_deltas(storedBids, b, timestamp)
-                example = self.safe_value(b, 0)
             # don't remove self line or I will poop on your face
             orderbook.limit()
             checksum = self.safe_bool(self.options, 'checksum', True)
             if checksum:
-                priceString = self.safe_string(example, 0)
-                amountString = self.safe_string(example, 1)
-                priceParts = priceString.split('.')
-                amountParts = amountString.split('.')
-                priceLength = len(priceParts[1]) - 0
-                amountLength = len(amountParts[1]) - 0
-                payloadArray = []
+                localChecksum = self.crc32('', False)
                 if c is not None:
-                    for i in range(0, 10):
-                        formatted = self.format_number(storedAsks[i][0], priceLength) + self.format_number(storedAsks[i][1], amountLength)
-                        payloadArray.append(formatted)
-                    for i in range(0, 10):
-                        formatted = self.format_number(storedBids[i][0], priceLength) + self.format_number(storedBids[i][1], amountLength)
-                        payloadArray.append(formatted)
-                payload = ''.join(payloadArray)
-                localChecksum = self.crc32(payload, False)
+                    # the first 10 asks then the first 10 bids, from the strings of the levels
+                    localChecksum = self.order_book_checksum(orderbook, 10, self.checksum_piece, False, '', False)
                 if localChecksum != c:
                     error = InvalidNonce(self.id + ' invalid checksum')
                     client.reject(error, messageHash)
@@ -756,6 +741,17 @@ class kraken(ccxt.async_support.kraken):
         else:
             return joined
 
+    def checksum_piece(self, level, strings, ask):
+        # the price and the amount as they were received, without the dots and the leading zeros
+        return self.checksum_digits(strings[0]) + self.checksum_digits(strings[1])
+
+    def checksum_digits(self, numberString):
+        digits = numberString.replace('.', '')
+        i = 0
+        while(digits[i] == '0'):
+            i += 1
+        return digits[i:]
+
     def custom_handle_deltas(self, bookside, deltas, timestamp=None):
         for j in range(0, len(deltas)):
             delta = deltas[j]
@@ -763,7 +759,7 @@ class kraken(ccxt.async_support.kraken):
             amount = self.parse_number(delta[1])
             oldTimestamp = timestamp if timestamp else 0
             timestamp = max(oldTimestamp, self.parse_to_int(float(delta[2]) * 1000))
-            bookside.store(price, amount)
+            bookside.storeWithStrings(price, amount, delta[0], delta[1])
         return timestamp
 
     def handle_system_status(self, client: Client, message):
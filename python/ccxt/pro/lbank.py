@@ -94,7 +94,7 @@ class lbank(ccxt.async_support.lbank):
             message['size'] = limit
         request = self.deep_extend(message, params)
         requestId = self.request_id()
-        return await self.watch(url, messageHash, request, requestId, request)
+        return await self.watch(url, messageHash, request, requestId, request, False)
 
     async def watch_ohlcv(self, symbol: str, timeframe='1m', since: Int = None, limit: Int = None, params={}) -> List[list]:
         """
@@ -246,7 +246,7 @@ class lbank(ccxt.async_support.lbank):
         }
         request = self.deep_extend(message, params)
         requestId = self.request_id()
-        return await self.watch(url, messageHash, request, requestId, request)
+        return await self.watch(url, messageHash, request, requestId, request, False)
 
     async def watch_ticker(self, symbol: str, params={}) -> Ticker:
         """
@@ -373,7 +373,7 @@ class lbank(ccxt.async_support.lbank):
         }
         request = self.deep_extend(message, params)
         requestId = self.request_id()
-        return await self.watch(url, messageHash, request, requestId, request)
+        return await self.watch(url, messageHash, request, requestId, request, False)
 
     async def watch_trades(self, symbol: str, since: Int = None, limit: Int = None, params={}) -> List[Trade]:
         """
@@ -659,7 +659,7 @@ class lbank(ccxt.async_support.lbank):
             'pair': market['id'],
         }
         request = self.deep_extend(subscribe, params)
-        orderbook = await self.watch(url, messageHash, request, messageHash)
+        orderbook = await self.watch(url, messageHash, request, messageHash, None, False)
         return orderbook.limit()
 
     async def watch_order_book(self, symbol: str, limit: Int = None, params={}) -> OrderBook:
@@ -95,6 +95,11 @@ class okx(ccxt.async_support.okx):
                 },
                 'ws': {
                     # 'inflate': True,
+                    # the subscriptions of one turn of the event loop are sent together, up to 100 channels per request
+                    'batch': {
+                        'key': 'args',
+                        'size': 100,
+                    },
                 },
                 'checksum': True,
             },
@@ -510,7 +515,7 @@ class okx(ccxt.async_support.okx):
         #
         price = self.safe_float(delta, 0)
         amount = self.safe_float(delta, 1)
-        bookside.store(price, amount)
+        bookside.storeWithStrings(price, amount, self.safe_string(delta, 0), self.safe_string(delta, 1))
 
     def handle_deltas(self, bookside, deltas):
         for i in range(0, len(deltas)):
@@ -541,19 +546,9 @@ class okx(ccxt.async_support.okx):
         self.handle_deltas(storedBids, bids)
         checksum = self.safe_bool(self.options, 'checksum', True)
         if checksum:
-            asksLength = len(storedAsks)
-            bidsLength = len(storedBids)
-            payloadArray = []
-            for i in range(0, 25):
-                if i < bidsLength:
-                    payloadArray.append(self.number_to_string(storedBids[i][0]))
-                    payloadArray.append(self.number_to_string(storedBids[i][1]))
-                if i < asksLength:
-                    payloadArray.append(self.number_to_string(storedAsks[i][0]))
-                    payloadArray.append(self.number_to_string(storedAsks[i][1]))
-            payload = ':'.join(payloadArray)
+            # the first 25 bids and asks, one level after the other, from the strings of the levels
             responseChecksum = self.safe_integer(message, 'checksum')
-            localChecksum = self.crc32(payload, True)
+            localChecksum = self.order_book_checksum(orderbook, 25, self.checksum_piece)
             if responseChecksum != localChecksum:
                 error = InvalidNonce(self.id + ' invalid checksum')
                 client.reject(error, messageHash)
@@ -562,6 +557,11 @@ class okx(ccxt.async_support.okx):
         orderbook['datetime'] = self.iso8601(timestamp)
         return orderbook
 
+    def checksum_piece(self, level, strings, ask):
+        if strings is None:
+            return self.number_to_string(level[0]) + ':' + self.number_to_string(level[1])
+        return strings[0] + ':' + strings[1]
+
     def handle_order_book(self, client: Client, message):
         #
         # snapshot
@@ -1216,7 +1216,7 @@ class okx(ccxt.async_support.okx):
             'op': op,
             'args': [args],
         }
-        return await self.watch(url, messageHash, request, messageHash)
+        return await self.watch(url, messageHash, request, messageHash, None, False)
 
     def handle_place_orders(self, client: Client, message):
         #
@@ -1276,7 +1276,7 @@ class okx(ccxt.async_support.okx):
             'op': op,
             'args': [args],
         }
-        return await self.watch(url, messageHash, self.extend(request, params), messageHash)
+        return await self.watch(url, messageHash, self.extend(request, params), messageHash, None, False)
 
     async def cancel_order_ws(self, id: str, symbol: Str = None, params={}) -> Order:
         """
@@ -1308,7 +1308,7 @@ class okx(ccxt.async_support.okx):
             'op': 'cancel-order',
             'args': [self.extend(arg, params)],
         }
-        return await self.watch(url, messageHash, request, messageHash)
+        return await self.watch(url, messageHash, request, messageHash, None, False)
 
     async def cancel_orders_ws(self, ids: List[str], symbol: Str = None, params={}):
         """
@@ -1340,7 +1340,7 @@ class okx(ccxt.async_support.okx):
             'op': 'batch-cancel-orders',
             'args': args,
         }
-        return await self.watch(url, messageHash, self.deep_extend(request, params), messageHash)
+        return await self.watch(url, messageHash, self.deep_extend(request, params), messageHash, None, False)
 
     async def cancel_all_orders_ws(self, symbol: Str = None, params={}):
         """
@@ -1367,7 +1367,7 @@ class okx(ccxt.async_support.okx):
                 'instFamily': market['id'],
             }, params)],
         }
-        return await self.watch(url, messageHash, request, messageHash)
+        return await self.watch(url, messageHash, request, messageHash, None, False)
 
     def handle_cancel_all_orders(self, client: Client, message):
         #
@@ -1435,6 +1435,40 @@ class okx(ccxt.async_support.okx):
                 client.reject(e)
         return message
 
+    def message_routes(self):
+        return {
+            'event': {
+                # 'info': self.handleSystemStatus,
+                # 'book': 'handleOrderBook',
+                'login': self.handle_authenticate,
+                'subscribe': self.handle_subscription_status,
+                'order': self.handle_place_orders,
+                'batch-orders': self.handle_place_orders,
+                'amend-order': self.handle_place_orders,
+                'batch-amend-orders': self.handle_place_orders,
+                'cancel-order': self.handle_place_orders,
+                'mass-cancel': self.handle_cancel_all_orders,
+            },
+            'channel': {
+                'bbo-tbt': self.handle_order_book,  # newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
+                'books': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required
+                'books5': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms(vs. every 200ms now)
+                'books50-l2-tbt': self.handle_order_book,  # only users who're VIP4 and above can subscribe, identity verification required before subscription
+                'books-l2-tbt': self.handle_order_book,  # only users who're VIP5 and above can subscribe, identity verification required before subscription
+                'tickers': self.handle_ticker,
+                'positions': self.handle_positions,
+                'index-tickers': self.handle_ticker,
+                'sprd-tickers': self.handle_ticker,
+                'block-tickers': self.handle_ticker,
+                'trades': self.handle_trades,
+                'account': self.handle_balance,
+                # 'margin_account': self.handle_balance,
+                'orders': self.handle_orders,
+                'orders-algo': self.handle_orders,
+                'candle*': self.handle_ohlcv,
+            },
+        }
+
     def handle_message(self, client: Client, message):
         if not self.handle_error_message(client, message):
             return
@@ -1484,44 +1518,12 @@ class okx(ccxt.async_support.okx):
         # if table is None:
         event = self.safe_string_2(message, 'event', 'op')
         if event is not None:
-            methods = {
-                # 'info': self.handleSystemStatus,
-                # 'book': 'handleOrderBook',
-                'login': self.handle_authenticate,
-                'subscribe': self.handle_subscription_status,
-                'order': self.handle_place_orders,
-                'batch-orders': self.handle_place_orders,
-                'amend-order': self.handle_place_orders,
-                'batch-amend-orders': self.handle_place_orders,
-                'cancel-order': self.handle_place_orders,
-                'mass-cancel': self.handle_cancel_all_orders,
-            }
-            method = self.safe_value(methods, event)
+            method = self.message_handler('event', event)
             if method is not None:
                 method(client, message)
         else:
             arg = self.safe_value(message, 'arg', {})
             channel = self.safe_string(arg, 'channel')
-            methods = {
-                'bbo-tbt': self.handle_order_book,  # newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
-                'books': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required
-                'books5': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms(vs. every 200ms now)
-                'books50-l2-tbt': self.handle_order_book,  # only users who're VIP4 and above can subscribe, identity verification required before subscription
-                'books-l2-tbt': self.handle_order_book,  # only users who're VIP5 and above can subscribe, identity verification required before subscription
-                'tickers': self.handle_ticker,
-                'positions': self.handle_positions,
-                'index-tickers': self.handle_ticker,
-                'sprd-tickers': self.handle_ticker,
-                'block-tickers': self.handle_ticker,
-                'trades': self.handle_trades,
-                'account': self.handle_balance,
-                # 'margin_account': self.handle_balance,
-                'orders': self.handle_orders,
-                'orders-algo': self.handle_orders,
-            }
-            method = self.safe_value(methods, channel)
-            if method is None:
-                if channel.find('candle') == 0:
-                    self.handle_ohlcv(client, message)
-            else:
+            method = self.message_handler('channel', channel)
+            if method is not None:
                 method(client, message)
@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+from aiohttp import web  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# subscribes to a universe of symbols on a local websocket server, once with a frame per
+# subscription throttled one by one, and once with the frames merged by options['ws']['batch']
+#
+#     python benchmark_batching.py [symbols] [rateLimit in ms]
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+rateLimit = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+
+async def handle_ws(request):
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    async for message in ws:
+        for symbol in json.loads(message.data)['args']:
+            await ws.send_str(json.dumps({'symbol': symbol}))
+    return ws
+
+
+class mock(Exchange):
+    def describe(self):
+        return self.deep_extend(super(mock, self).describe(), {
+            'id': 'mock',
+            'rateLimit': rateLimit,
+        })
+
+    async def watch_ticker(self, symbol, params={}):
+        message_hash = 'ticker:' + symbol
+        return await self.watch(self.urls['api']['ws'], message_hash, {'op': 'subscribe', 'args': [symbol]}, message_hash)
+
+    def handle_message(self, client, message):
+        client.resolve(message, 'ticker:' + message['symbol'])
+
+
+async def subscribe(url, options):
+    exchange = mock({'urls': {'api': {'ws': url}}, 'options': options})
+    begin = time.perf_counter()
+    await asyncio.gather(*[exchange.watch_ticker('S' + str(i) + '/USDT') for i in range(count)])
+    elapsed = time.perf_counter() - begin
+    await exchange.close()
+    return elapsed
+
+
+async def main():
+    app = web.Application()
+    app.router.add_get('/ws', handle_ws)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = 'ws://127.0.0.1:' + str(port) + '/ws'
+    try:
+        before = await subscribe(url, {})
+        after = await subscribe(url, {'ws': {'batch': {'key': 'args', 'size': 100}}})
+    finally:
+        await runner.cleanup()
+    print('%d subscriptions, rateLimit %d ms' % (count, rateLimit))
+    print('frame per subscription  %8.3f s' % before)
+    print('batched frames          %8.3f s %6.1fx' % (after, before / after))
+
+
+asyncio.run(main())
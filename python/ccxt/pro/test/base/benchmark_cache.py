@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.async_support.base.ws.cache import ArrayCacheBySymbolById  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# execution reports of random open orders appended to order caches of growing size, the time
+# of an update does not depend on the number of the cached orders
+#
+#     python benchmark_cache.py [updates]
+
+updates = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+symbols = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'XRP/USDT']
+
+
+def run(size):
+    rng = random.Random(size)
+    cache = ArrayCacheBySymbolById(size)
+    for i in range(size):
+        cache.append({'symbol': symbols[i % len(symbols)], 'id': str(i), 'status': 'open', 'filled': 0})
+    reports = []
+    for i in range(updates):
+        # most of the reports update a cached order, the others evict the oldest one
+        index = rng.randrange(size) if rng.random() < 0.9 else size + i
+        reports.append({'symbol': symbols[index % len(symbols)], 'id': str(index), 'status': 'open', 'filled': i})
+    begin = time.perf_counter()
+    for i, report in enumerate(reports):
+        cache.append(report)
+        if i % 100 == 0:
+            cache.getLimit(report['symbol'], None)
+    elapsed = time.perf_counter() - begin
+    assert len(cache) == size
+    return elapsed
+
+
+def main():
+    for size in [1000, 10000, 100000]:
+        elapsed = run(size)
+        print('%7d cached orders %10.3f s %8.2f us per update' % (size, elapsed, elapsed / updates * 1000000))
+
+
+main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import json
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt.pro  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# routes websocket frames to their handlers with the tables of binance and okx, once with the
+# table of bound methods built again for every frame, the way their handle_message() did it,
+# and once with message_handler(), only the routing is measured, the handlers are not called
+#
+#     python benchmark_dispatch.py [exchange frames.jsonl]
+#
+# the optional file holds one recorded frame of the exchange per line
+
+frames = {
+    'binance': ('event', lambda message: message['e'], [
+        {'e': 'depthUpdate', 'E': 1, 's': 'BTCUSDT', 'U': 1, 'u': 2, 'b': [], 'a': []},
+        {'e': 'trade', 'E': 1, 's': 'BTCUSDT', 't': 1, 'p': '1', 'q': '1'},
+        {'e': 'kline', 'E': 1, 's': 'BTCUSDT', 'k': {}},
+        {'e': '24hrTicker', 'E': 1, 's': 'BTCUSDT'},
+        {'e': 'executionReport', 'E': 1, 's': 'BTCUSDT'},
+    ]),
+    'okx': ('channel', lambda message: message['arg']['channel'], [
+        {'arg': {'channel': 'books', 'instId': 'BTC-USDT'}, 'data': []},
+        {'arg': {'channel': 'trades', 'instId': 'BTC-USDT'}, 'data': []},
+        {'arg': {'channel': 'candle1m', 'instId': 'BTC-USDT'}, 'data': []},
+        {'arg': {'channel': 'tickers', 'instId': 'BTC-USDT'}, 'data': []},
+        {'arg': {'channel': 'orders', 'instType': 'SPOT'}, 'data': []},
+    ]),
+}
+count = 200000
+
+
+def rebuilt(exchange, table, key):
+    methods = exchange.message_routes()[table]
+    method = exchange.safe_value(methods, key)
+    if method is None and key.startswith('candle'):
+        method = exchange.handle_ohlcv
+    return method
+
+
+def measure(callback, messages):
+    begin = time.perf_counter()
+    for message in messages:
+        callback(message)
+    return time.perf_counter() - begin
+
+
+def main():
+    if len(sys.argv) > 2:
+        with open(sys.argv[2]) as file:
+            table, key, _ = frames[sys.argv[1]]
+            frames[sys.argv[1]] = (table, key, [json.loads(line) for line in file if line.strip()])
+    for exchange_id, (table, key, messages) in frames.items():
+        exchange = getattr(ccxt.pro, exchange_id)()
+        messages = (messages * (count // len(messages) + 1))[:count]
+        before = measure(lambda message: rebuilt(exchange, table, key(message)), messages)
+        after = measure(lambda message: exchange.message_handler(table, key(message)), messages)
+        print('%-8s table per frame     %8.3f s %10.0f frames/s' % (exchange_id, before, count / before))
+        print('%-8s message_handler()   %8.3f s %10.0f frames/s %6.1fx' % (exchange_id, after, count / after, before / after))
+
+
+main()
@@ -0,0 +1,126 @@
+import os
+import sys
+import json
+import time
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt.pro  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# replays okx and kraken order book streams and computes their checksums after every update,
+# once with the payload formatted again from the numbers of all the levels, the way the
+# exchanges did it, and once with order_book_checksum() from the strings of the levels
+#
+#     python benchmark_order_book_checksum.py [okx|kraken frames.jsonl]
+#
+# the optional file holds one recorded frame per line, okx 'books' frames with their 'data',
+# or kraken book frames like [channelID, {'a': [...]}, 'book-10', 'XBT/USD'], otherwise a
+# synthetic stream is replayed
+
+updates = 20000
+
+
+def synthetic(depth, decimals, seed=1):
+    rng = random.Random(seed)
+
+    def string(number):
+        # okx sends the numbers without the trailing zeros, kraken with all the decimals
+        result = '%.*f' % (decimals, number)
+        return result if decimals < 8 else result.rstrip('0').rstrip('.')
+
+    tick = 0.1
+    mid = 30000.0
+    frames = [{
+        'asks': [[string(mid + (i + 1) * tick), string(rng.randint(1, 10 ** 6) / 10 ** 5)] for i in range(depth)],
+        'bids': [[string(mid - (i + 1) * tick), string(rng.randint(1, 10 ** 6) / 10 ** 5)] for i in range(depth)],
+    }]
+    for _ in range(updates):
+        frame = {'asks': [], 'bids': []}
+        for _ in range(rng.randint(1, 3)):
+            key = rng.choice(['asks', 'bids'])
+            # most of the activity happens near the top of the book
+            distance = int(rng.expovariate(1 / 8)) + 1
+            price = mid + (distance if key == 'asks' else -distance) * tick
+            size = 0 if rng.random() < 0.2 else rng.randint(1, 10 ** 6) / 10 ** 5
+            frame[key].append([string(price), string(size)])
+        frames.append(frame)
+    return frames
+
+
+def recorded(exchange_id, path):
+    with open(path) as file:
+        messages = [json.loads(line) for line in file if line.strip()]
+    frames = []
+    for message in messages:
+        if exchange_id == 'okx':
+            frames.extend({'asks': data.get('asks', []), 'bids': data.get('bids', [])} for data in message['data'])
+        else:
+            frame = {'asks': [], 'bids': []}
+            for part in message[1:-2]:
+                frame['asks'].extend(part.get('as', part.get('a', [])))
+                frame['bids'].extend(part.get('bs', part.get('b', [])))
+            frames.append(frame)
+    return frames
+
+
+def okx_formatted(exchange, orderbook):
+    bids = orderbook['bids']
+    asks = orderbook['asks']
+    payloadArray = []
+    for i in range(0, 25):
+        if i < len(bids):
+            payloadArray.append(exchange.number_to_string(bids[i][0]))
+            payloadArray.append(exchange.number_to_string(bids[i][1]))
+        if i < len(asks):
+            payloadArray.append(exchange.number_to_string(asks[i][0]))
+            payloadArray.append(exchange.number_to_string(asks[i][1]))
+    return exchange.crc32(':'.join(payloadArray), True)
+
+
+def kraken_formatted(exchange, orderbook):
+    payloadArray = []
+    for side in ['asks', 'bids']:
+        for level in orderbook[side][:10]:
+            payloadArray.append(exchange.format_number(level[0], 5) + exchange.format_number(level[1], 5))
+    return exchange.crc32(''.join(payloadArray), False)
+
+
+def replay(exchange, frames, depth, checksum):
+    orderbook = exchange.order_book({}, depth)
+    elapsed = 0
+    result = []
+    for frame in frames:
+        for key in ['asks', 'bids']:
+            side = orderbook[key]
+            for price, size in frame[key]:
+                side.storeWithStrings(float(price), float(size), price, size)
+        orderbook.limit()
+        begin = time.perf_counter()
+        result.append(checksum(orderbook))
+        elapsed += time.perf_counter() - begin
+    return result, elapsed
+
+
+def main():
+    streams = {
+        'okx': (ccxt.pro.okx(), 400, 8, okx_formatted, lambda exchange, orderbook: exchange.order_book_checksum(orderbook, 25, exchange.checksum_piece)),
+        'kraken': (ccxt.pro.kraken(), 10, 5, kraken_formatted, lambda exchange, orderbook: exchange.order_book_checksum(orderbook, 10, exchange.checksum_piece, False, '', False)),
+    }
+    for exchange_id, (exchange, depth, decimals, formatted, incremental) in streams.items():
+        if len(sys.argv) > 2 and sys.argv[1] == exchange_id:
+            frames = recorded(exchange_id, sys.argv[2])
+        else:
+            frames = synthetic(depth, decimals)
+        before, before_time = replay(exchange, frames, depth, lambda orderbook: formatted(exchange, orderbook))
+        after, after_time = replay(exchange, frames, depth, lambda orderbook: incremental(exchange, orderbook))
+        assert before == after
+        print('%-7s formatted payload      %8.3f s %8.1f us per update' % (exchange_id, before_time, before_time / len(frames) * 1000000))
+        print('%-7s order_book_checksum()  %8.3f s %8.1f us per update %6.1fx' % (exchange_id, after_time, after_time / len(frames) * 1000000, before_time / after_time))
+
+
+main()
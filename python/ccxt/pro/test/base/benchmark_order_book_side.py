@@ -0,0 +1,95 @@
+import os
+import sys
+import json
+import random
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt.pro  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# replays binance depthUpdate diffs through binance.handle_order_book_message
+# once per order book engine ('list' and 'sorted')
+#
+#     python benchmark_order_book_side.py [depth_updates.jsonl]
+#
+# the optional file holds one recorded depthUpdate message per line
+# (as received from the binance stream), the first line can be a REST snapshot
+# with 'bids' and 'asks', otherwise a synthetic 5000-level book is replayed
+
+levels = 5000
+messages = 20000
+tick = 0.01
+
+
+def synthetic_stream(seed=1):
+    rng = random.Random(seed)
+    mid = 30000.0
+    snapshot = {
+        'bids': [[round(mid - (i + 1) * tick, 2), rng.randint(1, 100) / 10] for i in range(levels)],
+        'asks': [[round(mid + (i + 1) * tick, 2), rng.randint(1, 100) / 10] for i in range(levels)],
+    }
+    updates = []
+    for u in range(messages):
+        mid += rng.choice([-tick, 0, tick])
+        message = {'e': 'depthUpdate', 'E': 1577554482280 + u, 's': 'BTCUSDT', 'U': u, 'u': u, 'b': [], 'a': []}
+        for key, sign in (('b', -1), ('a', 1)):
+            for _ in range(10):
+                # most of the activity happens near the top of the book
+                distance = int(rng.expovariate(1 / 50)) + 1
+                price = '%.2f' % (mid + sign * distance * tick)
+                size = '0' if rng.random() < 0.3 else '%.1f' % (rng.randint(1, 100) / 10)
+                message[key].append([price, size])
+        updates.append(message)
+    return snapshot, updates
+
+
+def recorded_stream(path):
+    with open(path) as file:
+        lines = [json.loads(line) for line in file if line.strip()]
+    snapshot = {'bids': [], 'asks': []}
+    if lines and 'bids' in lines[0]:
+        first = lines.pop(0)
+        snapshot = {
+            'bids': [[float(price), float(size)] for price, size in first['bids']],
+            'asks': [[float(price), float(size)] for price, size in first['asks']],
+        }
+    return snapshot, [line.get('data', line) for line in lines]
+
+
+def replay(engine, snapshot, updates):
+    exchange = ccxt.pro.binance({
+        'options': {
+            'orderBookEngine': engine,
+        },
+    })
+    orderbook = exchange.order_book({}, levels)
+    orderbook.reset(snapshot)
+    orderbook.limit()
+    start = time.perf_counter()
+    for message in updates:
+        exchange.handle_order_book_message(None, message, orderbook)
+        orderbook.limit()
+    elapsed = time.perf_counter() - start
+    return elapsed, orderbook
+
+
+def main():
+    if len(sys.argv) > 1:
+        snapshot, updates = recorded_stream(sys.argv[1])
+    else:
+        snapshot, updates = synthetic_stream()
+    results = {}
+    for engine in ('list', 'sorted'):
+        elapsed, orderbook = replay(engine, snapshot, updates)
+        results[engine] = orderbook
+        print('%-7s %6d messages %8.3f s %8.2f us/message, %d bids %d asks' % (engine, len(updates), elapsed, elapsed / len(updates) * 1e6, len(orderbook['bids']), len(orderbook['asks'])))
+    assert results['list']['bids'] == results['sorted']['bids']
+    assert results['list']['asks'] == results['sorted']['asks']
+
+
+main()
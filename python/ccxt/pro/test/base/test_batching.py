@@ -0,0 +1,135 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+from aiohttp import web  # noqa: E402
+import ccxt.pro  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# a local websocket server answering every subscribed symbol with a ticker, the frames are recorded
+
+frames = []
+
+
+async def handle_ws(request):
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    async for message in ws:
+        request = json.loads(message.data)
+        frames.append(request)
+        for symbol in request['args']:
+            await ws.send_str(json.dumps({'symbol': symbol}))
+    return ws
+
+
+class mock(Exchange):
+    def describe(self):
+        return self.deep_extend(super(mock, self).describe(), {
+            'id': 'mock',
+            'has': {
+                'ws': True,
+                'watchTicker': True,
+            },
+        })
+
+    async def watch_ticker(self, symbol, params={}):
+        message_hash = 'ticker:' + symbol
+        return await self.watch(self.urls['api']['ws'], message_hash, {'op': 'subscribe', 'args': [symbol]}, message_hash)
+
+    def handle_message(self, client, message):
+        client.resolve(message, 'ticker:' + message['symbol'])
+
+
+async def test_burst(url):
+    exchange = mock({'urls': {'api': {'ws': url}}, 'options': {'ws': {'batch': {'key': 'args', 'size': 3}}}})
+    symbols = ['B' + str(i) + '/USDT' for i in range(8)]
+    tickers = await asyncio.wait_for(asyncio.gather(*[exchange.watch_ticker(symbol) for symbol in symbols]), 10)
+    assert [ticker['symbol'] for ticker in tickers] == symbols
+    # the subscriptions of one turn of the loop are sent in as few frames as the size allows
+    assert [frame['args'] for frame in frames] == [symbols[0:3], symbols[3:6], symbols[6:8]], frames
+    await exchange.close()
+
+
+async def test_window(url):
+    del frames[:]
+    exchange = mock({'urls': {'api': {'ws': url}}, 'options': {'ws': {'batch': {'key': 'args', 'window': 200}}}})
+    first = asyncio.ensure_future(exchange.watch_ticker('W1/USDT'))
+    await asyncio.sleep(0.05)
+    second = asyncio.ensure_future(exchange.watch_ticker('W2/USDT'))
+    await asyncio.wait_for(asyncio.gather(first, second), 10)
+    assert [frame['args'] for frame in frames] == [['W1/USDT', 'W2/USDT']], frames
+    await exchange.close()
+
+
+async def test_unbatched(url):
+    del frames[:]
+    exchange = mock({'enableRateLimit': False, 'urls': {'api': {'ws': url}}})
+    await asyncio.wait_for(asyncio.gather(exchange.watch_ticker('U1/USDT'), exchange.watch_ticker('U2/USDT')), 10)
+    assert sorted(frame['args'][0] for frame in frames) == ['U1/USDT', 'U2/USDT']
+    await exchange.close()
+
+
+def test_merge():
+    exchange = mock({'options': {'ws': {'batch': {'key': 'args', 'size': 10, 'ignore': ['req_id']}}}})
+    messages = [
+        {'op': 'subscribe', 'req_id': '1', 'args': ['a']},
+        {'op': 'subscribe', 'req_id': '2', 'args': ['b', 'c']},
+        {'op': 'auth', 'args': ['key']},
+        {'op': 'subscribe', 'req_id': '3', 'args': ['d']},
+        'ping',
+        {'op': 'subscribe', 'req_id': '4', 'args': ['e']},
+    ]
+    # only the consecutive messages are merged so that the order of the frames is kept
+    assert exchange.merge_subscribe_messages(messages) == [
+        {'op': 'subscribe', 'req_id': '1', 'args': ['a', 'b', 'c']},
+        {'op': 'auth', 'args': ['key']},
+        {'op': 'subscribe', 'req_id': '3', 'args': ['d']},
+        'ping',
+        {'op': 'subscribe', 'req_id': '4', 'args': ['e']},
+    ]
+    assert messages[0]['args'] == ['a']
+    # the exchanges with a batched subscribe format
+    okx = ccxt.pro.okx()
+    merged = okx.merge_subscribe_messages([{'op': 'subscribe', 'args': [{'channel': 'books', 'instId': 'BTC-USDT'}]}, {'op': 'subscribe', 'args': [{'channel': 'trades', 'instId': 'ETH-USDT'}]}])
+    assert merged == [{'op': 'subscribe', 'args': [{'channel': 'books', 'instId': 'BTC-USDT'}, {'channel': 'trades', 'instId': 'ETH-USDT'}]}]
+    merged = okx.merge_subscribe_messages([{'op': 'subscribe', 'args': [{'channel': 'tickers', 'instId': str(i)}]} for i in range(150)])
+    assert [len(message['args']) for message in merged] == [100, 50]
+    bybit = ccxt.pro.bybit()
+    merged = bybit.merge_subscribe_messages([{'op': 'subscribe', 'req_id': str(i), 'args': ['tickers.S' + str(i)]} for i in range(25)])
+    assert [len(message['args']) for message in merged] == [10, 10, 5]
+    bitget = ccxt.pro.bitget()
+    merged = bitget.merge_subscribe_messages([{'op': 'subscribe', 'args': [{'instId': str(i)}]} for i in range(25)])
+    assert [len(message['args']) for message in merged] == [20, 5]
+    # without a batched format the messages are left as they are
+    binance = ccxt.pro.binance()
+    messages = [{'method': 'SUBSCRIBE', 'params': ['btcusdt@trade'], 'id': 1}, {'method': 'SUBSCRIBE', 'params': ['ethusdt@trade'], 'id': 2}]
+    assert binance.merge_subscribe_messages(messages) == messages
+
+
+async def test_batching():
+    app = web.Application()
+    app.router.add_get('/ws', handle_ws)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = 'ws://127.0.0.1:' + str(port) + '/ws'
+    try:
+        await test_burst(url)
+        await test_window(url)
+        await test_unbatched(url)
+        test_merge()
+    finally:
+        await runner.cleanup()
+    print('batching tests passed')
+
+
+asyncio.run(test_batching())
@@ -0,0 +1,105 @@
+import os
+import sys
+import random
+import collections
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# the caches by symbol and key, and the same observable behaviour as the previous implementation
+
+cache = ArrayCacheBySymbolById(3)
+for i in range(4):
+    cache.append({'symbol': 'BTC/USDT', 'id': str(i), 'status': 'open'})
+assert [order['id'] for order in cache] == ['1', '2', '3']
+assert sorted(cache.hashmap['BTC/USDT']) == ['1', '2', '3']
+# an update moves the order to the end and keeps the same reference
+reference = cache[0]
+cache.append({'symbol': 'BTC/USDT', 'id': '1', 'status': 'closed'})
+assert [order['id'] for order in cache] == ['2', '3', '1']
+assert cache[-1] is reference and reference['status'] == 'closed'
+assert [order['id'] for order in cache[1:]] == ['3', '1'] and [order['id'] for order in reversed(cache)] == ['1', '3', '2']
+assert reference in cache and {'symbol': 'BTC/USDT', 'id': '0', 'status': 'open'} not in cache
+# the same id in another symbol is another order
+cache.append({'symbol': 'ETH/USDT', 'id': '3', 'status': 'open'})
+assert [(order['symbol'], order['id']) for order in cache] == [('BTC/USDT', '3'), ('BTC/USDT', '1'), ('ETH/USDT', '3')]
+assert sorted(cache.hashmap['BTC/USDT']) == ['1', '3'] and list(cache.hashmap['ETH/USDT']) == ['3']
+
+positions = ArrayCacheBySymbolBySide()
+positions.append({'symbol': 'BTC/USDT', 'side': 'long', 'contracts': 1})
+positions.append({'symbol': 'BTC/USDT', 'side': 'short', 'contracts': 2})
+positions.append({'symbol': 'BTC/USDT', 'side': 'long', 'contracts': 3})
+assert positions == [{'symbol': 'BTC/USDT', 'side': 'short', 'contracts': 2}, {'symbol': 'BTC/USDT', 'side': 'long', 'contracts': 3}]
+assert positions.getLimit('BTC/USDT', None) == 2
+
+
+class ListCacheBySymbolById(ArrayCache):
+    # the previous implementation, that searches the deque of the ids on every update
+    def __init__(self, max_size=None):
+        super(ListCacheBySymbolById, self).__init__(max_size)
+        self._nested_new_updates_by_symbol = True
+        self.hashmap = {}
+        self._index = collections.deque([], max_size)
+
+    def append(self, item):
+        self._appended += 1
+        by_id = self.hashmap.setdefault(item['symbol'], {})
+        if item['id'] in by_id:
+            reference = by_id[item['id']]
+            if reference != item:
+                reference.update(item)
+            item = reference
+            index = self._index.index(item['id'])
+            del self._deque[index]
+            del self._index[index]
+        else:
+            by_id[item['id']] = item
+        if len(self._deque) == self._deque.maxlen:
+            delete_item = self._deque.popleft()
+            self._index.popleft()
+            del self.hashmap[delete_item['symbol']][delete_item['id']]
+        self._deque.append(item)
+        self._index.append(item['id'])
+        if self._clear_all_updates:
+            self._clear_all_updates = False
+            self._clear_updates_by_symbol.clear()
+            self._all_new_updates = 0
+            self._new_updates_by_symbol.clear()
+        if item['symbol'] not in self._new_updates_by_symbol:
+            self._new_updates_by_symbol[item['symbol']] = set()
+        if self._clear_updates_by_symbol.get(item['symbol']):
+            self._clear_updates_by_symbol[item['symbol']] = False
+            self._new_updates_by_symbol[item['symbol']].clear()
+        id_set = self._new_updates_by_symbol[item['symbol']]
+        before_length = len(id_set)
+        id_set.add(item['id'])
+        after_length = len(id_set)
+        self._all_new_updates = (self._all_new_updates or 0) + (after_length - before_length)
+
+
+random.seed(3)
+for max_size in [None, 1, 5, 50]:
+    cache = ArrayCacheBySymbolById(max_size)
+    expected = ListCacheBySymbolById(max_size)
+    for step in range(3000):
+        # the ids of the previous implementation are unique across the symbols
+        symbol = random.choice(['BTC/USDT', 'ETH/USDT'])
+        item = {'symbol': symbol, 'id': symbol[0] + str(random.randint(0, 80)), 'step': step}
+        cache.append(item)
+        expected.append(dict(item))
+        assert len(cache) == len(expected)
+        if step % 7 == 0:
+            assert cache == list(expected)
+            assert cache[len(cache) // 2] == expected[len(expected) // 2]
+            assert cache.hashmap == expected.hashmap
+        if step % 5 == 0:
+            symbol = random.choice(['BTC/USDT', 'ETH/USDT', None])
+            limit = random.choice([None, 3])
+            assert cache.getLimit(symbol, limit) == expected.getLimit(symbol, limit)
+
+print('cache by key tests passed')
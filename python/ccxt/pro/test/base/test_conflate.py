@@ -0,0 +1,78 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+from ccxt.async_support.base.ws.client import Client  # noqa: E402
+from ccxt.base.errors import NetworkError  # noqa: E402
+
+
+def create_client(conflate):
+    return Client('wss://localhost', None, None, None, None, {
+        'conflate': conflate,
+        'asyncio_loop': asyncio.get_running_loop(),
+    })
+
+
+async def test_latest():
+    client = create_client('latest')
+    future = client.future('orderbook:BTC/USDT')
+    wakeups = []
+    future.add_done_callback(wakeups.append)
+    # a burst of updates handled within one loop turn
+    for nonce in range(5):
+        client.resolve({'nonce': nonce}, 'orderbook:BTC/USDT')
+    assert not future.done()
+    result = await future
+    assert result == {'nonce': 4}
+    assert len(wakeups) == 1
+    assert client.conflated['orderbook:BTC/USDT'] == 5
+    assert 'orderbook:BTC/USDT' not in client.futures
+
+
+async def test_interval():
+    client = create_client(50)
+    loop = asyncio.get_running_loop()
+    # the first update after a quiet period is delivered on the next loop turn
+    first = client.future('ticker:BTC/USDT')
+    client.resolve(1, 'ticker:BTC/USDT')
+    assert await first == 1
+    assert client.conflated['ticker:BTC/USDT'] == 1
+    # the next ones wait for the interval to elapse
+    second = client.future('ticker:BTC/USDT')
+    start = loop.time()
+    for value in range(2, 12):
+        client.resolve(value, 'ticker:BTC/USDT')
+        await asyncio.sleep(0.001)
+    assert await second == 11
+    assert loop.time() - start >= 0.04
+    assert client.conflated['ticker:BTC/USDT'] == 10
+
+
+async def test_reject():
+    client = create_client('latest')
+    future = client.future('trades:BTC/USDT')
+    client.resolve([1], 'trades:BTC/USDT')
+    client.reject(NetworkError('disconnected'), 'trades:BTC/USDT')
+    try:
+        await future
+        assert False
+    except NetworkError:
+        pass
+    # the pending update is dropped together with the rejected future
+    await asyncio.sleep(0)
+    assert 'trades:BTC/USDT' not in client.conflated
+
+
+async def test_conflate():
+    await test_latest()
+    await test_interval()
+    await test_reject()
+    print('conflate tests passed')
+
+
+asyncio.run(test_conflate())
@@ -0,0 +1,86 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt.pro  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# the handlers of the messages are resolved from message_routes() once per exchange
+
+
+class Exchange(ccxt.async_support.Exchange):
+    id = 'dispatch'
+    built = 0
+
+    def message_routes(self):
+        self.built += 1
+        return {
+            'channel': {
+                'trades': self.handle_trades,
+                'candle*': self.handle_ohlcv,
+                'candle1s*': self.handle_seconds,
+            },
+        }
+
+    def handle_trades(self, client, message):
+        return 'trades'
+
+    def handle_ohlcv(self, client, message):
+        return 'ohlcv'
+
+    def handle_seconds(self, client, message):
+        return 'seconds'
+
+
+class Override(Exchange):
+    def handle_trades(self, client, message):
+        return 'override'
+
+
+exchange = Exchange()
+assert exchange.message_handler('channel', 'trades')(None, {}) == 'trades'
+assert exchange.message_handler('channel', 'candle1m')(None, {}) == 'ohlcv'
+# the longest prefix wins
+assert exchange.message_handler('channel', 'candle1s')(None, {}) == 'seconds'
+assert exchange.message_handler('channel', 'books') is None
+assert exchange.message_handler('channel', None) is None
+assert exchange.message_handler('event', 'login') is None
+# the table is built once, not once per message
+assert exchange.built == 1
+override = Override()
+assert override.message_handler('channel', 'trades')(None, {}) == 'override'
+assert exchange.message_handler('channel', 'trades')(None, {}) == 'trades'
+# the prefix matches are memoized up to a bound, the keys can hold symbols
+for i in range(2500):
+    assert exchange.message_handler('channel', 'candle1m:S' + str(i) + '/USDT')(None, {}) == 'ohlcv'
+assert len(exchange.messageHandlers['channel']['matches']) <= 1000
+
+
+# a handle_message() routing through the table
+class Router(Exchange):
+    def handle_message(self, client, message):
+        method = self.message_handler('channel', self.safe_string(message, 'channel'))
+        if method is not None:
+            return method(client, message)
+
+
+router = Router()
+assert [router.handle_message(None, {'channel': channel}) for channel in ['trades', 'candle5m', 'books', None]] == ['trades', 'ohlcv', None, None]
+
+# the exchanges routing through their tables
+okx = ccxt.pro.okx()
+assert okx.message_handler('channel', 'books') == okx.handle_order_book
+assert okx.message_handler('channel', 'candle1H') == okx.handle_ohlcv
+assert okx.message_handler('event', 'login') == okx.handle_authenticate
+assert okx.message_handler('channel', 'unknown') is None
+binance = ccxt.pro.binance()
+assert binance.message_handler('event', '24hrTicker@arr') == binance.handle_tickers
+assert binance.message_handler('event', 'executionReport') == binance.handle_order_update
+assert binance.message_handler('event', None) is None
+
+print('dispatch tests passed')
@@ -0,0 +1,62 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, SortedOrderBook  # noqa: E402
+from ccxt.async_support.base.ws import order_book_arrays  # noqa: E402
+from ccxt.base.errors import NotSupported  # noqa: E402
+
+if order_book_arrays.np is None:
+    try:
+        OrderBook({}).as_arrays()
+        raise AssertionError('as_arrays() should require numpy')
+    except NotSupported:
+        print('numpy is not installed, skipping order book arrays tests')
+    sys.exit(0)
+
+
+def close(a, b):
+    return abs(a - b) < 1e-9
+
+
+snapshot = {
+    'bids': [[10, 1], [9, 2], [8, 3]],
+    'asks': [[11, 3], [12, 2], [13, 1]],
+    'timestamp': 1574827239000,
+    'nonce': 69,
+    'symbol': 'BTC/USDT',
+}
+
+for orderbook in (OrderBook(snapshot), SortedOrderBook(snapshot)):
+    arrays = orderbook.limit().as_arrays()
+    assert arrays.bid_prices.dtype.name == 'float64'
+    assert list(arrays.bid_prices) == [10, 9, 8]
+    assert list(arrays.ask_sizes) == [3, 2, 1]
+    assert arrays.symbol == 'BTC/USDT'
+    assert arrays.nonce == 69
+    assert close(arrays.mid(), 10.5)
+    # the thin bid pulls the microprice down towards it
+    assert close(arrays.microprice(), (10 * 3 + 11 * 1) / 4)
+    assert list(arrays.cumulative_depth('sell')) == [1, 3, 6]
+    assert list(arrays.cumulative_depth('buy', True)) == [33, 57, 70]
+    assert close(arrays.vwap('buy', 3), 11)
+    assert close(arrays.vwap('buy', 4), (33 + 12) / 4)
+    assert close(arrays.vwap('sell', 2), (10 + 9) / 2)
+    assert arrays.vwap('buy', 7) is None
+    # 45 usdt buys 3 @ 11 and 1 @ 12, average 11.25
+    assert close(arrays.price_impact('buy', 45), (11.25 - 10.5) / 10.5)
+    assert arrays.price_impact('sell', 1000) is None
+
+limited = OrderBook(snapshot).as_arrays(2)
+assert list(limited.ask_prices) == [11, 12]
+
+# the third column of indexed books holds order ids and is ignored
+indexed = IndexedOrderBook({'bids': [[10, 1, 'a'], [9, 2, 'b']], 'asks': []}).as_arrays()
+assert list(indexed.bid_sizes) == [1, 2]
+assert indexed.mid() is None
+
+print('order book arrays tests passed')
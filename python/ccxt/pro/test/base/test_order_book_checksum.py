@@ -0,0 +1,135 @@
+import os
+import sys
+import random
+import binascii
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt.pro  # noqa: E402
+from ccxt.async_support.base.ws.order_book import OrderBook, SortedOrderBook  # noqa: E402
+from ccxt.async_support.base.ws.order_book_checksum import OrderBookChecksum  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+
+def crc32(payload, signed):
+    unsigned = binascii.crc32(payload.encode())
+    return unsigned - 0x100000000 if signed and unsigned >= 0x80000000 else unsigned
+
+
+def interleaved(orderbook, depth):
+    # the okx payload, formatted again from all the levels
+    result = []
+    for i in range(depth):
+        for side in ['bids', 'asks']:
+            if i < len(orderbook[side]):
+                level = orderbook[side][i]
+                result.append(orderbook[side].strings[level[0]][0] + ':' + orderbook[side].strings[level[0]][1])
+    return crc32(':'.join(result), True)
+
+
+def sequential(orderbook, depth):
+    # the kraken payload
+    result = []
+    for side in ['asks', 'bids']:
+        for level in orderbook[side][:depth]:
+            strings = orderbook[side].strings[level[0]]
+            result.append(strings[0].replace('.', '').lstrip('0') + strings[1].replace('.', '').lstrip('0'))
+    return crc32(''.join(result), False)
+
+
+def okx_piece(level, strings, ask):
+    return strings[0] + ':' + strings[1]
+
+
+def kraken_piece(level, strings, ask):
+    return strings[0].replace('.', '').lstrip('0') + strings[1].replace('.', '').lstrip('0')
+
+
+def price_string(rng, side):
+    return '%.2f' % (100 + (1 if side == 'asks' else -1) * rng.randint(1, 60) / 10)
+
+
+# the checksum of the changed part of the payload equals the one of the whole payload
+rng = random.Random(7)
+for cls in [OrderBook, SortedOrderBook]:
+    orderbook = cls({}, 40)
+    okx = OrderBookChecksum(25, okx_piece)
+    kraken = OrderBookChecksum(10, kraken_piece, False, '')
+    for step in range(3000):
+        for _ in range(rng.randint(1, 4)):
+            side = rng.choice(['bids', 'asks'])
+            size = '0.00000000' if rng.random() < 0.3 else '%.8f' % (rng.randint(1, 10 ** 6) / 10 ** 6)
+            price = price_string(rng, side)
+            orderbook[side].storeWithStrings(float(price), float(size), price, size)
+        orderbook.limit()
+        assert len(orderbook['bids'].strings) == len(orderbook['bids'])
+        assert orderbook['bids'].levelStrings(orderbook['bids'][0][0])[0] == '%.2f' % orderbook['bids'][0][0] if orderbook['bids'] else True
+        assert okx.crc32(orderbook['bids'], orderbook['asks'], True) == interleaved(orderbook, 25)
+        assert kraken.crc32(orderbook['bids'], orderbook['asks']) == sequential(orderbook, 10)
+    orderbook['bids'].clear()
+    assert orderbook['bids'].strings == {}
+# the levels stored without strings are formatted from their numbers
+orderbook = OrderBook({'bids': [[1.5, 2.0]], 'asks': [[1.75, 3.0]]})
+checksum = OrderBookChecksum(25, lambda level, strings, ask: str(level[0]) + ':' + str(-level[1] if ask else level[1]))
+assert checksum.crc32(orderbook['bids'], orderbook['asks'], True) == crc32('1.5:2.0:1.75:-3.0', True)
+
+
+class Client:
+    def __init__(self):
+        self.resolved = []
+        self.rejected = []
+
+    def resolve(self, result, message_hash):
+        self.resolved.append(message_hash)
+
+    def reject(self, error, message_hash):
+        self.rejected.append(message_hash)
+
+
+# the order books of the exchanges accept their checksums and reject the wrong ones
+exchange = ccxt.pro.okx()
+client = Client()
+snapshot = {'asks': [['101.5', '1.25', '0', '1'], ['102', '0.5', '0', '1']], 'bids': [['100.1', '3', '0', '2'], ['99.05', '0.001', '0', '1']], 'ts': '1'}
+snapshot['checksum'] = crc32('100.1:3:101.5:1.25:99.05:0.001:102:0.5', True)
+exchange.handle_order_book(client, {'arg': {'channel': 'books', 'instId': 'BTC-USDT'}, 'action': 'snapshot', 'data': [snapshot]})
+update = {'asks': [['101.5', '0', '0', '0']], 'bids': [['100.10', '2.50', '0', '1']], 'ts': '2'}
+update['checksum'] = crc32('100.10:2.50:102:0.5:99.05:0.001', True)
+exchange.handle_order_book(client, {'arg': {'channel': 'books', 'instId': 'BTC-USDT'}, 'action': 'update', 'data': [update]})
+assert client.rejected == []
+update = {'asks': [['102', '0.6', '0', '1']], 'bids': [], 'ts': '3', 'checksum': 1}
+exchange.handle_order_book(client, {'arg': {'channel': 'books', 'instId': 'BTC-USDT'}, 'action': 'update', 'data': [update]})
+assert len(client.rejected) == 1
+
+exchange = ccxt.pro.bitget()
+client = Client()
+exchange.handle_order_book(client, {'action': 'snapshot', 'arg': {'instType': 'SPOT', 'channel': 'books', 'instId': 'BTCUSDT'}, 'data': [{'asks': [['21041.11', '0.0445']], 'bids': [['21040.76', '0.0417']], 'ts': '1'}]})
+update = {'asks': [['21041.16', '0.0411']], 'bids': [], 'ts': '2', 'checksum': crc32('21040.76:0.0417:21041.11:0.0445:21041.16:0.0411', True)}
+exchange.handle_order_book(client, {'action': 'update', 'arg': {'instType': 'SPOT', 'channel': 'books', 'instId': 'BTCUSDT'}, 'data': [update]})
+assert client.rejected == [] and exchange.orderbooks['BTCUSDT']['asks'] == [[21041.11, 0.0445], [21041.16, 0.0411]]
+
+exchange = ccxt.pro.kraken()
+exchange.options['marketsByWsName'] = {'XBT/USD': {'symbol': 'BTC/USD'}}
+client = Client()
+asks = [['%.5f' % (5541.3 + i), '1.%08d' % i, '1534614248.123678'] for i in range(10)]
+bids = [['%.5f' % (5541.2 - i), '2.%08d' % i, '1534614248.123678'] for i in range(10)]
+exchange.handle_order_book(client, [1234, {'as': asks, 'bs': bids}, 'book-10', 'XBT/USD'], {})
+asks[0] = ['5541.30000', '0.50000000', '1534614249.000000']
+payload = ''.join(level[0].replace('.', '').lstrip('0') + level[1].replace('.', '').lstrip('0') for level in asks + bids)
+exchange.handle_order_book(client, [1234, {'a': [asks[0]], 'c': str(crc32(payload, False))}, 'book-10', 'XBT/USD'], {})
+assert client.rejected == []
+exchange.handle_order_book(client, [1234, {'a': [['5541.30000', '0.60000000', '1534614250.000000']], 'c': '1'}, 'book-10', 'XBT/USD'], {})
+assert len(client.rejected) == 1
+
+exchange = ccxt.pro.bitfinex2()
+client = Client()
+exchange.orderbooks[exchange.safe_symbol('tBTCUSD')] = exchange.counted_order_book({'bids': [[100.0, 1.5, 2]], 'asks': [[101.25, 0.5, 1]]})
+exchange.handle_checksum(client, [1, 'cs', crc32('100:1.5:101.25:-0.5', True)], {'symbol': 'tBTCUSD'})
+assert client.rejected == []
+exchange.handle_checksum(client, [1, 'cs', 1], {'symbol': 'tBTCUSD'})
+assert client.rejected == ['book:tBTCUSD']
+
+print('order book checksum tests passed')
@@ -0,0 +1,212 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import socket  # noqa: E402
+from aiohttp import web  # noqa: E402
+from ccxt.base.errors import NetworkError  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.ws.client import Client  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# a local websocket server that answers the logins, the orders and the subscriptions,
+# and drops the first connection after its first ticker, or before answering an order of DROP/USDT
+
+connections = []
+
+
+async def handle_ws(request):
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    received = []
+    connections.append(received)
+    async for message in ws:
+        request = json.loads(message.data)
+        received.append(request['op'] + ':' + request.get('symbol', ''))
+        if request['op'] == 'login':
+            await ws.send_str(json.dumps({'event': 'login'}))
+        elif request['op'] == 'order' and request['symbol'] == 'DROP/USDT':
+            await ws.close(code=1001)
+        elif request['op'] == 'order':
+            await ws.send_str(json.dumps({'event': 'order', 'id': request['id']}))
+        elif request['op'] == 'subscribe' and request['symbol'] == 'BTC/USDT':
+            await ws.send_str(json.dumps({'symbol': 'BTC/USDT', 'last': len(connections)}))
+            if len(connections) == 1:
+                await ws.close(code=1001)
+    return ws
+
+
+class mock(Exchange):
+    def describe(self):
+        return self.deep_extend(super(mock, self).describe(), {
+            'id': 'mock',
+            'has': {
+                'ws': True,
+                'watchTicker': True,
+            },
+        })
+
+    async def authenticate(self):
+        url = self.urls['api']['ws']
+        return await self.watch(url, 'authenticated', {'op': 'login'}, 'authenticated')
+
+    async def watch_ticker(self, symbol, params={}):
+        if not params.get('public'):
+            await self.authenticate()
+        message_hash = 'ticker:' + symbol
+        return await self.watch(self.urls['api']['ws'], message_hash, {'op': 'subscribe', 'symbol': symbol}, message_hash)
+
+    async def create_order(self, symbol):
+        # a one-shot request, not sent again after a reconnection
+        message_hash = 'order:' + str(self.nonce())
+        return await self.watch(self.urls['api']['ws'], message_hash, {'op': 'order', 'symbol': symbol, 'id': message_hash}, message_hash, None, False)
+
+    def handle_message(self, client, message):
+        if message.get('event') == 'login':
+            client.resolve(True, 'authenticated')
+        elif message.get('event') == 'order':
+            client.resolve(message, message['id'])
+        else:
+            client.resolve(message, 'ticker:' + message['symbol'])
+
+
+def closed_port():
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return 'ws://127.0.0.1:' + str(port) + '/ws'
+
+
+async def test_reconnect(url):
+    exchange = mock({'urls': {'api': {'ws': url}}, 'options': {'ws': {'reconnect': True, 'reconnectDelay': 20}}})
+    order = await exchange.create_order('BTC/USDT')
+    ticker = await exchange.watch_ticker('BTC/USDT')
+    assert ticker['last'] == 1
+    client = exchange.clients[url]
+    # the message of a subscription removed since then is not replayed
+    client.messages['ticker:ETH/USDT'] = {'op': 'subscribe', 'symbol': 'ETH/USDT'}
+    # the waiter survives the disconnection and gets the ticker of the new connection
+    ticker = await asyncio.wait_for(exchange.watch_ticker('BTC/USDT'), 5)
+    assert ticker['last'] == 2
+    # the order placed before the disconnection is not sent again
+    assert connections == [['order:BTC/USDT', 'login:', 'subscribe:BTC/USDT'], ['login:', 'subscribe:BTC/USDT']], connections
+    assert order['id'] not in client.messages and client.requests == {}
+    assert exchange.clients[url] is client
+    gaps = exchange.ws_gaps()
+    assert len(gaps) == 1 and gaps[0]['url'] == url and gaps[0]['attempts'] == 1
+    assert gaps[0]['end'] >= gaps[0]['start'] and client.gap is None
+    await exchange.close()
+
+
+async def test_stream(url):
+    del connections[:]
+    exchange = mock({'urls': {'api': {'ws': url}}, 'options': {'ws': {'reconnect': True, 'reconnectDelay': 20}}})
+    stream = exchange.open_stream('watch_ticker', ['BTC/USDT', {'public': True}])
+    # the stream calls watch() once, its subscription is replayed on the new connection
+    first = await asyncio.wait_for(stream.__anext__(), 5)
+    second = await asyncio.wait_for(stream.__anext__(), 5)
+    assert first['last'] == 1 and second['last'] == 2
+    assert connections == [['subscribe:BTC/USDT'], ['subscribe:BTC/USDT']], connections
+    stream.close()
+    await exchange.close()
+
+
+async def test_lost_request(url):
+    del connections[:]
+    exchange = mock({'urls': {'api': {'ws': url}}, 'options': {'ws': {'reconnect': True, 'reconnectDelay': 20}}})
+    # the connection drops before the response, the order is rejected rather than placed again
+    try:
+        await asyncio.wait_for(exchange.create_order('DROP/USDT'), 5)
+        assert False
+    except NetworkError:
+        pass
+    client = exchange.clients[url]
+    await asyncio.wait_for(client.connected, 5)
+    ticker = await asyncio.wait_for(exchange.watch_ticker('BTC/USDT'), 5)
+    assert ticker['last'] == 2
+    assert connections == [['order:DROP/USDT'], ['login:', 'subscribe:BTC/USDT']], connections
+    assert client.requests == {}
+    await exchange.close()
+
+
+async def test_give_up():
+    url = closed_port()
+    exchange = mock({'urls': {'api': {'ws': url}}, 'options': {'ws': {'reconnect': True, 'reconnectDelay': 10, 'maxReconnects': 2}}})
+    try:
+        await asyncio.wait_for(exchange.watch_ticker('BTC/USDT'), 5)
+        assert False
+    except NetworkError:
+        pass
+    # the client is dropped and the next one starts with a longer backoff
+    assert url not in exchange.clients
+    assert exchange.ws_failures[url] == 3
+    assert exchange.client(url).reconnects == 3
+    await exchange.close()
+
+
+async def test_backoff():
+    url = closed_port()
+    exchange = mock({'urls': {'api': {'ws': url}}})
+    try:
+        await asyncio.wait_for(exchange.watch_ticker('BTC/USDT'), 5)
+        assert False
+    except NetworkError:
+        pass
+    # without reconnect the waiters are rejected, the failure is counted for the next client
+    assert exchange.client(url).reconnects == 1
+    client = Client(url, None, None, None, None, {'reconnectDelay': 1000, 'maxReconnectDelay': 30000})
+    for reconnects, low, high in [(1, 0.5, 1), (3, 2, 4), (10, 15, 30)]:
+        client.reconnects = reconnects
+        delays = [client.backoff() for _ in range(100)]
+        assert min(delays) >= low and max(delays) <= high
+        assert len(set(delays)) > 1
+    await exchange.close()
+
+
+async def test_order_book_resync():
+    exchange = mock({'options': {'ws': {'reconnect': True}}})
+    exchange.open()
+    exchange.orderbooks['BTC/USDT'] = exchange.order_book({'bids': [[1.0, 1.0]], 'asks': [[2.0, 1.0]], 'nonce': 5, 'symbol': 'BTC/USDT'})
+    exchange.orderbooks['BTC/USDT'].cache.append({'nonce': 6})
+    exchange.orderbooks['ETH/USDT'] = exchange.order_book({'bids': [[1.0, 1.0]], 'nonce': 5})
+    client = exchange.client('ws://127.0.0.1/ws')
+    client.snapshots['BTC/USDT'] = 'orderbook:BTC/USDT'
+    exchange.on_reconnect(client, [])
+    # the order books loaded from rest wait for load_order_book() again, the others for their snapshot
+    orderbook = exchange.orderbooks['BTC/USDT']
+    assert orderbook['nonce'] is None and orderbook.cache == [] and len(orderbook['bids']) == 0
+    assert orderbook['symbol'] == 'BTC/USDT'
+    assert exchange.orderbooks['ETH/USDT']['nonce'] == 5
+    assert client.snapshots == {}
+    await exchange.close()
+
+
+async def test_reconnects():
+    app = web.Application()
+    app.router.add_get('/ws', handle_ws)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = 'ws://127.0.0.1:' + str(port) + '/ws'
+    try:
+        await test_reconnect(url)
+        await test_stream(url)
+        await test_lost_request(url)
+        await test_give_up()
+        await test_backoff()
+        await test_order_book_resync()
+    finally:
+        await runner.cleanup()
+    print('reconnect tests passed')
+
+
+asyncio.run(test_reconnects())
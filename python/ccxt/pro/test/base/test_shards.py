@@ -0,0 +1,194 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+from aiohttp import web  # noqa: E402
+from ccxt.base.errors import BadRequest  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# a local websocket server answering every subscription with a ticker of the connection,
+# the subscriptions of every connection are recorded, the private ones are answered only
+# on a connection that logged in
+
+connections = []
+
+
+async def handle_ws(request):
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    symbols = []
+    connections.append(symbols)
+    connection = len(connections) - 1
+    logged = False
+    async for message in ws:
+        request = json.loads(message.data)
+        if request['op'] == 'drop':
+            await ws.close()
+        elif request['op'] == 'login':
+            logged = True
+            await ws.send_str(json.dumps({'event': 'login', 'connection': connection}))
+        elif request['op'] == 'orders':
+            symbols.append('orders')
+            await ws.send_str(json.dumps({'event': 'orders' if logged else 'error', 'connection': connection}))
+        else:
+            symbols.append(request['symbol'])
+            await ws.send_str(json.dumps({'symbol': request['symbol'], 'connection': connection}))
+    return ws
+
+
+class mock(Exchange):
+    def describe(self):
+        return self.deep_extend(super(mock, self).describe(), {
+            'id': 'mock',
+            'has': {
+                'ws': True,
+                'watchTicker': True,
+            },
+        })
+
+    async def watch_ticker(self, symbol, params={}):
+        message_hash = 'ticker:' + symbol
+        return await self.watch(self.urls['api']['ws'], message_hash, {'op': 'subscribe', 'symbol': symbol}, message_hash)
+
+    async def authenticate(self):
+        url = self.urls['api']['ws']
+        client = self.client(url)
+        future = client.future('authenticated')
+        if 'authenticated' not in client.subscriptions:
+            self.watch(url, 'authenticated', {'op': 'login'}, 'authenticated')
+        return await future
+
+    async def watch_orders(self, symbol=None, since=None, limit=None, params={}):
+        await self.authenticate()
+        return await self.watch(self.urls['api']['ws'], 'orders', {'op': 'orders'}, 'orders')
+
+    def handle_message(self, client, message):
+        event = message.get('event')
+        if event == 'login':
+            client.resolve(message, 'authenticated')
+        elif event == 'orders':
+            client.resolve(message, 'orders')
+        elif event == 'error':
+            client.reject(BadRequest('not logged in'), 'orders')
+        else:
+            client.resolve(message, 'ticker:' + message['symbol'])
+
+
+async def test_spread(url):
+    exchange = mock({'enableRateLimit': False, 'urls': {'api': {'ws': url}}, 'options': {'ws': {'shards': {'connections': 4, 'maxSubscriptions': 50}}}})
+    symbols = ['S' + str(i) + '/USDT' for i in range(200)]
+    tickers = await asyncio.wait_for(asyncio.gather(*[exchange.watch_ticker(symbol) for symbol in symbols]), 10)
+    assert sorted(len(symbols) for symbols in connections) == [50, 50, 50, 50]
+    assert sorted(exchange.clients.keys()) == [url, url + '#1', url + '#2', url + '#3']
+    # every ticker came from the connection holding its subscription
+    for ticker in tickers:
+        assert ticker['symbol'] in connections[ticker['connection']]
+    metrics = exchange.ws_metrics()
+    assert len(metrics['connections']) == 4
+    # the frames handled include the pongs
+    assert metrics['subscriptions'] == 200 and metrics['received'] >= 200
+    assert metrics['lag'] >= 0 and metrics['maxLag'] >= metrics['lag']
+    # a subscription stays on its connection
+    client = exchange.shard(url, ['ticker:S7/USDT'])
+    assert 'ticker:S7/USDT' in client.subscriptions
+    try:
+        await exchange.watch_ticker('FULL/USDT')
+        assert False
+    except BadRequest:
+        pass
+    # a dropped connection is opened again for the subscriptions placed anew
+    dropped = [symbol for symbol in symbols if 'ticker:' + symbol in exchange.clients[url + '#2'].subscriptions]
+    await exchange.clients[url + '#2'].send({'op': 'drop'})
+    while url + '#2' in exchange.clients:
+        await asyncio.sleep(0.01)
+    await asyncio.wait_for(asyncio.gather(*[exchange.watch_ticker(symbol) for symbol in dropped]), 10)
+    assert len(connections) == 5 and sorted(connections[4]) == sorted(dropped)
+    assert len(exchange.clients[url + '#2'].subscriptions) == 50
+    await exchange.close()
+
+
+async def test_load(url):
+    exchange = mock({'enableRateLimit': False, 'urls': {'api': {'ws': url}}, 'options': {'ws': {'shards': {'connections': 2}}}})
+    for i in range(10):
+        await exchange.watch_ticker('L' + str(i) + '/USDT')
+    first = exchange.clients[url]
+    second = exchange.clients[url + '#1']
+    assert len(first.subscriptions) == 5 and len(second.subscriptions) == 5
+    # the least loaded connection gets the next subscription
+    for subscribe_hash in list(second.subscriptions.keys())[:4]:
+        del second.subscriptions[subscribe_hash]
+    assert exchange.shard(url, ['ticker:NEW/USDT']) is second
+    # unless it is reconnecting
+    second.gap = {'url': second.url, 'start': exchange.milliseconds(), 'end': None, 'error': None, 'attempts': 1}
+    assert exchange.shard(url, ['ticker:NEW/USDT']) is first
+    second.gap = None
+    # the messages watched without a subscription stay on the first connection
+    assert exchange.shard(url, ['ticker:OTHER/USDT'], False) is first
+    await exchange.close()
+
+
+async def test_login(url):
+    exchange = mock({'enableRateLimit': False, 'urls': {'api': {'ws': url}}, 'options': {'ws': {'shards': {'connections': 4}}}})
+    for i in range(8):
+        await exchange.watch_ticker('A' + str(i) + '/USDT')
+    assert len(exchange.clients) == 4
+    # the private subscriptions follow the login on the first connection
+    orders = await asyncio.wait_for(exchange.watch_orders(), 5)
+    first = exchange.clients[url]
+    assert first.login and 'authenticated' in first.subscriptions and 'orders' in first.subscriptions
+    # and so do the next subscriptions of the url, the public ones stay where they are
+    await exchange.watch_ticker('B/USDT')
+    assert 'ticker:B/USDT' in first.subscriptions
+    assert exchange.shard(url, ['ticker:A1/USDT']) is not first
+    # the clients keep the url of the server, the fragment is only their key
+    assert all(client.url == url for client in exchange.clients.values())
+    assert sorted(client.key for client in exchange.clients.values()) == sorted(exchange.clients.keys())
+    await exchange.close()
+    # the logins by market type are recognized too
+    exchange = mock({'enableRateLimit': False, 'urls': {'api': {'ws': url}}, 'options': {'ws': {'shards': {'connections': 4}}}})
+    assert exchange.shard(url, ['authenticated:swap']) is exchange.clients[url] and exchange.clients[url].login
+    assert exchange.shard(url, ['ticker:C/USDT']) is exchange.clients[url]
+    await exchange.close()
+
+
+async def test_unsharded(url):
+    exchange = mock({'enableRateLimit': False, 'urls': {'api': {'ws': url}}})
+    await exchange.watch_ticker('U1/USDT')
+    await exchange.watch_ticker('U2/USDT')
+    assert list(exchange.clients.keys()) == [url]
+    await exchange.close()
+    # the urls of the private streams are left out
+    exchange = mock({'enableRateLimit': False, 'urls': {'api': {'ws': url}}, 'options': {'ws': {'shards': {'connections': 4, 'urls': ['wss://public']}}}})
+    await exchange.watch_ticker('U3/USDT')
+    await exchange.watch_ticker('U4/USDT')
+    assert list(exchange.clients.keys()) == [url]
+    await exchange.close()
+
+
+async def test_shards():
+    app = web.Application()
+    app.router.add_get('/ws', handle_ws)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = 'ws://127.0.0.1:' + str(port) + '/ws'
+    try:
+        await test_spread(url)
+        await test_load(url)
+        await test_login(url)
+        await test_unsharded(url)
+    finally:
+        await runner.cleanup()
+    print('shards tests passed')
+
+
+asyncio.run(test_shards())
@@ -0,0 +1,101 @@
+import os
+import sys
+import json
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook  # noqa: E402
+from ccxt.async_support.base.ws.order_book import SortedOrderBook, SortedIndexedOrderBook, SortedCountedOrderBook  # noqa: E402
+from ccxt.async_support.base.ws import order_book_side  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# the sorted engine must be observably identical to the list engine
+
+default_load = order_book_side.SortedOrderBookSide.load
+# tiny blocks to exercise block splits and removals
+order_book_side.SortedOrderBookSide.load = 4
+
+order_book_input = {
+    'bids': [[10, 10], [9.1, 11], [8.2, 12], [7.3, 13], [6.4, 14], [4.5, 13], [4.5, 0]],
+    'asks': [[16.6, 10], [15.5, 11], [14.4, 12], [13.3, 13], [12.2, 14], [11.1, 13]],
+    'timestamp': 1574827239000,
+    'nonce': 69,
+    'symbol': None,
+}
+
+order_book_target = {
+    'bids': [[10, 10], [9.1, 11], [8.2, 12], [7.3, 13], [6.4, 14]],
+    'asks': [[11.1, 13], [12.2, 14], [13.3, 13], [14.4, 12], [15.5, 11], [16.6, 10]],
+}
+
+sorted_order_book = SortedOrderBook(order_book_input)
+assert sorted_order_book['bids'] == order_book_target['bids']
+assert sorted_order_book['asks'] == order_book_target['asks']
+assert sorted_order_book['bids'][0] == [10, 10]
+assert sorted_order_book['bids'][-1] == [6.4, 14]
+assert sorted_order_book['asks'][1:3] == [[12.2, 14], [13.3, 13]]
+assert len(sorted_order_book['asks']) == 6
+
+limited = SortedOrderBook(order_book_input, 3).limit()
+assert limited['bids'] == [[10, 10], [9.1, 11], [8.2, 12]]
+# the list storage is synced by limit() for C-level consumers like json
+assert json.loads(json.dumps(limited['asks'])) == [[11.1, 13], [12.2, 14], [13.3, 13]]
+
+sorted_order_book.reset({'bids': [[1, 1]], 'asks': []})
+assert sorted_order_book['bids'] == [[1, 1]]
+assert sorted_order_book['asks'] == []
+assert not sorted_order_book['asks']
+
+
+def random_deltas(rng, count, with_third=None):
+    deltas = []
+    for i in range(count):
+        price = rng.randint(1, 200) / 4
+        size = rng.choice([0, 0, rng.randint(1, 50)])
+        if with_third == 'count':
+            deltas.append([price, size, rng.choice([0, rng.randint(1, 5)])])
+        elif with_third == 'id':
+            deltas.append([price, size, 'id' + str(rng.randint(1, 300))])
+        else:
+            deltas.append([price, size])
+    return deltas
+
+
+def replay(list_book, sorted_book, deltas):
+    for side in ('bids', 'asks'):
+        for delta in deltas:
+            list_book[side].storeArray(list(delta))
+            sorted_book[side].storeArray(list(delta))
+        list_book.limit()
+        sorted_book.limit()
+        assert len(list_book[side]) == len(sorted_book[side])
+        assert list(list_book[side]) == list(sorted_book[side])
+        assert list_book[side][:7] == sorted_book[side][:7]
+        assert json.dumps(list_book[side]) == json.dumps(sorted_book[side])
+        for i in range(len(list_book[side])):
+            assert list_book[side][i] == sorted_book[side][i]
+
+
+rng = random.Random(42)
+for load in (4, default_load):
+    order_book_side.SortedOrderBookSide.load = load
+    for depth in (None, 25):
+        for _ in range(20):
+            replay(OrderBook({}, depth), SortedOrderBook({}, depth), random_deltas(rng, 300))
+            replay(CountedOrderBook({}, depth), SortedCountedOrderBook({}, depth), random_deltas(rng, 300, 'count'))
+            replay(IndexedOrderBook({}, depth), SortedIndexedOrderBook({}, depth), random_deltas(rng, 300, 'id'))
+
+# indexed books keep working when an update omits the price
+indexed = SortedIndexedOrderBook({'bids': [[5, 1, 'a'], [6, 2, 'b']]})
+indexed['bids'].store(None, 3, 'a')
+assert indexed['bids'] == [[6, 2, 'b'], [5, 3, 'a']]
+indexed['bids'].store(7, 3, 'a')
+assert indexed['bids'] == [[7, 3, 'a'], [6, 2, 'b']]
+indexed['bids'].store(7, 0, 'a')
+assert indexed['bids'] == [[6, 2, 'b']]
+
+print('sorted order book tests passed')
@@ -0,0 +1,146 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+from aiohttp import web  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.ws.cache import ArrayCache  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# a local websocket server publishing a burst of trades for every subscription
+
+burst = 500
+
+
+async def handle_ws(request):
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    async for message in ws:
+        subscription = json.loads(message.data)
+        for i in range(burst):
+            await ws.send_str(json.dumps({'symbol': subscription['symbol'], 'id': i}))
+    return ws
+
+
+class mock(Exchange):
+    def describe(self):
+        return self.deep_extend(super(mock, self).describe(), {
+            'id': 'mock',
+            'has': {
+                'ws': True,
+                'watchTrades': True,
+            },
+        })
+
+    async def watch_trades(self, symbol, since=None, limit=None, params={}):
+        message_hash = 'trades:' + symbol
+        trades = await self.watch(self.urls['api']['ws'], message_hash, {'symbol': symbol}, message_hash)
+        return self.filter_by_since_limit(trades, since, limit, 'timestamp', True)
+
+    def handle_message(self, client, message):
+        symbol = message['symbol']
+        if symbol not in self.trades:
+            self.trades[symbol] = ArrayCache(10000)
+        self.trades[symbol].append({'symbol': symbol, 'id': message['id'], 'timestamp': None})
+        client.resolve(self.trades[symbol], 'trades:' + symbol)
+
+
+async def test_lossless(url):
+    exchange = mock({'urls': {'api': {'ws': url}}})
+    ids = []
+    async with exchange.stream_trades('BTC/USDT') as stream:
+        async for trade in stream:
+            ids.append(trade['id'])
+            if len(ids) == burst:
+                break
+    assert ids == list(range(burst)), ids[:10]
+    assert stream.dropped == 0
+    assert not exchange.clients[url].streams
+    await exchange.close()
+
+
+async def test_drop_oldest(url):
+    exchange = mock({'urls': {'api': {'ws': url}}, 'options': {'stream': {'maxSize': 10}}})
+    stream = exchange.stream_trades('ETH/USDT')
+    first = await stream.get()
+    # let the rest of the burst arrive while nobody consumes
+    while exchange.trades.get('ETH/USDT') is None or len(exchange.trades['ETH/USDT']) < burst:
+        await asyncio.sleep(0.01)
+    assert len(stream.queue) == 10
+    assert stream.dropped == burst - 1 - 10
+    last = [(await stream.get())['id'] for _ in range(10)]
+    assert last == list(range(burst - 10, burst)), (first, last)
+    stream.close()
+    await exchange.close()
+
+
+async def test_block(url):
+    exchange = mock({'urls': {'api': {'ws': url}}, 'options': {'stream': {'maxSize': 10, 'overflow': 'block'}}})
+    stream = exchange.stream_trades('XRP/USDT')
+    ids = [(await stream.get())['id']]
+    await asyncio.sleep(0.1)
+    # the socket is paused instead of dropping updates
+    assert stream.paused
+    while len(ids) < burst:
+        ids.append((await stream.get())['id'])
+    assert ids == list(range(burst))
+    assert stream.dropped == 0
+    assert not stream.paused
+    stream.close()
+    await exchange.close()
+
+
+async def test_callback(url):
+    exchange = mock({'urls': {'api': {'ws': url}}})
+    received = []
+    stream = exchange.stream_trades('LTC/USDT', received.append)
+    while len(received) < burst:
+        await asyncio.sleep(0.01)
+    assert [trade['id'] for trade in received] == list(range(burst))
+    stream.close()
+    await exchange.close()
+
+
+async def test_cached_before(url):
+    exchange = mock({'urls': {'api': {'ws': url}}})
+    exchange.trades['DOT/USDT'] = ArrayCache(10000)
+    for i in range(5):
+        exchange.trades['DOT/USDT'].append({'symbol': 'DOT/USDT', 'id': 'old', 'timestamp': None})
+    # the trades cached before the stream was opened are not emitted
+    received = []
+    stream = exchange.stream_trades('DOT/USDT', received.append)
+    while len(received) < burst:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    assert [trade['id'] for trade in received] == list(range(burst))
+    stream.close()
+    await exchange.close()
+
+
+async def test_stream():
+    app = web.Application()
+    app.router.add_get('/ws', handle_ws)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = 'ws://127.0.0.1:' + str(port) + '/ws'
+    try:
+        await test_lossless(url)
+        await test_drop_oldest(url)
+        await test_block(url)
+        await test_callback(url)
+        await test_cached_before(url)
+    finally:
+        await runner.cleanup()
+    print('stream tests passed')
+
+
+asyncio.run(test_stream())
@@ -11,121 +11,176 @@ found on the official site [1]. Original implementation [2] by the Keccak Team.
 Some caveats about the implementation:
     * width `b` of permutation is fixed as 1600 (5 * 5 * 64), which means
     the number of rounds is 24 (12 + 2ℓ, ℓ = log_2(b / 25))
-    * ρ step could have its offsets pre-computed as the array `r`.
-    * ι step could have its round constants pre-computed as the array `RC`.
+    * the state is kept as a flat list of 25 lanes (64-bit words), the lane
+    at column x and row y is at index x + 5 * y
+    * the ρ offsets and the π destinations are unrolled into the
+    permutation and the ι round constants are pre-computed
+    * when openssl 3.2+, pycryptodome or pysha3 is available its C
+    implementation of Keccak-256 is used instead
 
 [1] http://keccak.noekeon.org/
 [2] https://git.io/vKfkb
 """
 
+import hashlib
 
-def keccak_f_1600(state):
+try:
+    # openssl 3.2+
+    hashlib.new('KECCAK-256')
+    openssl_keccak = True
+except ValueError:
+    openssl_keccak = False
+
+try:
+    from Crypto.Hash import keccak as pycryptodome_keccak
+except ImportError:
+    try:
+        from Cryptodome.Hash import keccak as pycryptodome_keccak
+    except ImportError:
+        pycryptodome_keccak = None
+
+try:
+    import sha3 as pysha3
+except ImportError:
+    pysha3 = None
+
+
+MASK = (1 << 64) - 1
+
+
+def _round_constants():
+    """The ι round constants, generated by the LFSR of the specification."""
+    constants = []
+    R = 1
+    for _ in range(24):
+        rc = 0
+        for j in range(7):
+            R = ((R << 1) ^ ((R >> 7) * 0x71)) % 256
+            if R & 2:
+                rc |= 1 << ((1 << j) - 1)
+        constants.append(rc)
+    return constants
+
+
+ROUND_CONSTANTS = _round_constants()
+
+
+def keccak_f_1600(A):
     """The inner permutation for the Keccak sponge function.
 
     The Keccak-f permutation is an iterated construction consisting of a
     sequence of almost identical rounds. It operates on a state array with
-    each of the twenty-four rounds performing five steps, described below
-    with detail.
-
-    The loops above and below the core of the permutation are used to save and
-    restore the state array to a stream of bytes, used outside the permutation.
-    The original state array has three dimensions, whereas this characteristic
-    can be cleverly optimized to a 5x5 matrix with 64-bit words. As such, this
-    implementation makes use of this trick and stores an entire lane (a z-axis
-    set of bits within the state) as a single word.
+    each of the twenty-four rounds performing five steps.
 
     The θ step diffuses the bits alongside the state array by calculating the
     parity of nearby columns relative to a lane.
 
     The ρ and π steps are merged; together, they move more bits around
-    according to two alike recurrence relations.
+    according to two alike recurrence relations, unrolled below.
 
     The χ step is similar to an S-box permutation; it makes the whole round
     non-linear with a few logic operations on bits inside a line.
 
-    The ι step is a simple LFSR that breaks the symmetry of the rounds. It
-    generates constants by doing computations according to the round number
-    and its previous output, modulo polynomials over GF(2)[x].
+    The ι step breaks the symmetry of the rounds with `ROUND_CONSTANTS`.
 
     Args:
-        state:  square matrix of order 5 that holds the input bytes.
+        A:  list of the 25 lanes of the state, permuted in place.
 
     Returns:
-        state:  bytes permuted by Keccak-f[1600].
+        A:  the lanes permuted by Keccak-f[1600].
     """
-
-    def load64(b):
-        """
-        Saves each byte on its respective position within a 64-bit word.
-
-        Args:
-            b:  partial list of bytes from input.
-
-        Returns:
-            Sum of list with numbers shifted.
-        """
-        return sum((b[i] << (8 * i)) for i in range(8))
-
-    def store64(a):
-        """
-        Transforms a 64-bit word into a list of bytes.
-
-        Args:
-            a:  64-bit word.
-
-        Returns:
-            List of bytes separated by position on the word.
-        """
-        return list((a >> (8 * i)) % 256 for i in range(8))
-
-    def rotate(a, n):
-        """
-        Denotes the bitwise cyclic shift operation, moving bit at position
-        `i` into position `i + n` (modulo the lane size).
-
-        Args:
-            a:  lane with a 64-bit word, or elements from the state array.
-            n:  offset for rotation.
-
-        Returns:
-            The rotated lane.
-        """
-        return ((a >> (64 - (n % 64))) + (a << (n % 64))) % (1 << 64)
-
-    A = [[0 for _ in range(5)] for _ in range(5)]
-    for x in range(5):
-        for y in range(5):
-            i = 8 * (x + 5 * y)
-            A[x][y] = load64(state[i : i + 8])
-
-    R = 1
-    for _ in range(24):
-        C = [A[x][0] ^ A[x][1] ^ A[x][2] ^ A[x][3] ^ A[x][4] for x in range(5)]
-        D = [C[(x - 1) % 5] ^ rotate(C[(x + 1) % 5], 1) for x in range(5)]
-        A = [[A[x][y] ^ D[x] for y in range(5)] for x in range(5)]
-
-        x, y, current = 1, 0, A[1][0]
-        for t in range(24):
-            x, y = y, (2 * x + 3 * y) % 5
-            offset = ((t + 1) * (t + 2)) // 2
-            current, A[x][y] = A[x][y], rotate(current, offset)
-
-        for y in range(5):
-            T = [A[x][y] for x in range(5)]
-            for x in range(5):
-                A[x][y] = T[x] ^ ((~T[(x + 1) % 5]) & T[(x + 2) % 5])
-
-        for j in range(7):
-            R = ((R << 1) ^ ((R >> 7) * 0x71)) % 256
-            if R & 2:
-                A[0][0] ^= 1 << ((1 << j) - 1)
-
-    for x in range(5):
-        for y in range(5):
-            i = 8 * (x + 5 * y)
-            state[i : i + 8] = store64(A[x][y])
-
-    return state
+    for rc in ROUND_CONSTANTS:
+        C0 = A[0] ^ A[5] ^ A[10] ^ A[15] ^ A[20]
+        C1 = A[1] ^ A[6] ^ A[11] ^ A[16] ^ A[21]
+        C2 = A[2] ^ A[7] ^ A[12] ^ A[17] ^ A[22]
+        C3 = A[3] ^ A[8] ^ A[13] ^ A[18] ^ A[23]
+        C4 = A[4] ^ A[9] ^ A[14] ^ A[19] ^ A[24]
+        D0 = C4 ^ (((C1 << 1) | (C1 >> 63)) & MASK)
+        D1 = C0 ^ (((C2 << 1) | (C2 >> 63)) & MASK)
+        D2 = C1 ^ (((C3 << 1) | (C3 >> 63)) & MASK)
+        D3 = C2 ^ (((C4 << 1) | (C4 >> 63)) & MASK)
+        D4 = C3 ^ (((C0 << 1) | (C0 >> 63)) & MASK)
+
+        # ρ and π, lane x + 5 * y rotated by its offset moves to y + 5 * ((2 * x + 3 * y) % 5)
+        B0 = A[0] ^ D0
+        a = A[1] ^ D1
+        B10 = ((a << 1) | (a >> 63)) & MASK
+        a = A[2] ^ D2
+        B20 = ((a << 62) | (a >> 2)) & MASK
+        a = A[3] ^ D3
+        B5 = ((a << 28) | (a >> 36)) & MASK
+        a = A[4] ^ D4
+        B15 = ((a << 27) | (a >> 37)) & MASK
+        a = A[5] ^ D0
+        B16 = ((a << 36) | (a >> 28)) & MASK
+        a = A[6] ^ D1
+        B1 = ((a << 44) | (a >> 20)) & MASK
+        a = A[7] ^ D2
+        B11 = ((a << 6) | (a >> 58)) & MASK
+        a = A[8] ^ D3
+        B21 = ((a << 55) | (a >> 9)) & MASK
+        a = A[9] ^ D4
+        B6 = ((a << 20) | (a >> 44)) & MASK
+        a = A[10] ^ D0
+        B7 = ((a << 3) | (a >> 61)) & MASK
+        a = A[11] ^ D1
+        B17 = ((a << 10) | (a >> 54)) & MASK
+        a = A[12] ^ D2
+        B2 = ((a << 43) | (a >> 21)) & MASK
+        a = A[13] ^ D3
+        B12 = ((a << 25) | (a >> 39)) & MASK
+        a = A[14] ^ D4
+        B22 = ((a << 39) | (a >> 25)) & MASK
+        a = A[15] ^ D0
+        B23 = ((a << 41) | (a >> 23)) & MASK
+        a = A[16] ^ D1
+        B8 = ((a << 45) | (a >> 19)) & MASK
+        a = A[17] ^ D2
+        B18 = ((a << 15) | (a >> 49)) & MASK
+        a = A[18] ^ D3
+        B3 = ((a << 21) | (a >> 43)) & MASK
+        a = A[19] ^ D4
+        B13 = ((a << 8) | (a >> 56)) & MASK
+        a = A[20] ^ D0
+        B14 = ((a << 18) | (a >> 46)) & MASK
+        a = A[21] ^ D1
+        B24 = ((a << 2) | (a >> 62)) & MASK
+        a = A[22] ^ D2
+        B9 = ((a << 61) | (a >> 3)) & MASK
+        a = A[23] ^ D3
+        B19 = ((a << 56) | (a >> 8)) & MASK
+        a = A[24] ^ D4
+        B4 = ((a << 14) | (a >> 50)) & MASK
+
+        A[0] = B0 ^ ((~B1) & B2)
+        A[1] = B1 ^ ((~B2) & B3)
+        A[2] = B2 ^ ((~B3) & B4)
+        A[3] = B3 ^ ((~B4) & B0)
+        A[4] = B4 ^ ((~B0) & B1)
+        A[5] = B5 ^ ((~B6) & B7)
+        A[6] = B6 ^ ((~B7) & B8)
+        A[7] = B7 ^ ((~B8) & B9)
+        A[8] = B8 ^ ((~B9) & B5)
+        A[9] = B9 ^ ((~B5) & B6)
+        A[10] = B10 ^ ((~B11) & B12)
+        A[11] = B11 ^ ((~B12) & B13)
+        A[12] = B12 ^ ((~B13) & B14)
+        A[13] = B13 ^ ((~B14) & B10)
+        A[14] = B14 ^ ((~B10) & B11)
+        A[15] = B15 ^ ((~B16) & B17)
+        A[16] = B16 ^ ((~B17) & B18)
+        A[17] = B17 ^ ((~B18) & B19)
+        A[18] = B18 ^ ((~B19) & B15)
+        A[19] = B19 ^ ((~B15) & B16)
+        A[20] = B20 ^ ((~B21) & B22)
+        A[21] = B21 ^ ((~B22) & B23)
+        A[22] = B22 ^ ((~B23) & B24)
+        A[23] = B23 ^ ((~B24) & B20)
+        A[24] = B24 ^ ((~B20) & B21)
+
+        A[0] ^= rc
+
+    return A
 
 
 def Keccak(r, c, _input, suffix, output_len):
@@ -151,33 +206,29 @@ def Keccak(r, c, _input, suffix, output_len):
     Returns:
         Hash of the input bytes.
     """
-    state = bytearray((r + c) // 8)
-    rate_bytes, block, offset = r // 8, 0, 0
-
-    while offset < len(_input):
-        block = min(len(_input) - offset, rate_bytes)
-        for i in range(block):
-            state[i] ^= _input[i + offset]
-        offset += block
-        if block == rate_bytes:
-            state = keccak_f_1600(state)
-            block = 0
-
-    state[block] ^= suffix
-    if (suffix & 0x80) and (block == (rate_bytes - 1)):
-        state = keccak_f_1600(state)
-    state[rate_bytes - 1] ^= 0x80
-    state = keccak_f_1600(state)
+    rate_bytes = r // 8
+    rate_lanes = rate_bytes // 8
+    # pad10*1, the suffix starts the padding and the last bit of the block ends it
+    padded = bytearray(_input)
+    padded.append(suffix)
+    padded.extend(bytes(-len(padded) % rate_bytes))
+    padded[-1] ^= 0x80
+
+    A = [0] * 25
+    from_bytes = int.from_bytes
+    for offset in range(0, len(padded), rate_bytes):
+        for i in range(rate_lanes):
+            start = offset + 8 * i
+            A[i] ^= from_bytes(padded[start:start + 8], 'little')
+        keccak_f_1600(A)
 
     output = bytearray()
-    while output_len:
-        block = min(output_len, rate_bytes)
-        output += state[:block]
-        output_len -= block
-        if output_len:
-            state = keccak_f_1600(state)
-
-    return output
+    while True:
+        for i in range(rate_lanes):
+            output += A[i].to_bytes(8, 'little')
+        if len(output) >= output_len:
+            return output[:output_len]
+        keccak_f_1600(A)
 
 
 def SHA3(_input):
@@ -192,6 +243,12 @@ def SHA3(_input):
         Instance of the Keccak permutation that calculates the hash.
     """
     size = 256
+    if openssl_keccak:
+        return bytearray(hashlib.new('KECCAK-256', bytes(_input)).digest())
+    if pycryptodome_keccak is not None:
+        return bytearray(pycryptodome_keccak.new(digest_bits=size, data=bytes(_input)).digest())
+    if pysha3 is not None:
+        return bytearray(pysha3.keccak_256(bytes(_input)).digest())
     # https://www.cybertest.com/blog/keccak-vs-sha3
     padding = 0x01  # change this to 0x06 for NIST sha3
     return Keccak(1600 - size * 2, size * 2, _input, padding, size // 8)
@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+import bisect
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt.async_support as ccxt  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# the trades of a range fetched with the forward dynamic pagination of fetch_trades()
+# and with backfill(), from an exchange that answers after a fixed latency
+#
+#     python benchmark_backfill.py [trades] [latency in ms] [concurrency]
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+latency = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+limit = 1000
+start = 1700000000000
+trades = [{'id': str(i), 'timestamp': start + i * 10, 'price': 1, 'amount': 1} for i in range(count)]
+timestamps = [trade['timestamp'] for trade in trades]
+until = start + count * 10
+
+
+class Exchange(ccxt.Exchange):
+    id = 'backfill'
+
+    async def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        await asyncio.sleep(latency / 1000)
+        index = bisect.bisect_left(timestamps, since)
+        return trades[index:index + limit]
+
+
+async def main():
+    exchange = Exchange()
+    begin = time.perf_counter()
+    paginated = await exchange.fetch_paginated_call_dynamic('fetchTrades', 'BTC/USDT', start, None, {
+        'until': until,
+        'paginationDirection': 'forward',
+        'paginationCalls': count // limit + 1,
+    }, limit)
+    paginated_time = time.perf_counter() - begin
+    begin = time.perf_counter()
+    backfilled = []
+    async for page in exchange.backfill('fetchTrades', 'BTC/USDT', start, until, config={'limit': limit, 'concurrency': concurrency}):
+        backfilled.extend(page)
+    backfill_time = time.perf_counter() - begin
+    assert len(paginated) == len(backfilled) == count
+    print('fetch_paginated_call_dynamic %8.3f s' % paginated_time)
+    print('backfill                     %8.3f s %6.2fx' % (backfill_time, paginated_time / backfill_time))
+    await exchange.close()
+
+asyncio.run(main())
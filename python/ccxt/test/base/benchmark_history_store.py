@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+import bisect
+import shutil
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# the same range of candles fetched again and again from an exchange that answers after
+# a fixed latency, without the history store and with it, and read as columns
+#
+#     python benchmark_history_store.py [candles] [latency in ms]
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+latency = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+limit = 1000
+minute = 60000
+start = 1600000000000 - 1600000000000 % minute
+candles = [[start + i * minute, 1.0, 2.0, 0.5, 1.5, float(i)] for i in range(count)]
+timestamps = [candle[0] for candle in candles]
+
+
+class Exchange(ccxt.Exchange):
+    id = 'history'
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        time.sleep(latency / 1000)
+        index = bisect.bisect_left(timestamps, since)
+        return [candle[:] for candle in candles[index:index + limit]]
+
+
+def fetch_all(exchange):
+    result = []
+    for since in range(start, start + count * minute, limit * minute):
+        result.extend(exchange.fetch_ohlcv('BTC/USDT', '1m', since, limit))
+    return result
+
+
+def measure(callback):
+    begin = time.perf_counter()
+    result = callback()
+    return result, time.perf_counter() - begin
+
+
+def main():
+    folder = tempfile.mkdtemp()
+    try:
+        rest, rest_time = measure(lambda: fetch_all(Exchange()))
+        exchange = Exchange({'options': {'historyStore': {'path': folder}}})
+        first, first_time = measure(lambda: fetch_all(exchange))
+        stored, stored_time = measure(lambda: fetch_all(Exchange({'options': {'historyStore': {'path': folder}}})))
+        assert rest == first == stored == candles
+        series = exchange.history_store().ohlcv(exchange.id, 'BTC/USDT', '1m')
+        columns, columns_time = measure(lambda: series.columns(start, start + count * minute))
+        assert len(columns['close']) == count
+        print('fetch_ohlcv without the store %10.3f s' % rest_time)
+        print('fetch_ohlcv, first time       %10.3f s' % first_time)
+        print('fetch_ohlcv, stored           %10.3f s %8.1fx' % (stored_time, rest_time / stored_time))
+        print('columns()                     %10.6f s %8.1fx' % (columns_time, rest_time / columns_time))
+    finally:
+        shutil.rmtree(folder)
+
+
+main()
@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import eip712  # noqa: E402
+from ccxt.static_dependencies.keccak import keccak  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# signs hyperliquid order actions offline, msgpack -> keccak -> EIP-712 -> secp256k1
+#
+#     python benchmark_hyperliquid_signing.py [number of actions]
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+
+def create_action(i):
+    return {
+        'type': 'order',
+        'orders': [{
+            'a': i % 100,
+            'b': i % 2 == 0,
+            'p': str(100 + i % 1000 / 100),
+            's': '0.1',
+            'r': False,
+            't': {'limit': {'tif': 'Gtc'}},
+        }],
+        'grouping': 'na',
+        'brokerCode': 1,
+    }
+
+
+def measure(name, exchange, actions):
+    nonce = 1709144041776
+    start = time.perf_counter()
+    signatures = [exchange.sign_l1_action(action, nonce + i) for i, action in enumerate(actions)]
+    elapsed = time.perf_counter() - start
+    print('%-45s %8d actions %10.3f ms %10.3f us/action' % (name, len(actions), elapsed * 1000, elapsed / len(actions) * 1e6))
+    return signatures
+
+
+def main():
+    exchange = ccxt.hyperliquid({
+        'walletAddress': '0xc95ebfd8c7b5f8e3b1a68f7c0bdcbcf4a5fa9d17',
+        'privateKey': '0x' + '4f' * 32,
+    })
+    actions = [create_action(i) for i in range(count)]
+    backend = 'openssl' if keccak.openssl_keccak else 'pycryptodome' if keccak.pycryptodome_keccak else 'pysha3' if keccak.pysha3 else 'pure python'
+    signatures = measure('keccak ' + backend + ', memoized EIP-712', exchange, actions)
+    # the same actions with the table based keccak and the vendored EIP-712 encoder
+    backends = [keccak.openssl_keccak, keccak.pycryptodome_keccak, keccak.pysha3]
+    encode_structured_data = eip712.encode_structured_data
+    keccak.openssl_keccak, keccak.pycryptodome_keccak, keccak.pysha3 = False, None, None
+    try:
+        sample = actions[0:max(count // 20, 1)]
+        assert measure('keccak pure python, memoized EIP-712', exchange, sample) == signatures[0:len(sample)]
+        eip712.encode_structured_data = lambda domain, message_types, message: None
+        assert measure('keccak pure python, vendored EIP-712', exchange, sample) == signatures[0:len(sample)]
+    finally:
+        keccak.openssl_keccak, keccak.pycryptodome_keccak, keccak.pysha3 = backends
+        eip712.encode_structured_data = encode_structured_data
+
+
+main()
@@ -0,0 +1,52 @@
+import os
+import sys
+import subprocess
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# ----------------------------------------------------------------------------
+# cold start of the ccxt packages, each case runs in a fresh interpreter
+# the "all" cases touch every exchange class, like the eager imports used to
+#
+#     python benchmark_import.py [runs]
+
+runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+probe = '''
+import sys, time, resource
+start = time.perf_counter()
+%s
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, rss if sys.platform == 'darwin' else rss * 1024, len([m for m in sys.modules if m.startswith('ccxt')]))
+'''
+
+cases = [
+    ('import ccxt', 'import ccxt'),
+    ('ccxt.binance()', 'import ccxt\nccxt.binance()'),
+    ('ccxt all', 'import ccxt\nfor id in ccxt.exchanges: getattr(ccxt, id)'),
+    ('import ccxt.async_support', 'import ccxt.async_support'),
+    ('async binance()', 'import ccxt.async_support\nccxt.async_support.binance()'),
+    ('import ccxt.pro', 'import ccxt.pro'),
+    ('pro binance()', 'import ccxt.pro\nccxt.pro.binance()'),
+    ('pro all', 'import ccxt.pro\nfor id in ccxt.pro.exchanges: getattr(ccxt.pro, id)'),
+]
+
+
+def measure(code):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', probe % code], cwd=root, env=dict(os.environ, PYTHONPATH=root))
+        samples.append([float(x) for x in output.split()])
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    print('%-28s %10s %10s %8s' % ('case', 'ms', 'max RSS MB', 'modules'))
+    for name, code in cases:
+        elapsed, rss, modules = measure(code)
+        print('%-28s %10.1f %10.1f %8d' % (name, elapsed * 1000, rss / 1048576, modules))
+
+
+main()
@@ -0,0 +1,45 @@
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# instantiates every exchange, the first instance of a class pays for its
+# precompilation, the following ones (like one per sub-account) only copy it
+#
+#     python benchmark_instantiation.py [instances per exchange]
+
+instances = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+
+def measure(package):
+    first = 0
+    rest = 0
+    slowest = []
+    for id in package.exchanges:
+        exchange_class = getattr(package, id)
+        start = time.perf_counter()
+        exchange_class()
+        elapsed = time.perf_counter() - start
+        first += elapsed
+        start = time.perf_counter()
+        for _ in range(instances - 1):
+            exchange_class({'apiKey': 'key', 'secret': 'secret'})
+        per_instance = (time.perf_counter() - start) / max(instances - 1, 1)
+        rest += per_instance
+        slowest.append((per_instance, id))
+    slowest.sort(reverse=True)
+    count = len(package.exchanges)
+    print('%-20s first instance %7.3f ms   next instances %7.3f ms   (average over %d exchanges)' % (package.__name__, first / count * 1000, rest / count * 1000, count))
+    print('%-20s slowest: %s' % ('', ', '.join('%s %.3f ms' % (id, t * 1000) for t, id in slowest[:5])))
+
+
+measure(ccxt)
+measure(ccxt.async_support)
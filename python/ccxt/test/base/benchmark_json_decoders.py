@@ -0,0 +1,63 @@
+import os
+import sys
+import json
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.base import json_decoder  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# decodes every recorded http response of ts/src/test/static/response
+# with each installed decoder, from str and from bytes
+#
+#     python benchmark_json_decoders.py [iterations]
+
+folder = os.path.join(os.path.dirname(root), 'ts', 'src', 'test', 'static', 'response')
+iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+
+def load_payloads():
+    payloads = []
+    for filename in sorted(os.listdir(folder)):
+        with open(os.path.join(folder, filename), encoding='utf8') as file:
+            static = json.load(file)
+        for tests in static.get('methods', {}).values():
+            for test in tests:
+                response = test.get('httpResponse')
+                if isinstance(response, (dict, list)):
+                    payloads.append(json.dumps(response))
+    return payloads
+
+
+def measure(loads, payloads):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for payload in payloads:
+            loads(payload)
+    return time.perf_counter() - start
+
+
+def main():
+    texts = load_payloads()
+    blobs = [text.encode() for text in texts]
+    size = sum(len(blob) for blob in blobs)
+    print('%d payloads, %.1f KB, %d iterations' % (len(texts), size / 1024, iterations))
+    reference = [json.loads(text) for text in texts]
+    rows = []
+    for name in json_decoder.preference:
+        if name not in json_decoder.decoders:
+            continue
+        loads = json_decoder.json_decoder(name)
+        assert [loads(blob) for blob in blobs] == reference, name
+        rows.append((name, measure(loads, texts), measure(loads, blobs)))
+    rows.append(('json quoted', measure(json_decoder.quoted_loads, texts), measure(json_decoder.quoted_loads, blobs)))
+    baseline = rows[-2][1] if len(rows) > 1 else rows[0][1]
+    for name, from_str, from_bytes in rows:
+        print('%-12s str %8.3f s (%5.2fx)   bytes %8.3f s   %7.1f MB/s' % (name, from_str, baseline / from_str, from_bytes, size * iterations / from_bytes / 1e6))
+
+
+main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# set_markets() and the market lookups of the parsing paths over a bybit-like
+# universe, where spot and linear swap markets share their ids
+#
+#     python benchmark_markets.py [number of base currencies]
+
+bases = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+lookups = 200000
+
+
+def create_markets():
+    markets = []
+    for i in range(bases):
+        base = 'C' + str(i)
+        common = {'base': base, 'baseId': base, 'active': True, 'precision': {'amount': 0.001, 'price': 0.01}}
+        markets.append(dict(common, id=base + 'USDT', symbol=base + '/USDT', quote='USDT', quoteId='USDT', type='spot', spot=True, swap=False, contract=False, linear=None, inverse=None))
+        markets.append(dict(common, id=base + 'USDT', symbol=base + '/USDT:USDT', quote='USDT', quoteId='USDT', settle='USDT', settleId='USDT', type='swap', spot=False, swap=True, contract=True, linear=True, inverse=False))
+        markets.append(dict(common, id=base + 'USD', symbol=base + '/USD:' + base, quote='USD', quoteId='USD', settle=base, settleId=base, type='swap', spot=False, swap=True, contract=True, linear=False, inverse=True))
+    return markets
+
+
+def measure(name, count, callback):
+    start = time.perf_counter()
+    callback()
+    elapsed = time.perf_counter() - start
+    print('%-40s %10.3f ms %10.3f us/call' % (name, elapsed * 1000, elapsed / count * 1e6))
+
+
+def main():
+    exchange = ccxt.bybit()
+    markets = create_markets()
+    print(len(markets), 'markets')
+    measure('set_markets', 1, lambda: exchange.set_markets(markets))
+    ids = [market['id'] for market in markets]
+    unique = [market_id for market_id in ids if market_id.endswith('USD')]
+    swap = exchange.markets['C1/USDT:USDT']
+    measure('safe_market (unique id)', lookups, lambda: [exchange.safe_market(unique[i % len(unique)]) for i in range(lookups)])
+    measure('safe_market (shared id, market type)', lookups, lambda: [exchange.safe_market(ids[i % len(ids)], None, None, 'swap') for i in range(lookups)])
+    measure('safe_symbol (shared id, market)', lookups, lambda: [exchange.safe_symbol(ids[i % len(ids)], swap) for i in range(lookups)])
+    measure('safe_symbol (unknown id, delimiter)', lookups, lambda: [exchange.safe_symbol('X' + str(i % 100) + '-USDT', None, '-') for i in range(lookups)])
+    measure('market (id)', lookups, lambda: [exchange.market(ids[i % len(ids)]) for i in range(lookups)])
+    measure('get_symbols_for_market_type', 1000, lambda: [exchange.get_symbols_for_market_type('swap', 'linear') for i in range(1000)])
+    folder = tempfile.mkdtemp()
+    cached = ccxt.bybit({'options': {'marketsCache': {'path': folder}}})
+    cache = cached.markets_cache()
+    measure('markets cache save', 1, lambda: cache.save(exchange))
+    measure('markets cache load', 1, lambda: cached.load_markets())
+    assert cached.markets == exchange.markets
+    shutil.rmtree(folder)
+
+
+main()
@@ -0,0 +1,76 @@
+import os
+import sys
+import time
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.ohlcv_aggregator import OHLCVAggregator  # noqa: E402
+from ccxt.async_support.base.ws.cache import ArrayCacheByTimestamp  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# the candles of a stream of trades, built again from the last trades on every update like
+# the exchanges that build them with build_ohlcvc(), and updated with the new trades only,
+# and the candles of all the trades at once
+#
+#     python benchmark_ohlcv_aggregator.py [trades] [trades per update] [cached trades]
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+size = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+cached = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+timeframes = ['1m', '5m', '1h']
+random.seed(1)
+timestamp = 1700000000000
+trades = []
+for i in range(count):
+    timestamp += random.randint(0, 2000)
+    trades.append({'timestamp': timestamp, 'price': random.uniform(99, 101), 'amount': random.uniform(0, 1)})
+exchange = ccxt.Exchange()
+
+
+def rebuild():
+    result = None
+    for i in range(0, count, size):
+        last = trades[max(0, i + size - cached):i + size]
+        result = [exchange.build_ohlcvc(last, timeframe) for timeframe in timeframes]
+    return result
+
+
+def incremental():
+    durations = dict((timeframe, exchange.parse_timeframe(timeframe) * 1000) for timeframe in timeframes)
+    aggregator = OHLCVAggregator(durations, lambda: ArrayCacheByTimestamp(1000))
+    for i in range(0, count, size):
+        aggregator.update(trades[i:i + size])
+    return aggregator
+
+
+def batch():
+    columns = [[trade['timestamp'] for trade in trades], [trade['price'] for trade in trades], [trade['amount'] for trade in trades]]
+    begin = time.perf_counter()
+    for timeframe in timeframes:
+        exchange.aggregate_ohlcvc(*columns, timeframe)
+    return time.perf_counter() - begin
+
+
+def measure(callback):
+    begin = time.perf_counter()
+    callback()
+    return time.perf_counter() - begin
+
+
+def main():
+    rebuild_time = measure(rebuild)
+    incremental_time = measure(incremental)
+    batch_time = batch()
+    build_time = measure(lambda: [exchange.build_ohlcvc(trades, timeframe) for timeframe in timeframes])
+    print('build_ohlcvc() on every update %10.3f s' % rebuild_time)
+    print('OHLCVAggregator.update()       %10.3f s %8.1fx' % (incremental_time, rebuild_time / incremental_time))
+    print('build_ohlcvc() of all trades   %10.3f s' % build_time)
+    print('aggregate_ohlcvc()             %10.3f s %8.1fx' % (batch_time, build_time / batch_time))
+
+
+main()
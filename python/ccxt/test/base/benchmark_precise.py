@@ -0,0 +1,88 @@
+import os
+import sys
+import time
+import random
+import subprocess
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.base.precise import Precise  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# the Precise.string_* methods over amounts and prices like the ones of the responses
+# and the arithmetic of Exchange.safe_order() for an order with trades, optionally with
+# the precise.py of a git revision as the baseline
+#
+#     python benchmark_precise.py [operations] [git revision of the baseline, like HEAD~1]
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+revision = sys.argv[2] if len(sys.argv) > 2 else None
+rounds = 3
+
+
+def load_baseline(revision):
+    source = subprocess.check_output(['git', 'show', revision + ':python/ccxt/base/precise.py'], cwd=root)
+    scope = {}
+    exec(compile(source, revision + ':precise.py', 'exec'), scope)
+    return scope['Precise']
+
+
+def create_numbers(size):
+    random.seed(1)
+    prices = [str(random.randint(1, 10 ** 7) / 100) for i in range(size // 10 + 1)]
+    amounts = [str(random.randint(1, 10 ** 6) / 10 ** random.randint(0, 6)) for i in range(size)]
+    return prices, amounts
+
+
+def safe_order_arithmetic(Precise, prices, amounts):
+    # the filled, cost and average of an order out of its trades
+    filled = None
+    cost = None
+    for price, amount in zip(prices, amounts):
+        filled = Precise.string_add(filled, amount)
+        cost = Precise.string_add(cost, Precise.string_mul(price, amount))
+    remaining = Precise.string_sub('1000000', filled)
+    if Precise.string_gt(filled, '0'):
+        average = Precise.string_div(cost, filled)
+        return [filled, cost, remaining, average]
+
+
+def measure(callback):
+    # the best of a few rounds
+    timings = []
+    for i in range(rounds):
+        start = time.perf_counter()
+        result = callback()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def benchmark(Precise, prices, amounts):
+    size = len(amounts)
+    results = {}
+    timings = {}
+    for name in ['string_add', 'string_sub', 'string_mul', 'string_div', 'string_gt', 'string_eq']:
+        method = getattr(Precise, name)
+        results[name], timings[name] = measure(lambda: [method(amounts[i], prices[i % len(prices)]) for i in range(size)])
+    results['safe_order'], timings['safe_order'] = measure(lambda: [safe_order_arithmetic(Precise, prices[i % 90:i % 90 + 10], amounts[i:i + 10]) for i in range(0, size, 10)])
+    return results, timings
+
+
+def main():
+    prices, amounts = create_numbers(count)
+    results, timings = benchmark(Precise, prices, amounts)
+    baseline = None
+    if revision is not None:
+        baseline_results, baseline = benchmark(load_baseline(revision), prices, amounts)
+        assert baseline_results == results
+    for name, elapsed in timings.items():
+        line = '%-12s %8d operations %10.3f s %8.3f us/operation' % (name, count, elapsed, elapsed / count * 1e6)
+        if baseline is not None:
+            line += '   %s %8.3f us/operation %6.2fx' % (revision, baseline[name] / count * 1e6, baseline[name] / elapsed)
+        print(line)
+
+
+main()
@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import decimal_to_precision as module  # noqa: E402
+from ccxt.base.decimal_to_precision import TRUNCATE, ROUND, DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE, NO_PADDING  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# decimal_to_precision() with the compiled formatters and with the original implementation,
+# and an order ladder rounded with price_to_precision() and with prices_to_precision()
+#
+#     python benchmark_precision.py [numbers]
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+cases = [
+    ['tick size round', ROUND, 0.1, TICK_SIZE],
+    ['tick size truncate', TRUNCATE, 0.001, TICK_SIZE],
+    ['decimal places round', ROUND, 2, DECIMAL_PLACES],
+    ['decimal places truncate', TRUNCATE, 4, DECIMAL_PLACES],
+    ['significant digits round', ROUND, 5, SIGNIFICANT_DIGITS],
+]
+
+
+def measure(callback):
+    start = time.perf_counter()
+    result = callback()
+    return result, (time.perf_counter() - start) / count * 1e6
+
+
+def main():
+    numbers = [27000 + i * 0.0137 for i in range(count)]
+    for name, rounding_mode, precision, counting_mode in cases:
+        compiled, compiled_time = measure(lambda: [module.decimal_to_precision(number, rounding_mode, precision, counting_mode, NO_PADDING) for number in numbers])
+        original, original_time = measure(lambda: [module.decimal_to_precision_slowly(number, rounding_mode, precision, counting_mode, NO_PADDING) for number in numbers])
+        assert compiled == original
+        print('%-26s %8.3f us/number %8.3f us/number original %6.2fx' % (name, compiled_time, original_time, original_time / compiled_time))
+    exchange = ccxt.Exchange({'id': 'exchange'})
+    exchange.precisionMode = TICK_SIZE
+    exchange.set_markets([{
+        'id': 'BTCUSDT',
+        'symbol': 'BTC/USDT',
+        'base': 'BTC',
+        'quote': 'USDT',
+        'type': 'spot',
+        'spot': True,
+        'precision': {'price': 0.1, 'amount': 0.001},
+    }])
+    batch, batch_time = measure(lambda: exchange.prices_to_precision('BTC/USDT', numbers))
+    single, single_time = measure(lambda: [exchange.price_to_precision('BTC/USDT', number) for number in numbers])
+    assert batch == single
+    print('%-26s %8.3f us/price  %8.3f us/price  price_to_precision() %6.2fx' % ('prices_to_precision', batch_time, single_time, single_time / batch_time))
+    decimal_to_precision = exchange.decimal_to_precision
+    exchange.decimal_to_precision = module.decimal_to_precision_slowly
+    try:
+        original, original_time = measure(lambda: [exchange.price_to_precision('BTC/USDT', number) for number in numbers])
+    finally:
+        exchange.decimal_to_precision = decimal_to_precision
+    assert original == single
+    print('%-26s %8.3f us/price  %8.3f us/price  original %6.2fx' % ('price_to_precision', single_time, original_time, original_time / single_time))
+
+
+main()
@@ -0,0 +1,130 @@
+import os
+import sys
+import json
+import hmac
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import signing  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# signs the requests of the static request tests, ts/src/test/static/request, offline
+# every unified method of the fixtures is called once to capture the arguments of sign()
+# then sign() alone is repeated, with the pre-keyed hmac and the inlined urlencode, and with
+# a fresh hmac per request and the urlencode of urllib.parse
+#
+#     python benchmark_sign.py [signatures per request] [exchange ...]
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+rounds = 3
+
+exchanges = sys.argv[2:] or [
+    'binance', 'bybit', 'okx', 'coinbase', 'kraken', 'kucoin', 'bitget', 'gate', 'htx', 'mexc',
+    'bitfinex2', 'bitmex', 'bingx', 'cryptocom', 'bitstamp', 'gemini', 'kucoinfutures', 'phemex', 'whitebit', 'bitmart',
+]
+
+static = os.path.join(os.path.dirname(root), 'ts', 'src', 'test', 'static')
+
+
+def read_json(*path):
+    with open(os.path.join(static, *path), encoding='utf8') as file:
+        return json.load(file)
+
+
+def init_offline_exchange(exchange_id):
+    exchange = getattr(ccxt, exchange_id)({
+        'markets': read_json('markets', exchange_id + '.json'),
+        'enableRateLimit': False,
+        'apiKey': 'key',
+        'secret': 'secretsecret',
+        'password': 'password',
+        'walletAddress': 'wallet',
+        'uid': 'uid',
+        'token': 'token',
+        'options': {
+            'accessToken': 'token',
+            'expires': 999999999999999,
+            'leverageBrackets': {},
+        },
+    })
+    exchange.currencies = read_json('currencies', exchange_id + '.json')
+    return exchange
+
+
+class Sunk(Exception):
+    pass
+
+
+def sink(url, method='GET', headers=None, body=None):
+    raise Sunk(url)
+
+
+def capture_requests(exchange, exchange_data):
+    requests = []
+    sign = exchange.sign
+    exchange.fetch = sink
+
+    def capture(path, api='public', method='GET', params={}, headers=None, body=None):
+        requests.append([path, api, method, exchange.extend({}, params), headers, body])
+        return sign(path, api, method, params, headers, body)
+
+    exchange.sign = capture
+    exchange.extend_exchange_options(exchange_data.get('options', {}))
+    for method, results in exchange_data['methods'].items():
+        for result in results:
+            if result.get('disabled'):
+                continue
+            try:
+                getattr(exchange, exchange.un_camel_case(method))(*result['input'])
+            except Sunk:
+                pass
+            except Exception:
+                # a request that needs a state the offline exchange does not have
+                pass
+    exchange.sign = sign
+    return requests
+
+
+def measure(exchange, requests):
+    start = time.perf_counter()
+    for i in range(count):
+        for path, api, method, params, headers, body in requests:
+            exchange.sign(path, api, method, exchange.extend({}, params), headers, body)
+    return (time.perf_counter() - start) / count / len(requests) * 1e6
+
+
+def unkeyed_hmac(secret, algorithm):
+    return hmac.new(secret, None, algorithm)
+
+
+def main():
+    total = [0, 0]
+    for exchange_id in exchanges:
+        exchange = init_offline_exchange(exchange_id)
+        requests = capture_requests(exchange, read_json('request', exchange_id + '.json'))
+        if not requests:
+            print('%-16s no requests captured' % exchange_id)
+            continue
+        keyed = min(measure(exchange, requests) for i in range(rounds))
+        keyed_hmac = signing.keyed_hmac
+        urlencode = Exchange.urlencode
+        signing.keyed_hmac = unkeyed_hmac
+        Exchange.urlencode = staticmethod(Exchange.urlencode_slowly)
+        try:
+            fresh = min(measure(exchange, requests) for i in range(rounds))
+        finally:
+            signing.keyed_hmac = keyed_hmac
+            Exchange.urlencode = staticmethod(urlencode)
+        total[0] += keyed
+        total[1] += fresh
+        print('%-16s %4d requests %10.2f us/sign %10.2f us/sign before' % (exchange_id, len(requests), keyed, fresh))
+    print('%-16s %4s          %10.2f us/sign %10.2f us/sign before' % ('total', '', total[0], total[1]))
+
+
+main()
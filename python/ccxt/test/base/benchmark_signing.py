@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.base import signing  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import rsa, ed25519  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# signs with every algorithm Exchange.ecdsa() accepts, with the accelerated backend
+# and with the pure python static_dependencies/ecdsa, and with rsa and ed25519 keys
+#
+#     python benchmark_signing.py [signatures per algorithm]
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+curves = {
+    'p192': 24,
+    'p224': 28,
+    'p256': 32,
+    'p384': 48,
+    'p521': 66,
+    'secp256k1': 32,
+}
+
+
+def measure(name, callback):
+    callback()  # the first call parses and caches the key
+    start = time.perf_counter()
+    for i in range(count):
+        callback()
+    elapsed = time.perf_counter() - start
+    print('%-40s %10.3f ms/signature' % (name, elapsed / count * 1000))
+
+
+def main():
+    print('coincurve', 'installed' if signing.coincurve is not None else 'not installed')
+    for algorithm, size in curves.items():
+        secret = '01' * size
+        request = 'ab' * min(size, 32)
+        measure('ecdsa ' + algorithm, lambda: Exchange.ecdsa(request, secret, algorithm))
+        multiply_generator = signing.multiply_generator
+        signing.multiply_generator = lambda curve_name, k: None
+        try:
+            measure('ecdsa ' + algorithm + ' (pure python)', lambda: Exchange.ecdsa(request, secret, algorithm))
+        finally:
+            signing.multiply_generator = multiply_generator
+    measure('ecdsa secp256k1 fixed length', lambda: Exchange.ecdsa('ab' * 32, '01' * 32, 'secp256k1', None, True))
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    rsa_pem = rsa_key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()).decode()
+    measure('rsa 2048 sha256', lambda: Exchange.rsa('hello', rsa_pem, 'sha256'))
+    ed25519_pem = ed25519.Ed25519PrivateKey.generate().private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()).decode()
+    measure('eddsa ed25519', lambda: Exchange.eddsa(Exchange.encode('hello'), ed25519_pem))
+
+
+main()
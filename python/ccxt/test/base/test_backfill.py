@@ -0,0 +1,175 @@
+import os
+import sys
+import json
+import bisect
+import asyncio
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt.async_support as ccxt  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+minute = 60000
+start = 1700000000000 - 1700000000000 % minute
+candles = [[start + i * minute, 1, 2, 0.5, 1.5, 10] for i in range(5000)]
+# 7 trades in every 1000 ms, some of them in the same millisecond
+trades = [{'id': str(i), 'timestamp': start + (i // 7) * 1000 + (i % 7 // 3), 'price': 1, 'amount': 1} for i in range(7000)]
+timestamps = {
+    id(candles): [candle[0] for candle in candles],
+    id(trades): [trade['timestamp'] for trade in trades],
+}
+
+
+class Exchange(ccxt.Exchange):
+    id = 'backfill'
+    calls = 0
+    running = 0
+    most_running = 0
+    failures = 0
+    failure = ccxt.NetworkError
+
+    async def request(self, rows, since, limit):
+        self.calls += 1
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        try:
+            await asyncio.sleep(0.001)
+            if self.failures:
+                self.failures -= 1
+                raise self.failure('failure')
+            index = bisect.bisect_left(timestamps[id(rows)], since)
+            return rows[index:index + limit]
+        finally:
+            self.running -= 1
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        assert timeframe == '1m'
+        return await self.request(candles, since, limit)
+
+    async def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        return await self.request(trades, since, limit)
+
+
+# the trades of an exchange without trade ids, three of them in the same millisecond
+anonymous_trades = [{'timestamp': start, 'price': 1, 'amount': 1}, {'timestamp': start, 'price': 1, 'amount': 2}, {'timestamp': start, 'price': 2, 'amount': 1}, {'timestamp': start + 1, 'price': 1, 'amount': 1}]
+timestamps[id(anonymous_trades)] = [trade['timestamp'] for trade in anonymous_trades]
+
+
+class Anonymous(Exchange):
+    async def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        return await self.request(anonymous_trades, since, limit)
+
+    fetchTrades = fetch_trades
+
+
+async def collect(backfill, pages=None):
+    result = []
+    iterator = backfill.__aiter__()
+    async for page in iterator:
+        assert len(page) > 0
+        result.extend(page)
+        if pages is not None:
+            pages -= 1
+            if pages == 0:
+                break
+    await iterator.aclose()
+    return result
+
+
+def assert_ascending_unique(rows, key):
+    timestamps = [row[0] if isinstance(row, list) else row['timestamp'] for row in rows]
+    assert timestamps == sorted(timestamps)
+    assert len(set(key(row) for row in rows)) == len(rows)
+
+
+async def test():
+    exchange = Exchange()
+    until = start + 4000 * minute
+    # every candle of [since, until) once, in time order, with at most concurrency requests at a time
+    result = await collect(exchange.backfill('fetchOHLCV', 'BTC/USDT', start + 10 * minute, until, '1m', config={'limit': 100, 'concurrency': 3}))
+    assert result == candles[10:4000]
+    assert exchange.most_running == 3
+    # the shards are aligned to the timeframe
+    backfill = exchange.backfill('fetchOHLCV', 'BTC/USDT', start + 1, until, '1m', config={'shards': 7})
+    assert all((shard_start - start - 1) % minute == 0 for shard_start, shard_end in backfill.split())
+    # the pages end in the middle of the trades of a millisecond
+    result = await collect(exchange.backfill('fetchTrades', 'BTC/USDT', start, start + 300000, config={'limit': 4, 'concurrency': 5, 'shards': 9}))
+    assert result == [trade for trade in trades if trade['timestamp'] < start + 300000]
+    # more trades in a millisecond than fit in a page, the rest of the millisecond is skipped
+    result = await collect(exchange.backfill('fetchTrades', 'BTC/USDT', start, start + 300000, config={'limit': 2}))
+    assert len(result) == 300 * 5
+    assert_ascending_unique(result, lambda trade: trade['id'])
+    # the trades without an id are told apart by their values
+    anonymous = Anonymous()
+    assert await collect(anonymous.backfill('fetchTrades', 'BTC/USDT', start, start + 2, config={'limit': 3})) == anonymous_trades
+    # and resumed from their values saved in the checkpoint
+    folder = tempfile.mkdtemp()
+    config = {'limit': 3, 'checkpoint': os.path.join(folder, 'anonymous.json')}
+    result = await collect(anonymous.backfill('fetchTrades', 'BTC/USDT', start, start + 2, config=config), 1)
+    result.extend(await collect(anonymous.backfill('fetchTrades', 'BTC/USDT', start, start + 2, config=config)))
+    assert result == anonymous_trades
+    os.unlink(config['checkpoint'])
+    os.rmdir(folder)
+    await anonymous.close()
+    # the network errors are retried with backoff, rate limits included
+    for failure in [ccxt.NetworkError, ccxt.RateLimitExceeded]:
+        exchange.failure = failure
+        exchange.failures = 2
+        assert await collect(exchange.backfill('fetchOHLCV', 'BTC/USDT', start, start + 300 * minute, '1m', config={'limit': 100, 'concurrency': 1, 'retryDelay': 1})) == candles[:300]
+    exchange.failures = 10
+    try:
+        await collect(exchange.backfill('fetchOHLCV', 'BTC/USDT', start, start + 300 * minute, '1m', config={'maxRetries': 1, 'retryDelay': 1}))
+        assert False
+    except ccxt.RateLimitExceeded:
+        pass
+    backfill = exchange.backfill('fetchOHLCV', 'BTC/USDT', start, start + minute, '1m', config={'retryDelay': 1000, 'maxRetryDelay': 5000})
+    assert 0.5 <= backfill.backoff(1) <= 1 and 2 <= backfill.backoff(3) <= 4 and 2.5 <= backfill.backoff(10) <= 5
+    # the other errors are not
+    exchange.failure = ccxt.BadSymbol
+    exchange.failures = 1
+    exchange.calls = 0
+    try:
+        await collect(exchange.backfill('fetchOHLCV', 'BTC/USDT', start, start + 300 * minute, '1m', config={'concurrency': 1, 'shards': 1}))
+        assert False
+    except ccxt.BadSymbol:
+        pass
+    assert exchange.calls == 1
+    exchange.failure = ccxt.NetworkError
+    exchange.failures = 0
+    # an interrupted backfill resumes from its checkpoint
+    folder = tempfile.mkdtemp()
+    checkpoint = os.path.join(folder, 'trades.json')
+    config = {'limit': 5, 'concurrency': 2, 'checkpoint': checkpoint}
+    result = []
+    for pages in [3, 10, 1, None]:
+        exchange.calls = 0
+        result.extend(await collect(exchange.backfill('fetchTrades', 'BTC/USDT', start, start + 500000, config=config), pages))
+    assert result == [trade for trade in trades if trade['timestamp'] < start + 500000]
+    with open(checkpoint) as file:
+        assert json.load(file)['cursor'] == start + 500000
+    # a finished backfill does not fetch anything
+    exchange.calls = 0
+    assert await collect(exchange.backfill('fetchTrades', 'BTC/USDT', start, start + 500000, config=config)) == []
+    assert exchange.calls == 0
+    # the checkpoint of another backfill is not used
+    assert len(await collect(exchange.backfill('fetchTrades', 'ETH/USDT', start, start + 5000, config=config))) == 35
+    os.unlink(checkpoint)
+    os.rmdir(folder)
+    # an exchange that ignores since
+    exchange.request = lambda rows, since, limit: Exchange.request(exchange, rows, 0, limit)
+    assert await collect(exchange.backfill('fetchOHLCV', 'BTC/USDT', start + minute, start + 10 * minute, '1m', config={'limit': 3})) == candles[1:3]
+    try:
+        exchange.backfill('fetchTrades', 'BTC/USDT')
+        assert False
+    except ccxt.ArgumentsRequired:
+        pass
+    await exchange.close()
+
+asyncio.run(test())
+
+print('backfill tests passed')
@@ -0,0 +1,134 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base import connection_pool  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path.startswith('/error'):
+            body = b'not found'
+            self.send_response(404)
+        else:
+            time.sleep(0.05)
+            body = json.dumps({'path': self.path, 'cookie': self.headers.get('Cookie')}).encode()
+            self.send_response(200)
+            self.send_header('Set-Cookie', 'session=' + self.path[1:])
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base = 'http://127.0.0.1:%d/' % server.server_address[1]
+
+
+def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+    return {'url': base + path, 'method': method, 'body': body, 'headers': headers}
+
+
+class Exchange(ccxt.Exchange):
+    id = 'pool'
+    rateLimit = 1
+    sign = sign
+
+    def fetch_path(self, path):
+        return self.fetch2(path)
+
+    def fetch_markets(self, params={}):
+        self.fetch_path('markets')
+        return [{'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'spot': True, 'type': 'spot', 'active': True, 'precision': {}, 'limits': {}}]
+
+
+class AsyncExchange(ccxt.async_support.Exchange):
+    id = 'pool'
+    rateLimit = 1
+    sign = sign
+
+    async def fetch_path(self, path):
+        return await self.fetch2(path)
+
+
+# the connections are reused, unless keepAlive is False
+exchange = Exchange()
+for i in range(3):
+    assert exchange.fetch_path('a' + str(i))['path'] == '/a' + str(i)
+assert exchange.connection_metrics() == {'requests': 3, 'connections': 1, 'reused': 2}
+closing = Exchange({'options': {'connectionPool': {'keepAlive': False}}})
+for i in range(3):
+    closing.fetch_path('b')
+assert closing.connection_metrics()['connections'] == 3
+
+# the instances of an exchange share a session, without their cookies
+first = Exchange({'options': {'connectionPool': {'shared': True, 'maxPerHost': 4}}})
+second = Exchange({'options': {'connectionPool': {'shared': True}}})
+assert first.session is second.session and first.session is not exchange.session
+assert Exchange({'options': {'connectionPool': {'shared': 'other'}}}).session is not first.session
+assert first.fetch_path('c')['cookie'] is None and second.fetch_path('d')['cookie'] is None
+del second
+assert first.fetch_path('e')['path'] == '/e'
+assert connection_pool.is_shared(first.session) and not connection_pool.is_shared(exchange.session)
+
+# fetch_many() runs the calls concurrently, in order, through the rate limiter of the instance
+exchange = Exchange({'options': {'connectionPool': {'maxPerHost': 8}}})
+begin = time.time()
+result = exchange.fetch_many([['fetch_path', 'f' + str(i)] for i in range(8)], {'loadMarkets': False})
+assert [response['path'] for response in result] == ['/f' + str(i) for i in range(8)]
+assert time.time() - begin < 0.3
+assert exchange.throttler.requests == 8
+assert exchange.connection_metrics()['connections'] == 8
+exchange.fetch_many([['fetch_path', 'g' + str(i)] for i in range(8)], {'loadMarkets': False})
+assert exchange.connection_metrics() == {'requests': 16, 'connections': 8, 'reused': 8}
+limited = Exchange({'rateLimit': 100})
+begin = time.time()
+limited.fetch_many([['fetch_path', 'h'] for i in range(4)], {'loadMarkets': False})
+assert time.time() - begin >= 0.3
+result = exchange.fetch_many([['fetch_path', 'i'], ['fetch_path', 'error']], {'loadMarkets': False, 'returnExceptions': True})
+assert result[0]['path'] == '/i' and isinstance(result[1], ccxt.ExchangeNotAvailable)
+try:
+    exchange.fetch_many([['fetch_path', 'error'], ['fetch_path', 'j']], {'loadMarkets': False})
+    assert False
+except ccxt.ExchangeNotAvailable:
+    pass
+# the markets are loaded once, before the calls
+exchange = Exchange()
+result = exchange.fetch_many([['fetch_path', 'l'], ['fetch_path', 'm']])
+assert [response['path'] for response in result] == ['/l', '/m']
+assert exchange.connection_metrics()['requests'] == 3 and list(exchange.markets) == ['BTC/USDT']
+assert exchange.fetch_many([]) == []
+
+
+async def test_async():
+    exchange = AsyncExchange()
+    begin = time.time()
+    result = await exchange.fetch_many([['fetch_path', 'k' + str(i)] for i in range(6)] + [['fetch_path', 'error']], {'loadMarkets': False, 'workers': 6, 'returnExceptions': True})
+    assert [response['path'] for response in result[:6]] == ['/k' + str(i) for i in range(6)]
+    assert isinstance(result[6], ccxt.ExchangeNotAvailable)
+    assert time.time() - begin < 0.3
+    await exchange.close()
+
+asyncio.run(test_async())
+server.shutdown()
+
+print('connection pool tests passed')
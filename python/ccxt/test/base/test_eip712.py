@@ -0,0 +1,103 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.base import eip712  # noqa: E402
+from ccxt.static_dependencies.keccak import keccak  # noqa: E402
+from ccxt.static_dependencies.ethereum import account  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+
+def vendored(domain, message_types, message):
+    encoded = account.messages.encode_typed_data(domain, message_types, message)
+    return b'\x19\x01' + encoded.header + encoded.body
+
+
+# the table based keccak and the optional backends are the original Keccak-256
+vectors = {
+    b'': 'c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470',
+    b'abc': '4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45',
+    b'\x01' * 135: None,
+    b'\x01' * 136: None,
+    b'\x01' * 137: None,
+    bytes(range(256)) * 3: None,
+}
+pure = [keccak.SHA3(data) for data in vectors]
+backends = [keccak.openssl_keccak, keccak.pycryptodome_keccak, keccak.pysha3]
+keccak.openssl_keccak, keccak.pycryptodome_keccak, keccak.pysha3 = False, None, None
+try:
+    assert [keccak.SHA3(data) for data in vectors] == pure
+    for data, expected in vectors.items():
+        assert isinstance(keccak.SHA3(data), bytearray)
+        if expected is not None:
+            assert keccak.SHA3(data).hex() == expected
+finally:
+    keccak.openssl_keccak, keccak.pycryptodome_keccak, keccak.pysha3 = backends
+
+domain = {
+    'chainId': 1337,
+    'name': 'Exchange',
+    'verifyingContract': '0x0000000000000000000000000000000000000000',
+    'version': '1',
+}
+agent = {
+    'Agent': [
+        {'name': 'source', 'type': 'string'},
+        {'name': 'connectionId', 'type': 'bytes32'},
+    ],
+}
+transfer = {
+    'UsdTransferSignPayload': [
+        {'name': 'destination', 'type': 'string'},
+        {'name': 'amount', 'type': 'string'},
+        {'name': 'time', 'type': 'uint64'},
+    ],
+}
+everything = {
+    'Everything': [
+        {'name': 'flag', 'type': 'bool'},
+        {'name': 'owner', 'type': 'address'},
+        {'name': 'delta', 'type': 'int128'},
+        {'name': 'tag', 'type': 'bytes4'},
+        {'name': 'amount', 'type': 'uint'},
+    ],
+}
+cases = [
+    [domain, agent, {'source': 'a', 'connectionId': bytes(range(32))}],
+    [domain, agent, {'source': 'b', 'connectionId': bytearray(b'\xff' * 32)}],
+    [dict(domain, chainId=42161, salt=b'\x01' * 32), transfer, {'destination': '0x5e9ee1089755c3435139848e47e6635505d5a13a', 'amount': '1.5', 'time': 1709144041776}],
+    [domain, everything, {'flag': True, 'owner': '0x5E9EE1089755C3435139848E47E6635505D5A13A', 'delta': -5, 'tag': b'\x01\x02', 'amount': 2 ** 255}],
+    [domain, everything, {'flag': False, 'owner': '0x5e9ee1089755c3435139848e47e6635505d5a13a', 'delta': 2 ** 127 - 1, 'tag': b'', 'amount': 0}],
+]
+for case in cases:
+    assert eip712.encode_structured_data(*case) is not None
+    assert eip712.encode_structured_data(*case) == vendored(*case)
+
+# left to the vendored encoder
+fallbacks = [
+    # values that need coercion
+    [domain, transfer, {'destination': 'x', 'amount': '1', 'time': '1709144041776'}],
+    [domain, agent, {'source': 'a', 'connectionId': '0x' + '01' * 32}],
+    # a checksummed address
+    [domain, everything, {'flag': True, 'owner': '0x5e9EE1089755c3435139848e47e6635505d5A13a', 'delta': 0, 'tag': b'', 'amount': 0}],
+    # nested and array types
+    [domain, {'Order': [{'name': 'ids', 'type': 'uint64[]'}]}, {'ids': [1, 2]}],
+    [domain, {'Order': [{'name': 'asset', 'type': 'Asset'}], 'Asset': [{'name': 'id', 'type': 'uint32'}]}, {'asset': {'id': 1}}],
+]
+for case in fallbacks:
+    assert eip712.encode_structured_data(*case) is None
+# unknown domain keys and out of range values are rejected by the vendored encoder
+for case in [[dict(domain, unknown=1), agent, cases[0][2]], [domain, everything, dict(cases[3][2], delta=2 ** 127)]]:
+    assert eip712.encode_structured_data(*case) is None
+    try:
+        vendored(*case)
+        assert False
+    except Exception:
+        pass
+
+print('eip712 tests passed')
@@ -0,0 +1,212 @@
+import os
+import sys
+import json
+import bisect
+import shutil
+import asyncio
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base import history_store  # noqa: E402
+from ccxt.base.history_store import HistoryStore  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+minute = 60000
+start = 1700000000000 - 1700000000000 % minute
+now = start + 1000 * minute + 30000
+candles = [[start + i * minute, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, None if i % 10 == 0 else float(i)] for i in range(1001)]
+# 3 trades in the same millisecond every second
+trades = [{'id': 't' + str(i), 'timestamp': start + (i // 3) * 1000, 'side': 'buy' if i % 2 else 'sell', 'price': 1.5, 'amount': float(i), 'cost': 1.5 * i} for i in range(3000)]
+timestamps = {
+    id(candles): [candle[0] for candle in candles],
+    id(trades): [trade['timestamp'] for trade in trades],
+}
+folder = tempfile.mkdtemp()
+
+
+def respond(exchange, rows, since, limit):
+    exchange.calls.append(since)
+    index = bisect.bisect_left(timestamps[id(rows)], since or 0)
+    return [row.copy() for row in rows[index:index + (limit or 500)]]
+
+
+class Exchange(ccxt.Exchange):
+    id = 'history'
+
+    def milliseconds(self):
+        return now
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        return respond(self, candles, since, limit)
+
+    def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        return respond(self, trades, since, limit)
+
+
+class AsyncExchange(ccxt.async_support.Exchange):
+    id = 'history'
+
+    def milliseconds(self):
+        return now
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        await asyncio.sleep(0)
+        return respond(self, candles, since, limit)
+
+
+def create(cls=Exchange):
+    exchange = cls({'options': {'historyStore': {'path': folder}}})
+    exchange.calls = []
+    return exchange
+
+
+# the columns of a series
+store = HistoryStore({'path': folder})
+series = store.ohlcv('series', 'BTC/USDT', '1m')
+assert store.ohlcv('series', 'BTC/USDT', '1m') is series
+assert len(series) == 0 and series.rows() == [] and len(series.columns()['close']) == 0
+series.append(candles[100:200])
+series.append(candles[150:300])
+assert series.meta['generation'] == 0
+assert series.rows() == candles[100:300]
+series.append(candles[0:120] + candles[500:501])
+assert series.meta['generation'] == 1
+assert series.rows() == candles[0:300] + candles[500:501]
+assert series.rows(start + 10 * minute, start + 12 * minute) == candles[10:12]
+columns = series.columns(start + 10 * minute, start + 20 * minute)
+assert list(columns['timestamp']) == [candle[0] for candle in candles[10:20]]
+assert list(columns['close']) == [candle[4] for candle in candles[10:20]]
+# the columns are views of the mapped files, with numpy or without it
+assert history_store.numpy is None or isinstance(columns['close'], history_store.numpy.ndarray)
+assert history_store.numpy is not None or isinstance(columns['close'], memoryview)
+numpy = history_store.numpy
+history_store.numpy = None
+assert series.columns(start + 10 * minute, start + 20 * minute)['close'].tolist() == [candle[4] for candle in candles[10:20]]
+history_store.numpy = numpy
+# they stay valid after the files of the next generation replace them
+series.append(candles[400:401])
+assert series.meta['generation'] == 2 and list(columns['timestamp'])[0] == start + 10 * minute
+assert sorted(os.listdir(series.folder)) == sorted([name + '.2.bin' for name in ['timestamp', 'open', 'high', 'low', 'close', 'volume']] + ['meta.json'])
+# the fetched ranges
+series.cover(0, 100)
+series.cover(200, 300)
+series.cover(100, 150)
+assert series.meta['covered'] == [[0, 150], [200, 300]]
+assert series.missing(50, 400) == [[150, 200], [300, 400]]
+assert series.missing(0, 150) == []
+# the rows after an interrupted write are ignored, and overwritten by the next append
+with open(series.filename('timestamp'), 'ab') as file:
+    file.write(b'\x00' * 12)
+reopened = HistoryStore({'path': folder}).ohlcv('series', 'BTC/USDT', '1m')
+assert reopened.rows() == series.rows() and reopened.meta['covered'] == [[0, 150], [200, 300]]
+reopened.append(candles[600:602])
+assert reopened.rows()[-2:] == candles[600:602]
+assert os.path.getsize(reopened.filename('timestamp')) == len(reopened) * 8
+
+# the trades, the ones with the same id are stored once
+trades_series = store.trades('series', 'BTC/USDT')
+trades_series.append(trades[0:10])
+trades_series.append(trades[8:20] + trades[5:7])
+assert trades_series.rows() == trades[0:20]
+assert trades_series.columns(start + 1000, start + 2000)['id'] == ['t3', 't4', 't5']
+# the trades without an id are keyed by their values, the ones of the same millisecond are kept
+anonymous = [{'id': None, 'timestamp': start + 10 ** 8, 'side': side, 'price': price, 'amount': 1.0, 'cost': price} for side, price in [('buy', 1.0), ('buy', 2.0), ('sell', 2.0)]]
+anonymous_series = store.trades('series', 'ETH/USDT')
+anonymous_series.append(anonymous)
+anonymous_series.append(anonymous[1:] + [dict(anonymous[0], price=None, cost=None)])
+anonymous_series.append([dict(anonymous[0], price=None, cost=None)])
+assert len(anonymous_series) == 4
+assert sorted(trade['price'] or 0 for trade in anonymous_series.rows()) == [0, 1.0, 2.0, 2.0]
+try:
+    trades_series.append([{'id': 'a\nb', 'timestamp': start + 10 ** 9}])
+    assert False
+except ValueError:
+    pass
+
+# fetch_ohlcv() fetches the missing ranges only
+exchange = create()
+assert exchange.fetch_ohlcv('BTC/USDT', '1m', start, 100) == candles[0:100]
+assert exchange.calls == [start]
+del exchange.calls[:]
+assert exchange.fetchOHLCV('BTC/USDT', '1m', start + 10 * minute, 50) == candles[10:60]
+assert exchange.calls == []
+assert exchange.fetch_ohlcv('BTC/USDT', '1m', start + 50 * minute, 100) == candles[50:150]
+assert exchange.calls == [start + 100 * minute]
+# another instance reads the same files
+exchange = create()
+assert exchange.fetch_ohlcv('BTC/USDT', '1m', start + 1, None, {'until': start + 150 * minute}) == candles[1:151]
+assert exchange.calls == [start + 150 * minute]
+# the last candle is not closed, it is fetched every time
+del exchange.calls[:]
+assert exchange.fetch_ohlcv('BTC/USDT', '1m', start + 990 * minute, 20) == candles[990:1001]
+assert exchange.fetch_ohlcv('BTC/USDT', '1m', start + 990 * minute, 20) == candles[990:1001]
+assert exchange.calls == [start + 990 * minute, now - minute, now - minute]
+# without a since or with other params the store is not used
+del exchange.calls[:]
+exchange.fetch_ohlcv('BTC/USDT', '1m', start, 10, {'price': 'mark'})
+exchange.fetch_ohlcv('BTC/USDT', '1m')
+exchange.fetch_ohlcv('BTC/USDT', '1M', start, 10)
+assert exchange.calls == [start, None, start]
+
+# fetch_trades() needs an until, the pages can end in the middle of a millisecond
+exchange.calls = []
+exchange.fetch_trades('BTC/USDT', start, 10)
+assert exchange.calls == [start]
+result = exchange.fetch_trades('BTC/USDT', start, None, {'until': start + 399999})
+assert [trade['id'] for trade in result] == [trade['id'] for trade in trades[0:1200]]
+assert result[0]['symbol'] == 'BTC/USDT' and result[0]['datetime'] == exchange.iso8601(start) and result[0]['fees'] == []
+exchange.calls = []
+assert [trade['id'] for trade in exchange.fetch_trades('BTC/USDT', start + 1000, 4, {'until': start + 99999})] == ['t3', 't4', 't5', 't6']
+assert exchange.calls == []
+with open(os.path.join(folder, 'history', 'BTC_USDT', 'trades', 'meta.json')) as file:
+    assert json.load(file)['covered'] == [[start, start + 399001]]
+# the trades of the last minute are not stored
+exchange.calls = []
+exchange.fetch_trades('BTC/USDT', now - 100000, None, {'until': now})
+exchange.fetch_trades('BTC/USDT', now - 100000, None, {'until': now})
+assert exchange.calls.count(now - 60000) == 2
+
+
+# the empty pages and the pages out of the range cover nothing, they are fetched again
+class EmptyExchange(Exchange):
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        self.calls.append(since)
+        return self.pages.pop(0) if self.pages else []
+
+
+exchange = create(EmptyExchange)
+exchange.pages = [[], candles[900:910]]
+assert exchange.fetch_ohlcv('EMPTY/USDT', '1m', start, 10) == []
+assert exchange.fetch_ohlcv('EMPTY/USDT', '1m', start, 10) == []
+assert exchange.calls == [start, start]
+assert exchange.history_series('EMPTY/USDT', '1m').meta['covered'] == []
+# a page ending early covers the range up to its last candle only
+exchange.calls = []
+exchange.pages = [candles[0:4]]
+assert exchange.fetch_ohlcv('EMPTY/USDT', '1m', start, 10) == candles[0:4]
+assert exchange.history_series('EMPTY/USDT', '1m').meta['covered'] == [[start, start + 4 * minute]]
+assert exchange.fetch_ohlcv('EMPTY/USDT', '1m', start, 10) == candles[0:4]
+assert exchange.calls == [start, start + 4 * minute, start + 4 * minute]
+
+# the default folder belongs to the user
+assert HistoryStore({}).folder.startswith(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~'))
+
+
+async def test_async():
+    exchange = create(AsyncExchange)
+    assert await exchange.fetch_ohlcv('ETH/USDT', '1m', start, 100) == candles[0:100]
+    assert await exchange.fetch_ohlcv('ETH/USDT', '1m', start, 120) == candles[0:120]
+    assert exchange.calls == [start, start + 100 * minute]
+    await exchange.close()
+
+asyncio.run(test_async())
+shutil.rmtree(folder)
+
+print('history store tests passed')
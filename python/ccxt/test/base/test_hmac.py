@@ -0,0 +1,60 @@
+import os
+import sys
+import hmac
+import random
+import hashlib
+import urllib.parse
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.base import signing  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# the pre-keyed hmac signs like a fresh one, for every secret and algorithm, and does not keep the messages
+secrets = [b'', b'secretsecret', b'\x00\xff' * 100, bytearray(b'bytearray secret')]
+algorithms = [hashlib.sha256, hashlib.sha384, hashlib.sha512, hashlib.md5, 'sha1', 'sha256']
+requests = [b'', b'symbol=BTCUSDT&side=BUY&timestamp=1700000000000', bytes(range(256)) * 3]
+for secret in secrets:
+    for algorithm in algorithms:
+        for request in requests:
+            expected = hmac.new(secret, request, algorithm).digest()
+            assert Exchange.hmac(request, secret, algorithm, 'binary') == expected
+            assert Exchange.hmac(request, secret, algorithm) == expected.hex()
+            assert Exchange.hmac(request, secret, algorithm, 'base64') == Exchange.binary_to_base64(expected)
+assert Exchange.hmac(b'a', b'secret') == Exchange.hmac(b'a', b'secret')
+assert len(signing.hmac_keys) <= signing.cache_size
+for i in range(signing.cache_size * 2):
+    secret = str(i).encode()
+    assert Exchange.hmac(b'request', secret, hashlib.sha512, 'binary') == hmac.new(secret, b'request', hashlib.sha512).digest()
+assert len(signing.hmac_keys) <= signing.cache_size
+assert Exchange.binary_to_base16(b'\x00\xab\xff') == '00abff'
+assert Exchange.binary_to_base16(bytearray(b'\x01')) == '01'
+
+
+# the urlencoded requests are the ones of urllib.parse
+def expected_urlencode(params, doseq=False):
+    params = dict((key, ('true' if value else 'false') if isinstance(value, bool) else value) for key, value in params.items())
+    return urllib.parse.urlencode(params, doseq, quote_via=urllib.parse.quote)
+
+
+values = [
+    'BTCUSDT', 'BTC/USDT', 'BTC-USDT_PERP.1~', 'a b', 'a+b&c=d', '1e-8', 'тест', '€', '', '%', '\x00',
+    0, 1, -1, 10 ** 30, 0.1, 1e-08, 1.5e+20, float('inf'), True, False, None,
+    b'bytes', bytearray(b'x'), {'a': 1}, ['BTC', 'ETH'], ('a b', 2), [], [True], [None], [['x']], [1.5, '/'],
+]
+keys = ['symbol', 'a b', 'key[]', 'ключ', '', 1, b'k']
+random.seed(7)
+for i in range(3000):
+    params = dict((random.choice(keys), random.choice(values)) for j in range(random.randint(0, 5)))
+    for doseq in [False, True]:
+        assert Exchange.urlencode(params, doseq) == expected_urlencode(params, doseq), (params, doseq)
+assert Exchange.urlencode({'symbol': 'BTCUSDT', 'reduceOnly': True, 'price': 0.1}) == 'symbol=BTCUSDT&reduceOnly=true&price=0.1'
+assert Exchange.urlencode_with_array_repeat({'symbols': ['BTC', 'ETH']}) == 'symbols=BTC&symbols=ETH'
+assert Exchange.rawencode({'symbol': 'BTC/USDT', 'type': 'limit'}) == 'symbol=BTC/USDT&type=limit'
+
+print('hmac tests passed')
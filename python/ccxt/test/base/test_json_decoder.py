@@ -0,0 +1,45 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import json_decoder  # noqa: E402
+from ccxt.base.errors import NotSupported  # noqa: E402
+
+payload = '{"price":"0.1","amount":0.30000000000000004,"id":123456789012345678901234567890,"list":[1,2.5,null,true]}'
+expected = {'price': '0.1', 'amount': 0.30000000000000004, 'id': 123456789012345678901234567890, 'list': [1, 2.5, None, True]}
+
+for name in json_decoder.decoders:
+    loads = json_decoder.json_decoder(name)
+    assert loads(payload) == expected or name == 'orjson', name
+    assert loads(payload.encode()) == expected or name == 'orjson', name
+    assert loads(payload.replace('123456789012345678901234567890', '1234567890123456789')) == dict(expected, id=1234567890123456789), name
+    assert loads('[NaN]')[0] != loads('[NaN]')[0], name
+
+quoted = json_decoder.json_decoder('orjson', True)
+assert quoted(payload.encode()) == {'price': '0.1', 'amount': '0.30000000000000004', 'id': '123456789012345678901234567890', 'list': ['1', '2.5', None, True]}
+
+fastest = [name for name in json_decoder.preference if name in json_decoder.decoders][0]
+assert json_decoder.json_decoder('auto') is json_decoder.decoders[fastest]
+# the accelerated decoders are opt-in, integers over 64 bits stay integers by default
+assert json_decoder.json_decoder(None) is json_decoder.decoders['json']
+assert json_decoder.json_decoder(None)(payload) == expected
+
+try:
+    json_decoder.json_decoder('simdjson')
+    assert False
+except NotSupported:
+    pass
+
+exchange = ccxt.Exchange({'jsonDecoder': 'json'})
+assert exchange.on_json_response('{"a":1}') == {'a': '1'}
+exchange.quoteJsonNumbers = False
+assert exchange.on_json_response('{"a":1}') == {'a': 1}
+exchange.jsonDecoder = lambda data: 'custom'
+assert exchange.on_json_response('{"a":1}') == 'custom'
+
+print('json decoder tests passed')
@@ -0,0 +1,41 @@
+import os
+import sys
+import subprocess
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# ----------------------------------------------------------------------------
+# every check runs in a fresh interpreter, so that no exchange module is imported yet
+
+checks = [
+    # the package import does not load the exchange modules
+    'import ccxt, ccxt.pro, sys\n'
+    'assert not [id for id in ccxt.exchanges if "ccxt." + id in sys.modules]\n'
+    'assert not [id for id in ccxt.pro.exchanges if "ccxt.async_support." + id in sys.modules]',
+    # first access loads only that exchange and its parents
+    'import ccxt, sys\n'
+    'assert ccxt.binanceusdm().id == "binanceusdm"\n'
+    'assert "ccxt.binance" in sys.modules and "ccxt.kraken" not in sys.modules\n'
+    'assert isinstance(ccxt.binance, type) and ccxt.binance.__module__ == "ccxt.binance"',
+    # submodule imports keep resolving to the class
+    'import ccxt.kraken, ccxt.async_support.kraken, ccxt.pro\n'
+    'from ccxt import bybit\n'
+    'assert isinstance(ccxt.kraken, type) and isinstance(ccxt.async_support.kraken, type)\n'
+    'assert issubclass(ccxt.pro.kraken, ccxt.async_support.kraken) and bybit is ccxt.bybit',
+    'import ccxt\n'
+    'assert "okx" in dir(ccxt)\n'
+    'try:\n'
+    '    ccxt.notanexchange\n'
+    '    assert False\n'
+    'except AttributeError:\n'
+    '    pass',
+    'from ccxt import *\n'
+    'assert all(isinstance(globals()[id], type) for id in exchanges)',
+    'from ccxt.pro import *\n'
+    'assert all(isinstance(globals()[id], type) for id in exchanges)',
+]
+
+for check in checks:
+    subprocess.check_call([sys.executable, '-c', check], cwd=root, env=dict(os.environ, PYTHONPATH=root))
+
+print('lazy exchanges tests passed')
@@ -0,0 +1,94 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.errors import ArgumentsRequired  # noqa: E402
+
+exchange = ccxt.Exchange({'id': 'mock'})
+markets = exchange.set_markets([
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT:USDT', 'base': 'BTC', 'quote': 'USDT', 'settle': 'USDT', 'type': 'swap', 'spot': False, 'swap': True, 'contract': True, 'linear': True, 'inverse': False, 'active': True},
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'type': 'spot', 'spot': True, 'swap': False, 'contract': False, 'active': True},
+    {'id': 'BTCUSD', 'symbol': 'BTC/USD:BTC', 'base': 'BTC', 'quote': 'USD', 'settle': 'BTC', 'type': 'swap', 'spot': False, 'swap': True, 'contract': True, 'linear': False, 'inverse': True, 'active': None},
+    {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'type': 'spot', 'spot': True, 'swap': False, 'contract': False, 'active': False},
+])
+
+assert markets is exchange.markets
+assert exchange.codes == ['BTC', 'ETH', 'USD', 'USDT']
+
+index = exchange.market_index
+assert index.by_symbol is exchange.markets and index.current(exchange.markets)
+assert [market['symbol'] for market in exchange.markets_by_id['BTCUSDT']] == ['BTC/USDT', 'BTC/USDT:USDT']
+
+# safe_market
+assert exchange.safe_market('BTCUSD')['symbol'] == 'BTC/USD:BTC'
+assert exchange.safe_market('BTCUSDT', None, None, 'spot')['symbol'] == 'BTC/USDT'
+assert exchange.safe_market('BTCUSDT', exchange.markets['BTC/USD:BTC'])['symbol'] == 'BTC/USDT:USDT'
+assert exchange.safe_market('BTCUSDT', None, None, 'option')['symbol'] == 'BTCUSDT'
+try:
+    exchange.safe_market('BTCUSDT')
+    assert False
+except ArgumentsRequired:
+    pass
+assert exchange.safe_symbol('LTC-USDT', None, '-') == 'LTC/USDT'
+assert exchange.safe_symbol('LTCUSDT') == 'LTCUSDT'
+assert exchange.safe_symbol(None, exchange.markets['ETH/USDT']) == 'ETH/USDT'
+
+# get_symbols_for_market_type
+assert exchange.get_symbols_for_market_type('swap') == ['BTC/USDT:USDT', 'BTC/USD:BTC']
+assert exchange.get_symbols_for_market_type('swap', 'inverse', True, False) == []
+assert exchange.get_symbols_for_market_type('spot', None, False, False) == ['BTC/USDT', 'ETH/USDT']
+symbols = exchange.get_symbols_for_market_type()
+symbols.append('XRP/USDT')
+assert exchange.get_symbols_for_market_type() == ['BTC/USDT', 'BTC/USDT:USDT', 'BTC/USD:BTC']
+
+# the index follows markets changed in place without set_markets()
+exchange.markets['BTC/USDT'] = exchange.extend(exchange.markets['BTC/USDT'], {'active': False})
+assert exchange.get_symbols_for_market_type('spot') == []
+exchange.markets['LTC/USDT'] = exchange.extend(exchange.markets['ETH/USDT'], {'id': 'LTCUSDT', 'symbol': 'LTC/USDT', 'active': True})
+assert exchange.get_symbols_for_market_type('spot') == ['LTC/USDT']
+del exchange.markets['LTC/USDT']
+assert exchange.get_symbols_for_market_type('spot') == []
+
+# and markets replaced without set_markets()
+exchange.markets = {'XRP/USDT': {'id': 'XRPUSDT', 'symbol': 'XRP/USDT', 'type': 'spot', 'subType': None, 'active': True}}
+assert exchange.get_symbols_for_market_type('spot') == ['XRP/USDT']
+
+
+# load_markets() returns the markets, sync and async
+class Markets(object):
+    def fetch_markets(self, params={}):
+        return [{'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'type': 'spot', 'spot': True, 'active': True}]
+
+
+class Exchange(Markets, ccxt.Exchange):
+    pass
+
+
+exchange = Exchange({'id': 'mock'})
+assert exchange.load_markets() is exchange.markets and list(exchange.markets) == ['BTC/USDT']
+assert exchange.codes == ['BTC', 'USDT']
+
+
+class AsyncExchange(ccxt.async_support.Exchange):
+    async def fetch_markets(self, params={}):
+        return Markets().fetch_markets(params)
+
+
+async def load():
+    exchange = AsyncExchange({'id': 'mock'})
+    markets = await exchange.load_markets()
+    await exchange.close()
+    return exchange, markets
+
+
+exchange, markets = asyncio.run(load())
+assert markets is exchange.markets and exchange.codes == ['BTC', 'USDT']
+
+print('market index tests passed')
@@ -0,0 +1,129 @@
+import os
+import sys
+import json
+import shutil
+import asyncio
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# load_markets() with options['marketsCache'] against the static markets, offline
+
+fixture = os.path.join(os.path.dirname(root), 'ts', 'src', 'test', 'static', 'markets', 'binance.json')
+with open(fixture, encoding='utf8') as file:
+    static_markets = json.load(file)
+
+folder = tempfile.mkdtemp()
+fetches = []
+
+
+class binance(ccxt.binance):
+    def fetch_markets(self, params={}):
+        fetches.append('markets')
+        return list(static_markets.values())
+
+    def fetch_currencies(self, params={}):
+        fetches.append('currencies')
+        return {}
+
+
+class async_binance(ccxt.async_support.binance):
+    async def fetch_markets(self, params={}):
+        fetches.append('markets')
+        await asyncio.sleep(0.01)
+        return list(static_markets.values())
+
+    async def fetch_currencies(self, params={}):
+        fetches.append('currencies')
+        return {}
+
+
+def create(exchange_class, ttl=3600000, **config):
+    return exchange_class({'options': {'marketsCache': dict({'path': folder, 'ttl': ttl}, **config)}})
+
+
+# a cold cache fetches and writes the cache
+exchange = create(binance)
+exchange.load_markets()
+assert fetches == ['currencies', 'markets']
+assert os.path.exists(exchange.markets_cache().filename)
+expected = exchange.markets
+
+# a fresh cache skips the network and set_markets
+del fetches[:]
+exchange = create(binance)
+exchange.load_markets()
+assert fetches == []
+assert exchange.markets == expected
+assert exchange.symbols == sorted(expected.keys())
+assert exchange.codes == sorted(exchange.currencies.keys())
+assert exchange.safe_market('BTCUSDT', None, None, 'spot')['symbol'] == 'BTC/USDT'
+assert exchange.market('ETH/USDT:USDT')['id'] == 'ETHUSDT'
+
+# reload bypasses the cache
+exchange.load_markets(True)
+assert fetches == ['currencies', 'markets']
+
+# the sandbox has its own entry
+del fetches[:]
+sandbox = create(binance)
+sandbox.set_sandbox_mode(True)
+assert sandbox.markets_cache().filename != exchange.markets_cache().filename
+sandbox.load_markets()
+assert fetches == ['currencies', 'markets']
+# including the exchanges that switch to their sandbox without the sandbox urls
+bitget = ccxt.bitget({'options': {'marketsCache': {'path': folder}}})
+live = bitget.markets_cache().filename
+bitget.set_sandbox_mode(True)
+assert bitget.markets_cache().filename != live
+
+# the default folder belongs to the user
+assert ccxt.binance({'options': {'marketsCache': {}}}).markets_cache().folder.startswith(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~'))
+
+# the pickles are not read from or written to a folder writable by the others
+shared = tempfile.mkdtemp()
+filename = os.path.join(shared, os.path.basename(exchange.markets_cache().filename))
+shutil.copy(exchange.markets_cache().filename, filename)
+os.chmod(shared, 0o777)
+modified = os.path.getmtime(filename)
+del fetches[:]
+shared_exchange = binance({'options': {'marketsCache': {'path': shared}}})
+shared_exchange.load_markets()
+assert fetches == ['currencies', 'markets']
+assert os.path.getmtime(filename) == modified
+shutil.rmtree(shared)
+
+# an unreadable cache is a cache miss
+with open(exchange.markets_cache().filename, 'wb') as file:
+    file.write(b'garbage')
+del fetches[:]
+create(binance).load_markets()
+assert fetches == ['currencies', 'markets']
+
+
+async def test_async():
+    del fetches[:]
+    exchange = create(async_binance)
+    await exchange.load_markets()
+    assert fetches == []
+    assert exchange.markets == expected
+    await exchange.close()
+    # stale: served at once, refreshed by a task
+    stale = create(async_binance, ttl=0)
+    assert await stale.load_markets() == expected
+    assert fetches == ['currencies', 'markets']
+    await stale.markets_refreshing
+    assert stale.markets == expected
+    await stale.close()
+
+asyncio.run(test_async())
+shutil.rmtree(folder)
+
+print('markets cache tests passed')
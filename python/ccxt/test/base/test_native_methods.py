@@ -0,0 +1,132 @@
+import os
+import sys
+import json
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.errors import ArgumentsRequired  # noqa: E402
+from ccxt.async_support.base.ws.order_book import OrderBook, SortedOrderBook  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# the methods implemented by hand in python answer like their transpiled_* versions
+# that build/transpile.js emits from ts/src/base/Exchange.ts
+
+folder = os.path.join(os.path.dirname(root), 'ts', 'src', 'test', 'static', 'markets')
+
+
+def attempt(method, *args):
+    try:
+        return method(*args)
+    except ArgumentsRequired as e:
+        return type(e)
+
+
+names = sorted(name for name in os.listdir(folder) if name.endswith('.json')) if os.path.isdir(folder) else []
+for name in names:
+    with open(os.path.join(folder, name)) as file:
+        fixture = json.load(file)
+    native = ccxt.Exchange({'id': name[:-5]})
+    transpiled = ccxt.Exchange({'id': name[:-5]})
+    for currencies in [None, {'BTC': {'id': 'btc', 'code': 'BTC', 'precision': 0.1}}]:
+        native.set_markets(list(fixture.values()), currencies)
+        transpiled.transpiled_set_markets(list(fixture.values()), currencies)
+        for attribute in ['markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'codes', 'baseCurrencies', 'quoteCurrencies']:
+            assert getattr(native, attribute) == getattr(transpiled, attribute), name + ' ' + attribute
+    for market_type in [None, 'spot', 'swap', 'future', 'option']:
+        for sub_type in [None, 'linear', 'inverse']:
+            for active in [True, False]:
+                for unknown in [True, False]:
+                    args = (market_type, sub_type, active, unknown)
+                    assert native.get_symbols_for_market_type(*args) == transpiled.transpiled_get_symbols_for_market_type(*args), name + ' ' + str(args)
+    markets = list(native.markets.values())
+    for market_id in list(native.markets_by_id) + ['UNKNOWN', 'A-B', 'A-B-C', None]:
+        for market in [None] + markets[:1]:
+            for delimiter in [None, '', '-']:
+                for market_type in [None, 'spot', 'swap']:
+                    args = (market_id, market, delimiter, market_type)
+                    assert attempt(native.safe_market, *args) == attempt(transpiled.transpiled_safe_market, *args), name + ' ' + str(args)
+assert len(names) > 0 or not os.path.isdir(folder)
+
+
+class Requests(object):
+    enableRateLimit = True
+
+    def throttle(self, cost=None, buckets=None):
+        self.costs.append(cost)
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': 'https://example.com/' + path + '?' + self.urlencode(params), 'method': method, 'headers': {'api': api}, 'body': body}
+
+    def fetch(self, url, method='GET', headers=None, body=None):
+        return [url, method, headers, body]
+
+
+class Exchange(Requests, ccxt.Exchange):
+    pass
+
+
+class AsyncExchange(Requests, ccxt.async_support.Exchange):
+    async def throttle(self, cost=None, buckets=None):
+        self.costs.append(cost)
+
+    async def fetch(self, url, method='GET', headers=None, body=None):
+        return [url, method, headers, body]
+
+
+requests = [('ticker', 'public', 'GET', {'symbol': 'BTCUSDT'}, None, None, {}), ('order', 'private', 'POST', {}, None, '{}', {'cost': 5})]
+for request in requests:
+    results = []
+    for method in ['fetch2', 'transpiled_fetch2']:
+        exchange = Exchange({'id': 'mock'})
+        exchange.costs = []
+        results.append([getattr(exchange, method)(*request), exchange.costs, exchange.last_request_url, exchange.last_request_headers, exchange.last_request_body])
+    assert results[0] == results[1]
+
+
+async def fetch(method, request):
+    exchange = AsyncExchange({'id': 'mock'})
+    exchange.costs = []
+    result = await getattr(exchange, method)(*request)
+    await exchange.close()
+    return [result, exchange.costs, exchange.last_request_url, exchange.last_request_headers, exchange.last_request_body]
+
+
+for request in requests:
+    assert asyncio.run(fetch('fetch2', request)) == asyncio.run(fetch('transpiled_fetch2', request))
+
+
+def okx_piece(level, strings, ask):
+    return strings[0] + ':' + strings[1]
+
+
+def kraken_piece(level, strings, ask):
+    return strings[0].replace('.', '').lstrip('0') + strings[1].replace('.', '').lstrip('0')
+
+
+def bitfinex_piece(level, strings, ask):
+    return str(level[0]) + ':' + str(-level[1] if ask else level[1])
+
+
+exchange = ccxt.async_support.Exchange({'id': 'mock'})
+for cls in [OrderBook, SortedOrderBook]:
+    for args in [(25, okx_piece, True, ':', True), (10, kraken_piece, False, '', False)]:
+        # the native checksum follows the changes of the same order book
+        orderbook = cls({}, 40)
+        for step in range(300):
+            side = 'bids' if step % 2 else 'asks'
+            price = '%.2f' % (100 + (1 if side == 'asks' else -1) * (step * 7 % 53 + 1) / 10)
+            size = '0.00000000' if step % 5 == 0 else '%.8f' % ((step * 13 % 97 + 1) / 1000)
+            orderbook[side].storeWithStrings(float(price), float(size), price, size)
+            orderbook.limit()
+            assert exchange.order_book_checksum(orderbook, *args) == exchange.transpiled_order_book_checksum(orderbook, *args)
+orderbook = OrderBook({'bids': [[1.5, 2.0]], 'asks': [[1.75, 3.0]]})
+assert exchange.order_book_checksum(orderbook, 25, bitfinex_piece) == exchange.transpiled_order_book_checksum(orderbook, 25, bitfinex_piece)
+asyncio.run(exchange.close())
+
+print('native methods tests passed')
@@ -0,0 +1,129 @@
+import os
+import sys
+import random
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base import ohlcv_aggregator  # noqa: E402
+from ccxt.base.ohlcv_aggregator import OHLCVAggregator, aggregate_ohlcvc  # noqa: E402
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheByTimestamp  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+random.seed(5)
+exchange = ccxt.Exchange()
+timeframes = ['1m', '5m', '1h']
+durations = dict((timeframe, exchange.parse_timeframe(timeframe) * 1000) for timeframe in timeframes)
+timestamp = 1700000000000
+trades = []
+for i in range(5000):
+    timestamp += random.choice([0, 1, 250, 5000, 30000, 400000])
+    trades.append({'timestamp': timestamp, 'price': round(random.uniform(99, 101), 2), 'amount': random.randint(1, 100) / 8, 'symbol': 'BTC/USDT'})
+expected = dict((timeframe, exchange.build_ohlcvc(trades, timeframe)) for timeframe in timeframes)
+
+# the candles of the trades in chunks are the ones of build_ohlcvc()
+for create_cache in [list, lambda: ArrayCacheByTimestamp(10000)]:
+    aggregator = OHLCVAggregator(dict(durations), create_cache)
+    i = 0
+    while i < len(trades):
+        size = random.choice([1, 2, 10, 100])
+        changed = aggregator.update(trades[i:i + size])
+        assert changed['1m'][-1] is aggregator.candles['1m'][-1]
+        i += size
+    for timeframe in timeframes:
+        assert list(aggregator.candles[timeframe]) == expected[timeframe]
+# the trades without a price are skipped
+aggregator = OHLCVAggregator({'1m': 60000})
+aggregator.update([{'timestamp': 0, 'price': None, 'amount': 1}, {'timestamp': 60000, 'price': 2, 'amount': 3}])
+assert aggregator.candles['1m'] == [[60000, 2, 2, 2, 2, 3, 1]]
+
+# a late trade updates its candle, but not the close, unless the candle is too old
+aggregator = OHLCVAggregator({'1m': 60000}, lambda: ArrayCacheByTimestamp(3), 3)
+cache = aggregator.candles['1m']
+aggregator.update([{'timestamp': i * 60000, 'price': 10 + i, 'amount': 1} for i in range(5)])
+assert cache.getLimit('BTC/USDT', None) == 5
+changed = aggregator.update([{'timestamp': 3 * 60000 + 1, 'price': 1, 'amount': 2}, {'timestamp': 1, 'price': 1, 'amount': 1}])
+assert changed['1m'] == [[3 * 60000, 13, 13, 1, 13, 3, 2]]
+assert list(cache) == [[2 * 60000, 12, 12, 12, 12, 1, 1], [3 * 60000, 13, 13, 1, 13, 3, 2], [4 * 60000, 14, 14, 14, 14, 1, 1]]
+assert cache.getLimit('BTC/USDT', None) == 1
+
+# a late trade of an interval without a candle creates it before the later candles, like build_ohlcvc()
+for create_cache in [list, lambda: ArrayCacheByTimestamp(3)]:
+    aggregator = OHLCVAggregator({'1m': 60000}, create_cache, 3)
+    cache = aggregator.candles['1m']
+    aggregator.update([{'timestamp': i * 60000, 'price': 10 + i, 'amount': 1} for i in [0, 2, 4]])
+    if create_cache is not list:
+        assert cache.getLimit('BTC/USDT', None) == 3
+    changed = aggregator.update([{'timestamp': 3 * 60000 + 5, 'price': 1, 'amount': 2}, {'timestamp': 3 * 60000, 'price': 2, 'amount': 1}])
+    assert changed['1m'] == [[3 * 60000, 1, 2, 1, 1, 3, 2]]
+    assert [candle[0] for candle in cache] == ([0, 2 * 60000, 3 * 60000, 4 * 60000] if create_cache is list else [2 * 60000, 3 * 60000, 4 * 60000])
+    assert list(aggregator.recent['1m']) == [2 * 60000, 3 * 60000, 4 * 60000]
+    if create_cache is not list:
+        assert cache.getLimit('BTC/USDT', None) == 1
+    # older than the kept candles
+    assert aggregator.update([{'timestamp': 60000, 'price': 1, 'amount': 1}])['1m'] == []
+    if create_cache is not list:
+        assert sorted(cache.hashmap) == [2 * 60000, 3 * 60000, 4 * 60000]
+# the shuffled trades give the candles of build_ohlcvc(), but for the opens and the closes
+shuffled = trades[:]
+for i in range(0, len(shuffled) - 3, 3):
+    shuffled[i:i + 3] = random.sample(shuffled[i:i + 3], 3)
+for create_cache in [list, lambda: ArrayCacheByTimestamp(10000)]:
+    aggregator = OHLCVAggregator(dict(durations), create_cache, 10000)
+    for i in range(0, len(shuffled), 7):
+        aggregator.update(shuffled[i:i + 7])
+    for timeframe in timeframes:
+        assert [candle[:1] + candle[2:4] + candle[5:] for candle in aggregator.candles[timeframe]] == [candle[:1] + candle[2:4] + candle[5:] for candle in expected[timeframe]]
+
+# the batch path, with numpy if it is installed and without it
+columns = [[trade['timestamp'] for trade in trades], [trade['price'] for trade in trades], [trade['amount'] for trade in trades]]
+numpy = ohlcv_aggregator.numpy
+for module in [numpy, None]:
+    ohlcv_aggregator.numpy = module
+    for timeframe in timeframes:
+        assert aggregate_ohlcvc(*columns, durations[timeframe]) == expected[timeframe]
+        assert exchange.aggregate_ohlcvc(*columns, timeframe) == expected[timeframe]
+    assert aggregate_ohlcvc([], [], [], 60000) == []
+ohlcv_aggregator.numpy = numpy
+
+
+# watch_ohlcv_from_trades() of the trades of watch_trades()
+class Exchange(ccxt.async_support.Exchange):
+    id = 'candles'
+    queue = None
+
+    async def watch_trades(self, symbol, since=None, limit=None, params={}):
+        batch = await self.queue.get()
+        cache = self.trades.setdefault(symbol, ArrayCache(1000))
+        for trade in batch:
+            cache.append(trade)
+        limit = cache.getLimit(symbol, limit)
+        return self.filter_by_since_limit(cache, since, limit, 'timestamp', True)
+
+
+async def test_watch():
+    exchange = Exchange()
+    exchange.queue = asyncio.Queue()
+    for i in range(0, len(trades), 250):
+        exchange.queue.put_nowait(trades[i:i + 250])
+    candles = {}
+    for i in range(0, len(trades), 250):
+        result = await exchange.watch_ohlcv_from_trades('BTC/USDT', ['1m', '1h'])
+        for timeframe in result:
+            # only the new or changed candles
+            assert len(result[timeframe]) <= len(set(trade['timestamp'] // durations[timeframe] for trade in trades[i:i + 250]))
+            for candle in result[timeframe]:
+                candles.setdefault(timeframe, {})[candle[0]] = candle
+    assert sorted(candles['1m'].values()) == expected['1m']
+    assert sorted(candles['1h'].values()) == expected['1h']
+    await exchange.close()
+
+asyncio.run(test_watch())
+
+print('ohlcv aggregator tests passed')
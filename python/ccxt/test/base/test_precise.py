@@ -0,0 +1,101 @@
+import os
+import sys
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import precise  # noqa: E402
+from ccxt.base.precise import Precise  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# the strings are formatted like Precise.__str__ always did, without trailing zeros
+cases = {
+    ('0', 0): '0',
+    ('0', 5): '0',
+    ('1', 0): '1',
+    ('10', 0): '10',
+    ('10', 1): '1',
+    ('15', 1): '1.5',
+    ('15', 2): '0.15',
+    ('15', 3): '0.015',
+    ('-15', 3): '-0.015',
+    ('-1500', 2): '-15',
+    ('-1500', 4): '-0.15',
+    ('12', -2): '1200',
+    ('-12', -2): '-1200',
+    ('123456789', 18): '0.000000000123456789',
+}
+for (integer, decimals), expected in cases.items():
+    assert str(Precise(int(integer), decimals)) == expected
+    assert precise.to_string(int(integer), decimals) == expected
+
+assert precise.parse('1.50') == (150, 2)
+assert precise.parse('-1.5E-3') == (-15, 4)
+assert precise.parse('2e3') == (2, -3)
+assert precise.parse('7') == (7, 0)
+assert precise.reduce(1500, 2) == (15, 0)
+assert precise.reduce(0, 7) == (0, 0)
+assert precise.compare(1, 0, 10, 1) == 0
+assert precise.compare(-1, 0, 5, 1) == -1
+
+number = Precise('1.500')
+assert number.reduce() is number
+assert (number.integer, number.decimals) == (15, 1)
+for invalid in ['abc', '1e', '']:
+    try:
+        Precise(invalid)
+        assert False
+    except ValueError:
+        pass
+
+assert Precise.string_eq('1.0', '1') is True
+assert Precise.string_equals('-0', '0.000') is True
+assert Precise.string_gt('0.1', '0.09') is True
+assert Precise.string_le('1e-2', '0.01') is True
+assert Precise.string_min('1.50', '2') == '1.5'
+assert Precise.string_max('1.50', '1.5') == '1.5'
+assert Precise.string_div('1', '0') is None
+assert Precise.string_div('-1', '3', 4) == '-0.3333'
+assert Precise.string_mod('-7', '3') == '2'
+assert Precise.string_neg('-0.10') == '0.1'
+assert Precise.string_abs('-1e3') == '1000'
+assert Precise.string_add(None, '1.50') == '1.50'
+assert Precise.string_add('1.50', None) == '1.50'
+assert Precise.string_add(None, None) is None
+assert Precise.string_gt(None, '1') is None
+
+# string_sum() is the chained string_add()
+assert Precise.string_sum([]) is None
+assert Precise.string_sum([None, None]) is None
+assert Precise.string_sum([None, '1.50']) == '1.50'
+assert Precise.string_sum(['0.1', '0.2', None, '-0.3']) == '0'
+assert Precise.string_sum(['1.1', '2.20']) == '3.3'
+random.seed(3)
+for i in range(1000):
+    strings = [None if random.random() < 0.2 else str(random.randint(-10 ** 6, 10 ** 6) / 10 ** random.randint(0, 8)) for j in range(random.randint(0, 6))]
+    expected = None
+    for string in strings:
+        expected = Precise.string_add(expected, string)
+    assert Precise.string_sum(strings) == expected, strings
+
+# safe_order() sums the trades and reduce_fees_by_currency() the fees with string_sum()
+exchange = ccxt.Exchange({'id': 'mock'})
+trades = [
+    {'info': {}, 'id': '1', 'amount': '0.10', 'cost': '1.50', 'fee': {'currency': 'BTC', 'cost': '0.0010'}},
+    {'info': {}, 'id': '2', 'amount': '0.20', 'cost': '3', 'fee': {'currency': 'BTC', 'cost': '0.002', 'rate': '0.01'}},
+    {'info': {}, 'id': '3', 'amount': None, 'cost': None, 'fees': [{'currency': 'BTC', 'cost': '0.0030'}, {'currency': 'USDT', 'cost': '0.10'}]},
+]
+order = exchange.safe_order({'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'type': 'limit', 'amount': '1', 'price': '15', 'status': 'open', 'trades': trades})
+assert order['filled'] == 0.3 and order['cost'] == 4.5 and order['remaining'] == 0.7
+assert order['fees'] == [{'currency': 'BTC', 'cost': 0.004}, {'currency': 'BTC', 'cost': 0.002, 'rate': 0.01}, {'currency': 'USDT', 'cost': 0.1}]
+order = exchange.safe_order({'id': '2', 'symbol': 'BTC/USDT', 'side': 'buy', 'type': 'limit', 'amount': '1', 'filled': '0.5', 'status': 'open', 'trades': [{'info': {}, 'id': '4', 'amount': '0.10', 'cost': '1.50'}]})
+assert order['filled'] == 0.5 and order['cost'] == 1.5
+assert exchange.reduce_fees_by_currency([{'currency': 'BTC', 'cost': '0.10'}, {'currency': 'BTC', 'cost': '0'}]) == [{'currency': 'BTC', 'cost': '0.10'}]
+assert exchange.reduce_fees_by_currency([{'currency': 'BTC', 'cost': '0.10'}, {'currency': 'BTC', 'cost': '0.20'}]) == [{'currency': 'BTC', 'cost': '0.3'}]
+
+print('precise tests passed')
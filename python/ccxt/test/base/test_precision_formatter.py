@@ -0,0 +1,122 @@
+import os
+import sys
+import decimal
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import decimal_to_precision as module  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision, precision_formatter  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision_slowly  # noqa: E402
+from ccxt.base.decimal_to_precision import TRUNCATE, ROUND, DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE, NO_PADDING, PAD_WITH_ZERO  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# the formatters are compiled once per arguments, 10 and 10.0 are different tick sizes
+assert precision_formatter(ROUND, 0.1, TICK_SIZE) is precision_formatter(ROUND, 0.1, TICK_SIZE)
+assert precision_formatter(ROUND, 10, TICK_SIZE) is not precision_formatter(ROUND, 10.0, TICK_SIZE)
+assert decimal_to_precision('1234', ROUND, 10, TICK_SIZE) == '1230'
+assert decimal_to_precision('1234', ROUND, 10.0, TICK_SIZE) == '1230'
+assert len(module.formatters) <= module.cache_size
+for i in range(module.cache_size + 10):
+    assert decimal_to_precision(1.23456789, TRUNCATE, i % 20, DECIMAL_PLACES, PAD_WITH_ZERO if i > 20 else NO_PADDING) is not None
+assert len(module.formatters) <= module.cache_size
+
+# the invalid arguments are rejected like before
+for arguments in [(None, DECIMAL_PLACES), (0.1, DECIMAL_PLACES), ([1], TICK_SIZE)]:
+    try:
+        decimal_to_precision('1', ROUND, arguments[0], arguments[1])
+        assert False
+    except AssertionError:
+        pass
+try:
+    decimal_to_precision('1', ROUND, -1, TICK_SIZE)
+    assert False
+except ValueError:
+    pass
+
+# the decimal context of the thread is not changed, and does not change the results
+context = decimal.getcontext()
+rounding = context.rounding
+traps = dict(context.traps)
+assert decimal_to_precision('0.125', ROUND, 2, DECIMAL_PLACES) == '0.13'
+assert decimal_to_precision('-0.125', ROUND, 2, SIGNIFICANT_DIGITS) == '-0.13'
+assert decimal_to_precision('1250', ROUND, -2, DECIMAL_PLACES) == '1300'
+assert context.rounding == rounding and dict(context.traps) == traps
+with decimal.localcontext() as local:
+    local.rounding = decimal.ROUND_DOWN
+    assert decimal_to_precision('0.125', ROUND, 2, DECIMAL_PLACES) == '0.13'
+    assert decimal_to_precision('0.126', ROUND, 0.01, TICK_SIZE) == '0.13'
+
+
+# the compiled formatters are the original implementation
+def outcome(method, arguments):
+    try:
+        return method(*arguments)
+    except Exception as e:
+        return type(e)
+
+
+random.seed(11)
+precisions = {
+    DECIMAL_PLACES: [0, 1, 2, 4, 8, 18, -1, -3],
+    SIGNIFICANT_DIGITS: [0, 1, 3, 5, 8],
+    TICK_SIZE: [0.1, 0.001, 0.25, 5, 10, 100.0, '0.01', '1e-8', decimal.Decimal('0.025')],
+}
+for i in range(20000):
+    counting_mode = random.choice(list(precisions.keys()))
+    number = random.choice([
+        random.uniform(-1e5, 1e5),
+        random.uniform(-1, 1) * 10 ** random.randint(-10, 10),
+        str(round(random.uniform(-100, 100), random.randint(0, 9))),
+        random.randint(-10 ** 9, 10 ** 9),
+        decimal.Decimal(str(random.uniform(-10, 10))),
+        random.choice(['0', '-0', '-0.000', '1e-9', '1E+3', '.5', '0.05', '-0.05', '0.5', '-2.5', '1.005']),
+    ])
+    arguments = [number, random.choice([ROUND, TRUNCATE]), random.choice(precisions[counting_mode]), counting_mode, random.choice([NO_PADDING, PAD_WITH_ZERO])]
+    assert outcome(decimal_to_precision, arguments) == outcome(decimal_to_precision_slowly, arguments), arguments
+
+# the batch helpers of the exchange
+exchange = ccxt.Exchange({'id': 'exchange'})
+exchange.precisionMode = TICK_SIZE
+exchange.set_markets([{
+    'id': 'BTCUSDT',
+    'symbol': 'BTC/USDT',
+    'base': 'BTC',
+    'quote': 'USDT',
+    'type': 'spot',
+    'spot': True,
+    'precision': {'price': 0.1, 'amount': 0.001},
+}])
+prices = [27000 + i * 0.37 for i in range(100)]
+amounts = [0.0123456 * i + 0.001 for i in range(100)]
+assert exchange.prices_to_precision('BTC/USDT', prices) == [exchange.price_to_precision('BTC/USDT', price) for price in prices]
+assert exchange.amounts_to_precision('BTC/USDT', amounts) == [exchange.amount_to_precision('BTC/USDT', amount) for amount in amounts]
+assert exchange.prices_to_precision('BTC/USDT', ['27000.06', 27000.04]) == ['27000.1', '27000']
+assert exchange.prices_to_precision('BTC/USDT', []) == []
+for method, values in [['prices_to_precision', [100, 0.01]], ['amounts_to_precision', [1, 0.0009]]]:
+    try:
+        getattr(exchange, method)('BTC/USDT', values)
+        assert False
+    except ccxt.InvalidOrder as e:
+        assert 'must be greater than minimum' in str(e)
+
+# an exchange with its own price_to_precision
+bitfinex = ccxt.bitfinex2()
+bitfinex.set_markets([{
+    'id': 'tBTCUSD',
+    'symbol': 'BTC/USD',
+    'base': 'BTC',
+    'quote': 'USD',
+    'type': 'spot',
+    'spot': True,
+    'precision': {'price': 5, 'amount': 8},
+}])
+prices = [27123.456789, 0.000123456789, 1.23456789]
+assert bitfinex.prices_to_precision('BTC/USD', prices) == [bitfinex.price_to_precision('BTC/USD', price) for price in prices]
+
+print('precision formatter tests passed')
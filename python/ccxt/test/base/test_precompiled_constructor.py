@@ -0,0 +1,40 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+first = ccxt.binance()
+second = ccxt.binance({'apiKey': 'key', 'options': {'defaultType': 'future'}, 'http_proxy': 'http://127.0.0.1:8080'})
+
+# the describe() tree is computed once per class
+assert '_precompiled' in ccxt.binance.__dict__
+assert '_precompiled' not in ccxt.binanceusdm.__dict__
+assert ccxt.binanceusdm().options['fetchMarkets'] == ['linear']
+assert '_precompiled' in ccxt.binanceusdm.__dict__
+
+# but every instance owns its copy
+assert first.options is not second.options
+assert first.api['sapi']['get'] is not second.api['sapi']['get']
+assert first.timeframes == second.timeframes and first.timeframes is not second.timeframes
+first.options['fetchMarkets'].append('option')
+assert 'option' not in second.options['fetchMarkets']
+assert 'option' not in ccxt.binance().options['fetchMarkets']
+
+# config is merged on top
+assert first.options['defaultType'] == 'spot'
+assert second.options['defaultType'] == 'future'
+assert second.options['recvWindow'] == first.options['recvWindow']
+assert second.apiKey == 'key' and first.apiKey == ''
+
+# camelcase aliases of the class and of the instance attributes
+assert first.fetchOHLCV.__func__ is ccxt.binance.fetch_ohlcv
+assert first.safeString is ccxt.Exchange.safe_string
+assert first.httpProxy is None and second.httpProxy == 'http://127.0.0.1:8080'
+assert first.numberToLE is ccxt.Exchange.number_to_le
+
+print('precompiled constructor tests passed')
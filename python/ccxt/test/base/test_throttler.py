@@ -0,0 +1,150 @@
+import os
+import sys
+import time
+import asyncio
+import threading
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.throttler import Throttler  # noqa: E402
+from ccxt.async_support.base.throttler import Throttler as AsyncThrottler  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+delta = 15
+
+
+def assert_elapsed(start, expected):
+    elapsed = (time.perf_counter() - start) * 1000
+    assert abs(elapsed - expected) < delta, 'elapsed ' + str(elapsed) + ' ms, expected ' + str(expected) + ' ms'
+
+
+def test_sync_throttler():
+    throttle = Throttler({'refillRate': 1 / 20})
+    start = time.perf_counter()
+    for i in range(6):
+        throttle(1)
+    assert_elapsed(start, 100)
+    # an idle period refills the bucket up to its capacity
+    time.sleep(0.1)
+    start = time.perf_counter()
+    throttle(1)
+    throttle(1)
+    assert_elapsed(start, 0)
+    metrics = throttle.metrics()
+    assert metrics['requests'] == 8 and metrics['queue'] == 0
+    assert metrics['delayed'] == 5 and 15 < metrics['maxWait'] < 15 + delta
+
+
+def test_sync_throttler_threads():
+    throttle = Throttler({'refillRate': 1 / 20})
+    depths = []
+    threads = [threading.Thread(target=throttle) for i in range(5)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(0.01)
+    depths.append(throttle.metrics()['queue'])
+    for thread in threads:
+        thread.join()
+    assert_elapsed(start, 80)
+    assert depths[0] == 4 and throttle.metrics()['queue'] == 0
+
+
+def test_sync_buckets():
+    throttle = Throttler({'refillRate': 1, 'buckets': {'uid': {'refillRate': 1 / 50}}})
+    start = time.perf_counter()
+    for i in range(4):
+        throttle(1, {'uid': 1})
+    assert_elapsed(start, 150)
+    # the requests that do not draw from the uid bucket are not held back by it
+    start = time.perf_counter()
+    for i in range(4):
+        throttle(1)
+    assert_elapsed(start, 4)
+    start = time.perf_counter()
+    throttle(1, {'uid': 2})
+    assert_elapsed(start, 50)
+    assert throttle.metrics()['tokens']['uid'] < -1
+
+
+async def test_async_throttler():
+    throttle = AsyncThrottler({'refillRate': 1 / 20, 'buckets': {'sapi': {'refillRate': 1 / 40}}})
+    start = time.perf_counter()
+    futures = [throttle(1, {'sapi': 1}) for i in range(3)] + [throttle(1) for i in range(3)]
+    assert throttle.metrics()['queue'] == 6
+    cancelled = throttle(1)
+    cancelled.cancel()
+    await asyncio.gather(*futures)
+    # the sapi bucket admits one request every 40 ms, the default bucket has one token
+    # banked by then and admits the following requests every 20 ms
+    assert_elapsed(start, 120)
+    await asyncio.sleep(0.01)
+    metrics = throttle.metrics()
+    assert metrics['queue'] == 0 and metrics['requests'] == 6
+    assert 120 - delta < metrics['maxWait'] < 120 + delta
+
+
+async def test_async_exchange():
+    exchange = ccxt.async_support.binance({
+        'tokenBucket': {
+            'buckets': {
+                'sapi': {'refillRate': 1 / 500, 'apis': ['sapi']},
+            },
+        },
+    })
+    calls = []
+
+    async def fetch(url, method='GET', headers=None, body=None):
+        calls.append(url)
+        return {}
+
+    exchange.fetch = fetch
+    start = time.perf_counter()
+    for i in range(3):
+        await exchange.fetch2('system/status', 'sapi', 'GET', {}, None, None, {'cost': 0.1})
+    await exchange.fetch2('ping', 'public', 'GET', {}, None, None, {'cost': 0.1})
+    assert_elapsed(start, 100)
+    assert len(calls) == 4 and exchange.throttle.metrics()['requests'] == 4
+    await exchange.close()
+
+
+def test_exchange_buckets():
+    exchange = ccxt.binance({
+        'tokenBucket': {
+            'buckets': {
+                'sapi': {'refillRate': 1 / 500, 'apis': ['sapi', 'sapiV2']},
+                'uid': {'refillRate': 1 / 100, 'capacity': 10},
+            },
+        },
+    })
+    assert exchange.rate_limiter_buckets('public', {'cost': 1}, 1) == {}
+    assert exchange.rate_limiter_buckets('sapiV2', {'cost': 0.1}, 0.1) == {'sapi': 0.1}
+    assert exchange.rate_limiter_buckets('sapi', {'cost': 0.1, 'uid': 6}, 0.1) == {'sapi': 0.1, 'uid': 6}
+    assert exchange.rate_limiter_buckets(['v2', 'sapi'], {}, 1) == {}
+    assert ccxt.binance().rate_limiter_buckets('sapi', {'cost': 0.1, 'uid': 6}, 0.1) is None
+    calls = []
+    exchange.fetch = lambda url, method='GET', headers=None, body=None: calls.append(url)
+    start = time.perf_counter()
+    for i in range(3):
+        exchange.fetch2('system/status', 'sapi', 'GET', {}, None, None, {'cost': 0.1})
+    assert_elapsed(start, 100)
+    assert len(calls) == 3 and exchange.throttler.metrics()['requests'] == 3
+
+
+async def test_async():
+    await test_async_throttler()
+    await test_async_exchange()
+
+
+test_sync_throttler()
+test_sync_throttler_threads()
+test_sync_buckets()
+test_exchange_buckets()
+asyncio.run(test_async())
+
+print('throttler tests passed')
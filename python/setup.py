@@ -99,6 +99,9 @@ setup(
         'type': [
             'mypy==1.6.1',
         ],
+        'numpy': [
+            'numpy>=1.17',
+        ],
     },
     project_urls=project_urls,
 )
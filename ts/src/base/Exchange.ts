@@ -357,6 +357,7 @@ export default class Exchange {
     clients: Dictionary<WsClient> = {}
     newUpdates: boolean = true
     streaming = {}
+    messageHandlers = undefined // the handlers of messageRoutes () by table, built once, see messageHandler ()
 
     alias: boolean = false;
 
@@ -1466,7 +1467,8 @@ export default class Exchange {
         return this.clients[url];
     }
 
-    watchMultiple (url: string, messageHashes: string[], message = undefined, subscribeHashes = undefined, subscription = undefined) {
+    watchMultiple (url: string, messageHashes: string[], message = undefined, subscribeHashes = undefined, subscription = undefined, replay = true) {
+        // replay = false marks the one-shot requests, like the orders, that are not sent again after a reconnection
         //
         // Without comments the code of this method is short and easy:
         //
@@ -1559,7 +1561,8 @@ export default class Exchange {
         return future;
     }
 
-    watch (url: string, messageHash: string, message = undefined, subscribeHash = undefined, subscription = undefined) {
+    watch (url: string, messageHash: string, message = undefined, subscribeHash = undefined, subscription = undefined, replay = true) {
+        // replay = false marks the one-shot requests, like the orders, that are not sent again after a reconnection
         //
         // Without comments the code of this method is short and easy:
         //
@@ -1944,6 +1947,114 @@ export default class Exchange {
         return -1;
     }
 
+    orderBookChecksum (orderbook, depth: number, piece, interleave = true, separator = ':', signed = true) {
+        /**
+         * @ignore
+         * @method
+         * @description the crc32 of the payload of the best levels of an order book, like the checksums of okx, bitget, kraken and bitfinex
+         * @param {object} orderbook the order book, the levels stored with storeWithStrings () keep their strings
+         * @param {int} depth the number of levels of every side in the payload
+         * @param {function} piece piece (level, strings, ask) returns the string of a level, strings is the [ priceString, sizeString ] of the level or undefined
+         * @param {boolean} [interleave] true for the bids and the asks one level after the other, false for the asks then the bids
+         * @param {string} [separator] between the pieces
+         * @param {boolean} [signed] true for a signed checksum
+         * @returns {int} the checksum
+         */
+        const bids = orderbook['bids'];
+        const asks = orderbook['asks'];
+        const bidsLength = Math.min (bids.length, depth);
+        const asksLength = Math.min (asks.length, depth);
+        const payloadArray = [];
+        if (interleave) {
+            for (let i = 0; i < depth; i++) {
+                if (i < bidsLength) {
+                    payloadArray.push (piece.call (this, bids[i], bids.levelStrings (bids[i][0]), false));
+                }
+                if (i < asksLength) {
+                    payloadArray.push (piece.call (this, asks[i], asks.levelStrings (asks[i][0]), true));
+                }
+            }
+        } else {
+            for (let i = 0; i < asksLength; i++) {
+                payloadArray.push (piece.call (this, asks[i], asks.levelStrings (asks[i][0]), true));
+            }
+            for (let i = 0; i < bidsLength; i++) {
+                payloadArray.push (piece.call (this, bids[i], bids.levelStrings (bids[i][0]), false));
+            }
+        }
+        return this.crc32 (payloadArray.join (separator), signed);
+    }
+
+    messageRoutes () {
+        // the handlers of the messages by table and key, like { 'channel': { 'trades': this.handleTrades, 'candle*': this.handleOHLCV } }
+        return {};
+    }
+
+    messageHandler (table: string, key: Str) {
+        /**
+         * @ignore
+         * @method
+         * @description the handler of the messages with a key in a table of messageRoutes (), the tables are built once instead of once per message
+         * @param {string} table the name of the table, like 'event' or 'channel'
+         * @param {string} key the key of the message, the routes ending with * match the keys that start with them, the longest first
+         * @returns {function|undefined} the handler, called with the client and the message
+         */
+        if (key === undefined) {
+            return undefined;
+        }
+        if (this.messageHandlers === undefined) {
+            this.messageHandlers = {};
+            const tables = this.messageRoutes ();
+            const names = Object.keys (tables);
+            for (let i = 0; i < names.length; i++) {
+                const routes = tables[names[i]];
+                const handlers = {};
+                const prefixes = [];
+                const routeKeys = Object.keys (routes);
+                for (let j = 0; j < routeKeys.length; j++) {
+                    const route = routeKeys[j];
+                    if (route.endsWith ('*')) {
+                        prefixes.push ([ route.slice (0, route.length - 1), routes[route] ]);
+                    } else {
+                        handlers[route] = routes[route];
+                    }
+                }
+                this.messageHandlers[names[i]] = { 'handlers': handlers, 'prefixes': prefixes, 'matches': {}, 'size': 0 };
+            }
+        }
+        if (!(table in this.messageHandlers)) {
+            return undefined;
+        }
+        const tableHandlers = this.messageHandlers[table];
+        if (key in tableHandlers['handlers']) {
+            return tableHandlers['handlers'][key];
+        }
+        const prefixes = tableHandlers['prefixes'];
+        if (prefixes.length === 0) {
+            return undefined;
+        }
+        if (key in tableHandlers['matches']) {
+            return tableHandlers['matches'][key];
+        }
+        let handler = undefined;
+        let length = -1;
+        for (let i = 0; i < prefixes.length; i++) {
+            const prefix = prefixes[i][0];
+            if ((prefix.length > length) && key.startsWith (prefix)) {
+                handler = prefixes[i][1];
+                length = prefix.length;
+            }
+        }
+        // the keys can hold symbols, so the matches are memoized up to a bound
+        if (tableHandlers['size'] >= 1000) {
+            this.messageHandlers[table]['matches'] = {};
+            this.messageHandlers[table]['size'] = 0;
+        }
+        this.messageHandlers[table]['matches'][key] = handler;
+        this.messageHandlers[table]['size'] = this.messageHandlers[table]['size'] + 1;
+        return handler;
+    }
+
     findTimeframe (timeframe, timeframes = undefined) {
         if (timeframes === undefined) {
             timeframes = this.timeframes;
@@ -2903,15 +3014,18 @@ export default class Exchange {
                 if (parseCost) {
                     cost = '0';
                 }
+                // added up once after the loop
+                const tradeAmounts = [ filled ];
+                const tradeCosts = [ cost ];
                 for (let i = 0; i < trades.length; i++) {
                     const trade = trades[i];
                     const tradeAmount = this.safeString (trade, 'amount');
                     if (parseFilled && (tradeAmount !== undefined)) {
-                        filled = Precise.stringAdd (filled, tradeAmount);
+                        tradeAmounts.push (tradeAmount);
                     }
                     const tradeCost = this.safeString (trade, 'cost');
                     if (parseCost && (tradeCost !== undefined)) {
-                        cost = Precise.stringAdd (cost, tradeCost);
+                        tradeCosts.push (tradeCost);
                     }
                     if (parseSymbol) {
                         symbol = this.safeString (trade, 'symbol');
@@ -2942,6 +3056,8 @@ export default class Exchange {
                         }
                     }
                 }
+                filled = Precise.stringSum (tradeAmounts);
+                cost = Precise.stringSum (tradeCosts);
             }
         }
         if (shouldParseFees) {
@@ -3344,6 +3460,8 @@ export default class Exchange {
         //     ]
         //
         const reduced = {};
+        // the sums are computed once at the end
+        const costs = {};
         for (let i = 0; i < fees.length; i++) {
             const fee = fees[i];
             const feeCurrencyCode = this.safeString (fee, 'currency');
@@ -3356,15 +3474,17 @@ export default class Exchange {
                 }
                 if (!(feeCurrencyCode in reduced)) {
                     reduced[feeCurrencyCode] = {};
+                    costs[feeCurrencyCode] = {};
                 }
                 const rateKey = (rate === undefined) ? '' : rate;
                 if (rateKey in reduced[feeCurrencyCode]) {
-                    reduced[feeCurrencyCode][rateKey]['cost'] = Precise.stringAdd (reduced[feeCurrencyCode][rateKey]['cost'], cost);
+                    costs[feeCurrencyCode][rateKey].push (cost);
                 } else {
                     reduced[feeCurrencyCode][rateKey] = {
                         'currency': feeCurrencyCode,
                         'cost': cost,
                     };
+                    costs[feeCurrencyCode][rateKey] = [ cost ];
                     if (rate !== undefined) {
                         reduced[feeCurrencyCode][rateKey]['rate'] = rate;
                     }
@@ -3372,9 +3492,15 @@ export default class Exchange {
             }
         }
         let result = [];
-        const feeValues = Object.values (reduced);
-        for (let i = 0; i < feeValues.length; i++) {
-            const reducedFeeValues = Object.values (feeValues[i]);
+        const feeCurrencyCodes = Object.keys (reduced);
+        for (let i = 0; i < feeCurrencyCodes.length; i++) {
+            const feeCurrencyCode = feeCurrencyCodes[i];
+            const rateKeys = Object.keys (reduced[feeCurrencyCode]);
+            for (let j = 0; j < rateKeys.length; j++) {
+                const rateKey = rateKeys[j];
+                reduced[feeCurrencyCode][rateKey]['cost'] = Precise.stringSum (costs[feeCurrencyCode][rateKey]);
+            }
+            const reducedFeeValues = Object.values (reduced[feeCurrencyCode]);
             result = this.arrayConcat (result, reducedFeeValues);
         }
         return result;
@@ -199,6 +199,15 @@ class Precise {
         return (new Precise (string1)).add (new Precise (string2)).toString ();
     }
 
+    static stringSum (strings: Str[]) {
+        // the same as chaining stringAdd () over the strings, the undefined strings are skipped
+        let result = undefined;
+        for (let i = 0; i < strings.length; i++) {
+            result = Precise.stringAdd (result, strings[i]);
+        }
+        return result;
+    }
+
     static stringSub (string1: Str, string2: Str) {
         if ((string1 === undefined) || (string2 === undefined)) {
             return undefined;
@@ -31,6 +31,8 @@ interface IOrderBookSide<T> extends Array<T> {
     store(price: any, size: any);
     store(price: any, size: any, index: any);
     storeArray(array: any[]);
+    storeWithStrings?(price: any, size: any, priceString: string, sizeString: string);
+    levelStrings?(price: any);
     limit();
 }
 
@@ -48,6 +50,12 @@ class OrderBookSide extends Array implements IOrderBookSide {
             value: depth || Number.MAX_SAFE_INTEGER,
             writable: true,
         })
+        // the original price and size strings of the levels by price, see storeWithStrings ()
+        Object.defineProperty (this, 'strings', {
+            __proto__: null, // make it invisible
+            value: {},
+            writable: true,
+        })
         // sort upon initiation
         this.length = 0
         for (let i = 0; i < deltas.length; i++) {
@@ -90,11 +98,27 @@ class OrderBookSide extends Array implements IOrderBookSide {
         this.storeArray ([ price, size ])
     }
 
+    // keeps the strings the level was parsed from, for the checksums of the exchanges
+    storeWithStrings (price, size, priceString, sizeString) {
+        if (size) {
+            this.strings[price] = [ priceString, sizeString ]
+        } else {
+            delete this.strings[price]
+        }
+        this.storeArray ([ price, size ])
+    }
+
+    // the [ priceString, sizeString ] of a level stored with storeWithStrings (), or undefined
+    levelStrings (price) {
+        return this.strings[price]
+    }
+
     // replace stored orders with new values
     limit () {
         if (this.length > this.depth) {
             for (let i = this.depth; i < this.length; i++) {
                 this.index[i] = Number.MAX_VALUE
+                delete this.strings[this[i][0]]
             }
             this.length = this.depth
         }
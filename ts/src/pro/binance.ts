@@ -332,7 +332,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handleFetchOrderBook,
         };
-        const orderbook = await this.watch (url, messageHash, message, messageHash, subscription);
+        const orderbook = await this.watch (url, messageHash, message, messageHash, subscription, false);
         orderbook['symbol'] = market['symbol'];
         return orderbook;
     }
@@ -993,7 +993,7 @@ export default class binance extends binanceRest {
             'method': method,
             'params': this.signParams (this.extend (payload, params)),
         };
-        const ticker = await this.watch (url, messageHash, message, messageHash, subscription);
+        const ticker = await this.watch (url, messageHash, message, messageHash, subscription, false);
         return ticker as Ticker;
     }
 
@@ -1049,7 +1049,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handleFetchOHLCV,
         };
-        return await this.watch (url, messageHash, message, messageHash, subscription);
+        return await this.watch (url, messageHash, message, messageHash, subscription, false);
     }
 
     handleFetchOHLCV (client: Client, message) {
@@ -1676,7 +1676,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': (method === 'account.status') ? this.handleAccountStatusWs : this.handleBalanceWs,
         };
-        return await this.watch (url, messageHash, message, messageHash, subscription);
+        return await this.watch (url, messageHash, message, messageHash, subscription, false);
     }
 
     handleBalanceWs (client: Client, message) {
@@ -1789,7 +1789,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handlePositionsWs,
         };
-        const result = await this.watch (url, messageHash, message, messageHash, subscription);
+        const result = await this.watch (url, messageHash, message, messageHash, subscription, false);
         return this.filterByArrayPositions (result, 'symbol', symbols, false);
     }
 
@@ -2045,7 +2045,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handleOrderWs,
         };
-        return await this.watch (url, messageHash, message, messageHash, subscription);
+        return await this.watch (url, messageHash, message, messageHash, subscription, false);
     }
 
     handleOrderWs (client: Client, message) {
@@ -2188,7 +2188,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handleEditOrderWs,
         };
-        return await this.watch (url, messageHash, message, messageHash, subscription);
+        return await this.watch (url, messageHash, message, messageHash, subscription, false);
     }
 
     handleEditOrderWs (client: Client, message) {
@@ -2345,7 +2345,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handleOrderWs,
         };
-        return await this.watch (url, messageHash, message, messageHash, subscription);
+        return await this.watch (url, messageHash, message, messageHash, subscription, false);
     }
 
     async cancelAllOrdersWs (symbol: Str = undefined, params = {}) {
@@ -2381,7 +2381,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handleOrdersWs,
         };
-        return await this.watch (url, messageHash, message, messageHash, subscription);
+        return await this.watch (url, messageHash, message, messageHash, subscription, false);
     }
 
     async fetchOrderWs (id: string, symbol: Str = undefined, params = {}): Promise<Order> {
@@ -2427,7 +2427,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handleOrderWs,
         };
-        return await this.watch (url, messageHash, message, messageHash, subscription);
+        return await this.watch (url, messageHash, message, messageHash, subscription, false);
     }
 
     async fetchOrdersWs (symbol: Str = undefined, since: Int = undefined, limit: Int = undefined, params = {}): Promise<Order[]> {
@@ -2472,7 +2472,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handleOrdersWs,
         };
-        const orders = await this.watch (url, messageHash, message, messageHash, subscription);
+        const orders = await this.watch (url, messageHash, message, messageHash, subscription, false);
         return this.filterBySymbolSinceLimit (orders, symbol, since, limit);
     }
 
@@ -2536,7 +2536,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handleOrdersWs,
         };
-        const orders = await this.watch (url, messageHash, message, messageHash, subscription);
+        const orders = await this.watch (url, messageHash, message, messageHash, subscription, false);
         return this.filterBySymbolSinceLimit (orders, symbol, since, limit);
     }
 
@@ -3115,7 +3115,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handleTradesWs,
         };
-        const trades = await this.watch (url, messageHash, message, messageHash, subscription);
+        const trades = await this.watch (url, messageHash, message, messageHash, subscription, false);
         return this.filterBySymbolSinceLimit (trades, symbol, since, limit);
     }
 
@@ -3163,7 +3163,7 @@ export default class binance extends binanceRest {
         const subscription = {
             'method': this.handleTradesWs,
         };
-        const trades = await this.watch (url, messageHash, message, messageHash, subscription);
+        const trades = await this.watch (url, messageHash, message, messageHash, subscription, false);
         return this.filterBySinceLimit (trades, since, limit);
     }
 
@@ -3421,6 +3421,35 @@ export default class binance extends binanceRest {
         }
     }
 
+    messageRoutes () {
+        return {
+            'event': {
+                'depthUpdate': this.handleOrderBook,
+                'trade': this.handleTrade,
+                'aggTrade': this.handleTrade,
+                'kline': this.handleOHLCV,
+                'markPrice_kline': this.handleOHLCV,
+                'indexPrice_kline': this.handleOHLCV,
+                '1hTicker@arr': this.handleTickers,
+                '4hTicker@arr': this.handleTickers,
+                '1dTicker@arr': this.handleTickers,
+                '24hrTicker@arr': this.handleTickers,
+                '24hrMiniTicker@arr': this.handleTickers,
+                '1hTicker': this.handleTickers,
+                '4hTicker': this.handleTickers,
+                '1dTicker': this.handleTickers,
+                '24hrTicker': this.handleTickers,
+                '24hrMiniTicker': this.handleTickers,
+                'bookTicker': this.handleBidsAsks, // there is no "bookTicker@arr" endpoint
+                'outboundAccountPosition': this.handleBalance,
+                'balanceUpdate': this.handleBalance,
+                'ACCOUNT_UPDATE': this.handleAcountUpdate,
+                'executionReport': this.handleOrderUpdate,
+                'ORDER_TRADE_UPDATE': this.handleOrderUpdate,
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         // handle WebSocketAPI
         const status = this.safeString (message, 'status');
@@ -3437,36 +3466,12 @@ export default class binance extends binanceRest {
             return;
         }
         // handle other APIs
-        const methods = {
-            'depthUpdate': this.handleOrderBook,
-            'trade': this.handleTrade,
-            'aggTrade': this.handleTrade,
-            'kline': this.handleOHLCV,
-            'markPrice_kline': this.handleOHLCV,
-            'indexPrice_kline': this.handleOHLCV,
-            '1hTicker@arr': this.handleTickers,
-            '4hTicker@arr': this.handleTickers,
-            '1dTicker@arr': this.handleTickers,
-            '24hrTicker@arr': this.handleTickers,
-            '24hrMiniTicker@arr': this.handleTickers,
-            '1hTicker': this.handleTickers,
-            '4hTicker': this.handleTickers,
-            '1dTicker': this.handleTickers,
-            '24hrTicker': this.handleTickers,
-            '24hrMiniTicker': this.handleTickers,
-            'bookTicker': this.handleBidsAsks, // there is no "bookTicker@arr" endpoint
-            'outboundAccountPosition': this.handleBalance,
-            'balanceUpdate': this.handleBalance,
-            'ACCOUNT_UPDATE': this.handleAcountUpdate,
-            'executionReport': this.handleOrderUpdate,
-            'ORDER_TRADE_UPDATE': this.handleOrderUpdate,
-        };
         let event = this.safeString (message, 'e');
         if (Array.isArray (message)) {
             const data = message[0];
             event = this.safeString (data, 'e') + '@arr';
         }
-        method = this.safeValue (methods, event);
+        method = this.messageHandler ('event', event);
         if (method === undefined) {
             const requestId = this.safeString (message, 'id');
             if (requestId !== undefined) {
@@ -668,28 +668,11 @@ export default class bitfinex2 extends bitfinex2Rest {
             return;
         }
         const depth = 25; // covers the first 25 bids and asks
-        const stringArray = [];
-        const bids = book['bids'];
-        const asks = book['asks'];
         const prec = this.safeString (subscription, 'prec', 'P0');
         const isRaw = (prec === 'R0');
-        const idToCheck = isRaw ? 2 : 0;
         // pepperoni pizza from bitfinex
-        for (let i = 0; i < depth; i++) {
-            const bid = this.safeValue (bids, i);
-            const ask = this.safeValue (asks, i);
-            if (bid !== undefined) {
-                stringArray.push (this.numberToString (bids[i][idToCheck]));
-                stringArray.push (this.numberToString (bids[i][1]));
-            }
-            if (ask !== undefined) {
-                stringArray.push (this.numberToString (asks[i][idToCheck]));
-                const aski1 = asks[i][1];
-                stringArray.push (this.numberToString (-aski1));
-            }
-        }
-        const payload = stringArray.join (':');
-        const localChecksum = this.crc32 (payload, true);
+        const piece = isRaw ? this.rawChecksumPiece : this.checksumPiece;
+        const localChecksum = this.orderBookChecksum (book, depth, piece);
         const responseChecksum = this.safeInteger (message, 2);
         if (responseChecksum !== localChecksum) {
             const error = new InvalidNonce (this.id + ' invalid checksum');
@@ -697,6 +680,18 @@ export default class bitfinex2 extends bitfinex2Rest {
         }
     }
 
+    checksumPiece (level, strings, ask) {
+        // the amounts of the asks are negative
+        const amount = ask ? -level[1] : level[1];
+        return this.numberToString (level[0]) + ':' + this.numberToString (amount);
+    }
+
+    rawChecksumPiece (level, strings, ask) {
+        // the order id in place of the price
+        const amount = ask ? -level[1] : level[1];
+        return this.numberToString (level[2]) + ':' + this.numberToString (amount);
+    }
+
     async watchBalance (params = {}): Promise<Balances> {
         /**
          * @method
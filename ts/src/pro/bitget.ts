@@ -52,6 +52,13 @@ export default class bitget extends bitgetRest {
             'options': {
                 'tradesLimit': 1000,
                 'OHLCVLimit': 1000,
+                'ws': {
+                    // the subscriptions of one turn of the event loop are sent together, up to 20 channels per request
+                    'batch': {
+                        'key': 'args',
+                        'size': 20,
+                    },
+                },
                 // WS timeframes differ from REST timeframes
                 'timeframes': {
                     '1m': '1m',
@@ -536,8 +543,7 @@ export default class bitget extends bitgetRest {
         if (incrementalBook) {
             // storedOrderBook = this.safeValue (this.orderbooks, symbol);
             if (!(symbol in this.orderbooks)) {
-                // const ob = this.orderBook ({});
-                const ob = this.countedOrderBook ({});
+                const ob = this.orderBook ({});
                 ob['symbol'] = symbol;
                 this.orderbooks[symbol] = ob;
             }
@@ -551,23 +557,8 @@ export default class bitget extends bitgetRest {
             const checksum = this.safeBool (this.options, 'checksum', true);
             const isSnapshot = this.safeString (message, 'action') === 'snapshot'; // snapshot does not have a checksum
             if (!isSnapshot && checksum) {
-                const storedAsks = storedOrderBook['asks'];
-                const storedBids = storedOrderBook['bids'];
-                const asksLength = storedAsks.length;
-                const bidsLength = storedBids.length;
-                const payloadArray = [];
-                for (let i = 0; i < 25; i++) {
-                    if (i < bidsLength) {
-                        payloadArray.push (storedBids[i][2][0]);
-                        payloadArray.push (storedBids[i][2][1]);
-                    }
-                    if (i < asksLength) {
-                        payloadArray.push (storedAsks[i][2][0]);
-                        payloadArray.push (storedAsks[i][2][1]);
-                    }
-                }
-                const payload = payloadArray.join (':');
-                const calculatedChecksum = this.crc32 (payload, true);
+                // the first 25 bids and asks, one level after the other, from the strings of the levels
+                const calculatedChecksum = this.orderBookChecksum (storedOrderBook, 25, this.checksumPiece);
                 const responseChecksum = this.safeInteger (rawOrderBook, 'checksum');
                 if (calculatedChecksum !== responseChecksum) {
                     const error = new InvalidNonce (this.id + ' invalid checksum');
@@ -587,8 +578,14 @@ export default class bitget extends bitgetRest {
         const bidAsk = this.parseBidAsk (delta, 0, 1);
         // we store the string representations in the orderbook for checksum calculation
         // this simplifies the code for generating checksums as we do not need to do any complex number transformations
-        bidAsk.push (delta);
-        bookside.storeArray (bidAsk);
+        bookside.storeWithStrings (bidAsk[0], bidAsk[1], this.safeString (delta, 0), this.safeString (delta, 1));
+    }
+
+    checksumPiece (level, strings, ask) {
+        if (strings === undefined) {
+            return this.numberToString (level[0]) + ':' + this.numberToString (level[1]);
+        }
+        return strings[0] + ':' + strings[1];
     }
 
     handleDeltas (bookside, deltas) {
@@ -78,6 +78,14 @@ export default class bybit extends bybitRest {
                 },
             },
             'options': {
+                'ws': {
+                    // the subscriptions of one turn of the event loop are sent together, up to 10 topics per request on spot
+                    'batch': {
+                        'key': 'args',
+                        'size': 10,
+                        'ignore': [ 'req_id' ],
+                    },
+                },
                 'watchTicker': {
                     'name': 'tickers', // 'tickers' for 24hr statistical ticker or 'tickers_lt' for leverage token ticker
                 },
@@ -222,7 +230,7 @@ export default class bybit extends bybitRest {
                 'X-BAPI-RECV-WINDOW': this.options['recvWindow'].toString (),
             },
         };
-        return await this.watch (url, requestId, request, requestId, true) as Order;
+        return await this.watch (url, requestId, request, requestId, true, false) as Order;
     }
 
     async editOrderWs (id: string, symbol: string, type:OrderType, side: OrderSide, amount: Num = undefined, price: Num = undefined, params = {}) {
@@ -267,7 +275,7 @@ export default class bybit extends bybitRest {
                 'X-BAPI-RECV-WINDOW': this.options['recvWindow'].toString (),
             },
         };
-        return await this.watch (url, requestId, request, requestId, true) as Order;
+        return await this.watch (url, requestId, request, requestId, true, false) as Order;
     }
 
     async cancelOrderWs (id: string, symbol: Str = undefined, params = {}) {
@@ -301,7 +309,7 @@ export default class bybit extends bybitRest {
                 'X-BAPI-RECV-WINDOW': this.options['recvWindow'].toString (),
             },
         };
-        return await this.watch (url, requestId, request, requestId, true) as Order;
+        return await this.watch (url, requestId, request, requestId, true, false) as Order;
     }
 
     async watchTicker (symbol: string, params = {}): Promise<Ticker> {
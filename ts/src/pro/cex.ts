@@ -341,7 +341,7 @@ export default class cex extends cexRest {
             'oid': messageHash,
             'data': [ market['base'], market['quote'] ],
         }, params);
-        return await this.watch (url, messageHash, request, messageHash) as Ticker;
+        return await this.watch (url, messageHash, request, messageHash, undefined, false) as Ticker;
     }
 
     handleTicker (client: Client, message) {
@@ -454,7 +454,7 @@ export default class cex extends cexRest {
             'e': 'get-balance',
             'oid': messageHash,
         }, params);
-        return await this.watch (url, messageHash, request, messageHash);
+        return await this.watch (url, messageHash, request, messageHash, undefined, false);
     }
 
     async watchOrders (symbol: Str = undefined, since: Int = undefined, limit: Int = undefined, params = {}): Promise<Order[]> {
@@ -1249,7 +1249,7 @@ export default class cex extends cexRest {
             'oid': messageHash,
             'data': data,
         };
-        const response = await this.watch (url, messageHash, request, messageHash);
+        const response = await this.watch (url, messageHash, request, messageHash, undefined, false);
         return this.parseOrder (response, market);
     }
 
@@ -1281,7 +1281,7 @@ export default class cex extends cexRest {
             'oid': messageHash,
             'data': data,
         };
-        const response = await this.watch (url, messageHash, request, messageHash);
+        const response = await this.watch (url, messageHash, request, messageHash, undefined, false);
         return this.parseOrders (response, market, since, limit, params);
     }
 
@@ -1319,7 +1319,7 @@ export default class cex extends cexRest {
             'oid': messageHash,
             'data': data,
         };
-        const rawOrder = await this.watch (url, messageHash, request, messageHash);
+        const rawOrder = await this.watch (url, messageHash, request, messageHash, undefined, false);
         return this.parseOrder (rawOrder, market);
     }
 
@@ -1361,7 +1361,7 @@ export default class cex extends cexRest {
             'oid': messageHash,
             'data': data,
         };
-        const response = await this.watch (url, messageHash, request, messageHash, messageHash);
+        const response = await this.watch (url, messageHash, request, messageHash, messageHash, false);
         return this.parseOrder (response, market);
     }
 
@@ -1392,7 +1392,7 @@ export default class cex extends cexRest {
             'oid': messageHash,
             'data': data,
         };
-        const response = await this.watch (url, messageHash, request, messageHash, messageHash);
+        const response = await this.watch (url, messageHash, request, messageHash, messageHash, false);
         return this.parseOrder (response, market);
     }
 
@@ -1422,7 +1422,7 @@ export default class cex extends cexRest {
             'oid': messageHash,
             'data': data,
         };
-        const response = await this.watch (url, messageHash, request, messageHash, messageHash);
+        const response = await this.watch (url, messageHash, request, messageHash, messageHash, false);
         //
         //    {
         //        "cancel-orders": [{
@@ -636,7 +636,7 @@ export default class coinex extends coinexRest {
         };
         const subscriptionHash = id;
         const request = this.deepExtend (subscribe, query);
-        const ohlcvs = await this.watch (url, messageHash, request, subscriptionHash, subscription);
+        const ohlcvs = await this.watch (url, messageHash, request, subscriptionHash, subscription, false);
         return this.filterBySinceLimit (ohlcvs, since, limit, 0);
     }
 
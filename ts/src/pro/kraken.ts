@@ -138,7 +138,7 @@ export default class kraken extends krakenRest {
             'volume': this.amountToPrecision (symbol, amount),
         };
         [ request, params ] = this.orderRequest ('createOrderWs', symbol, type, request, price, params);
-        return await this.watch (url, messageHash, this.extend (request, params), messageHash);
+        return await this.watch (url, messageHash, this.extend (request, params), messageHash, undefined, false);
     }
 
     handleCreateEditOrder (client, message) {
@@ -196,7 +196,7 @@ export default class kraken extends krakenRest {
             'volume': this.amountToPrecision (symbol, amount),
         };
         [ request, params ] = this.orderRequest ('editOrderWs', symbol, type, request, price, params);
-        return await this.watch (url, messageHash, this.extend (request, params), messageHash);
+        return await this.watch (url, messageHash, this.extend (request, params), messageHash, undefined, false);
     }
 
     async cancelOrdersWs (ids: string[], symbol: Str = undefined, params = {}) {
@@ -221,7 +221,7 @@ export default class kraken extends krakenRest {
             'reqid': requestId,
             'txid': ids,
         };
-        return await this.watch (url, messageHash, this.extend (request, params), messageHash);
+        return await this.watch (url, messageHash, this.extend (request, params), messageHash, undefined, false);
     }
 
     async cancelOrderWs (id: string, symbol: Str = undefined, params = {}): Promise<Order> {
@@ -248,7 +248,7 @@ export default class kraken extends krakenRest {
             'reqid': requestId,
             'txid': [ clientOrderId ],
         };
-        return await this.watch (url, messageHash, this.extend (request, params), messageHash);
+        return await this.watch (url, messageHash, this.extend (request, params), messageHash, undefined, false);
     }
 
     handleCancelOrder (client, message) {
@@ -287,7 +287,7 @@ export default class kraken extends krakenRest {
             'token': token,
             'reqid': requestId,
         };
-        return await this.watch (url, messageHash, this.extend (request, params), messageHash);
+        return await this.watch (url, messageHash, this.extend (request, params), messageHash, undefined, false);
     }
 
     handleCancelAllOrders (client, message) {
@@ -754,38 +754,21 @@ export default class kraken extends krakenRest {
             }
             const storedAsks = orderbook['asks'];
             const storedBids = orderbook['bids'];
-            let example = undefined;
             if (a !== undefined) {
                 timestamp = this.customHandleDeltas (storedAsks, a, timestamp);
-                example = this.safeValue (a, 0);
             }
             if (b !== undefined) {
                 timestamp = this.customHandleDeltas (storedBids, b, timestamp);
-                example = this.safeValue (b, 0);
             }
             // don't remove this line or I will poop on your face
             orderbook.limit ();
             const checksum = this.safeBool (this.options, 'checksum', true);
             if (checksum) {
-                const priceString = this.safeString (example, 0);
-                const amountString = this.safeString (example, 1);
-                const priceParts = priceString.split ('.');
-                const amountParts = amountString.split ('.');
-                const priceLength = priceParts[1].length - 0;
-                const amountLength = amountParts[1].length - 0;
-                const payloadArray = [];
+                let localChecksum = this.crc32 ('', false);
                 if (c !== undefined) {
-                    for (let i = 0; i < 10; i++) {
-                        const formatted = this.formatNumber (storedAsks[i][0], priceLength) + this.formatNumber (storedAsks[i][1], amountLength);
-                        payloadArray.push (formatted);
-                    }
-                    for (let i = 0; i < 10; i++) {
-                        const formatted = this.formatNumber (storedBids[i][0], priceLength) + this.formatNumber (storedBids[i][1], amountLength);
-                        payloadArray.push (formatted);
-                    }
+                    // the first 10 asks then the first 10 bids, from the strings of the levels
+                    localChecksum = this.orderBookChecksum (orderbook, 10, this.checksumPiece, false, '', false);
                 }
-                const payload = payloadArray.join ('');
-                const localChecksum = this.crc32 (payload, false);
                 if (localChecksum !== c) {
                     const error = new InvalidNonce (this.id + ' invalid checksum');
                     client.reject (error, messageHash);
@@ -817,6 +800,20 @@ export default class kraken extends krakenRest {
         }
     }
 
+    checksumPiece (level, strings, ask) {
+        // the price and the amount as they were received, without the dots and the leading zeros
+        return this.checksumDigits (strings[0]) + this.checksumDigits (strings[1]);
+    }
+
+    checksumDigits (numberString) {
+        const digits = numberString.replace ('.', '');
+        let i = 0;
+        while (digits[i] === '0') {
+            i += 1;
+        }
+        return digits.slice (i);
+    }
+
     customHandleDeltas (bookside, deltas, timestamp = undefined) {
         for (let j = 0; j < deltas.length; j++) {
             const delta = deltas[j];
@@ -824,7 +821,7 @@ export default class kraken extends krakenRest {
             const amount = this.parseNumber (delta[1]);
             const oldTimestamp = timestamp ? timestamp : 0;
             timestamp = Math.max (oldTimestamp, this.parseToInt (parseFloat (delta[2]) * 1000));
-            bookside.store (price, amount);
+            bookside.storeWithStrings (price, amount, delta[0], delta[1]);
         }
         return timestamp;
     }
@@ -94,7 +94,7 @@ export default class lbank extends lbankRest {
         }
         const request = this.deepExtend (message, params);
         const requestId = this.requestId ();
-        return await this.watch (url, messageHash, request, requestId, request);
+        return await this.watch (url, messageHash, request, requestId, request, false);
     }
 
     async watchOHLCV (symbol: string, timeframe = '1m', since: Int = undefined, limit: Int = undefined, params = {}): Promise<OHLCV[]> {
@@ -257,7 +257,7 @@ export default class lbank extends lbankRest {
         };
         const request = this.deepExtend (message, params);
         const requestId = this.requestId ();
-        return await this.watch (url, messageHash, request, requestId, request);
+        return await this.watch (url, messageHash, request, requestId, request, false);
     }
 
     async watchTicker (symbol: string, params = {}): Promise<Ticker> {
@@ -393,7 +393,7 @@ export default class lbank extends lbankRest {
         };
         const request = this.deepExtend (message, params);
         const requestId = this.requestId ();
-        return await this.watch (url, messageHash, request, requestId, request);
+        return await this.watch (url, messageHash, request, requestId, request, false);
     }
 
     async watchTrades (symbol: string, since: Int = undefined, limit: Int = undefined, params = {}): Promise<Trade[]> {
@@ -701,7 +701,7 @@ export default class lbank extends lbankRest {
             'pair': market['id'],
         };
         const request = this.deepExtend (subscribe, params);
-        const orderbook = await this.watch (url, messageHash, request, messageHash);
+        const orderbook = await this.watch (url, messageHash, request, messageHash, undefined, false);
         return orderbook.limit ();
     }
 
@@ -89,6 +89,11 @@ export default class okx extends okxRest {
                 },
                 'ws': {
                     // 'inflate': true,
+                    // the subscriptions of one turn of the event loop are sent together, up to 100 channels per request
+                    'batch': {
+                        'key': 'args',
+                        'size': 100,
+                    },
                 },
                 'checksum': true,
             },
@@ -559,7 +564,7 @@ export default class okx extends okxRest {
         //
         const price = this.safeFloat (delta, 0);
         const amount = this.safeFloat (delta, 1);
-        bookside.store (price, amount);
+        bookside.storeWithStrings (price, amount, this.safeString (delta, 0), this.safeString (delta, 1));
     }
 
     handleDeltas (bookside, deltas) {
@@ -593,22 +598,9 @@ export default class okx extends okxRest {
         this.handleDeltas (storedBids, bids);
         const checksum = this.safeBool (this.options, 'checksum', true);
         if (checksum) {
-            const asksLength = storedAsks.length;
-            const bidsLength = storedBids.length;
-            const payloadArray = [];
-            for (let i = 0; i < 25; i++) {
-                if (i < bidsLength) {
-                    payloadArray.push (this.numberToString (storedBids[i][0]));
-                    payloadArray.push (this.numberToString (storedBids[i][1]));
-                }
-                if (i < asksLength) {
-                    payloadArray.push (this.numberToString (storedAsks[i][0]));
-                    payloadArray.push (this.numberToString (storedAsks[i][1]));
-                }
-            }
-            const payload = payloadArray.join (':');
+            // the first 25 bids and asks, one level after the other, from the strings of the levels
             const responseChecksum = this.safeInteger (message, 'checksum');
-            const localChecksum = this.crc32 (payload, true);
+            const localChecksum = this.orderBookChecksum (orderbook, 25, this.checksumPiece);
             if (responseChecksum !== localChecksum) {
                 const error = new InvalidNonce (this.id + ' invalid checksum');
                 client.reject (error, messageHash);
@@ -620,6 +612,13 @@ export default class okx extends okxRest {
         return orderbook;
     }
 
+    checksumPiece (level, strings, ask) {
+        if (strings === undefined) {
+            return this.numberToString (level[0]) + ':' + this.numberToString (level[1]);
+        }
+        return strings[0] + ':' + strings[1];
+    }
+
     handleOrderBook (client: Client, message) {
         //
         // snapshot
@@ -1330,7 +1329,7 @@ export default class okx extends okxRest {
             'op': op,
             'args': [ args ],
         };
-        return await this.watch (url, messageHash, request, messageHash);
+        return await this.watch (url, messageHash, request, messageHash, undefined, false);
     }
 
     handlePlaceOrders (client: Client, message) {
@@ -1395,7 +1394,7 @@ export default class okx extends okxRest {
             'op': op,
             'args': [ args ],
         };
-        return await this.watch (url, messageHash, this.extend (request, params), messageHash);
+        return await this.watch (url, messageHash, this.extend (request, params), messageHash, undefined, false);
     }
 
     async cancelOrderWs (id: string, symbol: Str = undefined, params = {}): Promise<Order> {
@@ -1432,7 +1431,7 @@ export default class okx extends okxRest {
             'op': 'cancel-order',
             'args': [ this.extend (arg, params) ],
         };
-        return await this.watch (url, messageHash, request, messageHash);
+        return await this.watch (url, messageHash, request, messageHash, undefined, false);
     }
 
     async cancelOrdersWs (ids: string[], symbol: Str = undefined, params = {}) {
@@ -1470,7 +1469,7 @@ export default class okx extends okxRest {
             'op': 'batch-cancel-orders',
             'args': args,
         };
-        return await this.watch (url, messageHash, this.deepExtend (request, params), messageHash);
+        return await this.watch (url, messageHash, this.deepExtend (request, params), messageHash, undefined, false);
     }
 
     async cancelAllOrdersWs (symbol: Str = undefined, params = {}) {
@@ -1502,7 +1501,7 @@ export default class okx extends okxRest {
                 'instFamily': market['id'],
             }, params) ],
         };
-        return await this.watch (url, messageHash, request, messageHash);
+        return await this.watch (url, messageHash, request, messageHash, undefined, false);
     }
 
     handleCancelAllOrders (client: Client, message) {
@@ -1582,6 +1581,41 @@ export default class okx extends okxRest {
         return message;
     }
 
+    messageRoutes () {
+        return {
+            'event': {
+                // 'info': this.handleSystemStatus,
+                // 'book': 'handleOrderBook',
+                'login': this.handleAuthenticate,
+                'subscribe': this.handleSubscriptionStatus,
+                'order': this.handlePlaceOrders,
+                'batch-orders': this.handlePlaceOrders,
+                'amend-order': this.handlePlaceOrders,
+                'batch-amend-orders': this.handlePlaceOrders,
+                'cancel-order': this.handlePlaceOrders,
+                'mass-cancel': this.handleCancelAllOrders,
+            },
+            'channel': {
+                'bbo-tbt': this.handleOrderBook, // newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
+                'books': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required
+                'books5': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms (vs. every 200ms now)
+                'books50-l2-tbt': this.handleOrderBook, // only users who're VIP4 and above can subscribe, identity verification required before subscription
+                'books-l2-tbt': this.handleOrderBook, // only users who're VIP5 and above can subscribe, identity verification required before subscription
+                'tickers': this.handleTicker,
+                'positions': this.handlePositions,
+                'index-tickers': this.handleTicker,
+                'sprd-tickers': this.handleTicker,
+                'block-tickers': this.handleTicker,
+                'trades': this.handleTrades,
+                'account': this.handleBalance,
+                // 'margin_account': this.handleBalance,
+                'orders': this.handleOrders,
+                'orders-algo': this.handleOrders,
+                'candle*': this.handleOHLCV,
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         if (!this.handleErrorMessage (client, message)) {
             return;
@@ -1633,48 +1667,15 @@ export default class okx extends okxRest {
         // if (table === undefined) {
         const event = this.safeString2 (message, 'event', 'op');
         if (event !== undefined) {
-            const methods = {
-                // 'info': this.handleSystemStatus,
-                // 'book': 'handleOrderBook',
-                'login': this.handleAuthenticate,
-                'subscribe': this.handleSubscriptionStatus,
-                'order': this.handlePlaceOrders,
-                'batch-orders': this.handlePlaceOrders,
-                'amend-order': this.handlePlaceOrders,
-                'batch-amend-orders': this.handlePlaceOrders,
-                'cancel-order': this.handlePlaceOrders,
-                'mass-cancel': this.handleCancelAllOrders,
-            };
-            const method = this.safeValue (methods, event);
+            const method = this.messageHandler ('event', event);
             if (method !== undefined) {
                 method.call (this, client, message);
             }
         } else {
             const arg = this.safeValue (message, 'arg', {});
             const channel = this.safeString (arg, 'channel');
-            const methods = {
-                'bbo-tbt': this.handleOrderBook, // newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
-                'books': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required
-                'books5': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms (vs. every 200ms now)
-                'books50-l2-tbt': this.handleOrderBook, // only users who're VIP4 and above can subscribe, identity verification required before subscription
-                'books-l2-tbt': this.handleOrderBook, // only users who're VIP5 and above can subscribe, identity verification required before subscription
-                'tickers': this.handleTicker,
-                'positions': this.handlePositions,
-                'index-tickers': this.handleTicker,
-                'sprd-tickers': this.handleTicker,
-                'block-tickers': this.handleTicker,
-                'trades': this.handleTrades,
-                'account': this.handleBalance,
-                // 'margin_account': this.handleBalance,
-                'orders': this.handleOrders,
-                'orders-algo': this.handleOrders,
-            };
-            const method = this.safeValue (methods, channel);
-            if (method === undefined) {
-                if (channel.indexOf ('candle') === 0) {
-                    this.handleOHLCV (client, message);
-                }
-            } else {
+            const method = this.messageHandler ('channel', channel);
+            if (method !== undefined) {
                 method.call (this, client, message);
             }
         }